@@ -0,0 +1,8 @@
+import pytest
+from django.conf import settings
+
+
+@pytest.fixture(autouse=True, scope="session")
+def media_root(tmp_path_factory):
+    """Keep the files tests upload out of the source tree."""
+    settings.MEDIA_ROOT = str(tmp_path_factory.mktemp("media"))
@@ -0,0 +1,44 @@
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.libs.workflow.queues import QUEUE_STATES
+
+
+class AssignClaimForm(forms.Form):
+    barcode = forms.CharField(label=_("Form Barcode"))
+    username = forms.CharField(label=_("Clerk Username"))
+
+    def __init__(self, *args, tally_id=None, **kwargs):
+        super(AssignClaimForm, self).__init__(*args, **kwargs)
+        # The tally the view authorized, never a submitted value.
+        self.tally_id = tally_id
+
+    def clean(self):
+        """Find the form in a work queue and the clerk of the tally to
+        assign it to.
+        """
+        cleaned_data = super(AssignClaimForm, self).clean()
+        tally_id = self.tally_id
+
+        if self.errors:
+            return cleaned_data
+
+        try:
+            cleaned_data['result_form'] = ResultForm.objects.get(
+                barcode=cleaned_data['barcode'],
+                tally__id=tally_id,
+                form_state__in=QUEUE_STATES)
+        except ResultForm.DoesNotExist:
+            raise forms.ValidationError(
+                _('No form with this barcode is waiting in a queue.'))
+
+        try:
+            cleaned_data['user'] = UserProfile.objects.get(
+                username=cleaned_data['username'], tally__id=tally_id)
+        except UserProfile.DoesNotExist:
+            raise forms.ValidationError(
+                _('No user with this username works on this tally.'))
+
+        return cleaned_data
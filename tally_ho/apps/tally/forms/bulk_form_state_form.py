@@ -0,0 +1,90 @@
+import re
+
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+
+# The states super administrators can send many forms back to.
+BULK_FORM_STATES = (
+    FormState.UNSUBMITTED,
+    FormState.DATA_ENTRY_1,
+    FormState.AUDIT,
+    FormState.CLEARANCE,
+)
+
+
+class BulkFormStateForm(forms.Form):
+    barcodes = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={'cols': 40, 'rows': 5}),
+        label=_("Form Barcodes"),
+        help_text=_("Separated by spaces, commas or new lines"),
+    )
+    sub_con_code = forms.IntegerField(
+        required=False,
+        label=_("Sub Constituency Code"),
+    )
+    ballot_number = forms.IntegerField(
+        required=False,
+        label=_("Ballot Number"),
+    )
+    new_state = forms.ChoiceField(
+        choices=[(state.name, state.name) for state in BULK_FORM_STATES],
+        label=_("New Form State"),
+    )
+    reason = forms.CharField(
+        widget=forms.Textarea(attrs={'cols': 80, 'rows': 5}),
+        label=_("Add comment(s) for rejecting these forms"),
+    )
+
+    def __init__(self, *args, tally_id=None, **kwargs):
+        super(BulkFormStateForm, self).__init__(*args, **kwargs)
+        # The tally the view authorized, never a submitted value.
+        self.tally_id = tally_id
+
+    def clean_barcodes(self):
+        return [
+            barcode
+            for barcode in re.split(r'[\s,]+', self.cleaned_data['barcodes'])
+            if barcode
+        ]
+
+    def clean_new_state(self):
+        return FormState[self.cleaned_data['new_state']]
+
+    def clean(self):
+        cleaned_data = super(BulkFormStateForm, self).clean()
+
+        if not (cleaned_data.get('barcodes') or
+                cleaned_data.get('sub_con_code') is not None or
+                cleaned_data.get('ballot_number') is not None):
+            raise forms.ValidationError(_(
+                'Enter barcodes, a sub constituency code or a ballot '
+                'number'))
+
+        return cleaned_data
+
+    def get_result_forms(self):
+        """Return the forms selected, other than forms already in the new
+        state.
+        """
+        result_forms = ResultForm.objects.filter(
+            tally__id=self.tally_id,
+        ).exclude(form_state=self.cleaned_data['new_state'])
+        barcodes = self.cleaned_data['barcodes']
+        sub_con_code = self.cleaned_data['sub_con_code']
+        ballot_number = self.cleaned_data['ballot_number']
+
+        if barcodes:
+            result_forms = result_forms.filter(barcode__in=barcodes)
+
+        if sub_con_code is not None:
+            result_forms = result_forms.filter(
+                center__sub_constituency__code=sub_con_code)
+
+        if ballot_number is not None:
+            result_forms = result_forms.filter(ballot__number=ballot_number)
+
+        return result_forms
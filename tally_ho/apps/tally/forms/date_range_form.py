@@ -0,0 +1,38 @@
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+
+class DateRangeForm(forms.Form):
+    start_date = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        label=_("From"),
+    )
+    end_date = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        label=_("To"),
+    )
+
+    def filter(self, queryset, field='date'):
+        """Filter a queryset to the dates of the range, all of them if the
+        range is invalid.
+
+        :param queryset: The queryset to filter.
+        :param field: The date field to filter on.
+
+        :returns: The filtered queryset.
+        """
+        if not self.is_valid():
+            return queryset
+
+        start_date = self.cleaned_data['start_date']
+        end_date = self.cleaned_data['end_date']
+
+        if start_date:
+            queryset = queryset.filter(**{f'{field}__gte': start_date})
+
+        if end_date:
+            queryset = queryset.filter(**{f'{field}__lte': end_date})
+
+        return queryset
@@ -17,6 +17,7 @@ class TallyForm(forms.ModelForm):
             "print_cover_in_clearance",
             "print_cover_in_quality_control",
             "print_cover_in_audit",
+            "auto_promote_matching_forms",
         ]
         widgets = {
             "pvp_mode": forms.Select(attrs={"class": "form-control"}),
@@ -50,6 +51,9 @@ class TallyForm(forms.ModelForm):
             "Enable Cover Printing in Quality Control"
         )
         self.fields["print_cover_in_audit"].label = _("Enable Cover Printing in Audit")
+        self.fields["auto_promote_matching_forms"].label = _(
+            "Promote Matching Forms Automatically"
+        )
 
     def clean(self):
         if self.is_valid():
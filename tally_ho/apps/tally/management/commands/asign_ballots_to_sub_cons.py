@@ -1,9 +1,6 @@
-import duckdb
 import logging
 from django.conf import settings
-from tally_ho.apps.tally.management.commands.utils import (
-    check_for_missing_columns
-)
+from tally_ho.apps.tally.management.commands.utils import read_csv_file
 from tally_ho.apps.tally.models.ballot import Ballot
 
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
@@ -11,7 +8,7 @@ from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.utils.numbers import parse_int
 from tally_ho.libs.utils.query_set_helpers import BulkUpdateManyToManyManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import delete_cached_model_instances_count
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +29,10 @@ def set_sub_constituencies_ballots_from_sub_con_ballots_file_data(
     :param command: stdout command.
     :returns: None."""
     try:
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        client = MemCache()
-        client.delete(instances_count_memcache_key)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
         sub_cons_instances_by_code =\
             {
                 sub_con.code:\
@@ -62,8 +58,7 @@ def set_sub_constituencies_ballots_from_sub_con_ballots_file_data(
             BulkUpdateManyToManyManager(
                 instances_count=len(sub_con_code_data),
                 cache_instances_count=True,
-                cache_key=instances_count_memcache_key,
-                memcache_client=client)
+                cache_key=instances_count_cache_key)
 
         for sub_con_code_tuple in sub_con_code_data:
             sub_con_code = parse_int(sub_con_code_tuple[0])
@@ -121,18 +116,15 @@ def async_asign_ballots_to_sub_cons_from_ballots_file(
     :returns: Sub Constituencies count."""
     try:
         tally = Tally.objects.get(id=tally_id)
-        file_path =\
-            csv_file_path
-        duckdb_sub_con_ballots_data =\
-            duckdb.from_csv_auto(file_path, header=True)
         sub_con_ballots_col_names =\
             getattr(settings,
                     'SUB_CONSTITUENCY_BALLOTS_COLUMN_NAMES')
-        check_for_missing_columns(
-            sub_con_ballots_col_names,
-            duckdb_sub_con_ballots_data.columns,
-            'sub constituency ballots'
-        )
+        duckdb_sub_con_ballots_data =\
+            read_csv_file(
+                csv_file_path,
+                sub_con_ballots_col_names,
+                'sub constituency ballots'
+            )
         set_sub_constituencies_ballots_from_sub_con_ballots_file_data(
             duckdb_sub_con_ballots_data=duckdb_sub_con_ballots_data,
             tally=tally,
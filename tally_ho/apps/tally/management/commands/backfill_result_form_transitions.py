@@ -0,0 +1,146 @@
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db.models import CharField, Min
+from django.db.models.functions import Cast
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy
+from reversion.models import Version
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_transition import (
+    ENTRY_VERSION_BY_STATE,
+    ResultFormTransition,
+)
+from tally_ho.libs.models.enums.form_state import FormState
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def version_transitions(versions):
+    """Return the unsaved transitions recorded by result form versions.
+
+    A version is a transition when its form state differs from the state
+    of the previous version of the same form.
+
+    :param versions: Result form versions ordered by object id and pk.
+
+    :returns: A generator of ResultFormTransition.
+    """
+    object_id = None
+    from_state = None
+
+    for version in versions:
+        fields = json.loads(version.serialized_data)[0]['fields']
+        to_state = fields.get('form_state')
+
+        if version.object_id != object_id:
+            object_id = version.object_id
+            from_state = None
+
+        if to_state is None:
+            continue
+
+        to_state = FormState(to_state)
+
+        if to_state == from_state:
+            continue
+
+        modified_date = fields.get('modified_date')
+
+        yield ResultFormTransition(
+            result_form_id=int(object_id),
+            tally_id=fields.get('tally'),
+            from_state=from_state,
+            to_state=to_state,
+            entry_version=ENTRY_VERSION_BY_STATE.get(from_state),
+            user_id=fields.get('user'),
+            created_date=parse_datetime(modified_date)
+            if modified_date else version.revision.date_created)
+        from_state = to_state
+
+
+def backfill_result_form_transitions(tally_id=None,
+                                     batch_size=DEFAULT_BATCH_SIZE):
+    """Create the transitions of result forms from their versions.
+
+    Only transitions older than the oldest logged transition of a form are
+    created, so the backfill can run again, or after forms were saved with
+    the log in place, without creating duplicates.
+
+    :param tally_id: Only backfill the result forms of this tally.
+    :param batch_size: The number of versions read, and transitions
+        written, per query.
+
+    :returns: The number of transitions created.
+    """
+    result_forms = ResultForm.objects.all()
+    versions = Version.objects.filter(
+        content_type=ContentType.objects.get_for_model(ResultForm))
+
+    if tally_id is not None:
+        result_forms = result_forms.filter(tally_id=tally_id)
+        versions = versions.filter(object_id__in=result_forms.annotate(
+            object_id=Cast('pk', CharField())).values('object_id'))
+
+    result_form_ids = set(result_forms.values_list('pk', flat=True))
+    logged_since = dict(
+        ResultFormTransition.objects
+        .filter(result_form__in=result_forms)
+        .values('result_form')
+        .annotate(oldest=Min('created_date'))
+        .values_list('result_form', 'oldest'))
+
+    versions = versions.select_related('revision')\
+        .only('object_id', 'serialized_data', 'revision__date_created')\
+        .order_by('object_id', 'pk')\
+        .iterator(chunk_size=batch_size)
+
+    created = 0
+    batch = []
+
+    for transition in version_transitions(versions):
+        result_form_id = transition.result_form_id
+        oldest = logged_since.get(result_form_id)
+
+        if result_form_id not in result_form_ids or\
+                (oldest and transition.created_date >= oldest):
+            continue
+
+        batch.append(transition)
+
+        if len(batch) >= batch_size:
+            created += len(
+                ResultFormTransition.objects.bulk_create(batch))
+            batch = []
+
+    if batch:
+        created += len(ResultFormTransition.objects.bulk_create(batch))
+
+    return created
+
+
+class Command(BaseCommand):
+    help = gettext_lazy(
+        "Create the result form transition log from reversion versions.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tally-id',
+            type=int,
+            default=None,
+            help='Only backfill the result forms of this tally'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Versions read and transitions written per query'
+        )
+
+    def handle(self, *args, **options):
+        count = backfill_result_form_transitions(
+            tally_id=options['tally_id'],
+            batch_size=options['batch_size'])
+        self.stdout.write(f'Created {count} result form transitions.')
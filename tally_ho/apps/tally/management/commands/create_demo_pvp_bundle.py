@@ -14,6 +14,7 @@ from django.core.management.base import BaseCommand, CommandError
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.pvp.bundle import (
     CSV_NAME,
     IMAGE_COLUMNS,
@@ -60,7 +61,7 @@ def create_demo_pvp_bundle(tally, output):
     rows = list(_build_rows(tally))
     if not rows:
         raise CommandError(
-            f"tally {tally.id!r} has no result forms to bundle",
+            f"tally {tally.id!r} has no unsubmitted result forms to bundle",
         )
 
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
@@ -78,7 +79,11 @@ def create_demo_pvp_bundle(tally, output):
 
 def _build_rows(tally):
     forms = (
-        ResultForm.objects.filter(tally=tally)
+        ResultForm.objects.filter(
+            tally=tally,
+            form_state=FormState.UNSUBMITTED,
+            ballot__isnull=False,
+        )
         .select_related("ballot")
         .order_by("barcode")
     )
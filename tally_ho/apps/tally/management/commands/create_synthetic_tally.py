@@ -0,0 +1,555 @@
+"""Generate a large, reproducible tally for benchmarks and load tests.
+
+The tally is shaped like a national election: regions contain offices,
+offices contain sub constituencies, and each sub constituency has centers
+with stations that vote on a number of ballots. Every station gets one
+result form per ballot of its sub constituency, and the forms are spread
+over the workflow states by weight. Forms that passed data entry get
+reconciliation forms and results for each entry, and every form gets the
+transitions that led to its state.
+
+The same sizes and seed always produce the same tally. The defaults build
+about 50,000 result forms and 5 million results. Rows are written with
+``bulk_create`` and PostgreSQL ``COPY`` rather than ``save``, so signals
+and ``ResultForm.save`` hooks do not run.
+"""
+import datetime
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+
+from tally_ho.apps.tally.management.commands.create_demo_tally import (
+    _delete_tally_cascade,
+    _grant_super_admin_access,
+)
+from tally_ho.apps.tally.models.ballot import Ballot
+from tally_ho.apps.tally.models.candidate import Candidate
+from tally_ho.apps.tally.models.center import Center
+from tally_ho.apps.tally.models.constituency import Constituency
+from tally_ho.apps.tally.models.electrol_race import ElectrolRace
+from tally_ho.apps.tally.models.office import Office
+from tally_ho.apps.tally.models.reconciliation_form import (
+    ReconciliationForm,
+)
+from tally_ho.apps.tally.models.region import Region
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_transition import (
+    ENTRY_VERSION_BY_STATE,
+    ResultFormTransition,
+)
+from tally_ho.apps.tally.models.station import Station
+from tally_ho.apps.tally.models.sub_constituency import SubConstituency
+from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.models.enums.gender import Gender
+from tally_ho.libs.models.enums.race_type import RaceType
+from tally_ho.libs.verify.quarantine_checks import (
+    create_quarantine_checks as ensure_quarantine_checks,
+)
+
+DEFAULT_NAME = "Synthetic Tally"
+DEFAULT_SEED = 1
+BARCODE_START = 20000000001
+BATCH_SIZE = 5000
+USERNAME = "synthetic_clerk"
+MAX_CANDIDATE_VOTES = 60
+MAX_INVALID_VOTES = 20
+
+DEFAULT_SIZES = {
+    "regions": 5,
+    "offices_per_region": 4,
+    "sub_cons_per_office": 5,
+    "centers_per_sub_con": 25,
+    "stations_per_center": 10,
+    "ballots": 200,
+    "ballots_per_sub_con": 2,
+    "candidates_per_ballot": 50,
+    "duplicates": 500,
+    "replacements": 500,
+}
+
+DEFAULT_FORM_STATES = {
+    FormState.ARCHIVED: 55,
+    FormState.UNSUBMITTED: 15,
+    FormState.INTAKE: 5,
+    FormState.DATA_ENTRY_1: 5,
+    FormState.DATA_ENTRY_2: 5,
+    FormState.CORRECTION: 3,
+    FormState.QUALITY_CONTROL: 5,
+    FormState.CLEARANCE: 2,
+    FormState.AUDIT: 5,
+}
+
+# The states a form passes through to reach each state.
+STATE_PATHS = {
+    FormState.UNSUBMITTED: (FormState.UNSUBMITTED,),
+    FormState.CLEARANCE: (FormState.UNSUBMITTED, FormState.CLEARANCE),
+    FormState.INTAKE: (FormState.UNSUBMITTED, FormState.INTAKE),
+    FormState.DATA_ENTRY_1: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1),
+    FormState.DATA_ENTRY_2: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1,
+        FormState.DATA_ENTRY_2),
+    FormState.CORRECTION: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1,
+        FormState.DATA_ENTRY_2, FormState.CORRECTION),
+    FormState.QUALITY_CONTROL: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1,
+        FormState.DATA_ENTRY_2, FormState.QUALITY_CONTROL),
+    FormState.ARCHIVED: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1,
+        FormState.DATA_ENTRY_2, FormState.QUALITY_CONTROL,
+        FormState.ARCHIVED),
+    FormState.AUDIT: (
+        FormState.UNSUBMITTED, FormState.INTAKE, FormState.DATA_ENTRY_1,
+        FormState.DATA_ENTRY_2, FormState.QUALITY_CONTROL,
+        FormState.AUDIT),
+}
+
+# A form has results of an entry version once it left the state producing
+# them, final results are written when the entries match.
+ENTRY_VERSIONS_BY_STATE = {
+    state: [
+        ENTRY_VERSION_BY_STATE[passed] for passed in path[:-1]
+        if passed in ENTRY_VERSION_BY_STATE
+    ] + ([EntryVersion.FINAL] if FormState.QUALITY_CONTROL in path else [])
+    for state, path in STATE_PATHS.items()
+}
+
+
+def parse_form_states(value):
+    """Parse form state weights from ``STATE=WEIGHT,...``.
+
+    :param value: A comma separated list of form state names and weights,
+        e.g. ``ARCHIVED=60,UNSUBMITTED=40``.
+
+    :returns: A dict of FormState to weight.
+    """
+    form_states = {}
+
+    for item in value.split(","):
+        name, _, weight = item.strip().partition("=")
+
+        try:
+            form_state = FormState[name.strip().upper()]
+            form_states[form_state] = float(weight)
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid form state weight: {item!r}")
+
+        if form_state not in STATE_PATHS:
+            raise ValueError(f"Form state {form_state.name} is not supported")
+
+    return form_states
+
+
+def _copy_rows(model, fields, rows):
+    """Write rows to a model's table with PostgreSQL ``COPY``.
+
+    :param model: The model of the table.
+    :param fields: The names of the model fields in each row.
+    :param rows: An iterable of tuples of database values.
+
+    :returns: The number of rows written.
+    """
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(field).column)
+        for field in fields)
+    sql = (f"COPY {connection.ops.quote_name(model._meta.db_table)} "
+           f"({columns}) FROM STDIN")
+    count = 0
+
+    with connection.cursor() as cursor:
+        with cursor.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+
+    return count
+
+
+def _form_votes(form_seed, candidates_count, entry_version):
+    """Return the candidate votes of a form entry.
+
+    Votes are derived from the form seed so the reconciliation form and
+    results agree without keeping the votes of every form in memory. The
+    second entry differs from the first for some forms, as clerks make
+    mistakes that corrections resolve.
+    """
+    rng = random.Random(form_seed)
+    votes = [rng.randint(0, MAX_CANDIDATE_VOTES)
+             for _ in range(candidates_count)]
+
+    if entry_version == EntryVersion.DATA_ENTRY_2 and form_seed % 10 == 0:
+        votes[0] += 1
+
+    return votes
+
+
+def _create_geography(tally, rng, sizes):
+    regions = Region.objects.bulk_create([
+        Region(name=f"Region {number}", tally=tally)
+        for number in range(1, sizes["regions"] + 1)
+    ])
+    offices = Office.objects.bulk_create([
+        Office(name=f"Office {region_number}-{number}",
+               number=(region_number - 1) * sizes["offices_per_region"] +
+               number,
+               region=region,
+               tally=tally)
+        for region_number, region in enumerate(regions, 1)
+        for number in range(1, sizes["offices_per_region"] + 1)
+    ])
+    constituencies = Constituency.objects.bulk_create([
+        Constituency(name=f"Constituency {office.number}", tally=tally)
+        for office in offices
+    ])
+
+    sub_cons = SubConstituency.objects.bulk_create([
+        SubConstituency(
+            code=code,
+            name=f"Sub Constituency {code}",
+            constituency=constituency,
+            number_of_ballots=sizes["ballots_per_sub_con"],
+            tally=tally)
+        for code, constituency in enumerate((
+            constituency for constituency in constituencies
+            for _ in range(sizes["sub_cons_per_office"])), 1)
+    ])
+    offices_by_constituency = dict(zip(constituencies, offices))
+
+    centers = Center.objects.bulk_create([
+        Center(
+            code=sub_con.code * 1000 + number,
+            name=f"Center {sub_con.code}-{number}",
+            office=offices_by_constituency[sub_con.constituency],
+            region=offices_by_constituency[
+                sub_con.constituency].region.name,
+            sub_constituency=sub_con,
+            constituency=sub_con.constituency,
+            tally=tally)
+        for sub_con in sub_cons
+        for number in range(1, sizes["centers_per_sub_con"] + 1)
+    ], batch_size=BATCH_SIZE)
+
+    stations = Station.objects.bulk_create([
+        Station(
+            center=center,
+            sub_constituency=center.sub_constituency,
+            station_number=number,
+            gender=Gender.MALE if number % 2 else Gender.FEMALE,
+            registrants=rng.randint(300, 600),
+            tally=tally)
+        for center in centers
+        for number in range(1, sizes["stations_per_center"] + 1)
+    ], batch_size=BATCH_SIZE)
+
+    return sub_cons, stations
+
+
+def _create_ballots(tally, sub_cons, sizes):
+    races = ElectrolRace.objects.bulk_create([
+        ElectrolRace(election_level="Parliamentary",
+                     ballot_name=f"Ballot {number}",
+                     tally=tally)
+        for number in range(1, sizes["ballots"] + 1)
+    ])
+    ballots = Ballot.objects.bulk_create([
+        Ballot(number=number,
+               race_type=RaceType.GENERAL,
+               electrol_race=race,
+               tally=tally)
+        for number, race in enumerate(races, 1)
+    ])
+    candidates = Candidate.objects.bulk_create([
+        Candidate(
+            ballot=ballot,
+            electrol_race=ballot.electrol_race,
+            candidate_id=(ballot.number - 1) *
+            sizes["candidates_per_ballot"] + order,
+            full_name=f"Candidate {order} (Ballot {ballot.number})",
+            order=order,
+            race_type=RaceType.GENERAL,
+            tally=tally)
+        for ballot in ballots
+        for order in range(1, sizes["candidates_per_ballot"] + 1)
+    ], batch_size=BATCH_SIZE)
+
+    # Sub constituencies share ballots round robin, as neighbouring sub
+    # constituencies do in a national election.
+    ballots_by_sub_con = {
+        sub_con.pk: [
+            ballots[(index * sizes["ballots_per_sub_con"] + offset) %
+                    len(ballots)]
+            for offset in range(sizes["ballots_per_sub_con"])
+        ]
+        for index, sub_con in enumerate(sub_cons)
+    }
+    SubConstituency.ballots.through.objects.bulk_create([
+        SubConstituency.ballots.through(
+            subconstituency_id=sub_con_id, ballot_id=ballot.pk)
+        for sub_con_id, sub_con_ballots in ballots_by_sub_con.items()
+        for ballot in sub_con_ballots
+    ], batch_size=BATCH_SIZE)
+
+    candidate_ids = {}
+    for candidate in candidates:
+        candidate_ids.setdefault(candidate.ballot_id, []).append(
+            candidate.pk)
+
+    return ballots_by_sub_con, candidate_ids
+
+
+def _create_result_forms(tally, rng, stations, ballots_by_sub_con,
+                         form_states, sizes):
+    states = list(form_states)
+    weights = [form_states[state] for state in states]
+    forms = [
+        ResultForm(
+            ballot=ballot,
+            center=station.center,
+            office=station.center.office,
+            station_number=station.station_number,
+            gender=station.gender,
+            form_state=rng.choices(states, weights)[0],
+            tally=tally)
+        for station in stations
+        for ballot in ballots_by_sub_con[station.sub_constituency_id]
+    ]
+
+    # Duplicates are a second form for a station and ballot received at
+    # intake, replacements are blank forms handed out at intake.
+    for original in rng.sample(forms, min(sizes["duplicates"], len(forms))):
+        forms.append(ResultForm(
+            ballot=original.ballot,
+            center=original.center,
+            office=original.office,
+            station_number=original.station_number,
+            gender=original.gender,
+            form_state=FormState.INTAKE,
+            tally=tally))
+
+    forms.extend(
+        ResultForm(form_state=FormState.UNSUBMITTED,
+                   is_replacement=True,
+                   tally=tally)
+        for _ in range(sizes["replacements"]))
+
+    for serial_number, form in enumerate(forms):
+        form.barcode = str(BARCODE_START + serial_number)
+        form.serial_number = BARCODE_START + serial_number
+        form.previous_form_state = STATE_PATHS[form.form_state][-2]\
+            if len(STATE_PATHS[form.form_state]) > 1 else None
+
+    return ResultForm.objects.bulk_create(forms, batch_size=BATCH_SIZE)
+
+
+def _write_entries(tally, user, forms, form_seeds, registrants,
+                   candidate_ids, start):
+    """Write the transitions, reconciliation forms and results of forms."""
+    transitions = _copy_rows(
+        ResultFormTransition,
+        ["result_form", "tally", "from_state", "to_state",
+         "entry_version", "user", "created_date"],
+        (
+            (form.pk, tally.pk,
+             path[index - 1].value if index else None,
+             state.value,
+             ENTRY_VERSION_BY_STATE[path[index - 1]].value
+             if index and path[index - 1] in ENTRY_VERSION_BY_STATE
+             else None,
+             user.pk,
+             start + datetime.timedelta(minutes=form_seeds[form.pk] % 600 +
+                                        index * 45))
+            for form in forms
+            for path in [STATE_PATHS[form.form_state]]
+            for index, state in enumerate(path)
+        ))
+
+    entered = [
+        (form, entry_version)
+        for form in forms
+        for entry_version in ENTRY_VERSIONS_BY_STATE[form.form_state]
+        if form.ballot_id
+    ]
+
+    reconciliation_forms = _copy_rows(
+        ReconciliationForm,
+        ["result_form", "tally", "user", "active", "entry_version",
+         "number_of_voters", "number_of_voter_cards_in_the_ballot_box",
+         "number_invalid_votes", "number_valid_votes",
+         "number_sorted_and_counted", "created_date", "modified_date"],
+        (
+            (form.pk, tally.pk, user.pk, True, entry_version.value,
+             registrants[form.pk], valid + invalid, invalid, valid,
+             valid + invalid, start, start)
+            for form, entry_version in entered
+            for valid in [sum(_form_votes(
+                form_seeds[form.pk], len(candidate_ids[form.ballot_id]),
+                entry_version))]
+            for invalid in [form_seeds[form.pk] % MAX_INVALID_VOTES]
+        ))
+
+    results = _copy_rows(
+        Result,
+        ["candidate", "result_form", "tally", "user", "active",
+         "entry_version", "votes", "created_date", "modified_date"],
+        (
+            (candidate_id, form.pk, tally.pk, user.pk, True,
+             entry_version.value, votes, start, start)
+            for form, entry_version in entered
+            for candidate_id, votes in zip(
+                candidate_ids[form.ballot_id],
+                _form_votes(form_seeds[form.pk],
+                            len(candidate_ids[form.ballot_id]),
+                            entry_version))
+        ))
+
+    return transitions, reconciliation_forms, results
+
+
+def create_synthetic_tally(name=DEFAULT_NAME, seed=DEFAULT_SEED,
+                           form_states=None, clean=False, **sizes):
+    """Create a synthetic tally and return it with the created row counts.
+
+    :param name: The tally name, it must not be used by another tally.
+    :param seed: The seed of every random choice.
+    :param form_states: A dict of FormState to the weight of forms in that
+        state, defaults to ``DEFAULT_FORM_STATES``.
+    :param clean: Delete an existing tally with the same name first.
+    :param sizes: Overrides of ``DEFAULT_SIZES``.
+
+    :returns: A tuple of the tally and a dict of model names to counts.
+    """
+    unknown = set(sizes) - set(DEFAULT_SIZES)
+    if unknown:
+        raise ValueError(f"Unknown sizes: {', '.join(sorted(unknown))}")
+
+    sizes = {**DEFAULT_SIZES, **{
+        key: value for key, value in sizes.items() if value is not None}}
+    form_states = form_states or DEFAULT_FORM_STATES
+    rng = random.Random(seed)
+    start = timezone.now() - datetime.timedelta(days=7)
+
+    with transaction.atomic():
+        if clean:
+            for tally in Tally.objects.filter(name=name):
+                Result.objects.filter(tally=tally).delete()
+                ReconciliationForm.objects.filter(tally=tally).delete()
+                SubConstituency.ballots.through.objects.filter(
+                    subconstituency__tally=tally).delete()
+            _delete_tally_cascade(name)
+
+        if Tally.objects.filter(name=name).exists():
+            raise ValueError(f"A tally named {name!r} already exists")
+
+        tally = Tally.objects.create(name=name)
+        user, _ = UserProfile.objects.get_or_create(
+            username=USERNAME, defaults={"first_name": "Synthetic"})
+
+        sub_cons, stations = _create_geography(tally, rng, sizes)
+        ballots_by_sub_con, candidate_ids = _create_ballots(
+            tally, sub_cons, sizes)
+        forms = _create_result_forms(
+            tally, rng, stations, ballots_by_sub_con, form_states, sizes)
+
+        form_seeds = {form.pk: rng.getrandbits(32) for form in forms}
+        stations_by_key = {
+            (station.center_id, station.station_number): station
+            for station in stations
+        }
+        registrants = {
+            form.pk: stations_by_key[
+                (form.center_id, form.station_number)].registrants
+            for form in forms if form.center_id
+        }
+
+        transitions, reconciliation_forms, results = _write_entries(
+            tally, user, forms, form_seeds, registrants, candidate_ids,
+            start)
+
+        ensure_quarantine_checks(tally_id=tally.id)
+        _grant_super_admin_access(tally)
+
+    return tally, {
+        "centers": len({station.center_id for station in stations}),
+        "stations": len(stations),
+        "ballots": len(candidate_ids),
+        "candidates": sum(len(ids) for ids in candidate_ids.values()),
+        "result_forms": len(forms),
+        "transitions": transitions,
+        "reconciliation_forms": reconciliation_forms,
+        "results": results,
+    }
+
+
+class Command(BaseCommand):
+    help = gettext_lazy(
+        "Generate a large synthetic tally for benchmarks and load tests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--name",
+            default=DEFAULT_NAME,
+            help="Tally name.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=DEFAULT_SEED,
+            help="Seed of the random generator, the same seed and sizes "
+                 "always produce the same tally.",
+        )
+        parser.add_argument(
+            "--clean",
+            action="store_true",
+            help="Delete any existing tally with the same name first.",
+        )
+        parser.add_argument(
+            "--form-states",
+            type=parse_form_states,
+            default=None,
+            help="Weights of the form states, e.g. "
+                 "ARCHIVED=60,DATA_ENTRY_1=10,UNSUBMITTED=30.",
+        )
+
+        for size, default in DEFAULT_SIZES.items():
+            parser.add_argument(
+                f"--{size.replace('_', '-')}",
+                dest=size,
+                type=int,
+                default=default,
+                help=f"Default {default}.",
+            )
+
+    def handle(self, *args, **options):
+        sizes = {size: options[size] for size in DEFAULT_SIZES}
+        started = time.monotonic()
+
+        try:
+            tally, counts = create_synthetic_tally(
+                name=options["name"],
+                seed=options["seed"],
+                form_states=options["form_states"],
+                clean=options["clean"],
+                **sizes,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(", ".join(
+            f"{model}={count}" for model, count in counts.items()))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synthetic tally ready: id={tally.id}, "
+                f"name={tally.name!r}, "
+                f"seconds={time.monotonic() - started:.1f}"
+            )
+        )
@@ -0,0 +1,103 @@
+"""Celery task writing the PowerPoint export of a tally's results.
+
+Views queue it with ``.delay()`` and poll its progress, so large decks
+are not built inside a request, see ``get_export``.
+"""
+import os
+import uuid
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext_lazy
+
+from tally_ho.apps.tally.views.reports.helpers import (
+    get_results_export_queryset,
+)
+from tally_ho.celeryapp import app
+from tally_ho.libs.reports.results_presentation import (
+    get_results_presentation_dir,
+    remove_old_results_presentations,
+    results_presentation_cache_key,
+    write_results_presentation,
+)
+from tally_ho.libs.utils import analytics
+from tally_ho.libs.utils.numbers import parse_int
+
+
+def export_results_presentation(tally_id, data, export_id, cache_key=None):
+    """Write the PowerPoint export of a tally's results.
+
+    :param tally_id: The tally to export results of.
+    :param data: The export's filter values, see
+        ``get_results_export_queryset``.
+    :param export_id: A unique id of the export, part of its file name.
+    :param cache_key: The key to report the slides written under.
+
+    :returns: A tuple of the path of the file and the number of slides
+        written, the path is None if no results match the filters.
+    """
+    directory = get_results_presentation_dir(tally_id)
+    os.makedirs(directory, exist_ok=True)
+    remove_old_results_presentations(directory)
+    path = os.path.join(
+        directory, f"election_results_{date.today():%Y%m%d}_{export_id}.pptx"
+    )
+    slides = write_results_presentation(
+        analytics.fetch(
+            get_results_export_queryset(tally_id, data), from_snapshot=True
+        ),
+        path,
+        tally_id,
+        limit=parse_int(data.get("export_number")),
+        cache_key=cache_key,
+    )
+
+    return (path if slides else None), slides
+
+
+@app.task(bind=True)
+def async_export_results_presentation(self, tally_id=None, data=None):
+    """Write the PowerPoint export of a tally's results.
+
+    The slides written are reported in the cache under
+    ``results_presentation_cache_key``.
+
+    :param tally_id: The tally to export results of.
+    :param data: The export's filter values.
+
+    :returns: The file name of the export, None if no results match the
+        filters.
+    """
+    export_id = self.request.id or uuid.uuid4().hex
+    path, _ = export_results_presentation(
+        tally_id,
+        data,
+        export_id,
+        cache_key=results_presentation_cache_key(tally_id, export_id),
+    )
+
+    return path and os.path.basename(path)
+
+
+class Command(BaseCommand):
+    help = gettext_lazy("Write the PowerPoint export of a tally's results.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("tally_id", type=int)
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Only show this many leading candidates per race.",
+        )
+
+    def handle(self, *args, **kwargs):
+        path, slides = export_results_presentation(
+            kwargs["tally_id"],
+            {"export_number": kwargs["limit"]},
+            uuid.uuid4().hex,
+        )
+
+        if path is None:
+            self.stdout.write("No results to export.")
+        else:
+            self.stdout.write(f"Wrote {slides} slides to {path}.")
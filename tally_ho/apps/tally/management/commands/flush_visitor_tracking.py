@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext_lazy
+
+from tally_ho.celeryapp import app
+from tally_ho.libs.utils import visitor_tracking
+
+
+@app.task()
+def flush_visitor_tracking():
+    """Write the visitor tracking events buffered in Redis.
+
+    Scheduled by ``CELERY_BEAT_SCHEDULE``. With the memory backend this
+    only flushes the buffer of the worker process running the task.
+
+    :returns: The number of events written.
+    """
+    return visitor_tracking.flush()
+
+
+class Command(BaseCommand):
+    help = gettext_lazy("Write buffered visitor tracking events.")
+
+    def handle(self, *args, **kwargs):
+        count = flush_visitor_tracking()
+        self.stdout.write(f'Wrote {count} visitor tracking events.')
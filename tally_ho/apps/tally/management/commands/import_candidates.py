@@ -1,12 +1,11 @@
-import duckdb
 import logging
 
 from django.conf import settings
 from tally_ho.apps.tally.management.commands.utils import (
     build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_for_missing_columns,
     get_ballot_by_ballot_number,
     get_electrol_race_by_ballot_name,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.candidate import Candidate
@@ -14,7 +13,11 @@ from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import (
+    REFERENCE_DATA,
+    delete_cached_model_instances_count,
+    invalidate_tally_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +44,10 @@ def create_candidates_from_candidates_file_data(
     :param command: stdout command.
     :returns: None"""
     try:
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        client = MemCache()
-        client.delete(instances_count_memcache_key)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
         candidate_foreign_key_fields =\
                     ['ballot', 'electrol_race']
         col_names_to_model_field_map =\
@@ -60,8 +62,7 @@ def create_candidates_from_candidates_file_data(
         bulk_mgr = BulkCreateManager(
             chunk_size=1000,
             cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=client,
+            cache_key=instances_count_cache_key,
         )
 
         for candidate_vals_tuple in candidates_data:
@@ -127,9 +128,12 @@ def build_candidate_id_by_ballot_order_dict(ballot_order_file_path):
                 getattr(settings,
                         'BALLOT_ORDER_COLUMN_NAMES')
         duckdb_ballot_order_data =\
-            duckdb.from_csv_auto(ballot_order_file_path, header=True).project(
-                    ','.join(
-            ballot_order_column_list)).distinct().fetchall()
+            read_csv_file(
+                ballot_order_file_path,
+                ballot_order_column_list,
+                'ballot order'
+            ).project(','.join(
+                ballot_order_column_list)).distinct().fetchall()
         candidate_id_by_ballot_order =\
             { item[0]: item[1] for item in duckdb_ballot_order_data }
         return candidate_id_by_ballot_order
@@ -152,17 +156,11 @@ def async_import_candidates_from_candidates_file(
     :returns: candidates count."""
     try:
         tally = Tally.objects.get(id=tally_id)
-        candidates_file_path = csv_file_path
-        duckdb_candidates_data =\
-            duckdb.from_csv_auto(candidates_file_path, header=True)
         candidate_col_names =\
             getattr(settings,
                     'CANDIDATE_COLUMN_NAMES')
-        check_for_missing_columns(
-            candidate_col_names,
-            duckdb_candidates_data.columns,
-            'candidates'
-        )
+        duckdb_candidates_data =\
+            read_csv_file(csv_file_path, candidate_col_names, 'candidates')
         ballot_order_file_path = kwargs.get('ballot_order_file_path')
         candidate_id_by_ballot_order_dict =\
             build_candidate_id_by_ballot_order_dict(
@@ -191,6 +189,9 @@ def async_import_candidates_from_candidates_file(
             command=command,
         )
 
+        # Rows created in bulk are not saved one by one.
+        invalidate_tally_cache(tally.id, REFERENCE_DATA)
+
         return duckdb_candidates_data.shape[0]
     except Exception as e:
         msg = f'Error occured while trying to create candidates: {e}'
@@ -1,13 +1,12 @@
-import duckdb
 import logging
 from django.conf import settings
 from tally_ho.apps.tally.management.commands.utils import (
     build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_for_missing_columns,
     get_constituency_by_name,
     get_office_by_office_name_and_region_name,
     get_region_by_name,
-    get_sub_constituency_by_code
+    get_sub_constituency_by_code,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.center import Center
 from tally_ho.apps.tally.models.constituency import Constituency
@@ -19,7 +18,7 @@ from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.enums.center_type import CenterType
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import delete_cached_model_instances_count
 
 logger = logging.getLogger(__name__)
 
@@ -156,11 +155,10 @@ def create_centers_from_centers_file_data(
     :param command: stdout command.
     :returns: None"""
     try:
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        client = MemCache()
-        client.delete(instances_count_memcache_key)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
         centers_foreign_key_fields =\
                     ['region', 'office', 'constituency',
                      'sub_constituency', 'center_type']
@@ -175,8 +173,7 @@ def create_centers_from_centers_file_data(
             center_cols_names_list)).distinct().fetchall()
         bulk_mgr = BulkCreateManager(
             cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=client,
+            cache_key=instances_count_cache_key,
         )
 
         for center_vals_tuple in centers_data:
@@ -266,17 +263,12 @@ def async_import_centers_from_centers_file(
     :returns: candidates count."""
     try:
         tally = Tally.objects.get(id=tally_id)
-        centers_file_path = csv_file_path
-        duckdb_centers_data =\
-            duckdb.from_csv_auto(centers_file_path, header=True).distinct()
         center_col_names =\
             getattr(settings,
                     'CENTER_COLUMN_NAMES')
-        check_for_missing_columns(
-            center_col_names,
-            duckdb_centers_data.columns,
-            'centers'
-        )
+        duckdb_centers_data =\
+            read_csv_file(
+                csv_file_path, center_col_names, 'centers').distinct()
         create_regions_from_centers_file_data(
             duckdb_centers_data=duckdb_centers_data,
             tally=tally,
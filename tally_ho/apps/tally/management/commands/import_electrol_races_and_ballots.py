@@ -1,4 +1,3 @@
-import duckdb
 import logging
 from django.conf import settings
 from tally_ho.apps.tally.models.ballot import Ballot
@@ -6,14 +5,14 @@ from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 from tally_ho.apps.tally.management.commands.utils import (
     build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_for_missing_columns,
-    generate_duckdb_electrol_race_str_query
+    generate_duckdb_electrol_race_str_query,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.utils.numbers import parse_int
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import delete_cached_model_instances_count
 
 logger = logging.getLogger(__name__)
 
@@ -66,24 +65,21 @@ def create_ballots_from_ballot_file_data(
         electrol_races=None,
         tally=None,
         command=None,
-        instances_count_memcache_key=None,
-        memcache_client=None,
+        instances_count_cache_key=None,
 ):
     """Create ballots from ballot file data inside duckdb.
 
     :param duckdb_ballots_data: Ballot file data in duckdb format.
     :param electrol_races: Tally electrol races queryset.
     :param tally: tally queryset.
-    :param instances_count_memcache_key: instances count memcache key.
-    :param memcache_client: memcache client.
+    :param instances_count_cache_key: instances count cache key.
     :param command: stdout command.
     :returns: None."""
     try:
         bulk_mgr = BulkCreateManager(
             objs_count=len(duckdb_ballots_data.distinct().fetchall()),
             cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=memcache_client,)
+            cache_key=instances_count_cache_key,)
         ballot_name_column_name =\
             getattr(settings,
                     'BALLOT_NAME_COLUMN_NAME_IN_BALLOT_FILE')
@@ -132,21 +128,16 @@ def async_import_electrol_races_and_ballots_from_ballots_file(
         tally = Tally.objects.get(id=tally_id)
         step_number = kwargs.get('step_number')
         step_name=kwargs.get('step_name')
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        memcache_client = MemCache()
-        memcache_client.delete(instances_count_memcache_key)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
 
-        ballots_data = duckdb.from_csv_auto(csv_file_path, header=True)
         ballots_col_names =\
             getattr(settings,
                     'BALLOT_COLUMN_NAMES')
-        check_for_missing_columns(
-            ballots_col_names,
-            ballots_data.columns,
-            'ballots'
-        )
+        ballots_data =\
+            read_csv_file(csv_file_path, ballots_col_names, 'ballots')
         create_electrol_races_from_ballot_file_data(
             duckdb_ballots_data=ballots_data,
             tally=tally,
@@ -159,8 +150,7 @@ def async_import_electrol_races_and_ballots_from_ballots_file(
             electrol_races=electrol_races,
             tally=tally,
             command=command,
-            instances_count_memcache_key=instances_count_memcache_key,
-            memcache_client=memcache_client
+            instances_count_cache_key=instances_count_cache_key,
         )
 
         return len(ballots_data.fetchall())
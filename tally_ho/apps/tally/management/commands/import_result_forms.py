@@ -1,14 +1,14 @@
 import duckdb
 import logging
+import tempfile
 
 from django.conf import settings
+from django.db import connections, router
 from tally_ho.apps.tally.management.commands.utils import (
-    build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_duplicates,
-    check_for_missing_columns,
-    find_missing_center_codes,
-    get_ballot_by_ballot_number,
-    get_office_by_office_name_and_region_name,
+    MissingReferencesError,
+    copy_duckdb_relation_to_model,
+    copy_queryset_to_duckdb,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.center import Center
@@ -18,153 +18,220 @@ from tally_ho.apps.tally.models.station import Station
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.gender import Gender
-from tally_ho.libs.utils.numbers import parse_int
-from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import (
+    REFERENCE_DATA,
+    REPORTS,
+    delete_cached_model_instances_count,
+    invalidate_tally_cache,
+)
 
 logger = logging.getLogger(__name__)
 
-def get_result_form_center(
-        center_code,
-        result_form_station_number,
-        centers_by_code,
-        stations_by_number_underscore_center_code
-    ):
-    center = None
-    center_code = parse_int(center_code)
-    if center_code:
-        center =\
-            centers_by_code.get(center_code)
-        if center is None:
-            raise Center.DoesNotExist(
-                f'Center {center_code} does not exist')
-        station =\
-            stations_by_number_underscore_center_code.get(
-            f"{center_code}_{result_form_station_number}"
-            )
-        if station is None:
-            msg =\
-                str(f'Station {result_form_station_number} does not exist '
-                    f'for center {center_code}')
-            raise Station.DoesNotExist(msg)
+# Types the rows of the result forms file and matches them to the ids of
+# the tally's centers, stations, offices and ballots. Forms without a
+# center code are replacement forms.
+RESULT_FORMS_QUERY = """
+    CREATE TABLE result_forms AS
+    WITH rows AS (
+        SELECT DISTINCT
+            COALESCE(CAST(barcode AS VARCHAR), '') AS barcode,
+            NULLIF(CAST(name AS VARCHAR), '') AS name,
+            NULLIF(TRY_CAST(serial_number AS BIGINT), 0) AS serial_number,
+            NULLIF(TRY_CAST(station_number AS INTEGER), 0)
+                AS station_number,
+            NULLIF(UPPER(CAST(gender AS VARCHAR)), '') AS gender,
+            NULLIF(TRY_CAST(center_code AS INTEGER), 0) AS center_code,
+            NULLIF(TRIM(CAST(office_name AS VARCHAR)), '') AS office_name,
+            NULLIF(CAST(region_name AS VARCHAR), '') AS region_name,
+            TRY_CAST(ballot_number AS INTEGER) AS ballot_number
+        FROM result_forms_file
+    )
+    SELECT
+        rows.*,
+        genders.value AS gender_value,
+        centers.id AS center_id,
+        stations.station_number IS NOT NULL AS station_exists,
+        offices.id AS office_id,
+        ballots.id AS ballot_id
+    FROM rows
+    LEFT JOIN genders ON genders.name = rows.gender
+    LEFT JOIN centers ON centers.code = rows.center_code
+    LEFT JOIN stations
+        ON stations.center_code = rows.center_code
+        AND stations.station_number = rows.station_number
+    LEFT JOIN offices
+        ON offices.name = rows.office_name
+        AND offices.region_name = rows.region_name
+    LEFT JOIN (
+        SELECT number, max(id) AS id FROM ballots GROUP BY number
+    ) AS ballots ON ballots.number = rows.ballot_number
+"""
+
+MISSING_REFERENCES_QUERY = """
+    SELECT DISTINCT reference FROM (
+        SELECT concat('Center ', center_code, ' does not exist')
+            AS reference
+        FROM result_forms
+        WHERE center_code IS NOT NULL AND center_id IS NULL
+        UNION ALL
+        SELECT concat('Station ', station_number,
+                      ' does not exist for center ', center_code)
+        FROM result_forms
+        WHERE center_id IS NOT NULL AND NOT station_exists
+        UNION ALL
+        SELECT concat('Office ', office_name,
+                      ' does not exist for region ', region_name)
+        FROM result_forms
+        WHERE office_name IS NOT NULL
+            AND region_name IS NOT NULL
+            AND office_id IS NULL
+        UNION ALL
+        SELECT concat('Ballot ', ballot_number, ' does not exist')
+        FROM result_forms
+        WHERE ballot_id IS NULL
+    )
+    ORDER BY reference
+"""
+
+# The result form fields read from the file, in the order of the
+# columns the loader selects.
+RESULT_FORM_FILE_FIELDS = [
+    ('barcode', 'barcode'),
+    ('name', 'name'),
+    ('serial_number', 'serial_number'),
+    ('station_number', 'station_number'),
+    ('gender', 'gender_value'),
+    ('center', 'center_id'),
+    ('office', 'office_id'),
+    ('ballot', 'ballot_id'),
+    ('is_replacement', 'center_id IS NULL'),
+]
+
+def get_result_form_default_values(tally):
+    """Return the database values of the result form fields not read
+    from the result forms file.
+
+    :param tally: result forms tally.
+    :returns: A dict of field names to database values."""
+    file_fields = [field for field, _ in RESULT_FORM_FILE_FIELDS]
+    result_form = ResultForm(tally=tally, form_state=FormState.UNSUBMITTED)
+    connection = connections[router.db_for_write(ResultForm)]
+    default_values = {}
 
-    return center
+    for field in ResultForm._meta.concrete_fields:
+        if field.primary_key or field.name in file_fields:
+            continue
+
+        value = field.pre_save(result_form, True)
+        default_values[field.name] = field.get_db_prep_save(
+            value, connection=connection)
+
+    return default_values
+
+def load_result_forms_lookups(duckdb_connection, tally, directory):
+    """Create DuckDB tables of the tally's centers, stations, offices
+    and ballots, and of the genders, to match result forms to.
+
+    :param duckdb_connection: DuckDB connection of the result forms file.
+    :param tally: result forms tally.
+    :param directory: directory to write the exported rows in.
+    :returns: None"""
+    copy_queryset_to_duckdb(
+        duckdb_connection,
+        'centers',
+        Center.objects.filter(tally=tally).values_list('id', 'code'),
+        {'id': 'INTEGER', 'code': 'INTEGER'},
+        directory,
+    )
+    copy_queryset_to_duckdb(
+        duckdb_connection,
+        'stations',
+        Station.objects.filter(tally=tally).values_list(
+            'center__code', 'station_number'),
+        {'center_code': 'INTEGER', 'station_number': 'INTEGER'},
+        directory,
+    )
+    copy_queryset_to_duckdb(
+        duckdb_connection,
+        'offices',
+        Office.objects.filter(tally=tally).values_list(
+            'id', 'name', 'region__name'),
+        {'id': 'INTEGER', 'name': 'VARCHAR', 'region_name': 'VARCHAR'},
+        directory,
+    )
+    copy_queryset_to_duckdb(
+        duckdb_connection,
+        'ballots',
+        Ballot.objects.filter(tally=tally).values_list('id', 'number'),
+        {'id': 'INTEGER', 'number': 'INTEGER'},
+        directory,
+    )
+    duckdb_connection.execute(
+        'CREATE TABLE genders (name VARCHAR, value INTEGER)')
+    duckdb_connection.executemany(
+        'INSERT INTO genders VALUES (?, ?)',
+        [(gender.name, gender.value) for gender in Gender
+         if gender.name != 'CHOICES'])
 
 def create_result_forms_result_form_file_data(
+        duckdb_connection=None,
         duckdb_result_forms_data=None,
         tally=None,
-        ballots_by_ballot_number=None,
-        centers_by_code=None,
-        offices_by_name_underscore_region_name=None,
-        stations_by_number_underscore_center_code=None,
         step_number=7,
         step_name=None,
         command=None,
 ):
     """Create result forms from result forms file data inside duckdb.
 
+    Rows are matched to the tally's centers, stations, offices and
+    ballots with joins in duckdb, every missing reference is reported in
+    one error, and the rows are copied to the database without building
+    a ResultForm per row.
+
+    :param duckdb_connection: duckdb connection of the result forms data.
     :param duckdb_result_forms_data: result forms file data in duckdb format.
     :param tally: result forms tally.
-    :param ballots_by_ballot_number: ballots by ballot number dictionary.
-    :param centers_by_code: centers by code dictionary.
-    :param offices_by_name_underscore_region_name: offices by office name
-    underscore region name.
-    :param stations_by_number_underscore_center_code: stations by station
-    number underscore center code.
     :param step_number: Step number
     :param step_name: Step name
     :param command: stdout command.
     :returns: None"""
     try:
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        client = MemCache()
-        client.delete(instances_count_memcache_key)
-        genders_by_name =\
-            {
-                gender.name: gender for gender in Gender\
-                    if gender.name != 'CHOICES'
-            }
-        result_form_foreign_key_fields =\
-                    ['center', 'office', 'ballot', 'gender']
-        col_names_to_model_field_map =\
-            getattr(settings,
-                    'RESULT_FORM_FILE_COLS_NAMES_TO_RESULT_FORM_MODEL_FIELDS')
-        result_forms_cols_names_list =\
-            list(col_names_to_model_field_map.keys())
-        result_forms_data =\
-                    duckdb_result_forms_data.project(
-                    ','.join(
-            result_forms_cols_names_list)).distinct().fetchall()
-        bulk_mgr = BulkCreateManager(
-            chunk_size=1000,
-            cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=client,
-        )
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
+        duckdb_result_forms_data.create_view('result_forms_file')
+
+        with tempfile.TemporaryDirectory() as directory:
+            load_result_forms_lookups(duckdb_connection, tally, directory)
+            duckdb_connection.execute(RESULT_FORMS_QUERY)
+            missing_references = [
+                row[0] for row in duckdb_connection.execute(
+                    MISSING_REFERENCES_QUERY).fetchall()]
+
+            if missing_references:
+                raise MissingReferencesError(missing_references)
+
+            default_values = get_result_form_default_values(tally)
+            columns = [column for _, column in RESULT_FORM_FILE_FIELDS] +\
+                ['CAST(? AS VARCHAR)'] * len(default_values)
+            result_forms = duckdb_connection.sql(
+                f"SELECT {', '.join(columns)} FROM result_forms",
+                params=[None if value is None else str(value)
+                        for value in default_values.values()])
+            copy_duckdb_relation_to_model(
+                result_forms,
+                ResultForm,
+                [field for field, _ in RESULT_FORM_FILE_FIELDS] +\
+                list(default_values),
+                directory,
+                cache_key=instances_count_cache_key,
+            )
 
-        for result_form_vals_tuple in result_forms_data:
-            kwargs =\
-                build_generic_model_key_values_from_duckdb_row_tuple_data(
-                    result_form_vals_tuple,
-                    col_names_to_model_field_map,
-                    result_forms_cols_names_list,
-                )
-            result_form_data_by_index =\
-                { item[0]: item[1] for item in enumerate(
-                list(result_form_vals_tuple))}
-            for index, col_name in enumerate(result_forms_cols_names_list):
-                field_name = col_names_to_model_field_map.get(col_name)
-                # Continue if field is not a foreign key field
-                if field_name not in result_form_foreign_key_fields:
-                    continue
-
-                field_val = result_form_data_by_index.get(index)
-                if field_name == 'center':
-                    center = get_result_form_center(
-                        field_val,
-                        kwargs.get('station_number'),
-                        centers_by_code,
-                        stations_by_number_underscore_center_code
-                    )
-                    if center is None:
-                        kwargs['is_replacement'] = True
-                    kwargs['center'] = center
-                    continue
-
-                if field_name == 'office':
-                    result_form_region_name = kwargs.get('region')
-                    if result_form_region_name:
-                        del kwargs['region']
-                    office = get_office_by_office_name_and_region_name(
-                        field_val,
-                        result_form_region_name,
-                        offices_by_name_underscore_region_name
-                    )
-                    kwargs['office'] = office
-                    continue
-
-                if field_name == 'ballot':
-                    kwargs['ballot'] =\
-                        get_ballot_by_ballot_number(
-                            field_val,
-                            ballots_by_ballot_number
-                        )
-                    continue
-
-                if field_name == 'gender':
-                    kwargs['gender'] = \
-                        genders_by_name.get(field_val.upper()) \
-                        if field_val else None
-                    continue
-
-            if len(kwargs.items()):
-                kwargs['tally'] = tally
-                kwargs['form_state'] = FormState.UNSUBMITTED
-                bulk_mgr.add(ResultForm(**kwargs))
-        bulk_mgr.done()
+        # Forms copied to the database are not saved one by one.
+        invalidate_tally_cache(tally.id, REPORTS)
+        invalidate_tally_cache(tally.id, REFERENCE_DATA)
 
         return
     except Exception as e:
@@ -189,54 +256,22 @@ def async_import_results_forms_from_result_forms_file(
     :returns: Result forms count."""
     try:
         tally = Tally.objects.get(id=tally_id)
-        file_path = csv_file_path
-        duckdb_result_forms_data = duckdb.from_csv_auto(file_path, header=True)
+        duckdb_connection = duckdb.connect()
         result_forms_col_names =\
             getattr(settings,
                     'RESULT_FORM_COLUMN_NAMES')
-        check_for_missing_columns(
-            result_forms_col_names,
-            duckdb_result_forms_data.columns,
-            'result_form'
-        )
-        check_duplicates(
-            csv_file_path=file_path,
-            field='barcode'
-        )
-        centers_by_code =\
-            {
-                center.code:\
-                center for center in Center.objects.filter(tally=tally)
-            }
-        find_missing_center_codes(
-            result_forms_file=file_path,
-            centers_by_code=centers_by_code
-        )
-
-        stations_by_number_underscore_center_code =\
-            {
-                f'{station.center.code}_{station.station_number}':\
-                station for station in Station.objects.filter(tally=tally)
-            }
-        ballots_by_ballot_number =\
-            {
-                ballot.number:\
-                ballot for ballot in Ballot.objects.filter(tally=tally)
-            }
-        offices_by_name_underscore_region_name =\
-            {
-                f'{office.name}_{office.region.name}':\
-                office for office in Office.objects.filter(tally=tally)
-            }
+        duckdb_result_forms_data =\
+            read_csv_file(
+                csv_file_path,
+                result_forms_col_names,
+                'result_form',
+                unique_field='barcode',
+                duckdb_connection=duckdb_connection,
+            )
         create_result_forms_result_form_file_data(
+            duckdb_connection=duckdb_connection,
             duckdb_result_forms_data=duckdb_result_forms_data,
             tally=tally,
-            ballots_by_ballot_number=ballots_by_ballot_number,
-            centers_by_code=centers_by_code,
-            offices_by_name_underscore_region_name=
-            offices_by_name_underscore_region_name,
-            stations_by_number_underscore_center_code=
-            stations_by_number_underscore_center_code,
             step_name=kwargs.get('step_name'),
             step_number=kwargs.get('step_number'),
             command=command,
@@ -1,8 +1,12 @@
 import csv
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-from django.contrib.auth.models import Group
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, User
 from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
@@ -10,6 +14,7 @@ from tally_ho.libs.permissions import groups
 
 # Default paths for backward compatibility
 DEFAULT_STAFF_LIST_PATH = "data/staff_list.csv"
+DEFAULT_BATCH_SIZE = 500
 
 # Dict for all the variations on Clerk names.
 STAFF_ROLE_DICT = {
@@ -45,74 +50,234 @@ def unicode_csv_reader(unicode_csv_data, dialect=csv.excel, **kwargs):
         yield row
 
 
-def add_row(
-    command,
-    name,
-    username,
-    role,
-    admin=None,
-    tally_id=None,
-    password_suffix=None,
-):
-    """Add a user from a CSV row with required password suffix."""
-    try:
-        # Parse the name into first and last name
-        first_name, last_name = assign_names(name)
+def hash_passwords(passwords, workers=None):
+    """Hash passwords with the default password hasher.
 
-        tally = None
-        if tally_id:
-            try:
-                tally = Tally.objects.get(id=tally_id)
-            except Tally.DoesNotExist:
-                command.stdout.write(
-                    command.style.ERROR(
-                        f"Tally with id '{tally_id}' does not exist."
-                    )
-                )
-                return False  # Exit function if the Tally is not found
-
-        user, was_created = create_user(
-            first_name,
-            last_name,
-            username,
-            tally,
-            password_suffix=password_suffix,
-        )
+    PBKDF2 is slow by design, so passwords are hashed in a pool of
+    processes, one per CPU unless ``workers`` says otherwise.
 
-        # Only modify permissions and groups for newly created users
-        if was_created:
-            permission = True if admin == "Yes" else False
-            user.is_superuser = user.is_staff = permission
-            user.save(update_fields=["is_superuser", "is_staff"])
+    :param passwords: A list of raw passwords.
+    :param workers: The number of processes, 1 hashes in this process.
 
-    except Exception as e:
-        command.stdout.write(
-            command.style.ERROR(f"User '{username}' not created! '{e}'")
-        )
-        return False
-    else:
+    :returns: A list of encoded passwords, in the order of ``passwords``.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(passwords))
+
+    if workers <= 1:
+        return [make_password(password) for password in passwords]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            make_password,
+            passwords,
+            chunksize=max(1, len(passwords) // (workers * 4))))
+
+
+def _create_profiles(users):
+    """Insert the ``UserProfile`` rows of users, with one statement.
+
+    ``bulk_create`` does not support multi-table inheritance, so the
+    ``auth_user`` rows are bulk created first and their profiles here.
+
+    :param users: Saved users with ``reset_password`` and ``tally_id``
+        attributes.
+    """
+    opts = UserProfile._meta
+    columns = ", ".join(
+        connection.ops.quote_name(opts.get_field(field).column)
+        for field in ["user_ptr", "reset_password", "tally"])
+
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {connection.ops.quote_name(opts.db_table)} "
+            f"({columns}) VALUES (%s, %s, %s)",
+            [(user.pk, user.reset_password, user.tally_id)
+             for user in users])
+
+
+def _create_users(new_users, groups_by_name):
+    """Create users, their profiles and group memberships.
+
+    :param new_users: A list of ``(user, group_name, role)``, ``user`` an
+        unsaved ``User`` with ``reset_password`` and ``tally_id``
+        attributes and ``group_name`` None for an unknown role.
+    :param groups_by_name: The groups of the users by name.
+    """
+    users = User.objects.bulk_create([user for user, *_ in new_users])
+
+    for user, (new_user, *_) in zip(users, new_users):
+        user.reset_password = new_user.reset_password
+        user.tally_id = new_user.tally_id
+
+    _create_profiles(users)
+    User.groups.through.objects.bulk_create([
+        User.groups.through(user_id=user.pk,
+                            group_id=groups_by_name[group_name].pk)
+        for user, (_, group_name, _) in zip(users, new_users)
+        if group_name
+    ])
+
+
+def provision_users(
+    command,
+    rows,
+    password_suffix,
+    workers=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    """Create users from CSV rows with a password of username + suffix.
+
+    Tallies, groups and existing users are loaded once for all rows,
+    passwords are hashed in a process pool and users are inserted in
+    batches. Each row is reported as before: users that already exist are
+    skipped, rows with a missing tally are not created and users with an
+    unknown role are created without a group but reported as errors. When
+    a batch fails to insert, its rows are created one by one so only the
+    failing rows are reported.
+
+    :param command: The command to write row messages to.
+    :param rows: A list of ``(name, username, role, admin, tally_id)``.
+    :param password_suffix: The suffix of the initial passwords.
+    :param workers: The number of password hashing processes.
+    :param batch_size: The number of users inserted per query.
+
+    :returns: A tuple of the imported and failed row counts.
+    """
+    tally_ids = {
+        int(tally_id) for *_, tally_id in rows
+        if tally_id and tally_id.isdigit()
+    }
+    tallies = Tally.objects.in_bulk(tally_ids)
+    usernames = [username for _, username, *_ in rows]
+    existing_profiles = set(
+        UserProfile.objects.filter(username__in=usernames)
+        .values_list("username", flat=True))
+    existing_users = set(
+        User.objects.filter(username__in=usernames)
+        .values_list("username", flat=True))
+    groups_by_name = {
+        name: Group.objects.get_or_create(name=name)[0]
+        for name in sorted({
+            STAFF_ROLE_DICT.get(role.upper().strip())
+            for _, _, role, *_ in rows
+        } - {None})
+    }
+
+    max_username_length = User._meta.get_field("username").max_length
+    imported_count = 0
+    error_count = 0
+    new_users = []
+
+    for name, username, role, admin, tally_id in rows:
         system_role = STAFF_ROLE_DICT.get(role.upper().strip())
 
-        if system_role:
-            # Only add to group if user was newly created
-            if was_created:
-                group = Group.objects.get_or_create(name=system_role)[0]
-                user.groups.add(group)
+        if tally_id and (not tally_id.isdigit() or
+                         int(tally_id) not in tallies):
+            command.stdout.write(
+                command.style.ERROR(
+                    f"Tally with id '{tally_id}' does not exist."
+                )
+            )
+            error_count += 1
+        elif username in existing_profiles:
+            if system_role:
                 command.stdout.write(
-                    f"Created user '{username}' with role '{system_role}'"
+                    f"User '{username}' already exists, skipped"
                 )
+                imported_count += 1
             else:
                 command.stdout.write(
-                    f"User '{username}' already exists, skipped"
+                    command.style.ERROR(
+                        f"Unable to add user {username} to unknown group "
+                        f"'{role}'."
+                    )
                 )
-            return True
-        else:
+                error_count += 1
+        elif username in existing_users:
+            command.stdout.write(
+                command.style.ERROR(
+                    f"User '{username}' not created! 'A user with that "
+                    "username already exists.'"
+                )
+            )
+            error_count += 1
+        elif len(username) > max_username_length:
+            # Multi-row inserts cast values to the column type, which
+            # truncates long usernames instead of failing.
             command.stdout.write(
                 command.style.ERROR(
-                    f"Unable to add user {username} to unknown group '{role}'."
+                    f"User '{username}' not created! 'Ensure this value "
+                    f"has at most {max_username_length} characters.'"
                 )
             )
-            return False
+            error_count += 1
+        else:
+            first_name, last_name = assign_names(name)
+            permission = admin == "Yes"
+            user = User(
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+                is_superuser=permission,
+                is_staff=permission,
+            )
+            user.reset_password = True
+            user.tally_id = int(tally_id) if tally_id else None
+            new_users.append((user, system_role, role))
+            # Later rows with the same username are skipped like rows of
+            # users that existed before the import.
+            existing_profiles.add(username)
+
+    passwords = hash_passwords(
+        [f"{user.username}{password_suffix}" for user, *_ in new_users],
+        workers=workers)
+
+    for (user, *_), password in zip(new_users, passwords):
+        user.password = password
+
+    for start in range(0, len(new_users), batch_size):
+        batch = new_users[start:start + batch_size]
+
+        try:
+            with transaction.atomic():
+                _create_users(batch, groups_by_name)
+        except DatabaseError:
+            created = []
+
+            for new_user in batch:
+                try:
+                    with transaction.atomic():
+                        _create_users([new_user], groups_by_name)
+                except Exception as e:
+                    command.stdout.write(
+                        command.style.ERROR(
+                            f"User '{new_user[0].username}' not created! "
+                            f"'{e}'"
+                        )
+                    )
+                    error_count += 1
+                else:
+                    created.append(new_user)
+
+            batch = created
+
+        for user, system_role, role in batch:
+            if system_role:
+                command.stdout.write(
+                    f"Created user '{user.username}' with role "
+                    f"'{system_role}'"
+                )
+                imported_count += 1
+            else:
+                command.stdout.write(
+                    command.style.ERROR(
+                        f"Unable to add user {user.username} to unknown "
+                        f"group '{role}'."
+                    )
+                )
+                error_count += 1
+
+    return imported_count, error_count
 
 
 def assign_names(name):
@@ -127,44 +292,6 @@ def assign_names(name):
     return first_name, last_name
 
 
-def create_user(
-    first_name, last_name, username, tally=None, password_suffix=None
-):
-    """Create a user with password as username + suffix.
-
-    Args:
-        first_name: User's first name
-        last_name: User's last name
-        username: User's username
-        tally: Optional Tally object to assign
-        password_suffix: Required suffix for password generation
-
-    Returns:
-        Tuple of (user, was_created)
-    """
-    try:
-        return UserProfile.objects.get(
-            username=username
-        ), False  # Return existing user and False (not created)
-    except UserProfile.DoesNotExist:
-        if not password_suffix:
-            raise ValueError("password_suffix is required for user creation")
-
-        user = UserProfile(
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
-            reset_password=True,
-        )
-        if tally:
-            user.tally = tally
-        # Save with password_suffix - UserProfile.save() will create password
-        # as username + suffix
-        user.save(password_suffix=password_suffix)
-
-        return user, True  # Return new user and True (created)
-
-
 class Command(BaseCommand):
     help = (
         "Import staff list from CSV file.\n\n"
@@ -211,11 +338,31 @@ class Command(BaseCommand):
                 "Minimum 4 characters."
             ),
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help=(
+                "Processes hashing passwords "
+                "(default: one per CPU)"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=(
+                "Users inserted per query "
+                f"(default: {DEFAULT_BATCH_SIZE})"
+            ),
+        )
 
     def handle(self, *args, **kwargs):
         csv_file = kwargs["csv_file"]
         csv_template = kwargs["csv_template"]
         password_suffix = kwargs["password_suffix"]
+        workers = kwargs.get("workers")
+        batch_size = kwargs.get("batch_size", DEFAULT_BATCH_SIZE)
 
         # Validate password suffix has minimum security requirements
         if len(password_suffix) < 4:
@@ -232,12 +379,14 @@ class Command(BaseCommand):
             self.stdout.write(
                 f"Using user template with password suffix: {password_suffix}"
             )
-            self.import_user_list(csv_file, password_suffix)
+            self.import_user_list(
+                csv_file, password_suffix, workers, batch_size)
         elif csv_template == "staff":
             self.stdout.write(
                 f"Using staff template with password suffix: {password_suffix}"
             )
-            self.import_staff_list(csv_file, password_suffix)
+            self.import_staff_list(
+                csv_file, password_suffix, workers, batch_size)
         else:
             raise CommandError(f"Invalid template: {csv_template}")
 
@@ -247,10 +396,17 @@ class Command(BaseCommand):
             )
         )
 
-    def import_staff_list(self, csv_file, password_suffix):
-        """Import users from staff format CSV"""
-        self.stdout.write(f"Importing staff from '{csv_file}'...")
-        imported_count = 0
+    def read_rows(self, csv_file, parse_row):
+        """Read the data rows of a CSV file, reporting unparsable rows.
+
+        :param csv_file: The path of the CSV file.
+        :param parse_row: A function returning the ``(name, username, role,
+            admin, tally_id)`` of a row.
+
+        :returns: A tuple of the parsed rows and the unparsable row count,
+            or None when the file has no header.
+        """
+        rows = []
         error_count = 0
 
         with open(csv_file, encoding="utf-8") as f:
@@ -259,18 +415,13 @@ class Command(BaseCommand):
                 next(reader)  # ignore header
             except StopIteration:
                 self.stdout.write("CSV file is empty or has no data rows.")
-                return
+                return None
 
             for row_num, row in enumerate(
                 reader, start=2
             ):  # Start at 2 to account for header
                 try:
-                    name, username, role, admin = row[0:4]
-                    tally_id = (
-                        row[4].strip()
-                        if len(row) > 4 and row[4].strip()
-                        else None
-                    )
+                    rows.append(parse_row(row))
                 except Exception as e:
                     self.stdout.write(
                         self.style.ERROR(
@@ -279,19 +430,28 @@ class Command(BaseCommand):
                         )
                     )
                     error_count += 1
-                else:
-                    if add_row(
-                        self,
-                        name,
-                        username,
-                        role,
-                        admin,
-                        tally_id,
-                        password_suffix,
-                    ):
-                        imported_count += 1
-                    else:
-                        error_count += 1
+
+        return rows, error_count
+
+    def import_rows(self, csv_file, parse_row, password_suffix, workers,
+                    batch_size):
+        started = time.perf_counter()
+        read = self.read_rows(csv_file, parse_row)
+
+        if read is None:
+            return
+
+        rows, error_count = read
+        row_count = len(rows) + error_count
+        imported_count, provision_errors = provision_users(
+            self,
+            rows,
+            password_suffix,
+            workers=workers,
+            batch_size=batch_size,
+        )
+        error_count += provision_errors
+        seconds = time.perf_counter() - started
 
         # Print summary
         self.stdout.write(
@@ -303,53 +463,36 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.WARNING(f"Failed to import {error_count} users.")
             )
+        self.stdout.write(
+            f"Processed {row_count} rows in {seconds:.1f}s "
+            f"({row_count / seconds:.1f} rows/s)."
+        )
 
-    def import_user_list(self, csv_file, password_suffix):
+    def import_staff_list(self, csv_file, password_suffix, workers=None,
+                          batch_size=DEFAULT_BATCH_SIZE):
+        """Import users from staff format CSV"""
+        self.stdout.write(f"Importing staff from '{csv_file}'...")
+
+        def parse_row(row):
+            name, username, role, admin = row[0:4]
+            tally_id = (
+                row[4].strip()
+                if len(row) > 4 and row[4].strip()
+                else None
+            )
+            return name, username, role, admin, tally_id
+
+        self.import_rows(
+            csv_file, parse_row, password_suffix, workers, batch_size)
+
+    def import_user_list(self, csv_file, password_suffix, workers=None,
+                         batch_size=DEFAULT_BATCH_SIZE):
         """Import users from user format CSV"""
         self.stdout.write(f"Importing users from '{csv_file}'...")
-        imported_count = 0
-        error_count = 0
 
-        with open(csv_file, encoding="utf-8") as f:
-            reader = unicode_csv_reader(f)
-            try:
-                next(reader)  # ignore header
-            except StopIteration:
-                self.stdout.write("CSV file is empty or has no data rows.")
-                return
-
-            for row_num, row in enumerate(
-                reader, start=2
-            ):  # Start at 2 to account for header
-                try:
-                    username, name, role = row[0:3]
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Row {row_num}: Unable to parse row: {row}. "
-                            f"xception: {e}"
-                        )
-                    )
-                    error_count += 1
-                else:
-                    if add_row(
-                        self,
-                        name,
-                        username,
-                        role,
-                        password_suffix=password_suffix,
-                    ):
-                        imported_count += 1
-                    else:
-                        error_count += 1
+        def parse_row(row):
+            username, name, role = row[0:3]
+            return name, username, role, None, None
 
-        # Print summary
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Imported {imported_count} users successfully."
-            )
-        )
-        if error_count > 0:
-            self.stdout.write(
-                self.style.WARNING(f"Failed to import {error_count} users.")
-            )
+        self.import_rows(
+            csv_file, parse_row, password_suffix, workers, batch_size)
@@ -1,13 +1,12 @@
-import duckdb
 import logging
 
 from django.conf import settings
 
 from tally_ho.apps.tally.management.commands.utils import (
     build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_for_missing_columns,
     get_center_by_center_code,
-    get_sub_constituency_by_code
+    get_sub_constituency_by_code,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.center import Center
 from tally_ho.apps.tally.models.station import Station
@@ -16,7 +15,7 @@ from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import delete_cached_model_instances_count
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +41,10 @@ def create_stations_from_stations_file_data(
     :param command: stdout command.
     :returns: None"""
     try:
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        client = MemCache()
-        client.delete(instances_count_memcache_key)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
         genders_by_name =\
             {
                 gender.name: gender for gender in Gender\
@@ -68,8 +66,7 @@ def create_stations_from_stations_file_data(
         bulk_mgr = BulkCreateManager(
             chunk_size=1000,
             cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=client,
+            cache_key=instances_count_cache_key,
         )
 
         for station_vals_tuple in stations_data:
@@ -138,16 +135,11 @@ def async_import_stations_from_stations_file(
     :returns: stations count."""
     try:
         tally = Tally.objects.get(id=tally_id)
-        file_path = csv_file_path
-        duckdb_stations_data = duckdb.from_csv_auto(file_path, header=True)
         stations_col_names =\
             getattr(settings,
                     'STATION_COLUMN_NAMES')
-        check_for_missing_columns(
-            stations_col_names,
-            duckdb_stations_data.columns,
-            'stations'
-        )
+        duckdb_stations_data =\
+            read_csv_file(csv_file_path, stations_col_names, 'stations')
         centers_by_code =\
             {
                 center.code:\
@@ -1,17 +1,20 @@
-import duckdb
 import logging
 from django.conf import settings
 from tally_ho.apps.tally.models.constituency import Constituency
 
 from tally_ho.apps.tally.management.commands.utils import (
     build_generic_model_key_values_from_duckdb_row_tuple_data,
-    check_for_missing_columns,
+    read_csv_file,
 )
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.celeryapp import app
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import (
+    REFERENCE_DATA,
+    delete_cached_model_instances_count,
+    invalidate_tally_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +23,7 @@ def create_sub_constituencies_from_sub_con_file_data(
         constituencies_by_name=None,
         tally=None,
         command=None,
-        instances_count_memcache_key=None,
-        memcache_client=None,
+        instances_count_cache_key=None,
 ):
     """Create sub constituencies from sub constituencies file data
         inside duckdb.
@@ -29,8 +31,7 @@ def create_sub_constituencies_from_sub_con_file_data(
     :param duckdb_sub_con_data: sub constituencies file data in duckdb format.
     :param constituencies_by_name: tally constituencies_by_name queryset.
     :param tally: tally queryset.
-    :param instances_count_memcache_key: instances count memcache key.
-    :param memcache_client: memcache client.
+    :param instances_count_cache_key: instances count cache key.
     :param command: stdout command.
     :returns: None."""
     try:
@@ -44,8 +45,7 @@ def create_sub_constituencies_from_sub_con_file_data(
         bulk_mgr = BulkCreateManager(
             objs_count=len(sub_cons_data),
             cache_instances_count=True,
-            cache_key=instances_count_memcache_key,
-            memcache_client=memcache_client,)
+            cache_key=instances_count_cache_key,)
 
         for sub_con_vals_tuple in sub_cons_data:
             kwargs =\
@@ -133,20 +133,16 @@ def async_import_sub_constituencies_and_constituencies_from_sub_cons_file(
         tally = Tally.objects.get(id=tally_id)
         step_number = kwargs.get('step_number')
         step_name=kwargs.get('step_name')
-        instances_count_memcache_key =\
+        instances_count_cache_key =\
             f"{tally.id}_{step_name}_{step_number}"
-        # reset instances count in memcache if exists already
-        memcache_client = MemCache()
-        memcache_client.delete(instances_count_memcache_key)
-        duckdb_sub_con_data = duckdb.from_csv_auto(csv_file_path, header=True)
+        # reset instances count in cache if exists already
+        delete_cached_model_instances_count(instances_count_cache_key)
         sub_cons_col_names =\
             getattr(settings,
                     'SUB_CONSTITUENCY_COLUMN_NAMES')
-        check_for_missing_columns(
-            sub_cons_col_names,
-            duckdb_sub_con_data.columns,
-            'sub constituencies'
-        )
+        duckdb_sub_con_data =\
+            read_csv_file(
+                csv_file_path, sub_cons_col_names, 'sub constituencies')
         create_constituencies_from_sub_con_file_data(
             duckdb_sub_con_data=duckdb_sub_con_data,
             tally=tally,
@@ -163,10 +159,12 @@ def async_import_sub_constituencies_and_constituencies_from_sub_cons_file(
             constituencies_by_name=constituencies_by_name,
             tally=tally,
             command=command,
-            instances_count_memcache_key=instances_count_memcache_key,
-            memcache_client=memcache_client
+            instances_count_cache_key=instances_count_cache_key,
         )
 
+        # Rows created in bulk are not saved one by one.
+        invalidate_tally_cache(tally.id, REFERENCE_DATA)
+
         return len(duckdb_sub_con_data.fetchall())
     except Exception as e:
         msg =\
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext_lazy
+
+from tally_ho.apps.tally.management.commands.utils import ingest_csv_file
+from tally_ho.celeryapp import app
+
+
+@app.task()
+def async_ingest_csv_file(
+        csv_file_path=None,
+        required_col_names=(),
+        unique_field=None):
+    """Convert an uploaded CSV file to the Parquet file the imports read,
+    and report its columns, rows and validation.
+
+    :param csv_file_path: The path to the CSV file.
+    :param required_col_names: The columns the file must have.
+    :param unique_field: A column whose values must be unique, if any.
+
+    :returns: The ingest report, see ``ingest_csv_file``.
+    """
+    return ingest_csv_file(csv_file_path, required_col_names, unique_field)
+
+
+class Command(BaseCommand):
+    help = gettext_lazy(
+        "Convert CSV files to the Parquet files the tally setup imports "
+        "read.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_file_paths", nargs="+")
+
+    def handle(self, *args, **options):
+        for csv_file_path in options['csv_file_paths']:
+            report = ingest_csv_file(csv_file_path)
+            self.stdout.write(
+                f"Ingested {report['rows']} rows of {csv_file_path}.")
@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.translation import gettext_lazy
+
+from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.celeryapp import app
+from tally_ho.libs.workflow import transitions
+
+
+@app.task()
+def promote_matching_forms():
+    """Promote the forms in corrections whose data entries match to
+    quality control, for the active tallies that promote them
+    automatically.
+
+    Scheduled by ``CELERY_BEAT_SCHEDULE``.
+
+    :returns: The number of forms promoted.
+    """
+    tally_ids = Tally.objects.filter(
+        active=True, auto_promote_matching_forms=True,
+    ).values_list('pk', flat=True)
+
+    return sum(
+        transitions.promote_matching_forms(tally_id)
+        for tally_id in tally_ids)
+
+
+class Command(BaseCommand):
+    help = gettext_lazy(
+        "Promote the forms in corrections whose data entries match to "
+        "quality control.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tally-id", type=int,
+            help="Promote the forms of this tally, whether or not it "
+                 "promotes matching forms automatically. Defaults to the "
+                 "tallies that do.")
+        parser.add_argument(
+            "--username",
+            help="The user to record as promoting the forms.")
+        parser.add_argument("--batch-size", type=int)
+
+    def handle(self, *args, **options):
+        user = None
+
+        if options['username']:
+            try:
+                user = UserProfile.objects.get(username=options['username'])
+            except UserProfile.DoesNotExist:
+                raise CommandError(
+                    f"No user with username {options['username']}.")
+
+        if options['tally_id']:
+            tally_ids = [options['tally_id']]
+        else:
+            tally_ids = Tally.objects.filter(
+                active=True, auto_promote_matching_forms=True,
+            ).values_list('pk', flat=True)
+
+        for tally_id in tally_ids:
+            promoted = transitions.promote_matching_forms(
+                tally_id, user=user, batch_size=options['batch_size'])
+            self.stdout.write(
+                f'Promoted {promoted} forms of tally {tally_id}.')
@@ -1,15 +1,10 @@
 import csv
 import pathlib
 
-from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
-from django.utils.dateparse import parse_datetime
-from reversion.models import Version
 
 from tally_ho.apps.tally.models.result_form import ResultForm
-from tally_ho.libs.models.enums.form_state import FormState
-from tally_ho.libs.utils.time import format_duration_human_readable
 
 
 class Command(BaseCommand):
@@ -69,13 +64,12 @@ class Command(BaseCommand):
                 f'Result form with barcode "{barcode}" does not exist'
             )
 
-        # Get version history
-        versions = Version.objects.get_for_object(result_form).order_by('pk')
+        history_data = result_form.transitions.history()
 
-        if not versions:
+        if not history_data:
             self.stdout.write(
                 self.style.WARNING(
-                    f'No version history found for result form {barcode}'
+                    f'No history found for result form {barcode}'
                 )
             )
             return
@@ -91,67 +85,6 @@ class Command(BaseCommand):
             self.stdout.write(f'Tally: {result_form.tally.name}')
         self.stdout.write(f'Current State: {result_form.form_state.name}\n')
 
-        # Prepare history data (same logic as the view)
-        history_data = []
-        previous_timestamp = None
-
-        for version in versions:
-            version_data = version.field_dict
-
-            # Get user info
-            user_name = "Unknown"
-            if 'user_id' in version_data and version_data['user_id']:
-                try:
-                    user = User.objects.get(pk=version_data['user_id'])
-                    user_name = user.username
-                except User.DoesNotExist:
-                    user_name = f"User ID {version_data['user_id']}"
-
-            # Format timestamp
-            modified_date = version_data.get('modified_date')
-            timestamp = None
-            if modified_date:
-                if isinstance(modified_date, str):
-                    timestamp = parse_datetime(modified_date)
-                else:
-                    timestamp = modified_date
-
-            # Get form states
-            current_state = version_data.get('form_state')
-            previous_state = version_data.get('previous_form_state')
-
-            if current_state:
-                current_state_name = FormState(current_state).name
-            else:
-                current_state_name = "Unknown"
-
-            if previous_state:
-                previous_state_name = FormState(previous_state).name
-            else:
-                previous_state_name = "None"
-
-            # Calculate duration in previous state
-            duration_display = None
-            if previous_timestamp and timestamp:
-                duration = timestamp - previous_timestamp
-                duration_display = format_duration_human_readable(duration)
-
-            history_data.append({
-                'user': user_name,
-                'timestamp': timestamp,
-                'current_state': current_state_name,
-                'previous_state': previous_state_name,
-                'duration_display': duration_display,
-                'is_current': False
-            })
-
-            previous_timestamp = timestamp
-
-        # Reverse to show newest first, then mark first entry as current
-        history_data.reverse()
-        if history_data:
-            history_data[0]['is_current'] = True
-
         # Display history
         self.stdout.write("History (newest to oldest):")
         self.stdout.write("-" * 110)
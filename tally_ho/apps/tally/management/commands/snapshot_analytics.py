@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext_lazy
+
+from tally_ho.celeryapp import app
+from tally_ho.libs.utils import analytics
+
+
+@app.task()
+def snapshot_analytics():
+    """Export the tally tables to a new analytics snapshot.
+
+    Scheduled by ``CELERY_BEAT_SCHEDULE``.
+
+    :returns: The name of the snapshot.
+    """
+    return analytics.take_snapshot()['name']
+
+
+class Command(BaseCommand):
+    help = gettext_lazy("Export the tally tables to an analytics snapshot.")
+
+    def handle(self, *args, **kwargs):
+        snapshot = analytics.take_snapshot()
+        rows = sum(snapshot['tables'].values())
+        self.stdout.write(
+            f"Wrote snapshot {snapshot['name']} of "
+            f"{len(snapshot['tables'])} tables and {rows} rows.")
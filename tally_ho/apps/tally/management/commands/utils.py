@@ -1,7 +1,12 @@
 import duckdb
+import hashlib
+import json
+import os
+import time
+import uuid
 from gettext import ngettext
 from django.conf import settings
-from django.db import transaction
+from django.db import connections, router, transaction
 
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.candidate import Candidate
@@ -13,6 +18,7 @@ from tally_ho.apps.tally.models.region import Region
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
+from tally_ho.libs.utils.cache import cache_model_instances_count
 from tally_ho.libs.utils.numbers import parse_int
 
 OCV_VOTING = 'OCV Voting'
@@ -22,6 +28,19 @@ NO_CONSTITUENCY_SUB_CON_NUMBER = 999
 
 NO_CENTER_NAME_AVAILABLE = '#N/A'
 
+# Bytes of a CSV file written to PostgreSQL COPY at a time.
+COPY_CHUNK_SIZE = 64 * 1024
+
+# The states of the ingest of an uploaded CSV file, see ingest_csv_file.
+INGEST_QUEUED = 'queued'
+INGEST_RUNNING = 'running'
+INGEST_DONE = 'done'
+INGEST_FAILED = 'failed'
+# How long an ingest waits for another one of the same file to end, and
+# how often it checks, before converting the file itself.
+INGEST_WAIT_SECONDS = 10 * 60
+INGEST_POLL_SECONDS = 0.5
+
 def build_generic_model_key_values_from_duckdb_row_tuple_data(
         duckdb_row_tuple_data,
         col_name_to_model_field_mapping,
@@ -238,84 +257,315 @@ class DuplicatesFoundError(Exception):
         )
         super().__init__(message)
 
-def check_duplicates(csv_file_path: str, field: str) -> None:
+def ingested_file_paths(csv_file_path):
+    """Return the paths of the Parquet file and the report of an ingested
+    CSV file, in ``UPLOAD_INGEST_PATH``.
+
+    :param csv_file_path: The path to the CSV file.
     """
-    Checks for duplicates in a CSV file based on a specified field using
-    DuckDB.
-
-    This function loads the specified CSV file into DuckDB, groups the data
-    by the provided field, and checks if any of the groups contain more than
-    one row. It returns `True` if duplicates are found, otherwise `False`.
-
-    Parameters:
-    ----------
-    csv_file_path : str
-        The path to the CSV file to be checked.
-    field : str, optional
-        The name of the field/column to check for duplicates.
-
-    Raises:
-    -------
-    DuplicatesFoundError
-        If duplicates are found in the specified field.
-
-    Returns:
-    -------
-    None
-        If no duplicates are found.
+    digest = hashlib.sha1(
+        os.path.abspath(csv_file_path).encode('utf-8')).hexdigest()
+    path = os.path.join(settings.UPLOAD_INGEST_PATH, digest)
+
+    return f'{path}.parquet', f'{path}.json'
+
+def _file_version(csv_file_path):
+    stat = os.stat(csv_file_path)
+
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _write_atomically(path, write):
+    # Written under a temporary name then renamed, so a concurrent reader
+    # finds the previous file or the whole new one. The name is unique to
+    # the call, so threads writing the same file do not share it.
+    temporary_path = f'{path}.{uuid.uuid4().hex}.tmp'
+
+    try:
+        write(temporary_path)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+def write_ingest_status(csv_file_path, status, **fields):
+    """Record the state of the ingest of the current version of a CSV file,
+    e.g. ``INGEST_QUEUED`` when queueing it.
+
+    :param csv_file_path: The path to the CSV file.
+    :param status: The state of the ingest.
+    :param fields: Other fields of the record, ``version`` if the file was
+        read before it last changed.
     """
-    con = duckdb.connect()
-
-    query = """
-        SELECT {field}, COUNT(*) AS cnt
-        FROM read_csv_auto(?)
-        WHERE {field} IS NOT NULL
-        GROUP BY {field}
-        HAVING cnt > 1
-    """.format(field=field)
-
-    result = con.execute(query, [csv_file_path]).fetchall()
-    con.close()
-
-    if len(result) > 0:
-        duplicate_values = [row[0] for row in result]
-        raise DuplicatesFoundError(field, duplicate_values)
-
-
-class CenterCodeNotFoundException(Exception):
-    def __init__(self, center_codes):
-        self.center_codes = center_codes
-        self.message = (
-            "The following center codes do not exist in the centers file: "
-            f"{', '.join(map(str, center_codes))}"
-        )
-        super().__init__(self.message)
+    _, report_path = ingested_file_paths(csv_file_path)
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    record = {
+        'version': _file_version(csv_file_path),
+        'status': status,
+        **fields,
+    }
+
+    def write_record(path):
+        with open(path, 'w') as record_file:
+            json.dump(record, record_file, default=str)
+
+    _write_atomically(report_path, write_record)
+
+    return record
+
+def get_ingest_status(csv_file_path):
+    """Return the record of the ingest of the current version of a CSV
+    file, or None if the file is missing or was not queued since it last
+    changed.
+
+    :param csv_file_path: The path to the CSV file.
+
+    :returns: A dict of the ``status`` of the ingest, and once it is
+        ``INGEST_DONE`` the fields of the report, see ``ingest_csv_file``.
+    """
+    _, report_path = ingested_file_paths(csv_file_path)
+
+    try:
+        with open(report_path) as report_file:
+            record = json.load(report_file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    try:
+        version = _file_version(csv_file_path)
+    except FileNotFoundError:
+        return None
+
+    return record if record.get('version') == version else None
+
+def _wait_for_running_ingest(csv_file_path):
+    # A running ingest of the same version of the file, e.g. the upload's
+    # task while an import step starts, writes the same Parquet file.
+    deadline = time.monotonic() + INGEST_WAIT_SECONDS
+
+    while time.monotonic() < deadline:
+        record = get_ingest_status(csv_file_path)
+
+        if record is None or record['status'] != INGEST_RUNNING:
+            return
+
+        time.sleep(INGEST_POLL_SECONDS)
 
-def find_missing_center_codes(result_forms_file, centers_by_code):
-    center_codes_list = list(centers_by_code.keys())
+def get_ingest_report(csv_file_path):
+    """Return the report of the ingest of a CSV file, or None if it was not
+    ingested since it last changed.
 
-    con = duckdb.connect()
+    :param csv_file_path: The path to the CSV file.
+    """
+    parquet_path, _ = ingested_file_paths(csv_file_path)
+    report = get_ingest_status(csv_file_path)
+
+    if report is None or report.get('status') != INGEST_DONE or\
+            not os.path.exists(parquet_path):
+        return None
+
+    return report
+
+def ingest_csv_file(csv_file_path, required_col_names=(), unique_field=None):
+    """Convert a CSV file to a Parquet file, once per version of the file.
+
+    The Parquet file keeps the column types DuckDB detects in the CSV file,
+    so the imports reading it get the rows they would read from the CSV
+    file without parsing and sniffing it again. An ingest of the same
+    version of the file already running is waited for and its report
+    reused, for at most ``INGEST_WAIT_SECONDS``.
 
-    center_codes_tuple = tuple(center_codes_list)
+    :param csv_file_path: The path to the CSV file.
+    :param required_col_names: The columns the file must have.
+    :param unique_field: A column whose values must be unique, if any.
 
-    query = f"""
-    SELECT rf.center_code
-    FROM read_csv_auto('{result_forms_file}', ALL_VARCHAR=TRUE) AS rf
-    WHERE rf.center_code IS NOT NULL
-      AND rf.center_code != ''
-      AND CAST(rf.center_code AS INTEGER) NOT IN {center_codes_tuple};
+    :returns: The ingest report, a dict of the ``columns`` and their types,
+        the number of distinct ``rows``, the ``missing_columns`` of the
+        required columns and the ``duplicates`` of the unique field.
     """
+    checks = {
+        'required_columns': list(required_col_names),
+        'unique_field': unique_field,
+    }
+    _wait_for_running_ingest(csv_file_path)
+    report = get_ingest_report(csv_file_path)
+
+    if report is not None and report['checks'] == checks:
+        return report
+
+    parquet_path, _ = ingested_file_paths(csv_file_path)
+    version = _file_version(csv_file_path)
+    write_ingest_status(csv_file_path, INGEST_RUNNING, version=version)
+    duckdb_connection = duckdb.connect()
+
+    try:
+        if report is None:
+            _write_atomically(
+                parquet_path,
+                duckdb_connection.read_csv(
+                    csv_file_path, header=True).write_parquet)
+
+        relation = duckdb_connection.read_parquet(parquet_path)
+        duplicates = []
+
+        if unique_field in relation.columns:
+            duplicates = [row[0] for row in relation.filter(
+                f'"{unique_field}" IS NOT NULL',
+            ).aggregate(
+                f'"{unique_field}", count(*) AS count', f'"{unique_field}"',
+            ).filter('count > 1').fetchall()]
+
+        report = {
+            'checks': checks,
+            'columns': dict(zip(relation.columns, map(str, relation.types))),
+            # Distinct rows, as the setup wizard has always counted them.
+            'rows': relation.distinct().aggregate('count(*)').fetchone()[0],
+            'missing_columns': find_missing_csv_col_names(
+                required_col_names, relation.columns),
+            'duplicates': duplicates,
+        }
+    except Exception as e:
+        write_ingest_status(
+            csv_file_path, INGEST_FAILED, version=version, error=str(e))
+        raise
+    finally:
+        duckdb_connection.close()
+
+    return write_ingest_status(
+        csv_file_path, INGEST_DONE, version=version, **report)
+
+def read_csv_file(
+        csv_file_path,
+        required_col_names=(),
+        file_name=None,
+        unique_field=None,
+        duckdb_connection=duckdb,
+    ):
+    """Return a DuckDB relation of the rows of a CSV file, read from the
+    Parquet file it was ingested to, ingesting it first if needed.
+
+    :param csv_file_path: The path to the CSV file.
+    :param required_col_names: The columns the file must have.
+    :param file_name: The name of the file in error messages.
+    :param unique_field: A column whose values must be unique, if any.
+    :param duckdb_connection: The DuckDB connection of the relation,
+        DuckDB's default connection if omitted.
+
+    :raises: An Exception naming the missing columns, like
+        ``check_for_missing_columns``, or a DuplicatesFoundError.
+    """
+    report = ingest_csv_file(csv_file_path, required_col_names, unique_field)
+    check_for_missing_columns(
+        required_col_names, report['columns'], file_name)
+
+    if report['duplicates']:
+        raise DuplicatesFoundError(unique_field, report['duplicates'])
+
+    parquet_path, _ = ingested_file_paths(csv_file_path)
 
-    # Execute the query and fetch the result
-    result = con.execute(query).fetchall()
+    return duckdb_connection.read_parquet(parquet_path)
 
-    # Close the connection
-    con.close()
 
-    # Extract the missing center codes
-    missing_center_codes = [row[0] for row in result]
+class MissingReferencesError(Exception):
+    """Exception raised when rows of a file refer to objects that do not
+    exist in the tally."""
+    def __init__(self, references):
+        self.references = references
+        message = (
+            "The following references do not exist: "
+            f"{'; '.join(references)}."
+        )
+        super().__init__(message)
+
+def copy_queryset_to_duckdb(
+        duckdb_connection,
+        table_name,
+        queryset,
+        columns,
+        directory,
+    ):
+    """Create a DuckDB table of the rows of a ``values_list`` queryset.
 
-    # Raise the exception if there are any missing center codes
-    if missing_center_codes:
-        print(f"center codes: {missing_center_codes}")
-        raise CenterCodeNotFoundException(missing_center_codes)
+    The rows are exported with PostgreSQL ``COPY`` to a CSV file DuckDB
+    reads, rather than fetched and inserted one by one.
+
+    :param duckdb_connection: The DuckDB connection to create the table in.
+    :param table_name: The name of the table.
+    :param queryset: A ``values_list`` queryset of the rows.
+    :param columns: A dict of the DuckDB name and type of each value.
+    :param directory: The directory to write the CSV file in.
+    """
+    path = os.path.join(directory, f'{table_name}.csv')
+    sql, params = queryset.query.sql_with_params()
+
+    with connections[queryset.db].cursor() as cursor,\
+            open(path, 'wb') as csv_file:
+        with cursor.copy(
+                f'COPY ({sql}) TO STDOUT (FORMAT csv)', params) as copy:
+            for data in copy:
+                csv_file.write(data)
+
+    # Columns are given rather than sniffed, which fails on empty files.
+    # Postgres writes NULL unquoted and empty strings quoted.
+    csv_columns = ', '.join(
+        f"'{name}': '{duckdb_type}'"
+        for name, duckdb_type in columns.items())
+    duckdb_connection.execute(
+        f"CREATE TABLE {table_name} AS SELECT * FROM read_csv(?, "
+        "header=false, auto_detect=false, delim=',', quote='\"', "
+        f"escape='\"', allow_quoted_nulls=false, columns={{{csv_columns}}})",
+        [path])
+
+def copy_duckdb_relation_to_model(
+        relation,
+        model,
+        fields,
+        directory,
+        cache_key=None,
+    ):
+    """Write the rows of a DuckDB relation to a model's table.
+
+    DuckDB writes the rows to a CSV file which is streamed to PostgreSQL
+    ``COPY`` in chunks, so no Python object is built per row. All rows
+    are written in one statement, a failing row writes none.
+
+    :param relation: A DuckDB relation with a column of database values
+        per field.
+    :param model: The model of the table.
+    :param fields: The names of the model fields, in the order of the
+        columns of the relation.
+    :param directory: The directory to write the CSV file in.
+    :param cache_key: The key to report the progress of an import job
+        under, if any.
+
+    :returns: The number of rows written.
+    """
+    path = os.path.join(directory, f'{model._meta.db_table}.csv')
+    relation.write_csv(path, header=False)
+    rows_count = relation.aggregate('count(*)').fetchone()[0]
+    connection = connections[router.db_for_write(model)]
+    quote_name = connection.ops.quote_name
+    columns = ', '.join(
+        quote_name(model._meta.get_field(field).column) for field in fields)
+    sql = (f'COPY {quote_name(model._meta.db_table)} ({columns}) '
+           'FROM STDIN (FORMAT csv)')
+    reported_count = 0
+
+    with connection.cursor() as cursor, open(path, 'rb') as csv_file:
+        with cursor.copy(sql) as copy:
+            while data := csv_file.read(COPY_CHUNK_SIZE):
+                copy.write(data)
+
+                if cache_key:
+                    # Rows are counted by line, a quoted value spanning
+                    # lines can only make the count run ahead.
+                    count = min(data.count(b'\n'),
+                                rows_count - reported_count)
+                    cache_model_instances_count(cache_key, count)
+                    reported_count += count
+
+    if cache_key:
+        cache_model_instances_count(
+            cache_key, rows_count - reported_count, done=True)
+
+    return rows_count
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:38
+
+import django.db.models.deletion
+import django.utils.timezone
+import enumfields.fields
+import tally_ho.libs.models.enums.entry_version
+import tally_ho.libs.models.enums.form_state
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tally', '0081_resultform_pvp_submission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResultFormTransition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_state', enumfields.fields.EnumIntegerField(enum=tally_ho.libs.models.enums.form_state.FormState, null=True)),
+                ('to_state', enumfields.fields.EnumIntegerField(enum=tally_ho.libs.models.enums.form_state.FormState)),
+                ('entry_version', enumfields.fields.EnumIntegerField(enum=tally_ho.libs.models.enums.entry_version.EntryVersion, null=True)),
+                ('created_date', models.DateTimeField(default=django.utils.timezone.now)),
+                ('result_form', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='tally.resultform')),
+                ('tally', models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='result_form_transitions', to='tally.tally')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='tally.userprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['result_form', 'created_date'], name='tally_resul_result__53f302_idx'), models.Index(fields=['tally', 'to_state', 'created_date'], name='tally_resul_tally_i_d98a04_idx')],
+            },
+        ),
+    ]
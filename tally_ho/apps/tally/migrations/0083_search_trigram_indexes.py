@@ -0,0 +1,60 @@
+import warnings
+
+from django.db import migrations
+
+# Keyword search filters with icontains, which Django runs as
+# UPPER(column::text) LIKE UPPER('%keyword%'), so the indexes are on the
+# same expression. See tally_ho/libs/utils/search.py.
+SEARCH_INDEXES = (
+    ('tally_resultform_barcode_trgm', 'tally_resultform', 'barcode'),
+    ('tally_center_name_trgm', 'tally_center', 'name'),
+    ('tally_candidate_full_name_trgm', 'tally_candidate', 'full_name'),
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    """Create the pg_trgm extension and the keyword search indexes.
+
+    Searches work without the indexes, scanning the tables, so databases
+    where pg_trgm is not installed skip them with a warning rather than
+    fail the migration. See docs/operations/search.md.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+
+        if cursor.fetchone() is None:
+            warnings.warn(
+                "The pg_trgm extension is not available, the keyword "
+                "search indexes are not created and searches scan the "
+                "tables. Install the postgresql contrib package, then "
+                "migrate tally back to 0082 and forward again to create "
+                "them.",
+                RuntimeWarning,
+            )
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for name, table, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)')
+
+
+def drop_search_indexes(apps, schema_editor):
+    for name, _, _ in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+    # Build the indexes without locking the tables against writes.
+    atomic = False
+
+    dependencies = [
+        ('tally', '0082_result_form_transition'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tally', '0083_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resultform',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_result_forms', to='tally.userprofile'),
+        ),
+        migrations.AddField(
+            model_name='resultform',
+            name='claimed_date',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='resultform',
+            index=models.Index(fields=['tally', 'form_state', 'id'], name='tally_resul_tally_i_d85875_idx'),
+        ),
+    ]
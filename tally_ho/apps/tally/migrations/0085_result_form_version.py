@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tally', '0084_result_form_claims'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resultform',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
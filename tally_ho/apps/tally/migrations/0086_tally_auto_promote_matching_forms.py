@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tally', '0085_result_form_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tally',
+            name='auto_promote_matching_forms',
+            field=models.BooleanField(default=False, help_text='Move forms whose data entries match from Corrections to Quality Control automatically'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.8 on 2026-10-19 18:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+
+def rollup_result_form_stats(apps, schema_editor):
+    """Add the existing result form stats to the rollups of their users'
+    groups.
+    """
+    ResultFormStats = apps.get_model("tally", "ResultFormStats")
+    ResultFormStatsRollup = apps.get_model("tally", "ResultFormStatsRollup")
+    reviewed = Q(reviewed_by_supervisor=True)
+
+    rows = ResultFormStats.objects.filter(
+        user__groups__isnull=False,
+    ).values(
+        "tally_id",
+        "user_id",
+        group_id=F("user__groups"),
+        date=TruncDate("created_date"),
+    ).annotate(
+        rollup_forms_processed=Count("id"),
+        rollup_processing_time=Coalesce(Sum("processing_time"), 0),
+        rollup_data_entry_errors=Coalesce(Sum("data_entry_errors"), 0),
+        rollup_forms_with_errors=Count(
+            "id", filter=Q(data_entry_errors__gt=0)),
+        rollup_forms_reviewed=Count("id", filter=reviewed),
+        rollup_forms_approved=Count(
+            "id", filter=reviewed & Q(approved_by_supervisor=True)),
+    ).order_by()
+
+    ResultFormStatsRollup.objects.bulk_create(
+        (ResultFormStatsRollup(**{
+            name.removeprefix("rollup_"): value
+            for name, value in row.items()
+        }) for row in rows.iterator()),
+        batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('tally', '0086_tally_auto_promote_matching_forms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResultFormStatsRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('forms_processed', models.PositiveIntegerField(default=0)),
+                ('processing_time', models.PositiveBigIntegerField(default=0)),
+                ('data_entry_errors', models.PositiveIntegerField(default=0)),
+                ('forms_with_errors', models.PositiveIntegerField(default=0)),
+                ('forms_reviewed', models.PositiveIntegerField(default=0)),
+                ('forms_approved', models.PositiveIntegerField(default=0)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='auth.group')),
+                ('tally', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='result_form_stats_rollups', to='tally.tally')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tally.userprofile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tally', 'group', 'date', 'user'), name='unique_result_form_stats_rollup')],
+            },
+        ),
+        migrations.RunPython(
+            rollup_result_form_stats, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,8 @@ from tally_ho.apps.tally.models.reconciliation_form import\
 from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.result_form_stats import ResultFormStats
+from tally_ho.apps.tally.models.result_form_stats_rollup import\
+    ResultFormStatsRollup
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.apps.tally.models.user_profile import UserProfile
@@ -22,5 +24,7 @@ from tally_ho.apps.tally.models.constituency import Constituency
 from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 from tally_ho.apps.tally.models.workflow_request import WorkflowRequest
 from tally_ho.apps.tally.models.result_form_reset import ResultFormReset
+from tally_ho.apps.tally.models.result_form_transition import\
+    ResultFormTransition
 from tally_ho.apps.tally.models.pvp_upload_bundle import PvpUploadBundle
 from tally_ho.apps.tally.models.pvp_submission import PvpSubmission
@@ -1,7 +1,7 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
 
-import reversion
+from tally_ho.libs.utils.revisions import register
 
 
 class AllCandidatesVotes(models.Model):
@@ -27,4 +27,4 @@ class AllCandidatesVotes(models.Model):
     stations_complete_percent = models.IntegerField()
 
 
-reversion.register(AllCandidatesVotes)
+register(AllCandidatesVotes)
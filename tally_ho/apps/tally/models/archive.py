@@ -1,10 +1,10 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class Archive(BaseModel):
@@ -24,4 +24,4 @@ class Archive(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(Archive)
+register(Archive)
@@ -1,7 +1,6 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 
 from tally_ho.apps.tally.models.quarantine_check import QuarantineCheck
 from tally_ho.apps.tally.models.result_form import ResultForm
@@ -11,6 +10,7 @@ from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.enums.actions_prior import ActionsPrior
 from tally_ho.libs.models.enums.audit_resolution import AuditResolution
 from tally_ho.libs.utils.collections import keys_if_value
+from tally_ho.libs.utils.revisions import register
 
 
 class Audit(BaseModel):
@@ -80,4 +80,4 @@ class Audit(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(Audit)
+register(Audit)
@@ -1,8 +1,9 @@
-from django.db import models
+import functools
+
+from django.db import models, transaction
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 import os
 import uuid
 import pathlib
@@ -12,7 +13,9 @@ from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.enums.race_type import RaceType
 from tally_ho.libs.models.enums.disable_reason import DisableReason
+from tally_ho.libs.utils.cache import REFERENCE_DATA, invalidate_tally_cache
 from tally_ho.libs.utils.templates import get_ballot_link
+from tally_ho.libs.utils.revisions import register
 
 
 COMPONENT_TO_BALLOTS = {
@@ -146,4 +149,21 @@ def auto_delete_document(sender, instance, **kwargs):
     return False
 
 
-reversion.register(Ballot)
+register(Ballot)
+
+
+def invalidate_reference_data(sender, instance, **kwargs):
+    """Invalidate the cached setup data, e.g. the ballot topology, of the
+    tally of a ballot, candidate or sub constituency once it is saved or
+    deleted.
+    """
+    if instance.tally_id:
+        transaction.on_commit(functools.partial(
+            invalidate_tally_cache, instance.tally_id, REFERENCE_DATA))
+
+
+for reference_model in (Ballot, 'tally.Candidate', 'tally.SubConstituency'):
+    for signal in (models.signals.post_save, models.signals.post_delete):
+        signal.connect(invalidate_reference_data,
+                       sender=reference_model,
+                       dispatch_uid='invalidate_reference_data')
@@ -2,7 +2,6 @@ from django.db import models
 from django.db.models import Q, Sum, Value as V
 from django.db.models.functions import Coalesce
 from enumfields import EnumIntegerField
-import reversion
 from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 
 from tally_ho.apps.tally.models.tally import Tally
@@ -12,6 +11,7 @@ from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.race_type import RaceType
 from tally_ho.libs.utils.templates import get_active_candidate_link
+from tally_ho.libs.utils.revisions import register
 
 
 class Candidate(BaseModel):
@@ -131,4 +131,4 @@ class Candidate(BaseModel):
         return get_active_candidate_link(self) if self else None
 
 
-reversion.register(Candidate)
+register(Candidate)
@@ -1,7 +1,6 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.office import Office
@@ -11,6 +10,7 @@ from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.dependencies import check_results_for_forms
 from tally_ho.libs.models.enums.center_type import CenterType
 from tally_ho.libs.models.enums.disable_reason import DisableReason
+from tally_ho.libs.utils.revisions import register
 
 
 class Center(BaseModel):
@@ -78,4 +78,4 @@ class Center(BaseModel):
         return 'Special' if self.center_type == 1 else 'General'
 
 
-reversion.register(Center)
+register(Center)
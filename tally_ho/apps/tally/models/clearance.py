@@ -1,7 +1,6 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.tally import Tally
@@ -11,6 +10,7 @@ from tally_ho.libs.models.enums.actions_prior import ActionsPrior
 from tally_ho.libs.models.enums.clearance_resolution import\
     ClearanceResolution
 from tally_ho.libs.utils.collections import keys_if_value
+from tally_ho.libs.utils.revisions import register
 
 
 class Clearance(BaseModel):
@@ -78,4 +78,4 @@ class Clearance(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(Clearance)
+register(Clearance)
@@ -1,5 +1,4 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.center import Center
@@ -7,6 +6,7 @@ from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class Comment(BaseModel):
@@ -43,4 +43,4 @@ class Comment(BaseModel):
                               on_delete=models.PROTECT)
 
 
-reversion.register(Comment)
+register(Comment)
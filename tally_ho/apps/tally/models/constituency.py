@@ -1,8 +1,8 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class Constituency(BaseModel):
@@ -22,4 +22,4 @@ class Constituency(BaseModel):
         return self.name
 
 
-reversion.register(Constituency)
+register(Constituency)
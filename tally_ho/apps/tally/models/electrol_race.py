@@ -1,4 +1,3 @@
-import reversion
 from django.db import models
 from enumfields import EnumIntegerField
 import os
@@ -9,6 +8,7 @@ from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.enums.disable_reason import DisableReason
 from tally_ho.libs.utils.templates import get_electrol_race_link
 from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.libs.utils.revisions import register
 
 def bck_grnd_img_directory_path(instance, filename):
     # file will be uploaded to
@@ -71,4 +71,4 @@ def auto_delete_background_image(sender, instance, **kwargs):
     return False
 
 
-reversion.register(ElectrolRace)
+register(ElectrolRace)
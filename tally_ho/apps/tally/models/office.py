@@ -1,9 +1,9 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.region import Region
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class Office(BaseModel):
@@ -29,4 +29,4 @@ class Office(BaseModel):
         return u'%s - %s' % (self.number, self.name)
 
 
-reversion.register(Office)
+register(Office)
@@ -1,11 +1,11 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-import reversion
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class QualityControl(BaseModel):
@@ -48,4 +48,4 @@ class QualityControl(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(QualityControl)
+register(QualityControl)
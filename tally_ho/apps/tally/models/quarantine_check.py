@@ -1,9 +1,9 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-import reversion
 
 from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.libs.utils.revisions import register
 
 
 class QuarantineCheck(BaseModel):
@@ -29,4 +29,4 @@ class QuarantineCheck(BaseModel):
         return _(self.name)
 
 
-reversion.register(QuarantineCheck)
+register(QuarantineCheck)
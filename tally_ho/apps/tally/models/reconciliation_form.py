@@ -1,4 +1,3 @@
-import reversion
 from django.db import models
 from django.db.models import IntegerField, OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
@@ -11,6 +10,7 @@ from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.apps.tally.models.workflow_request import WorkflowRequest
 from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.utils.revisions import register
 
 
 class ReconciliationFormSet(models.QuerySet):
@@ -131,4 +131,4 @@ class ReconciliationForm(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(ReconciliationForm)
+register(ReconciliationForm)
@@ -1,8 +1,8 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class Region(BaseModel):
@@ -22,4 +22,4 @@ class Region(BaseModel):
         return self.name
 
 
-reversion.register(Region)
+register(Region)
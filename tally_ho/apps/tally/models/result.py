@@ -1,6 +1,5 @@
 from django.db import models
 from enumfields import EnumIntegerField
-import reversion
 from django.utils.translation import gettext_lazy as _
 
 from tally_ho.apps.tally.models.candidate import Candidate
@@ -10,6 +9,7 @@ from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.models.base_model import BaseModel
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.apps.tally.models.workflow_request import WorkflowRequest
+from tally_ho.libs.utils.revisions import register
 
 
 class Result(BaseModel):
@@ -56,4 +56,4 @@ class Result(BaseModel):
         super().save(*args, **kwargs)
 
 
-reversion.register(Result)
+register(Result)
@@ -1,11 +1,12 @@
+import functools
+
 from django.core.exceptions import SuspiciousOperation
 from django.db import models, transaction
-from django.db.models import Q, Sum
+from django.db.models import F, Q, Sum
 from django.forms.models import model_to_dict
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.center import Center
@@ -19,6 +20,24 @@ from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.utils.templates import get_result_form_edit_delete_links
 from tally_ho.apps.tally.models.result_form_reset import ResultFormReset
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.libs.utils.cache import (
+    REFERENCE_DATA,
+    REPORTS,
+    invalidate_tally_cache,
+)
+from tally_ho.libs.utils.revisions import register
+from tally_ho.libs.workflow.diff import diff_result_form
+
+_UNKNOWN_STATE = object()
+# Only written by state changes, which check the version first.
+_STATE_FIELDS = frozenset(['form_state', 'version'])
+
+
+class ResultFormConflict(Exception):
+    """Raised when a result form changed state since it was loaded."""
 
 male_local = _('Male')
 female_local = _('Female')
@@ -43,17 +62,12 @@ def get_matched_results(result_form, results):
 
     :returns: A list of matched and unmatched results.
     """
-    results_v1 = results.filter(
-        result_form=result_form, entry_version=EntryVersion.DATA_ENTRY_1)\
-        .values('candidate', 'votes')
-    results_v2 = results.filter(
-        result_form=result_form, entry_version=EntryVersion.DATA_ENTRY_2)\
-        .values('candidate', 'votes')
-
-    if results and (not results_v1 or not results_v2):
+    diff = diff_result_form(result_form, results)
+
+    if diff.counts and not diff.double_entered:
         raise SuspiciousOperation(_(u"Result Form has no double entries."))
 
-    if results_v1.count() != results_v2.count():
+    if not diff.counts_match:
         result_form.previous_form_state = result_form.form_state
         result_form.reject()
 
@@ -62,11 +76,7 @@ def get_matched_results(result_form, results):
             u"return result form to Data Entry 1." %
             {'barcode': result_form.barcode}))
 
-    tuple_list = [i.items() for i in results_v1]
-    matches = [rec for rec in results_v2 if rec.items() in tuple_list]
-    no_match = [rec for rec in results_v2 if rec.items() not in tuple_list]
-
-    return matches, no_match
+    return diff.split()
 
 
 def match_results(result_form, results=None):
@@ -149,6 +159,8 @@ class ResultForm(BaseModel):
             models.Index(fields=['form_state', 'tally']),
             # Optimize ballot and form_state queries
             models.Index(fields=['ballot', 'form_state', 'tally']),
+            # Serve work queues in order without sorting the state
+            models.Index(fields=['tally', 'form_state', 'id']),
         ]
         unique_together = (('barcode', 'tally'), ('serial_number', 'tally'))
 
@@ -201,6 +213,116 @@ class ResultForm(BaseModel):
         related_name='result_form',
         on_delete=models.SET_NULL,
     )
+    # The clerk working the form in its current state. Claims lapse after
+    # WORK_QUEUE_CLAIM_SECONDS and are cleared when the state changes, see
+    # tally_ho.libs.workflow.queues.
+    claimed_by = models.ForeignKey(
+        UserProfile,
+        null=True,
+        blank=True,
+        related_name='claimed_result_forms',
+        on_delete=models.SET_NULL,
+    )
+    claimed_date = models.DateTimeField(null=True, blank=True)
+    # Incremented by every state change, so a change made from a stale
+    # copy of the form is refused instead of overwriting another one.
+    version = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored state so save can log state changes.
+        instance._loaded_form_state = instance.__dict__.get(
+            'form_state', _UNKNOWN_STATE)
+        # And the ballot and office, the ballot topology depends on them.
+        instance._loaded_ballot_office = instance._ballot_office
+
+        return instance
+
+    @property
+    def _ballot_office(self):
+        return self.__dict__.get('ballot_id'), self.__dict__.get('office_id')
+
+    def save(self, *args, **kwargs):
+        """Save the form and log a transition if its state changed.
+
+        State changes release the form's claim and invalidate the tally's
+        cached reports once the transaction commits. Other saves leave the
+        stored state and version alone, so a stale copy of the form does
+        not undo a state change made since it was loaded.
+
+        :raises: `ResultFormConflict` if the state changes and the form's
+            version in the database is not the version loaded, because
+            another request changed its state first.
+        """
+        adding = self._state.adding
+        from_state = None if adding else getattr(
+            self, '_loaded_form_state', _UNKNOWN_STATE)
+        update_fields = kwargs.get('update_fields')
+        state_saved = 'form_state' in self.__dict__ and (
+            update_fields is None or 'form_state' in update_fields)
+
+        state_changed = state_saved and from_state != self.form_state
+        ballot_office_changed = self._ballot_office != getattr(
+            self, '_loaded_ballot_office', None) and (
+            update_fields is None or
+            {'ballot', 'ballot_id', 'office', 'office_id'} &
+            set(update_fields))
+
+        if state_changed:
+            self.claimed_by = None
+            self.claimed_date = None
+
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields, 'claimed_by', 'claimed_date', 'version'}
+        elif not adding and update_fields is None and \
+                not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and
+                field.attname not in _STATE_FIELDS and
+                field.attname in self.__dict__]
+
+        with transaction.atomic():
+            if state_changed and not adding and \
+                    from_state is not _UNKNOWN_STATE:
+                self._increment_version()
+
+            super().save(*args, **kwargs)
+
+            if state_saved and from_state != self.form_state:
+                if from_state is _UNKNOWN_STATE:
+                    from_state = self.previous_form_state
+
+                ResultFormTransition.for_result_form(
+                    self, from_state).save()
+                transaction.on_commit(functools.partial(
+                    invalidate_tally_cache, self.tally_id, REPORTS))
+
+            if ballot_office_changed:
+                transaction.on_commit(functools.partial(
+                    invalidate_tally_cache, self.tally_id, REFERENCE_DATA))
+
+        self._loaded_form_state = self.form_state
+        self._loaded_ballot_office = self._ballot_office
+
+    def _increment_version(self):
+        """Increment the stored version if it is the version loaded.
+
+        The update locks the form's row until the transaction ends, so
+        a concurrent state change waits and then finds a newer version.
+        """
+        updated = ResultForm.objects.filter(
+            pk=self.pk, version=self.version,
+        ).update(version=F('version') + 1)
+
+        if not updated:
+            raise ResultFormConflict(
+                _('Form %(barcode)s was changed by another user while you '
+                  'were working on it.') % {'barcode': self.barcode})
+
+        self.version += 1
 
     @property
     def from_pvp(self):
@@ -438,25 +560,23 @@ class ResultForm(BaseModel):
             new_state=FormState.DATA_ENTRY_1,
             reject_reason=None,
             workflow_request=None):
-        """Deactivate existing results and reconciliation forms for this result
+        """Deactivate active results and reconciliation forms for this result
         form, change the state, and increment the rejected count.
 
+        See ``tally_ho.libs.workflow.transitions.reject_result_forms`` to
+        reject many forms at once.
+
         :param new_state: The state to set the form to.
         :param reject_reason: Optional reason text for the rejection.
         :param workflow_request: Optional WorkflowRequest instance that
             triggered this rejection.
         """
-        for result in self.results.all():
-            result.active = False
-            if workflow_request:
-                result.deactivated_by_request = workflow_request
-            result.save()
-
-        for recon in self.reconciliationform_set.all():
-            recon.active = False
-            if workflow_request:
-                recon.deactivated_by_request = workflow_request
-            recon.save()
+        deactivated = {'active': False, 'modified_date': timezone.now()}
+        if workflow_request:
+            deactivated['deactivated_by_request'] = workflow_request
+
+        self.results.filter(active=True).update(**deactivated)
+        self.reconciliationform_set.filter(active=True).update(**deactivated)
 
         self.rejected_count += 1
         self.form_state = new_state
@@ -790,4 +910,4 @@ class ResultForm(BaseModel):
         self.save()
 
 
-reversion.register(ResultForm)
+register(ResultForm)
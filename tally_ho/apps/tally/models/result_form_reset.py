@@ -1,9 +1,9 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 class ResultFormReset(BaseModel):
     class Meta:
@@ -20,4 +20,4 @@ class ResultFormReset(BaseModel):
             self.tally_id = self.result_form.tally_id
         super().save(*args, **kwargs)
 
-reversion.register(ResultFormReset)
+register(ResultFormReset)
@@ -1,10 +1,14 @@
 from django.db import models
-import reversion
+from django.db.models import F
 
 from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_stats_rollup import (
+    ResultFormStatsRollup,
+)
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class ResultFormStats(BaseModel):
@@ -21,9 +25,35 @@ class ResultFormStats(BaseModel):
     reviewed_by_supervisor = models.BooleanField(default=False)
 
     def save(self, *args, **kwargs):
+        adding = self._state.adding
+
         if not self.tally_id and self.result_form_id:
             self.tally_id = self.result_form.tally_id
         super().save(*args, **kwargs)
 
+        if adding:
+            reviewed = int(self.reviewed_by_supervisor)
+            ResultFormStatsRollup.add(
+                self,
+                forms_processed=1,
+                processing_time=int(self.processing_time or 0),
+                data_entry_errors=self.data_entry_errors,
+                forms_with_errors=int(self.data_entry_errors > 0),
+                forms_reviewed=reviewed,
+                forms_approved=reviewed * int(self.approved_by_supervisor))
+
+    def add_data_entry_errors(self, errors):
+        """Attribute data entry errors to the user of these stats.
+
+        :param errors: The number of errors to add.
+        """
+        ResultFormStats.objects.filter(pk=self.pk).update(
+            data_entry_errors=F('data_entry_errors') + errors)
+        ResultFormStatsRollup.add(
+            self,
+            data_entry_errors=errors,
+            forms_with_errors=int(self.data_entry_errors == 0))
+        self.data_entry_errors += errors
+
 
-reversion.register(ResultFormStats)
+register(ResultFormStats)
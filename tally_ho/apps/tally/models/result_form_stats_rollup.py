@@ -0,0 +1,64 @@
+from django.contrib.auth.models import Group
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.apps.tally.models.user_profile import UserProfile
+
+
+class ResultFormStatsRollup(models.Model):
+    """The daily totals of the result form stats of a user, for each group
+    of the user, in a tally.
+
+    ``ResultFormStats`` adds every stats row it saves and every data entry
+    error attributed to one, so the staff performance reports sum a few
+    rows per user instead of every stats row joined to the user's groups.
+    """
+    class Meta:
+        app_label = 'tally'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['tally', 'group', 'date', 'user'],
+                name='unique_result_form_stats_rollup'),
+        ]
+
+    tally = models.ForeignKey(Tally,
+                              on_delete=models.CASCADE,
+                              related_name='result_form_stats_rollups',
+                              db_index=False)
+    group = models.ForeignKey(Group, on_delete=models.CASCADE)
+    date = models.DateField()
+    user = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
+    forms_processed = models.PositiveIntegerField(default=0)
+    processing_time = models.PositiveBigIntegerField(default=0)
+    data_entry_errors = models.PositiveIntegerField(default=0)
+    forms_with_errors = models.PositiveIntegerField(default=0)
+    forms_reviewed = models.PositiveIntegerField(default=0)
+    forms_approved = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def add(cls, result_form_stats, **totals):
+        """Add to the rollups of a stats row, for each group of its user on
+        the day it was created.
+
+        :param result_form_stats: The saved ResultFormStats.
+        :param totals: The amounts to add by field name.
+        """
+        keys = {
+            'tally_id': result_form_stats.tally_id,
+            'user_id': result_form_stats.user_id,
+            'date': timezone.localdate(result_form_stats.created_date),
+        }
+        group_ids = list(Group.objects.filter(
+            user__id=result_form_stats.user_id,
+        ).values_list('pk', flat=True))
+
+        if not group_ids:
+            return
+
+        cls.objects.bulk_create(
+            [cls(group_id=group_id, **keys) for group_id in group_ids],
+            ignore_conflicts=True)
+        cls.objects.filter(group_id__in=group_ids, **keys).update(**{
+            name: F(name) + value for name, value in totals.items()})
@@ -0,0 +1,161 @@
+from django.db import models
+from django.db.models import (
+    Avg,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+)
+from django.utils import timezone
+from enumfields import EnumIntegerField
+
+from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.utils.time import format_duration_human_readable
+
+# The results a form leaves a state with, if it was entered in that state.
+ENTRY_VERSION_BY_STATE = {
+    FormState.DATA_ENTRY_1: EntryVersion.DATA_ENTRY_1,
+    FormState.DATA_ENTRY_2: EntryVersion.DATA_ENTRY_2,
+    FormState.CORRECTION: EntryVersion.FINAL,
+}
+
+
+class ResultFormTransitionQuerySet(models.QuerySet):
+    def history(self):
+        """Return the transitions as history entries, newest first.
+
+        :returns: A list of dicts with the ``user``, ``timestamp``,
+            ``previous_state`` and ``current_state`` names, the
+            ``duration_in_previous_state`` timedelta and its
+            ``duration_display``, and ``is_current``, True for the entry
+            of the current state.
+        """
+        history_data = []
+        previous_timestamp = None
+
+        for transition in self.select_related('user')\
+                .order_by('created_date', 'id'):
+            duration = None
+            if previous_timestamp:
+                duration = transition.created_date - previous_timestamp
+
+            history_data.append({
+                'user': transition.user.username
+                if transition.user else 'Unknown',
+                'timestamp': transition.created_date,
+                'previous_state': transition.from_state.name
+                if transition.from_state is not None else 'None',
+                'current_state': transition.to_state.name,
+                'transition_id': transition.pk,
+                'duration_in_previous_state': duration,
+                'duration_display': format_duration_human_readable(duration),
+                'is_current': False,
+            })
+            previous_timestamp = transition.created_date
+
+        history_data.reverse()
+        if history_data:
+            history_data[0]['is_current'] = True
+
+        return history_data
+
+    def time_in_state(self):
+        """Return how long forms stayed in each state they left.
+
+        A form's time in a state runs from the transition into it to the
+        form's next transition, so the current state of each form is not
+        counted.
+
+        :returns: A dict of FormState to a dict with the ``count`` of
+            forms that left the state and their ``average`` timedelta in
+            it.
+        """
+        left_date = ResultFormTransition.objects.filter(
+            result_form=OuterRef('result_form'),
+            created_date__gt=OuterRef('created_date'),
+        ).order_by('created_date').values('created_date')[:1]
+
+        rows = self.annotate(left_date=Subquery(left_date))\
+            .exclude(left_date=None)\
+            .values('to_state')\
+            .annotate(
+                count=Count('id'),
+                average=Avg(ExpressionWrapper(
+                    F('left_date') - F('created_date'),
+                    output_field=DurationField())))\
+            .order_by()
+
+        return {
+            row['to_state']: {
+                'count': row['count'],
+                'average': row['average'],
+            }
+            for row in rows
+        }
+
+
+class ResultFormTransition(models.Model):
+    """An append-only log of result form state changes.
+
+    Rows are written by ``ResultForm.save`` and never updated. They hold
+    what the history views need so those views do not deserialize
+    reversion versions.
+    """
+    class Meta:
+        app_label = 'tally'
+        indexes = [
+            models.Index(fields=['result_form', 'created_date']),
+            models.Index(fields=['tally', 'to_state', 'created_date']),
+        ]
+
+    result_form = models.ForeignKey('ResultForm',
+                                    on_delete=models.CASCADE,
+                                    related_name='transitions',
+                                    db_index=False)
+    tally = models.ForeignKey(Tally,
+                              null=True,
+                              on_delete=models.CASCADE,
+                              related_name='result_form_transitions',
+                              db_index=False)
+    from_state = EnumIntegerField(FormState, null=True)
+    to_state = EnumIntegerField(FormState)
+    entry_version = EnumIntegerField(EntryVersion, null=True)
+    user = models.ForeignKey(UserProfile,
+                             null=True,
+                             on_delete=models.SET_NULL)
+    created_date = models.DateTimeField(default=timezone.now)
+
+    objects = ResultFormTransitionQuerySet.as_manager()
+
+    @classmethod
+    def for_result_form(cls, result_form, from_state, created_date=None,
+                        user_id=None):
+        """Return an unsaved transition of a result form to its state.
+
+        :param result_form: The result form that changed state.
+        :param from_state: The state the form left, None for a new form.
+        :param created_date: When the form changed state, defaults to now.
+        :param user_id: The user who changed the state, defaults to the
+            result form's user.
+
+        :returns: A ResultFormTransition.
+        """
+        return cls(
+            result_form_id=result_form.pk,
+            tally_id=result_form.tally_id,
+            from_state=from_state,
+            to_state=result_form.form_state,
+            entry_version=ENTRY_VERSION_BY_STATE.get(from_state),
+            user_id=result_form.user_id if user_id is None else user_id,
+            created_date=created_date or timezone.now())
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Result form transitions are append-only.')
+
+        super().save(*args, **kwargs)
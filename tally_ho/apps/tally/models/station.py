@@ -1,6 +1,5 @@
 from datetime import timedelta
 
-import reversion
 from django.db import models
 from enumfields import EnumIntegerField
 from django.utils import timezone
@@ -15,6 +14,7 @@ from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.utils.numbers import rounded_safe_div_percent
 from tally_ho.libs.utils.templates import get_edits_link
 from tally_ho.libs.models.enums.disable_reason import DisableReason
+from tally_ho.libs.utils.revisions import register
 
 
 def status_to_str(status):
@@ -146,4 +146,4 @@ class Station(BaseModel):
                 station.cache_archived_and_received()
 
 
-reversion.register(Station)
+register(Station)
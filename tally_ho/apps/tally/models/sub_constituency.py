@@ -1,10 +1,10 @@
 from django.db import models
-import reversion
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.constituency import Constituency
 from tally_ho.libs.models.base_model import BaseModel
+from tally_ho.libs.utils.revisions import register
 
 
 class SubConstituency(BaseModel):
@@ -56,4 +56,4 @@ class SubConstituency(BaseModel):
             return None
 
 
-reversion.register(SubConstituency)
+register(SubConstituency)
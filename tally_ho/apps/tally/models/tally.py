@@ -31,6 +31,10 @@ class Tally(BaseModel):
         PvpMode,
         default=PvpMode.DISABLED,
         help_text=_('Preliminary Vote Protocol ingest mode for this tally'))
+    auto_promote_matching_forms = models.BooleanField(
+        default=False,
+        help_text=_('Move forms whose data entries match from Corrections '
+                    'to Quality Control automatically'))
 
     def __str__(self):
         return u'%d - %s' % (self.id, self.name)
@@ -1,10 +1,10 @@
-import reversion
 from django.contrib.auth.models import User
 from django.db import models
 
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.utils.templates import get_edit_user_link
+from tally_ho.libs.utils.revisions import register
 
 
 class UserProfile(User):
@@ -69,4 +69,4 @@ class UserProfile(User):
         return "%s - %s %s" % (self.username, self.first_name, self.last_name)
 
 
-reversion.register(UserProfile)
+register(UserProfile)
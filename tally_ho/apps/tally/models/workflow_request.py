@@ -2,7 +2,6 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumIntegerField
-import reversion
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.tally import Tally
@@ -12,9 +11,10 @@ from tally_ho.libs.models.enums.request_reason import RequestReason
 from tally_ho.libs.models.enums.request_status import RequestStatus
 from tally_ho.libs.models.enums.request_type import RequestType
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.utils.revisions import register
 
 
-@reversion.register()
+@register()
 class WorkflowRequest(BaseModel):
     class Meta:
         app_label = 'tally'
@@ -26,7 +26,8 @@ for (var i = 1; i <= totalSteps; i++) {
 
   $("#progressbar" + i).progressbar({
     value: false,
-    max: total,
+    // Until the file is counted its total is the state of the count.
+    max: total || 100,
   });
 }
 
@@ -84,6 +85,17 @@ const checkImportProgress = (taskId) => {
     },
     success(data) {
       if (data?.status === "OK") {
+        // Files are counted in the background once uploaded.
+        if (data?.total_elements != null && !data?.done) {
+          $("#total" + currentStep).html(data.total_elements);
+          if (typeof data.total_elements === "number") {
+            $("#progressbar" + currentStep).progressbar(
+              "option",
+              "max",
+              data.total_elements
+            );
+          }
+        }
         if (data.elements_processed !== 0) {
           updateDomWithElementsProcessed(data?.elements_processed, data?.done);
         }
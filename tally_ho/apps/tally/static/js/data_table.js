@@ -66,6 +66,26 @@ $(document).ready(function () {
     return payload
   }
 
+  /**
+   * Searches on the server once typing has paused instead of throttling
+   * a request every 400ms while typing, which DataTables does by default.
+   */
+  const debounceSearch = (api, delay = 400) => {
+    let timer;
+    $(api.table().container())
+      .find('.dataTables_filter input')
+      .off('keyup.DT search.DT input.DT paste.DT cut.DT')
+      .on('input.DT', function () {
+        const input = this;
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+          if (api.search() !== input.value) {
+            api.search(input.value).draw();
+          }
+        }, delay);
+      });
+  };
+
   const createTable = () => {
     const table = $('.datatable').DataTable({
       language: dt_language, // global variable defined in html
@@ -140,6 +160,9 @@ $(document).ready(function () {
        */
       initComplete: function(settings, json) {
         $(this.api().table().container()).find('table').DataTable().columns.adjust();
+        if (serverSide) {
+          debounceSearch(this.api());
+        }
       },
 
       /**
@@ -10,81 +10,30 @@ $(document).ready(function () {
         a.remove();
     };
 
+    // Streamed exports are downloaded by the browser as they are written.
+    const downloadExport = function (url, data) {
+        window.location = `${url}?${$.param({ data: JSON.stringify(data) })}`;
+    };
+
     $("#in-report").on("click", "#export-results", function () {
-        $("#export-results").html("Exporting...");
-        $("#export-results").prop("disabled", true);
-        $.ajax({
-            url: resultsDownloadUrl,
-            data: {
-                data: JSON.stringify({
-                    tally_id: tallyId,
-                }),
-            },
-            traditional: true,
-            dataType: 'json',
-            success: (data) => {
-                downloadResults(data, `results_${Date.now()}.json`);
-                $("#export-results").removeAttr("disabled");
-                $("#export-results").html("All Results JSON Export");
-            },
+        downloadExport(resultsDownloadUrl, {
+            tally_id: tallyId,
         });
     });
 
     $("#in-report").on("click", "#export-centers-by-mun-results", function () {
-        $("#export-centers-by-mun-results").html("Exporting...");
-        $("#export-centers-by-mun-results").prop("disabled", true);
-        $.ajax({
-            url: centersByMunResultsDownloadUrl,
-            data: {
-                data: JSON.stringify({
-                    tally_id: tallyId,
-                }),
-            },
-            traditional: true,
-            dataType: 'json',
-            success: (data) => {
-                downloadResults(data, `centers_by_mun_results_${Date.now()}.json`);
-                $("#export-centers-by-mun-results").removeAttr("disabled");
-                $("#export-centers-by-mun-results").html("All Centers By Mun Results JSON Export");
-            },
+        downloadExport(centersByMunResultsDownloadUrl, {
+            tally_id: tallyId,
         });
     });
     $("#in-report").on("click", "#export-centers-by-mun-c-votes-results", function () {
-        $("#export-centers-by-mun-c-votes-results").html("Exporting...");
-        $("#export-centers-by-mun-c-votes-results").prop("disabled", true);
-        $.ajax({
-            url: centersByMunCandidatesVotesResultsDownloadUrl,
-            data: {
-                data: JSON.stringify({
-                    tally_id: tallyId,
-                }),
-            },
-            traditional: true,
-            dataType: 'json',
-            success: (data) => {
-                downloadResults(data, `centers_by_mun_c_votes_results_${Date.now()}.json`);
-                $("#export-centers-by-mun-c-votes-results").removeAttr("disabled");
-                $("#export-centers-by-mun-c-votes-results").html("Centers By Mun Candidates Votes Results (JSON)");
-            },
+        downloadExport(centersByMunCandidatesVotesResultsDownloadUrl, {
+            tally_id: tallyId,
         });
     });
     $("#in-report").on("click", "#export-centers-stations-by-mun-c-votes-results", function () {
-        $("#export-centers-stations-by-mun-c-votes-results").html("Exporting...");
-        $("#export-centers-stations-by-mun-c-votes-results").prop("disabled", true);
-        $.ajax({
-            url: centersStationsByMunCandidatesVotesResultsDownloadUrl,
-            data: {
-                data: JSON.stringify({
-                    tally_id: tallyId,
-                }),
-            },
-            traditional: true,
-            dataType: 'json',
-            success: (data) => {
-                downloadResults(data, `centers_stations_by_mun_c_votes_results_${Date.now()}.json`);
-                $("#export-centers-stations-by-mun-c-votes-results").removeAttr("disabled");
-                $("#export-centers-stations-by-mun-c-votes-results").html("Centers/Stations By Mun Candidates Votes Results (JSON)");
-            },
+        downloadExport(centersStationsByMunCandidatesVotesResultsDownloadUrl, {
+            tally_id: tallyId,
         });
     });
 
@@ -109,24 +58,10 @@ $(document).ready(function () {
     });
 
     $("#report").on("click", "#export-form-results-parliamentary", function () {
-        $("#export-form-results-parliamentary").html("Exporting...");
-        $("#export-form-results-parliamentary").prop("disabled", true);
         const parliamentaryRaceTypeNumbers = [0,1];
-        $.ajax({
-            url: resultsDownloadUrl,
-            data: {
-                data: JSON.stringify({
-                    tally_id: tallyId,
-                    race_types: parliamentaryRaceTypeNumbers
-                }),
-            },
-            traditional: true,
-            dataType: 'json',
-            success: (data) => {
-                downloadResults(data, 'parliamentary_results.json');
-                $("#export-form-results-parliamentary").removeAttr("disabled");
-                $("#export-form-results-parliamentary").html("Export Parliamentary Results in JSON");
-            },
+        downloadExport(resultsDownloadUrl, {
+            tally_id: tallyId,
+            race_types: parliamentaryRaceTypeNumbers
         });
     });
 });
\ No newline at end of file
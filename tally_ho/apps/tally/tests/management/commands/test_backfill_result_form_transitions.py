@@ -0,0 +1,77 @@
+import io
+
+from django.core.management import call_command
+from reversion import revisions
+
+from tally_ho.apps.tally.management.commands.\
+    backfill_result_form_transitions import backfill_result_form_transitions
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (TestBase, create_result_form,
+                                           create_tally)
+
+
+class TestBackfillResultFormTransitions(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.tally = create_tally()
+
+        with revisions.create_revision():
+            self.result_form = create_result_form(
+                form_state=FormState.DATA_ENTRY_1,
+                tally=self.tally,
+                user=self.user)
+
+        for form_state in [FormState.DATA_ENTRY_1, FormState.DATA_ENTRY_2]:
+            with revisions.create_revision():
+                self.result_form.form_state = form_state
+                self.result_form.save()
+
+        ResultFormTransition.objects.all().delete()
+
+    def test_backfill_from_versions(self):
+        self.assertEqual(backfill_result_form_transitions(), 2)
+
+        transitions = list(
+            self.result_form.transitions.order_by('created_date'))
+
+        self.assertEqual(
+            [(t.from_state, t.to_state) for t in transitions],
+            [(None, FormState.DATA_ENTRY_1),
+             (FormState.DATA_ENTRY_1, FormState.DATA_ENTRY_2)])
+        self.assertEqual(transitions[1].entry_version,
+                         EntryVersion.DATA_ENTRY_1)
+        self.assertEqual(transitions[1].user_id, self.user.pk)
+        self.assertEqual(transitions[1].tally_id, self.tally.pk)
+
+    def test_backfill_is_idempotent(self):
+        backfill_result_form_transitions()
+
+        self.assertEqual(backfill_result_form_transitions(), 0)
+        self.assertEqual(self.result_form.transitions.count(), 2)
+
+    def test_backfill_keeps_logged_transitions(self):
+        self.result_form.form_state = FormState.CORRECTION
+        self.result_form.save()
+
+        self.assertEqual(backfill_result_form_transitions(), 2)
+        self.assertEqual(
+            self.result_form.transitions.latest('created_date').to_state,
+            FormState.CORRECTION)
+
+    def test_backfill_tally(self):
+        other_tally = create_tally(name='otherTally')
+
+        self.assertEqual(
+            backfill_result_form_transitions(tally_id=other_tally.pk), 0)
+        self.assertEqual(
+            backfill_result_form_transitions(tally_id=self.tally.pk), 2)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('backfill_result_form_transitions', stdout=out)
+
+        self.assertIn('Created 2 result form transitions.', out.getvalue())
@@ -1,9 +1,7 @@
 import duckdb
-import json
 
 from django.conf import settings
-from django.test import TestCase
-from unittest.mock import patch, MagicMock
+from django.test import TestCase, override_settings
 
 from tally_ho.apps.tally.management.commands.import_electrol_races_and_ballots\
     import (
@@ -12,8 +10,13 @@ from tally_ho.apps.tally.management.commands.import_electrol_races_and_ballots\
     )
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.electrol_race import ElectrolRace
-from tally_ho.libs.tests.test_base import create_tally
+from tally_ho.libs.tests.test_base import LOCMEM_CACHES, create_tally
+from tally_ho.libs.utils.cache import (
+    delete_cached_model_instances_count,
+    get_cached_model_instances_count,
+)
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class TestCreateBallotsFromBallotFileData(TestCase):
     def setUp(self):
         self.tally = create_tally()
@@ -33,21 +36,15 @@ class TestCreateBallotsFromBallotFileData(TestCase):
             tally=self.tally
         )
         self.cache_key = 'test_cache_key'
+        delete_cached_model_instances_count(self.cache_key)
 
-    @patch('tally_ho.libs.utils.memcache.MemCache', autospec=True)
-    def test_create_ballots(self, mock_memcache):
+    def test_create_ballots(self):
         electrol_races = ElectrolRace.objects.filter(tally=self.tally)
-        # Mock the MemCache instance
-        memcache_instance = MagicMock()
-        mock_memcache.return_value = memcache_instance
-        memcache_instance.get.return_value = (None, None)
-
         create_ballots_from_ballot_file_data(
             duckdb_ballots_data=self.duckdb_ballots_data,
             electrol_races=electrol_races,
             tally=self.tally,
-            instances_count_memcache_key=self.cache_key,
-            memcache_client=memcache_instance
+            instances_count_cache_key=self.cache_key,
         )
         ballot_name_column_name =\
             getattr(settings,
@@ -63,24 +60,17 @@ class TestCreateBallotsFromBallotFileData(TestCase):
                     f"{ballot_name_column_name} != "
                     f"'ballot_number_HOR_component - Matrix'")).distinct()
 
-        cached_data =\
-            json.dumps(
-                {
-                    "elements_processed": self.duckdb_ballots_data.shape[0],
-                    "done": True
-                }
-            )
-        memcache_instance.get.assert_called_once_with(self.cache_key)
-        memcache_instance.set.assert_called_once_with(
-            self.cache_key,
-            cached_data)
+        elements_processed, done =\
+            get_cached_model_instances_count(self.cache_key)
+        self.assertEqual(elements_processed,
+                         self.duckdb_ballots_data.shape[0])
+        self.assertTrue(done)
 
         # Assert that the Ballot objects are created
         self.assertEqual(Ballot.objects.filter(tally=self.tally).count(),
                          self.duckdb_ballots_data.shape[0])
 
-    @patch('tally_ho.libs.utils.memcache.MemCache', autospec=True)
-    def test_create_ballots_with_exception(self, mock_memcache):
+    def test_create_ballots_with_exception(self):
         file_path =\
             'tally_ho/libs/tests/fixtures/tally_setup_files/ballot_order.csv'
         # Call the function with faulty data that raises an exception
@@ -88,16 +78,10 @@ class TestCreateBallotsFromBallotFileData(TestCase):
             file_path,
             header=True)
         electrol_races = ElectrolRace.objects.filter(tally=self.tally)
-        # Mock the MemCache instance
-        memcache_instance = MagicMock()
-        mock_memcache.return_value = memcache_instance
-        memcache_instance.get.return_value = (None, None)
-
         with self.assertRaises(Exception):
             create_ballots_from_ballot_file_data(
                 duckdb_ballots_data=faulty_duckdb_ballots_data,
                 electrol_races=electrol_races,
                 tally=self.tally,
-                instances_count_memcache_key=self.cache_key,
-                memcache_client=memcache_instance
+                instances_count_cache_key=self.cache_key,
             )
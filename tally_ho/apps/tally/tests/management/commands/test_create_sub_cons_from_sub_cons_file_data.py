@@ -1,8 +1,6 @@
-import json
 import duckdb
 
-from django.test import TestCase
-from unittest.mock import patch, MagicMock
+from django.test import TestCase, override_settings
 
 from tally_ho.apps.tally.management.commands.import_sub_cons_and_cons\
     import (
@@ -15,8 +13,13 @@ from tally_ho.apps.tally.management.commands.import_electrol_races_and_ballots\
     )
 from tally_ho.apps.tally.models.constituency import Constituency
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
-from tally_ho.libs.tests.test_base import create_tally
+from tally_ho.libs.tests.test_base import LOCMEM_CACHES, create_tally
+from tally_ho.libs.utils.cache import (
+    delete_cached_model_instances_count,
+    get_cached_model_instances_count,
+)
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class TestCreateSubConsFromSubConsFileData(TestCase):
     def setUp(self):
         self.tally = create_tally()
@@ -34,46 +37,33 @@ class TestCreateSubConsFromSubConsFileData(TestCase):
             tally=self.tally
         )
         self.cache_key = 'test_cache_key'
+        delete_cached_model_instances_count(self.cache_key)
 
-    @patch('tally_ho.libs.utils.memcache.MemCache', autospec=True)
-    def test_create_sub_constituencies(self, mock_memcache):
+    def test_create_sub_constituencies(self):
         constituencies_by_name =\
                 {
                     constituency.name:\
                     constituency for constituency in\
                         Constituency.objects.filter(tally=self.tally)
                 }
-        # Mock the MemCache instance
-        memcache_instance = MagicMock()
-        mock_memcache.return_value = memcache_instance
-        memcache_instance.get.return_value = (None, None)
-
         create_sub_constituencies_from_sub_con_file_data(
             duckdb_sub_con_data=self.duckdb_sub_cons_data,
             constituencies_by_name=constituencies_by_name,
             tally=self.tally,
-            instances_count_memcache_key=self.cache_key,
-            memcache_client=memcache_instance
+            instances_count_cache_key=self.cache_key,
         )
 
-        cached_data =\
-            json.dumps(
-                {
-                    "elements_processed": self.duckdb_sub_cons_data.shape[0],
-                    "done": True
-                }
-            )
-        memcache_instance.get.assert_called_once_with(self.cache_key)
-        memcache_instance.set.assert_called_once_with(
-            self.cache_key,
-            cached_data)
+        elements_processed, done =\
+            get_cached_model_instances_count(self.cache_key)
+        self.assertEqual(elements_processed,
+                         self.duckdb_sub_cons_data.shape[0])
+        self.assertTrue(done)
 
         # Assert that the Sub Constituency objects are created
         cons = SubConstituency.objects.filter(tally=self.tally)
         self.assertGreater(cons.count(), 0)
 
-    @patch('tally_ho.libs.utils.memcache.MemCache', autospec=True)
-    def test_create_sub_constituencies_with_exception(self, mock_memcache):
+    def test_create_sub_constituencies_with_exception(self):
         file_path =\
             'tally_ho/libs/tests/fixtures/tally_setup_files/ballot_order.csv'
         # Call the function with faulty data that raises an exception
@@ -86,16 +76,10 @@ class TestCreateSubConsFromSubConsFileData(TestCase):
                     constituency for constituency in\
                         Constituency.objects.filter(tally=self.tally)
                 }
-        # Mock the MemCache instance
-        memcache_instance = MagicMock()
-        mock_memcache.return_value = memcache_instance
-        memcache_instance.get.return_value = (None, None)
-
         with self.assertRaises(Exception):
             create_sub_constituencies_from_sub_con_file_data(
             duckdb_sub_con_data=faulty_duckdb_ballots_data,
             constituencies_by_name=constituencies_by_name,
             tally=self.tally,
-            instances_count_memcache_key=self.cache_key,
-            memcache_client=memcache_instance
+            instances_count_cache_key=self.cache_key,
         )
@@ -0,0 +1,126 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from tally_ho.apps.tally.management.commands.create_synthetic_tally import (
+    create_synthetic_tally,
+    parse_form_states,
+)
+from tally_ho.apps.tally.models.reconciliation_form import (
+    ReconciliationForm,
+)
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.apps.tally.models.station import Station
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+
+SIZES = {
+    "regions": 2,
+    "offices_per_region": 1,
+    "sub_cons_per_office": 2,
+    "centers_per_sub_con": 2,
+    "stations_per_center": 2,
+    "ballots": 3,
+    "ballots_per_sub_con": 2,
+    "candidates_per_ballot": 3,
+    "duplicates": 2,
+    "replacements": 1,
+}
+
+
+def _snapshot(tally):
+    return (
+        list(ResultForm.objects.filter(tally=tally).order_by(
+            "barcode").values_list(
+                "barcode", "form_state", "station_number",
+                "center__code", "ballot__number", "is_replacement")),
+        list(Result.objects.filter(tally=tally).order_by(
+            "result_form__barcode", "entry_version",
+            "candidate__candidate_id").values_list(
+                "result_form__barcode", "entry_version", "votes")),
+    )
+
+
+class TestCreateSyntheticTally(TestCase):
+    def test_creates_sized_tally(self):
+        tally, counts = create_synthetic_tally(seed=3, **SIZES)
+
+        self.assertEqual(Station.objects.filter(tally=tally).count(), 16)
+        # A form per station and ballot, plus duplicates and replacements.
+        self.assertEqual(counts["result_forms"], 16 * 2 + 2 + 1)
+        self.assertEqual(
+            ResultForm.objects.filter(tally=tally).count(), 35)
+        self.assertEqual(
+            ResultForm.objects.filter(
+                tally=tally, is_replacement=True).count(), 1)
+        self.assertEqual(counts["results"],
+                         Result.objects.filter(tally=tally).count())
+        self.assertEqual(
+            counts["reconciliation_forms"],
+            ReconciliationForm.objects.filter(tally=tally).count())
+
+    def test_entries_match_form_states(self):
+        tally, _ = create_synthetic_tally(
+            seed=3,
+            form_states={FormState.ARCHIVED: 1},
+            **{**SIZES, "duplicates": 0, "replacements": 0})
+
+        result_form = ResultForm.objects.filter(tally=tally).first()
+        self.assertEqual(result_form.form_state, FormState.ARCHIVED)
+        self.assertEqual(
+            set(result_form.results.values_list(
+                "entry_version", flat=True)),
+            {EntryVersion.DATA_ENTRY_1, EntryVersion.DATA_ENTRY_2,
+             EntryVersion.FINAL})
+        recon = result_form.reconciliationform_set.get(
+            entry_version=EntryVersion.FINAL)
+        final_votes = sum(result_form.results.filter(
+            entry_version=EntryVersion.FINAL).values_list(
+                "votes", flat=True))
+        self.assertEqual(recon.number_valid_votes, final_votes)
+        self.assertEqual(
+            [t["current_state"] for t in result_form.transitions.history()],
+            ["ARCHIVED", "QUALITY_CONTROL", "DATA_ENTRY_2", "DATA_ENTRY_1",
+             "INTAKE", "UNSUBMITTED"])
+        self.assertEqual(
+            ResultFormTransition.objects.filter(tally=tally).count(),
+            6 * 32)
+
+    def test_same_seed_same_tally(self):
+        tally, _ = create_synthetic_tally(name="First", seed=7, **SIZES)
+        first = _snapshot(tally)
+        tally, _ = create_synthetic_tally(name="First", seed=7, clean=True,
+                                          **SIZES)
+
+        self.assertEqual(_snapshot(tally), first)
+
+    def test_existing_name_is_rejected(self):
+        create_synthetic_tally(**SIZES)
+
+        with self.assertRaises(ValueError):
+            create_synthetic_tally(**SIZES)
+
+    def test_parse_form_states(self):
+        self.assertEqual(
+            parse_form_states("archived=3, UNSUBMITTED=1"),
+            {FormState.ARCHIVED: 3, FormState.UNSUBMITTED: 1})
+
+        with self.assertRaises(ValueError):
+            parse_form_states("ARCHIVING=1")
+
+        with self.assertRaises(ValueError):
+            parse_form_states("ARCHIVED")
+
+    def test_command(self):
+        call_command(
+            "create_synthetic_tally", "--regions=1",
+            "--centers-per-sub-con=1", "--candidates-per-ballot=2",
+            "--form-states=DATA_ENTRY_2=1", verbosity=0)
+
+        with self.assertRaises(CommandError):
+            call_command("create_synthetic_tally", "--regions=1",
+                         verbosity=0)
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+
+from django.test import override_settings
+from pptx import Presentation
+
+from tally_ho.apps.tally.management.commands.export_results_presentation\
+    import async_export_results_presentation
+from tally_ho.apps.tally.models.center import Center
+from tally_ho.libs.models.enums.center_type import CenterType
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.reports.results_presentation import (
+    get_results_presentation_dir,
+)
+from tally_ho.libs.tests.fixtures.electrol_race_data import electrol_races
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    create_ballot,
+    create_candidates,
+    create_electrol_race,
+    create_office,
+    create_result_form,
+    create_station,
+    create_sub_constituency,
+    create_tally,
+)
+
+
+class TestExportResultsPresentation(TestBase):
+    def setUp(self):
+        self.presentation_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.presentation_dir)
+        settings_override = override_settings(
+            RESULTS_PRESENTATION_DIR=self.presentation_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.tally = create_tally()
+        ballot = create_ballot(
+            self.tally,
+            electrol_race=create_electrol_race(
+                self.tally, **electrol_races[0]))
+        sub_constituency = create_sub_constituency(
+            code=1, tally=self.tally, ballots=[ballot])
+        center = Center.objects.create(
+            code=1,
+            name="1",
+            office=create_office(tally=self.tally),
+            tally=self.tally,
+            sub_constituency=sub_constituency,
+            center_type=CenterType.GENERAL)
+        station = create_station(center=center, tally=self.tally)
+        result_form = create_result_form(
+            tally=self.tally,
+            form_state=FormState.ARCHIVED,
+            center=center,
+            station_number=station.station_number,
+            ballot=ballot)
+        create_candidates(
+            result_form, votes=20, user=self._create_user(), num_results=1,
+            tally=self.tally)
+        result_form.results.update(entry_version=EntryVersion.FINAL)
+
+    def test_export_results_presentation(self):
+        file_name = async_export_results_presentation(
+            tally_id=self.tally.id, data={"export_number": 1})
+
+        presentation = Presentation(os.path.join(
+            get_results_presentation_dir(self.tally.id), file_name))
+        # The cover page, then a summary and a candidates results slide.
+        self.assertEqual(len(presentation.slides), 3)
+
+    def test_export_without_results(self):
+        self.assertIsNone(async_export_results_presentation(
+            tally_id=create_tally(name="empty").id, data={}))
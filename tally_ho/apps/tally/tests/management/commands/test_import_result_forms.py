@@ -0,0 +1,123 @@
+import os
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from tally_ho.apps.tally.management.commands.asign_ballots_to_sub_cons\
+    import async_asign_ballots_to_sub_cons_from_ballots_file
+from tally_ho.apps.tally.management.commands.import_centers\
+    import async_import_centers_from_centers_file
+from tally_ho.apps.tally.management.commands.import_electrol_races_and_ballots\
+    import async_import_electrol_races_and_ballots_from_ballots_file
+from tally_ho.apps.tally.management.commands.import_result_forms\
+    import async_import_results_forms_from_result_forms_file
+from tally_ho.apps.tally.management.commands.import_stations\
+    import async_import_stations_from_stations_file
+from tally_ho.apps.tally.management.commands.import_sub_cons_and_cons\
+    import (
+        async_import_sub_constituencies_and_constituencies_from_sub_cons_file\
+            as async_import_sub_cons_and_cons_from_sub_cons_file,
+    )
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.models.enums.gender import Gender
+from tally_ho.libs.tests.test_base import LOCMEM_CACHES, create_tally
+from tally_ho.libs.utils.cache import (
+    get_cache,
+    get_cached_model_instances_count,
+)
+
+FIXTURES = 'tally_ho/libs/tests/fixtures/tally_setup_files'
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestImportResultForms(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.tally = create_tally()
+
+        for task, file_name in (
+                (async_import_electrol_races_and_ballots_from_ballots_file,
+                 'ballots.csv'),
+                (async_import_sub_cons_and_cons_from_sub_cons_file,
+                 'subcons.csv'),
+                (async_asign_ballots_to_sub_cons_from_ballots_file,
+                 'subs_ballots.csv'),
+                (async_import_centers_from_centers_file, 'centers.csv'),
+                (async_import_stations_from_stations_file, 'stations.csv')):
+            task(tally_id=self.tally.id,
+                 csv_file_path=os.path.join(FIXTURES, file_name))
+
+    def import_result_forms(self, csv_file_path):
+        return async_import_results_forms_from_result_forms_file(
+            tally_id=self.tally.id,
+            csv_file_path=csv_file_path,
+            step_name='result_forms',
+            step_number=7)
+
+    def test_import_result_forms(self):
+        count = self.import_result_forms(
+            os.path.join(FIXTURES, 'result_forms_with_replacements.csv'))
+
+        result_forms = ResultForm.objects.filter(tally=self.tally)
+        self.assertEqual(count, 14)
+        self.assertEqual(result_forms.count(), 14)
+        self.assertEqual(
+            get_cached_model_instances_count(
+                f'{self.tally.id}_result_forms_7'),
+            (14, True))
+
+        result_form = result_forms.get(barcode='31001002105')
+        self.assertEqual(result_form.center.code, 31001)
+        self.assertEqual(result_form.station_number, 2)
+        self.assertEqual(result_form.ballot.number, 105)
+        self.assertEqual(result_form.office.name, 'Tubruq')
+        self.assertEqual(result_form.office.region.name, 'East')
+        self.assertEqual(result_form.gender, Gender.FEMALE)
+        self.assertEqual(result_form.name, 'Test School A')
+        self.assertEqual(result_form.form_state, FormState.UNSUBMITTED)
+        self.assertIsNone(result_form.serial_number)
+        self.assertFalse(result_form.is_replacement)
+        self.assertFalse(result_form.intake_printed)
+        self.assertIsNotNone(result_form.created_date)
+
+        replacement_form = result_forms.get(barcode='99990001002')
+        self.assertTrue(replacement_form.is_replacement)
+        self.assertIsNone(replacement_form.center)
+        self.assertIsNone(replacement_form.gender)
+        self.assertEqual(replacement_form.ballot.number, 2)
+
+    def test_missing_references_are_reported_together(self):
+        with tempfile.NamedTemporaryFile(
+                'w', suffix='.csv', delete=False) as csv_file:
+            csv_file.write(
+                'ballot_number,center_code,station_number,gender,name,'
+                'office_name,barcode,serial_number,region_name\n'
+                '1,31001,2,female,A,Tubruq,1,,East\n'
+                '999,31001,2,female,A,Tubruq,2,,East\n'
+                '1,99999,1,male,A,Tubruq,3,,East\n'
+                '1,31001,9,male,A,Tubruq,4,,East\n'
+                '1,31001,1,male,A,Nowhere,5,,East\n')
+        self.addCleanup(os.remove, csv_file.name)
+
+        with self.assertRaises(Exception) as context:
+            self.import_result_forms(csv_file.name)
+
+        for reference in ('Ballot 999 does not exist',
+                          'Center 99999 does not exist',
+                          'Station 9 does not exist for center 31001',
+                          'Office Nowhere does not exist for region East'):
+            self.assertIn(reference, str(context.exception))
+
+        self.assertFalse(
+            ResultForm.objects.filter(tally=self.tally).exists())
+
+    def test_tally_without_references(self):
+        self.tally = create_tally(name='empty')
+
+        with self.assertRaises(Exception) as context:
+            self.import_result_forms(
+                os.path.join(FIXTURES, 'result_forms.csv'))
+
+        self.assertIn('Ballot 1 does not exist', str(context.exception))
+        self.assertIn('Center 31001 does not exist', str(context.exception))
@@ -1,12 +1,19 @@
 import csv
 import os
 import tempfile
+from io import StringIO
 
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import Group
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from tally_ho.apps.tally.management.commands.import_staff_list import (
+    hash_passwords,
+)
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.permissions import groups
@@ -505,3 +512,162 @@ class TestImportStaffList(TestCase):
         user.save(password_suffix="@Final2024")
         user.refresh_from_db()
         self.assertTrue(user.check_password("test_update_fields@Final2024"))
+
+    def test_hash_passwords_in_process_pool(self):
+        """Test passwords hashed by worker processes"""
+        passwords = ["user1@Test2024", "user2@Test2024", "user3@Test2024"]
+
+        hashed = hash_passwords(passwords, workers=2)
+
+        self.assertEqual(len(hashed), 3)
+        for password, encoded in zip(passwords, hashed):
+            self.assertTrue(check_password(password, encoded))
+
+    def test_queries_do_not_grow_with_rows(self):
+        """Test users are provisioned with a fixed number of queries"""
+        def import_users(prefix, count):
+            csv_file = self.create_staff_csv(f"{prefix}.csv", [
+                {
+                    "name": f"User {i}",
+                    "username": f"{prefix}{i}",
+                    "role": "Intake Clerk" if i % 2 else "Audit Clerk",
+                    "admin": "No",
+                    "tally_id": str(self.test_tally.id),
+                }
+                for i in range(count)
+            ])
+
+            with CaptureQueriesContext(connection) as queries:
+                call_command(
+                    "import_staff_list",
+                    csv_file=csv_file,
+                    csv_template="staff",
+                    password_suffix="@Test2024",
+                    workers=1,
+                    stdout=StringIO(),
+                )
+
+            return len(queries)
+
+        self.assertEqual(import_users("few", 2), import_users("many", 6))
+        self.assertEqual(
+            UserProfile.objects.filter(
+                tally=self.test_tally, groups__name=groups.INTAKE_CLERK
+            ).count(),
+            4,
+        )
+
+    def test_duplicate_username_in_file(self):
+        """Test a username repeated in the file is created once"""
+        data = [
+            {
+                "name": "First User",
+                "username": "same_user",
+                "role": "Audit Clerk",
+                "admin": "No",
+                "tally_id": "",
+            },
+            {
+                "name": "Second User",
+                "username": "same_user",
+                "role": "Intake Clerk",
+                "admin": "Yes",
+                "tally_id": "",
+            },
+        ]
+        csv_file = self.create_staff_csv("duplicate.csv", data)
+        out = StringIO()
+
+        call_command(
+            "import_staff_list",
+            csv_file=csv_file,
+            csv_template="staff",
+            password_suffix="@Test2024",
+            stdout=out,
+        )
+
+        user = UserProfile.objects.get(username="same_user")
+        self.assertEqual(user.first_name, "First")
+        self.assertFalse(user.is_superuser)
+        self.assertIn("User 'same_user' already exists, skipped",
+                      out.getvalue())
+
+    def test_long_username_not_created(self):
+        """Test usernames over the column length are reported"""
+        data = [
+            {
+                "name": "Good User",
+                "username": "good_user",
+                "role": "Audit Clerk",
+                "admin": "No",
+                "tally_id": "",
+            },
+            {
+                "name": "Long User",
+                "username": "x" * 151,
+                "role": "Audit Clerk",
+                "admin": "No",
+                "tally_id": "",
+            },
+        ]
+        csv_file = self.create_staff_csv("long.csv", data)
+        out = StringIO()
+
+        call_command(
+            "import_staff_list",
+            csv_file=csv_file,
+            csv_template="staff",
+            password_suffix="@Test2024",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertTrue(
+            UserProfile.objects.filter(username="good_user").exists())
+        self.assertFalse(
+            UserProfile.objects.filter(username__startswith="x").exists())
+        self.assertIn(f"User '{'x' * 151}' not created!", output)
+        self.assertIn("Imported 1 users successfully.", output)
+        self.assertIn("Failed to import 1 users.", output)
+
+    def test_failed_batch_reports_rows(self):
+        """Test a row failing to insert does not fail its batch"""
+        data = [
+            {
+                "name": "Good User",
+                "username": "good_user",
+                "role": "Audit Clerk",
+                "admin": "No",
+                "tally_id": "",
+            },
+            {
+                "name": "Bad User",
+                "username": "bad_user",
+                "role": "Audit Clerk",
+                "admin": "No",
+                "tally_id": "",
+            },
+        ]
+        csv_file = self.create_staff_csv("bad.csv", data)
+        out = StringIO()
+        # Rolled back with the test.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE auth_user ADD CONSTRAINT no_bad_user "
+                "CHECK (username <> 'bad_user')")
+
+        call_command(
+            "import_staff_list",
+            csv_file=csv_file,
+            csv_template="staff",
+            password_suffix="@Test2024",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertTrue(
+            UserProfile.objects.filter(username="good_user").exists())
+        self.assertIn("User 'bad_user' not created!", output)
+        self.assertIn("Imported 1 users successfully.", output)
+        self.assertIn("Failed to import 1 users.", output)
+        self.assertIn("rows/s", output)
@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from tally_ho.apps.tally.management.commands.utils import (
+    INGEST_DONE,
+    INGEST_FAILED,
+    INGEST_QUEUED,
+    INGEST_RUNNING,
+    DuplicatesFoundError,
+    get_ingest_report,
+    get_ingest_status,
+    ingest_csv_file,
+    ingested_file_paths,
+    read_csv_file,
+    write_ingest_status,
+)
+
+
+class TestIngestCsvFiles(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        settings_override = override_settings(
+            UPLOAD_INGEST_PATH=os.path.join(self.directory, 'ingested'))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.csv_file_path = os.path.join(self.directory, 'forms.csv')
+        self.write_csv_file("barcode,name\n1,A\n2,B\n1,C\n2,B\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_csv_file(self, content):
+        with open(self.csv_file_path, 'w') as csv_file:
+            csv_file.write(content)
+
+    def test_ingest_csv_file(self):
+        self.assertIsNone(get_ingest_report(self.csv_file_path))
+
+        report = ingest_csv_file(
+            self.csv_file_path, ['barcode', 'office'], 'barcode')
+
+        self.assertEqual(report['rows'], 3)
+        self.assertEqual(report['columns'],
+                         {'barcode': 'BIGINT', 'name': 'VARCHAR'})
+        self.assertEqual(report['missing_columns'], ['office'])
+        self.assertEqual(report['duplicates'], [1, 2])
+        self.assertEqual(get_ingest_report(self.csv_file_path), report)
+
+        parquet_path, _ = ingested_file_paths(self.csv_file_path)
+        modified = os.stat(parquet_path).st_mtime_ns
+
+        self.assertEqual(ingest_csv_file(
+            self.csv_file_path, ['barcode', 'office'], 'barcode'), report)
+        self.assertEqual(os.stat(parquet_path).st_mtime_ns, modified)
+
+    def test_changed_file_is_ingested_again(self):
+        ingest_csv_file(self.csv_file_path)
+        self.write_csv_file("barcode,name\n1,A\n2,B\n3,C\n4,D\n")
+
+        self.assertIsNone(get_ingest_report(self.csv_file_path))
+        self.assertEqual(ingest_csv_file(self.csv_file_path)['rows'], 4)
+
+    def test_ingest_status(self):
+        self.assertIsNone(get_ingest_status(self.csv_file_path))
+        write_ingest_status(self.csv_file_path, INGEST_QUEUED)
+
+        self.assertEqual(
+            get_ingest_status(self.csv_file_path)['status'], INGEST_QUEUED)
+        self.assertIsNone(get_ingest_report(self.csv_file_path))
+
+        ingest_csv_file(self.csv_file_path)
+
+        self.assertEqual(
+            get_ingest_status(self.csv_file_path)['status'], INGEST_DONE)
+
+        os.remove(self.csv_file_path)
+
+        self.assertIsNone(get_ingest_status(self.csv_file_path))
+
+    def test_failed_ingest_status(self):
+        with open(self.csv_file_path, 'wb') as csv_file:
+            csv_file.write(b"barcode\n\xff\xfe\n")
+
+        with self.assertRaises(Exception):
+            ingest_csv_file(self.csv_file_path)
+
+        status = get_ingest_status(self.csv_file_path)
+        self.assertEqual(status['status'], INGEST_FAILED)
+        self.assertTrue(status['error'])
+        self.assertIsNone(get_ingest_report(self.csv_file_path))
+
+    def test_ingest_leaves_no_temporary_files(self):
+        ingest_csv_file(self.csv_file_path)
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.directory, 'ingested'))),
+            sorted(map(os.path.basename,
+                       ingested_file_paths(self.csv_file_path))))
+
+    def test_ingest_waits_for_running_ingest(self):
+        report = ingest_csv_file(self.csv_file_path)
+        parquet_path, _ = ingested_file_paths(self.csv_file_path)
+        modified = os.stat(parquet_path).st_mtime_ns
+        write_ingest_status(self.csv_file_path, INGEST_RUNNING)
+
+        def finish_running_ingest(seconds):
+            write_ingest_status(
+                self.csv_file_path, INGEST_DONE,
+                **{key: value for key, value in report.items()
+                   if key != 'status'})
+
+        with mock.patch(
+                'tally_ho.apps.tally.management.commands.utils.time.sleep',
+                side_effect=finish_running_ingest) as sleep:
+            self.assertEqual(ingest_csv_file(self.csv_file_path), report)
+
+        sleep.assert_called_once()
+        self.assertEqual(os.stat(parquet_path).st_mtime_ns, modified)
+
+    @mock.patch(
+        'tally_ho.apps.tally.management.commands.utils.INGEST_WAIT_SECONDS',
+        0)
+    def test_ingest_stops_waiting_for_running_ingest(self):
+        write_ingest_status(self.csv_file_path, INGEST_RUNNING)
+
+        self.assertEqual(ingest_csv_file(self.csv_file_path)['rows'], 3)
+
+    def test_read_csv_file(self):
+        with self.assertRaisesRegex(Exception, 'Column office is missing'):
+            read_csv_file(self.csv_file_path, ['barcode', 'office'], 'forms')
+
+        with self.assertRaises(DuplicatesFoundError):
+            read_csv_file(
+                self.csv_file_path, ['barcode'], 'forms', 'barcode')
+
+        self.assertEqual(
+            read_csv_file(self.csv_file_path, ['barcode'], 'forms').project(
+                'name').order('name').fetchall(),
+            [('A',), ('B',), ('B',), ('C',)])
+
+        self.write_csv_file("barcode,name\n1,A\n2,B\n")
+        self.assertEqual(read_csv_file(
+            self.csv_file_path, ['barcode'], 'forms', 'barcode').project(
+                'name').order('name').fetchall(),
+            [('A',), ('B',)])
+
+    def test_command(self):
+        out = StringIO()
+        call_command('ingest_csv_files', self.csv_file_path, stdout=out)
+
+        self.assertIn(f'Ingested 3 rows of {self.csv_file_path}.',
+                      out.getvalue())
+        self.assertEqual(get_ingest_report(self.csv_file_path)['rows'], 3)
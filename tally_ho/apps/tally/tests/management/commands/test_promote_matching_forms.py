@@ -0,0 +1,61 @@
+import io
+
+from django.core.management import call_command
+
+from tally_ho.apps.tally.management.commands.promote_matching_forms import (
+    promote_matching_forms,
+)
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    create_ballot,
+    create_candidate,
+    create_result_form,
+    create_tally,
+)
+
+
+class TestPromoteMatchingForms(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.tally = create_tally()
+        ballot = create_ballot(self.tally)
+        candidate = create_candidate(ballot, 'candidate', tally=self.tally)
+        self.result_form = create_result_form(
+            ballot=ballot,
+            form_state=FormState.CORRECTION,
+            tally=self.tally)
+
+        for entry_version in (EntryVersion.DATA_ENTRY_1,
+                              EntryVersion.DATA_ENTRY_2):
+            Result.objects.create(
+                result_form=self.result_form,
+                user=self.user,
+                candidate=candidate,
+                votes=2,
+                entry_version=entry_version)
+
+    def test_task_promotes_switched_on_tallies(self):
+        self.assertEqual(promote_matching_forms(), 0)
+
+        self.tally.auto_promote_matching_forms = True
+        self.tally.save()
+
+        self.assertEqual(promote_matching_forms(), 1)
+        self.result_form.refresh_from_db()
+        self.assertEqual(
+            self.result_form.form_state, FormState.QUALITY_CONTROL)
+
+    def test_command_promotes_tally(self):
+        out = io.StringIO()
+        call_command('promote_matching_forms',
+                     tally_id=self.tally.pk,
+                     username=self.user.username,
+                     stdout=out)
+
+        self.assertIn(
+            f'Promoted 1 forms of tally {self.tally.pk}.', out.getvalue())
+        self.result_form.refresh_from_db()
+        self.assertEqual(self.result_form.user, self.user.userprofile)
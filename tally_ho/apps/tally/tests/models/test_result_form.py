@@ -9,6 +9,7 @@ from tally_ho.apps.tally.models.quality_control import QualityControl
 from tally_ho.apps.tally.models.quarantine_check import QuarantineCheck
 from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import (
+    ResultFormConflict,
     get_matched_results,
     sanity_check_final_results,
 )
@@ -1498,3 +1499,54 @@ class TestResultForm(TestBase):
         result_form.reset_to_unsubmitted(user=self.user, reason=reason)
 
         self.assertEqual(result_form.form_state, FormState.UNSUBMITTED)
+
+    def test_state_changes_increment_version(self):
+        result_form = create_result_form(
+            tally=self.tally, form_state=FormState.DATA_ENTRY_1)
+        self.assertEqual(result_form.version, 0)
+
+        result_form.form_state = FormState.DATA_ENTRY_2
+        result_form.save()
+        result_form.name = 'renamed'
+        result_form.save()
+
+        self.assertEqual(result_form.version, 1)
+        self.assertEqual(ResultForm.objects.get(pk=result_form.pk).version, 1)
+
+    def test_state_change_from_stale_form_conflicts(self):
+        result_form = create_result_form(
+            tally=self.tally, form_state=FormState.DATA_ENTRY_1)
+        stale_result_form = ResultForm.objects.get(pk=result_form.pk)
+
+        result_form.form_state = FormState.DATA_ENTRY_2
+        result_form.save()
+        stale_result_form.form_state = FormState.DATA_ENTRY_2
+
+        with self.assertRaises(ResultFormConflict):
+            stale_result_form.save()
+
+        # Other changes are saved from stale forms as before.
+        stale_result_form = ResultForm.objects.get(pk=result_form.pk)
+        result_form.form_state = FormState.CORRECTION
+        result_form.save()
+        stale_result_form.name = 'renamed'
+        stale_result_form.save(update_fields=['name'])
+
+        self.assertEqual(
+            ResultForm.objects.get(pk=result_form.pk).form_state,
+            FormState.CORRECTION)
+
+    def test_save_from_stale_form_keeps_state_change(self):
+        result_form = create_result_form(
+            tally=self.tally, form_state=FormState.DATA_ENTRY_1)
+        stale_result_form = ResultForm.objects.get(pk=result_form.pk)
+
+        result_form.form_state = FormState.DATA_ENTRY_2
+        result_form.save()
+        stale_result_form.name = 'renamed'
+        stale_result_form.save()
+
+        result_form = ResultForm.objects.get(pk=result_form.pk)
+        self.assertEqual(result_form.form_state, FormState.DATA_ENTRY_2)
+        self.assertEqual(result_form.version, 1)
+        self.assertEqual(result_form.name, 'renamed')
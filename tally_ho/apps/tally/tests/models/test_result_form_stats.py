@@ -5,6 +5,8 @@ from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.tests.test_base import create_result_form,\
     create_result_form_stats, create_tally, TestBase
 from tally_ho.apps.tally.models.result_form_stats import ResultFormStats
+from tally_ho.apps.tally.models.result_form_stats_rollup import\
+    ResultFormStatsRollup
 
 
 class TestResultFormStats(TestBase):
@@ -57,3 +59,30 @@ class TestResultFormStats(TestBase):
         self.assertEqual(
             result_form_stats.reviewed_by_supervisor,
             True)
+
+    def test_result_form_stats_rollup(self):
+        tally = create_tally()
+        self._add_user_to_group(self.user, groups.DATA_ENTRY_1_CLERK)
+
+        for i in range(2):
+            result_form_stats = create_result_form_stats(
+                processing_time=60,
+                user=self.user,
+                result_form=create_result_form(
+                    barcode=str(i), serial_number=i, tally=tally),
+                reviewed_by_supervisor=True,
+                approved_by_supervisor=bool(i))
+
+        result_form_stats.add_data_entry_errors(2)
+        result_form_stats.add_data_entry_errors(1)
+
+        rollup = ResultFormStatsRollup.objects.get()
+        self.assertEqual(rollup.group.name, groups.DATA_ENTRY_1_CLERK)
+        self.assertEqual(rollup.date, timezone.localdate())
+        self.assertEqual(
+            (rollup.forms_processed, rollup.processing_time,
+             rollup.data_entry_errors, rollup.forms_with_errors,
+             rollup.forms_reviewed, rollup.forms_approved),
+            (2, 120, 3, 1, 2, 1))
+        result_form_stats.refresh_from_db()
+        self.assertEqual(result_form_stats.data_entry_errors, 3)
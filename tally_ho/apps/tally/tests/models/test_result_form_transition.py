@@ -0,0 +1,123 @@
+import datetime
+
+from django.utils import timezone
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (TestBase, create_result_form,
+                                           create_tally)
+
+
+class TestResultFormTransition(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.tally = create_tally()
+        self.result_form = create_result_form(
+            form_state=FormState.DATA_ENTRY_1,
+            tally=self.tally,
+            user=self.user)
+
+    def test_create_logs_transition(self):
+        transition = self.result_form.transitions.get()
+
+        self.assertIsNone(transition.from_state)
+        self.assertEqual(transition.to_state, FormState.DATA_ENTRY_1)
+        self.assertEqual(transition.tally_id, self.tally.pk)
+        self.assertEqual(transition.user_id, self.user.pk)
+        self.assertIsNone(transition.entry_version)
+
+    def test_state_change_logs_transition(self):
+        self.result_form.form_state = FormState.DATA_ENTRY_2
+        self.result_form.save()
+
+        transition = self.result_form.transitions.latest('id')
+
+        self.assertEqual(transition.from_state, FormState.DATA_ENTRY_1)
+        self.assertEqual(transition.to_state, FormState.DATA_ENTRY_2)
+        self.assertEqual(transition.entry_version,
+                         EntryVersion.DATA_ENTRY_1)
+
+    def test_save_without_state_change_logs_nothing(self):
+        self.result_form.name = 'renamed'
+        self.result_form.save()
+        ResultForm.objects.get(pk=self.result_form.pk).save()
+
+        self.assertEqual(self.result_form.transitions.count(), 1)
+
+    def test_update_fields_without_state_logs_nothing(self):
+        self.result_form.form_state = FormState.DATA_ENTRY_2
+        self.result_form.save(update_fields=['name'])
+
+        self.assertEqual(self.result_form.transitions.count(), 1)
+
+    def test_deferred_state_uses_stored_state(self):
+        result_form = ResultForm.objects.only('id').get(
+            pk=self.result_form.pk)
+        result_form.form_state = FormState.CORRECTION
+        result_form.previous_form_state = FormState.DATA_ENTRY_1
+        result_form.save()
+
+        transition = result_form.transitions.latest('id')
+
+        self.assertEqual(transition.from_state, FormState.DATA_ENTRY_1)
+        self.assertEqual(transition.to_state, FormState.CORRECTION)
+
+    def test_transitions_are_append_only(self):
+        transition = self.result_form.transitions.get()
+        transition.to_state = FormState.ARCHIVED
+
+        with self.assertRaises(ValueError):
+            transition.save()
+
+    def test_history(self):
+        self.result_form.form_state = FormState.DATA_ENTRY_2
+        self.result_form.save()
+
+        history = self.result_form.transitions.history()
+
+        self.assertEqual(len(history), 2)
+        self.assertTrue(history[0]['is_current'])
+        self.assertFalse(history[1]['is_current'])
+        self.assertEqual(history[0]['previous_state'], 'DATA_ENTRY_1')
+        self.assertEqual(history[0]['current_state'], 'DATA_ENTRY_2')
+        self.assertEqual(history[0]['user'], self.user.username)
+        self.assertEqual(history[1]['previous_state'], 'None')
+        self.assertIsNone(history[1]['duration_in_previous_state'])
+        self.assertIsNotNone(history[0]['duration_in_previous_state'])
+
+    def test_time_in_state(self):
+        start = timezone.now()
+        other_form = create_result_form(
+            barcode='987654321',
+            serial_number=1,
+            form_state=FormState.DATA_ENTRY_1,
+            tally=self.tally)
+        ResultFormTransition.objects.all().delete()
+        ResultFormTransition.objects.bulk_create([
+            ResultFormTransition.for_result_form(
+                result_form, None, created_date=start)
+            for result_form in [self.result_form, other_form]
+        ] + [
+            ResultFormTransition(
+                result_form=self.result_form,
+                from_state=FormState.DATA_ENTRY_1,
+                to_state=FormState.DATA_ENTRY_2,
+                created_date=start + datetime.timedelta(minutes=10)),
+            ResultFormTransition(
+                result_form=other_form,
+                from_state=FormState.DATA_ENTRY_1,
+                to_state=FormState.DATA_ENTRY_2,
+                created_date=start + datetime.timedelta(minutes=20)),
+        ])
+
+        stats = ResultFormTransition.objects.filter(
+            tally=self.tally).time_in_state()
+
+        self.assertEqual(list(stats), [FormState.DATA_ENTRY_1])
+        self.assertEqual(stats[FormState.DATA_ENTRY_1]['count'], 2)
+        self.assertEqual(stats[FormState.DATA_ENTRY_1]['average'],
+                         datetime.timedelta(minutes=15))
@@ -1,9 +1,15 @@
 import json
+import os
 import re
+import shutil
+import tempfile
+from unittest import mock
 
 from bs4 import BeautifulSoup
 from django.contrib.auth.models import AnonymousUser
-from django.test import RequestFactory
+from django.template.loader import render_to_string
+from django.http import Http404
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 
 from tally_ho.apps.tally.models import Station
@@ -16,6 +22,8 @@ from tally_ho.apps.tally.views.reports import \
     administrative_areas_reports as admin_reports
 from tally_ho.apps.tally.views.reports import \
     administrative_areas_reports as aar
+from tally_ho.apps.tally.views.reports.helpers import \
+    get_results_export_queryset
 from tally_ho.libs.models.enums.center_type import CenterType
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
@@ -31,6 +39,7 @@ from tally_ho.libs.tests.test_base import (TestBase, create_ballot,
                                            create_result_form, create_station,
                                            create_sub_constituency,
                                            create_tally)
+from tally_ho.libs.utils import analytics
 
 
 class TestAdministrativeAreasReports(TestBase):
@@ -163,6 +172,115 @@ class TestAdministrativeAreasReports(TestBase):
             '<td class="center">{}</td>'.format(candidates_count),
         )
 
+    def summary_report_valid_votes(self):
+        view = admin_reports.SummaryReportDataView.as_view()
+        request = self.factory.post("/sub-constituency-summary-report")
+        request.user = self.user
+        response = view(
+            request,
+            tally_id=self.tally.pk,
+            region_id=self.region.pk,
+            constituency_id=self.constituency.pk,
+        )
+
+        return json.loads(response.content.decode())["data"][0][1]
+
+    def test_summary_report_reads_analytics_snapshot(self):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+
+        with override_settings(ANALYTICS_SNAPSHOT_DIR=snapshot_dir):
+            analytics.take_snapshot()
+            ReconciliationForm.objects.filter(pk=self.recon_form.pk).update(
+                number_valid_votes=30)
+
+            self.assertEqual(
+                self.summary_report_valid_votes(),
+                '<td class="center">20</td>',
+            )
+
+            view = admin_reports.SummaryReportView.as_view()
+            request = self.factory.get("/")
+            request.user = self.user
+            response = view(
+                request,
+                tally_id=self.tally.id,
+                region_id=self.region.id,
+                constituency_id=self.constituency.id,
+            )
+            self.assertEqual(
+                response.context_data["analytics_snapshot"]["name"],
+                analytics.get_snapshot()["name"],
+            )
+            self.assertIn(
+                "Figures as of",
+                render_to_string(
+                    "includes/_analytics_snapshot.html",
+                    response.context_data,
+                ),
+            )
+
+            with override_settings(ANALYTICS_SNAPSHOT_MAX_AGE=0):
+                self.assertEqual(
+                    self.summary_report_valid_votes(),
+                    '<td class="center">30</td>',
+                )
+
+        # Keyword searches read the database.
+        view = admin_reports.SummaryReportDataView()
+        view.request = self.factory.post("/", data={"search[value]": "1"})
+        self.assertFalse(view.reads_snapshot())
+
+    def report_queryset(self, view_class, **kwargs):
+        view = view_class()
+        view.request = self.factory.post("/")
+        view.request.user = self.user
+        view.kwargs = {"tally_id": self.tally.pk, **kwargs}
+
+        return view.filter_queryset(view.get_initial_queryset())
+
+    def test_report_querysets_read_the_same_rows_from_snapshots(self):
+        """
+        Test that DuckDB reads the same rows from a snapshot as Postgres
+        from the database for every queryset read with from_snapshot.
+        """
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        querysets = [
+            get_results_export_queryset(self.tally.pk, {}),
+        ]
+
+        for kwargs in (
+            {},
+            {"region_id": self.region.pk},
+            {
+                "region_id": self.region.pk,
+                "constituency_id": self.constituency.pk,
+            },
+        ):
+            querysets.append(self.report_queryset(
+                admin_reports.SummaryReportDataView, **kwargs))
+            querysets.append(self.report_queryset(
+                admin_reports.ProgressiveReportDataView, **kwargs))
+
+            for report_type in (3, 4, 5):
+                querysets.append(self.report_queryset(
+                    admin_reports.DiscrepancyReportDataView,
+                    report_name=aar.report_types[report_type],
+                    **kwargs))
+
+        with override_settings(ANALYTICS_SNAPSHOT_DIR=snapshot_dir):
+            analytics.take_snapshot()
+
+            for qs in querysets:
+                with self.assertNoLogs(analytics.logger, "WARNING"):
+                    rows = analytics._snapshot_rows(qs)
+                    count = analytics.count(qs, from_snapshot=True)
+
+                self.assertIsNotNone(rows)
+                self.assertCountEqual(rows, list(qs))
+                self.assertEqual(count, qs.count())
+
     def apply_filter(self, data):
         view = admin_reports.ResultFormResultsListDataView.as_view()
         request = self.factory.post("/form-results", data=data)
@@ -709,8 +827,78 @@ class TestAdministrativeAreasReports(TestBase):
         request = self.factory.get("/")
         request.user = self.user
         request.GET = {"data": json.dumps(data)}
-        response = admin_reports.get_export(request)
+
+        with mock.patch(
+            "tally_ho.apps.tally.views.reports.administrative_areas_reports."
+            "async_export_results_presentation"
+        ) as mock_task:
+            mock_task.delay.return_value.id = "task-1"
+            response = admin_reports.get_export(request)
+
         self.assertEqual(response.status_code, 200)
+        mock_task.delay.assert_called_once_with(
+            tally_id=self.tally.id, data=data
+        )
+        self.assertEqual(
+            json.loads(response.content)["progress_url"],
+            reverse(
+                "results-presentation-progress",
+                kwargs={"tally_id": self.tally.id, "task_id": "task-1"},
+            ),
+        )
+
+    def test_results_presentation_progress(self):
+        view = admin_reports.ResultsPresentationProgressView.as_view()
+        request = self.factory.get("/")
+        request.user = self.user
+
+        with mock.patch(
+            "tally_ho.apps.tally.views.reports.administrative_areas_reports."
+            "AsyncResult"
+        ) as mock_result:
+            mock_result.return_value.status = "SUCCESS"
+            mock_result.return_value.result = "election_results.pptx"
+            response = view(request, tally_id=self.tally.id, task_id="1")
+
+        self.assertEqual(
+            json.loads(response.content)["download_url"],
+            reverse(
+                "results-presentation-download",
+                kwargs={
+                    "tally_id": self.tally.id,
+                    "file_name": "election_results.pptx",
+                },
+            ),
+        )
+
+    def test_results_presentation_download(self):
+        presentation_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, presentation_dir)
+        os.makedirs(os.path.join(presentation_dir, str(self.tally.id)))
+
+        with open(
+            os.path.join(
+                presentation_dir, str(self.tally.id), "election_results.pptx"
+            ),
+            "wb",
+        ) as presentation:
+            presentation.write(b"pptx")
+
+        view = admin_reports.ResultsPresentationDownloadView.as_view()
+        request = self.factory.get("/")
+        request.user = self.user
+
+        with override_settings(RESULTS_PRESENTATION_DIR=presentation_dir):
+            response = view(
+                request,
+                tally_id=self.tally.id,
+                file_name="election_results.pptx",
+            )
+
+            self.assertEqual(b"".join(response.streaming_content), b"pptx")
+
+            with self.assertRaises(Http404):
+                view(request, tally_id=self.tally.id, file_name="other.pptx")
 
     def test_duplicate_results_list_data_view_duplicate_forms_visible(self):
         """
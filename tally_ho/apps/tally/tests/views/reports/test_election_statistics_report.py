@@ -1,8 +1,9 @@
 import json
 
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 
 from tally_ho.apps.tally.models.center import Center
+from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.views.reports import election_statistics_report
 from tally_ho.libs.models.enums.center_type import CenterType
 from tally_ho.libs.models.enums.entry_version import EntryVersion
@@ -10,7 +11,8 @@ from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.tests.fixtures.electrol_race_data import electrol_races
-from tally_ho.libs.tests.test_base import (TestBase, create_ballot,
+from tally_ho.libs.tests.test_base import (LOCMEM_CACHES, TestBase,
+                                           create_ballot,
                                            create_candidates,
                                            create_constituency,
                                            create_electrol_race, create_office,
@@ -19,6 +21,7 @@ from tally_ho.libs.tests.test_base import (TestBase, create_ballot,
                                            create_result_form, create_station,
                                            create_sub_constituency,
                                            create_tally)
+from tally_ho.libs.utils.cache import get_cache
 
 
 class TestElectionStatisticsReports(TestBase):
@@ -108,6 +111,61 @@ class TestElectionStatisticsReports(TestBase):
             for field in fields:
                 self.assertIn(field, stat)
 
+    def test_generate_election_statistics_by_gender(self):
+        """
+        Test station statistics per ballot and station gender
+        """
+        for gender, expected in (
+            (None, {'stations_expected': 4, 'stations_counted': 1,
+                    'percentage_of_stations_counted': 25.0}),
+            (Gender.MALE, {'stations_expected': 2, 'stations_counted': 1,
+                           'percentage_of_stations_counted': 50.0}),
+            (Gender.FEMALE, {'stations_expected': 1, 'stations_counted': 0,
+                             'percentage_of_stations_counted': 0}),
+        ):
+            stat, = election_statistics_report.generate_election_statistics(
+                self.tally.id, 'Presidential', gender=gender)
+
+            for field, value in expected.items():
+                self.assertEqual(stat[field], value)
+
+            counted = expected['stations_counted']
+            self.assertEqual(
+                stat['registrants_in_stations_counted'], 20 * counted)
+            # 4 results * 20 votes each
+            self.assertEqual(stat['voters_in_counted_stations'], 80 * counted)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_election_statistics_cached_until_form_state_changes(self):
+        """
+        Test election statistics are read from the cache until a form of
+        the tally changes state
+        """
+        get_cache().clear()
+        statistics = election_statistics_report.generate_election_statistics
+        self.assertEqual(
+            statistics(self.tally.id, 'Presidential')[0]['stations_counted'],
+            1)
+
+        ResultForm.objects.filter(pk=self.result_form.pk).update(
+            form_state=FormState.AUDIT)
+        self.assertEqual(
+            statistics(self.tally.id, 'Presidential')[0]['stations_counted'],
+            1)
+        self.assertEqual(
+            statistics(self.tally.id, 'Presidential', gender=Gender.FEMALE)
+            [0]['stations_counted'],
+            0)
+
+        self.result_form.form_state = FormState.UNSUBMITTED
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.result_form.save()
+
+        self.assertEqual(
+            statistics(self.tally.id, 'Presidential')[0]['stations_counted'],
+            0)
+
     def test_generate_overview_election_statistics(self):
         """
         Test generate_overview_election_statistics function
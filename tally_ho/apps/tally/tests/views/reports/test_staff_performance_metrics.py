@@ -270,3 +270,28 @@ class TestStaffPerformanceMetrics(TestBase):
             "<th>Percentage of Errors</th>")
         self.assertContains(response, '<td>No Data</td>')
         self.assertContains(response, '<td></td>', 3)
+
+    def test_staff_perfomance_metrics_date_range(self):
+        tally = create_tally()
+        tally.users.add(self.user)
+        create_result_form_stats(
+            processing_time=60,
+            user=self.user,
+            result_form=create_result_form(tally=tally))
+        view = staff_performance_metrics.StaffPerformanceMetricsView.as_view()
+        today = timezone.localdate()
+
+        for start_date, forms_processed in (
+                (today, 1), (today + timezone.timedelta(days=1), 0)):
+            request = self.factory.get('/', {'start_date': start_date})
+            request.user = self.user
+            request.session = {}
+            response = view(
+                request,
+                tally_id=tally.pk,
+                group_name=groups.TALLY_MANAGER)
+
+            self.assertEqual(
+                sum(rec['forms_processed']
+                    for rec in response.context_data['result_form_stats']),
+                forms_processed)
@@ -449,3 +449,26 @@ class TestTurnoutByGenderReport(TestBase):
         self.assertEqual(agg_voters, '<td class="center">140</td>')
         self.assertEqual(agg_registrants, '<td class="center">220</td>')
         self.assertEqual(agg_turnout, '<td class="center">63.64</td>')
+
+    def test_turnout_data_by_gender_skips_unassigned_replacements(self):
+        """
+        Test replacement forms without a center are not reported
+        """
+        create_result_form(
+            barcode="999999999",
+            serial_number=999,
+            is_replacement=True,
+            force_ballot=False,
+            tally=self.tally,
+        )
+        request = self.factory.get(
+            f"/data/turnout-report-by-gender-data/{self.tally.pk}/region/"
+        )
+        request.user = self.user
+        request.session = {}
+        view = TurnoutReportByGenderAndAdminAreasDataView.as_view()
+        response = view(request, tally_id=self.tally.pk, admin_level="region")
+        content = json.loads(response.content.decode())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(content.get("data")), 2)
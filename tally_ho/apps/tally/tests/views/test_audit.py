@@ -96,6 +96,39 @@ class TestAudit(TestBase):
         self.assertContains(response, username)
         self.assertContains(response, '42')
 
+    def test_dashboard_pages(self):
+        self._create_and_login_user()
+        self._add_user_to_group(self.user, groups.AUDIT_SUPERVISOR)
+        tally = create_tally()
+        tally.users.add(self.user)
+
+        for i in range(11):
+            result_form = create_result_form(barcode=f'{i:09d}',
+                                             serial_number=i,
+                                             form_state=FormState.AUDIT,
+                                             tally=tally)
+            create_audit(result_form, self.user)
+
+        view = views.DashboardView.as_view()
+        request = self.factory.get('/')
+        request.user = self.user
+        request.session = {}
+        forms = view(request, tally_id=tally.pk).context_data['forms']
+
+        self.assertEqual(len(forms), 10)
+        self.assertFalse(forms.has_previous())
+
+        request = self.factory.get('/', {'page_audit': forms.next_cursor})
+        request.user = self.user
+        request.session = {}
+        response = view(request, tally_id=tally.pk)
+        forms = response.context_data['forms']
+
+        self.assertEqual([form.barcode for form in forms], ['000000010'])
+        self.assertEqual(forms.number, 2)
+        self.assertFalse(forms.has_next())
+        self.assertContains(response, 'Page 2 of about 2.')
+
     def test_dashboard_get_csv(self):
         self._create_and_login_user()
         self._add_user_to_group(self.user, groups.AUDIT_CLERK)
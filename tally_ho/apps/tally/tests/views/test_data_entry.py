@@ -4,6 +4,7 @@ from django.core.serializers.json import DjangoJSONEncoder, json
 from django.test import RequestFactory
 from django.urls import reverse
 from django.utils import timezone
+from reversion.models import Version
 
 from tally_ho.apps.tally.models.clearance import Clearance
 from tally_ho.apps.tally.models.result_form import ResultForm
@@ -391,6 +392,11 @@ class TestDataEntry(TestBase):
             self.assertEqual(result.user, self.user)
             self.assertEqual(result.votes, votes[i])
 
+        version = Version.objects.get_for_object(result_form).get()
+        self.assertEqual(version.revision.user_id, self.user.id)
+        self.assertEqual(version.field_dict['form_state'],
+                         FormState.DATA_ENTRY_2)
+
     def test_enter_results_success_data_entry_two(self):
         self._create_and_login_user()
         tally = create_tally()
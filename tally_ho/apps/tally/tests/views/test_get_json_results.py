@@ -1,14 +1,12 @@
-from datetime import datetime
 from django.urls import reverse
 from tally_ho.libs.tests.test_base import (
     TestBase, create_ballot, create_candidate, create_result,
     create_result_form, create_electrol_race, create_center,
     create_office, create_sub_constituency)
-from django.http import JsonResponse
+from django.http import StreamingHttpResponse
 import json
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.tests.test_base import create_tally
-from django.utils import timezone
 from tally_ho.libs.models.enums.form_state import FormState
 
 class GetJSONResultsTest(TestBase):
@@ -76,44 +74,82 @@ class GetJSONResultsTest(TestBase):
 
         request_data = json.dumps({'tally_id': self.tally.id})
         response = self.client.get(self.url, {'data': request_data})
-        self.assertIsInstance(response, JsonResponse)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertIn('attachment; filename="results_',
+                      response['Content-Disposition'])
 
-        response_data = json.loads(response.content)
-        expected_data = {
-            'data': [{
-                'candidate__candidate_id': candidate.candidate_id,
-                'candidate__ballot__number': ballot.number,
-                'candidate__ballot__electrol_race__id': electrol_race.id,
-                'candidate__ballot__electrol_race__election_level': 'Level 1',
-                'candidate__ballot__electrol_race__ballot_name': 'Type A',
-                'candidate_number': candidate.candidate_id,
-                'candidate_name': candidate.full_name,
-                'ballot_number': ballot.number,
-                'total_votes': 100,
-                'order': 1,
-                'candidate_status': 'enabled',
-                'electrol_race_id': electrol_race.id,
-                'election_level': 'Level 1',
-                'sub_race_type': 'Type A',
-                'candidate_id': candidate.candidate_id,
-                'valid_votes': 100,
-                'metadata': [{
-                    'barcode': result_form.barcode,
-                    'gender': result_form.gender.name,
-                    'station_number': result_form.station_number,
-                    'center_code': 1,
-                    'center_name': center.name,
-                    'office_name': office.name,
-                    'office_number': office.number,
-                    'sub_con_name': sub_constituency.name,
-                    'sub_con_code': sub_constituency.code
-            }]}],
-            'created_at': response_data['created_at'],
-        }
+        response_data = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()]
+        expected_data = [{
+            'candidate__candidate_id': candidate.candidate_id,
+            'candidate__ballot__number': ballot.number,
+            'candidate__ballot__electrol_race__id': electrol_race.id,
+            'candidate__ballot__electrol_race__election_level': 'Level 1',
+            'candidate__ballot__electrol_race__ballot_name': 'Type A',
+            'candidate_number': candidate.candidate_id,
+            'candidate_name': candidate.full_name,
+            'ballot_number': ballot.number,
+            'total_votes': 100,
+            'order': 1,
+            'candidate_status': 'enabled',
+            'electrol_race_id': electrol_race.id,
+            'election_level': 'Level 1',
+            'sub_race_type': 'Type A',
+            'candidate_id': candidate.candidate_id,
+            'valid_votes': 100,
+            'metadata': [{
+                'barcode': result_form.barcode,
+                'gender': result_form.gender.name,
+                'station_number': result_form.station_number,
+                'center_code': 1,
+                'center_name': center.name,
+                'office_name': office.name,
+                'office_number': office.number,
+                'sub_con_name': sub_constituency.name,
+                'sub_con_code': sub_constituency.code
+        }]}]
 
-        self.assertEqual(response_data['data'], expected_data['data'])
+        self.assertEqual(response_data, expected_data)
 
-        created_at = datetime.strptime(
-            response_data['created_at'], '%Y-%m-%dT%H:%M:%S.%fZ')
-        created_at = timezone.make_aware(created_at)
-        self.assertTrue(created_at <= timezone.now())
+    def test_get_results_sorted_by_votes(self):
+        electrol_race = create_electrol_race(
+            self.tally,
+            election_level='Level 1',
+            ballot_name='Type A'
+        )
+        ballot = create_ballot(
+            self.tally,
+            electrol_race=electrol_race,
+            available_for_release=True
+        )
+        result_form = create_result_form(
+            ballot=ballot,
+            form_state=FormState.ARCHIVED,
+            tally=self.tally
+        )
+        other_result_form = create_result_form(
+            ballot=ballot,
+            form_state=FormState.ARCHIVED,
+            tally=self.tally,
+            barcode='123456790',
+            serial_number=1
+        )
+
+        for name, votes in (('A', 10), ('B', 30)):
+            candidate = create_candidate(ballot, name, tally=self.tally)
+            create_result(result_form, candidate, self.user, votes=votes)
+            create_result(
+                other_result_form, candidate, self.user, votes=votes)
+
+        response = self.client.get(
+            self.url, {'data': json.dumps({'tally_id': self.tally.id})})
+        response_data = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()]
+
+        self.assertEqual(
+            [(row['candidate_name'], row['total_votes'], row['valid_votes'],
+              len(row['metadata'])) for row in response_data],
+            [('B', 60, 80, 2), ('A', 20, 80, 2)])
@@ -23,6 +23,7 @@ from tally_ho.libs.tests.test_base import (TestBase, create_audit,
                                            create_reconciliation_form,
                                            create_result_form, create_station,
                                            create_tally)
+from tally_ho.libs.workflow.queues import claim_result_form
 
 
 class TestQualityControl(TestBase):
@@ -95,6 +96,33 @@ class TestQualityControl(TestBase):
         self.assertEqual(result_form.form_state, FormState.QUALITY_CONTROL)
         self.assertEqual(result_form.qualitycontrol.user, self.user)
 
+    def test_quality_control_post_claimed_form(self):
+        """
+        Test quality control view post of a form another clerk claimed
+        """
+        barcode = "123456789"
+        result_form = create_result_form(
+            barcode, tally=self.tally, form_state=FormState.QUALITY_CONTROL
+        )
+        other_user = self._create_user("alice", "alice")
+        claim_result_form(result_form, other_user)
+        self._add_user_to_group(self.user, groups.QUALITY_CONTROL_CLERK)
+        view = views.QualityControlView.as_view()
+        data = {
+            "barcode": barcode,
+            "barcode_copy": barcode,
+            "tally_id": self.tally.pk,
+        }
+        request = self.factory.post("/", data=data)
+        request.user = self.user
+        request.session = {}
+        response = view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Form is being processed by alice")
+        self.assertNotIn("result_form", request.session)
+        self.assertFalse(QualityControl.objects.exists())
+
     def test_dashboard_abort_post(self):
         """
         Test dashboard abort post
@@ -10,7 +10,6 @@ from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import RequestFactory
 from django.utils import timezone
-from reversion import revisions
 
 from tally_ho.apps.tally.forms.create_result_form import CreateResultForm
 from tally_ho.apps.tally.forms.edit_result_form import EditResultForm
@@ -2353,12 +2352,9 @@ class TestSuperAdmin(TestBase):
 
     def test_result_form_history_view_with_session(self):
         """Test ResultFormHistoryView with valid session"""
-        # Create result form with revision history
-        with revisions.create_revision():
-            result_form = create_result_form(
-                form_state=FormState.INTAKE, tally=self.tally, barcode="12345"
-            )
-            revisions.set_comment("Test revision")
+        result_form = create_result_form(
+            form_state=FormState.INTAKE, tally=self.tally, barcode="12345"
+        )
 
         view = views.ResultFormHistoryView.as_view()
         request = self.factory.get("/")
@@ -2387,20 +2383,14 @@ class TestSuperAdmin(TestBase):
 
     def test_result_form_history_view_duration_display(self):
         """Test ResultFormHistoryView shows duration correctly"""
-        # Create result form with multiple revisions
-        with revisions.create_revision():
-            result_form = create_result_form(
-                form_state=FormState.UNSUBMITTED,
-                tally=self.tally,
-                barcode="12345",
-            )
-            revisions.set_comment("Initial")
-
-        # Add second revision
-        with revisions.create_revision():
-            result_form.form_state = FormState.INTAKE
-            result_form.save()
-            revisions.set_comment("To intake")
+        # Create result form with two state transitions
+        result_form = create_result_form(
+            form_state=FormState.UNSUBMITTED,
+            tally=self.tally,
+            barcode="12345",
+        )
+        result_form.form_state = FormState.INTAKE
+        result_form.save()
 
         view = views.ResultFormHistoryView.as_view()
         request = self.factory.get("/")
@@ -2422,13 +2412,13 @@ class TestSuperAdmin(TestBase):
             self.assertTrue(history_data[0]["is_current"])
 
     def test_result_form_history_view_no_history(self):
-        """Test ResultFormHistoryView with form that has no version history"""
-        # Create result form without revisions
-        result_form = ResultForm.objects.create(
+        """Test ResultFormHistoryView with form that has no transitions"""
+        # bulk_create does not call save, so no transition is logged
+        [result_form] = ResultForm.objects.bulk_create([ResultForm(
             barcode="nohistory",
             tally=self.tally,
             form_state=FormState.UNSUBMITTED,
-        )
+        )])
 
         view = views.ResultFormHistoryView.as_view()
         request = self.factory.get("/")
@@ -2440,7 +2430,7 @@ class TestSuperAdmin(TestBase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(
             response,
-            f"No version history found for result form {result_form.barcode}",
+            f"No history found for result form {result_form.barcode}",
         )
 
     def test_result_form_history_view_permissions(self):
@@ -3431,3 +3421,111 @@ class TestSuperAdmin(TestBase):
             '55555555555' in str(msg)
             for msg in message_list
         ))
+
+    def test_bulk_form_state_view_preview(self):
+        ballot = create_ballot(self.tally)
+        for barcode in ['1111', '2222', '3333']:
+            create_result_form(
+                barcode=barcode,
+                serial_number=int(barcode),
+                ballot=ballot,
+                form_state=FormState.ARCHIVED,
+                tally=self.tally)
+
+        view = views.BulkFormStateView.as_view()
+        data = {
+            'barcodes': '1111, 2222',
+            'new_state': FormState.CLEARANCE.name,
+            'reason': 'Duplicate results',
+            'tally_id': self.tally.pk,
+        }
+        request = self.factory.post('/', data=data)
+        request.user = self.user
+        request.session = {}
+        response = view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data['result_forms_count'], 2)
+        self.assertFalse(ResultForm.objects.filter(
+            form_state=FormState.CLEARANCE).exists())
+
+    def test_bulk_form_state_view_confirm(self):
+        ballot = create_ballot(self.tally)
+        for barcode in ['1111', '2222', '3333']:
+            create_result_form(
+                barcode=barcode,
+                serial_number=int(barcode),
+                ballot=ballot,
+                form_state=FormState.ARCHIVED,
+                tally=self.tally)
+
+        view = views.BulkFormStateView.as_view()
+        data = {
+            'ballot_number': ballot.number,
+            'new_state': FormState.UNSUBMITTED.name,
+            'reason': 'Recount',
+            'tally_id': self.tally.pk,
+            'confirm_submit': 'Confirm',
+        }
+        request = self.factory.post('/', data=data)
+        request.user = self.user
+        request.session = {}
+        configure_messages(request)
+        response = view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            ResultForm.objects.filter(
+                tally=self.tally, form_state=FormState.UNSUBMITTED).count(),
+            3)
+        self.assertEqual(
+            ResultFormReset.objects.filter(
+                tally=self.tally, reason='Recount').count(),
+            3)
+        self.assertTrue(any(
+            '3 form(s) successfully moved to UNSUBMITTED' in str(msg)
+            for msg in messages.get_messages(request)
+        ))
+
+    def test_bulk_form_state_view_ignores_posted_tally(self):
+        other_tally = create_tally(name='otherTally')
+        ballot = create_ballot(other_tally)
+        create_result_form(
+            barcode='1111',
+            ballot=ballot,
+            form_state=FormState.ARCHIVED,
+            tally=other_tally)
+
+        view = views.BulkFormStateView.as_view()
+        data = {
+            'barcodes': '1111',
+            'new_state': FormState.UNSUBMITTED.name,
+            'reason': 'Recount',
+            'tally_id': other_tally.pk,
+            'confirm_submit': 'Confirm',
+        }
+        request = self.factory.post('/', data=data)
+        request.user = self.user
+        request.session = {}
+        configure_messages(request)
+        view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(
+            ResultForm.objects.get(barcode='1111').form_state,
+            FormState.ARCHIVED)
+        self.assertFalse(ResultFormReset.objects.exists())
+
+    def test_bulk_form_state_view_requires_selection(self):
+        view = views.BulkFormStateView.as_view()
+        data = {
+            'new_state': FormState.AUDIT.name,
+            'reason': 'Audit',
+            'tally_id': self.tally.pk,
+        }
+        request = self.factory.post('/', data=data)
+        request.user = self.user
+        request.session = {}
+        response = view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context_data['form'].non_field_errors())
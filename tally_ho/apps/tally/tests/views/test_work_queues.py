@@ -0,0 +1,163 @@
+from django.contrib import messages
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.test import RequestFactory
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.views import work_queues as views
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.permissions import groups
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    configure_messages,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.workflow.queues import claim_result_form
+
+
+class TestWorkQueues(TestBase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self._create_permission_groups()
+        self._create_and_login_user()
+        self.tally = create_tally()
+        self.tally.users.add(self.user)
+
+        for i in range(2):
+            create_result_form(
+                barcode=str(i),
+                serial_number=i,
+                form_state=FormState.DATA_ENTRY_1,
+                tally=self.tally)
+
+    def post_claim(self, form_state):
+        request = self.factory.post('/')
+        request.user = self.user
+        request.session = {}
+        configure_messages(request)
+        response = views.ClaimNextFormView.as_view()(
+            request, tally_id=self.tally.pk, form_state=form_state)
+
+        return request, response
+
+    def test_claim_next_form(self):
+        self._add_user_to_group(self.user, groups.DATA_ENTRY_1_CLERK)
+
+        request, response = self.post_claim('DATA_ENTRY_1')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            response['location'], f'/data-entry/{self.tally.pk}/')
+        self.assertEqual(
+            [str(message) for message in messages.get_messages(request)],
+            ['Your next form is 0'])
+        self.assertEqual(
+            ResultForm.objects.get(barcode='0').claimed_by, self.user)
+
+    def test_claim_next_form_empty_queue(self):
+        self._add_user_to_group(self.user, groups.CORRECTIONS_CLERK)
+
+        request, response = self.post_claim('CORRECTION')
+
+        self.assertEqual(
+            [str(message) for message in messages.get_messages(request)],
+            ['No forms are waiting in Correction'])
+
+    def test_claim_next_form_other_queue(self):
+        self._add_user_to_group(self.user, groups.DATA_ENTRY_2_CLERK)
+
+        with self.assertRaises(PermissionDenied):
+            self.post_claim('DATA_ENTRY_1')
+
+        with self.assertRaises(Http404):
+            self.post_claim('ARCHIVED')
+
+    def test_work_queues_view(self):
+        self._add_user_to_group(self.user, groups.TALLY_MANAGER)
+        claim_result_form(ResultForm.objects.get(barcode='1'), self.user)
+
+        request = self.factory.get('/')
+        request.user = self.user
+        request.session = {}
+        response = views.WorkQueuesView.as_view()(
+            request, tally_id=self.tally.pk)
+
+        queues = {
+            queue['form_state']: queue
+            for queue in response.context_data['queues']
+        }
+        self.assertEqual(queues[FormState.DATA_ENTRY_1]['waiting'], 2)
+        self.assertEqual(queues[FormState.DATA_ENTRY_1]['claimed'], 1)
+        self.assertEqual(
+            [result_form.barcode
+             for result_form in response.context_data['claims']],
+            ['1'])
+        response.render()
+        self.assertContains(response, 'Data Entry 1')
+
+    def test_work_queues_view_assign_and_release(self):
+        self._add_user_to_group(self.user, groups.TALLY_MANAGER)
+        view = views.WorkQueuesView.as_view()
+
+        request = self.factory.post('/', data={
+            'barcode': '0',
+            'username': self.user.username,
+            'tally_id': self.tally.pk,
+        })
+        request.user = self.user
+        request.session = {}
+        configure_messages(request)
+        response = view(request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 302)
+        result_form = ResultForm.objects.get(barcode='0')
+        self.assertEqual(result_form.claimed_by, self.user)
+
+        request = self.factory.post('/', data={'release': result_form.pk})
+        request.user = self.user
+        request.session = {}
+        configure_messages(request)
+        view(request, tally_id=self.tally.pk)
+
+        self.assertIsNone(ResultForm.objects.get(barcode='0').claimed_by)
+
+    def test_work_queues_view_assign_ignores_posted_tally(self):
+        self._add_user_to_group(self.user, groups.TALLY_MANAGER)
+        other_tally = create_tally(name='otherTally')
+        other_tally.users.add(self.user)
+        create_result_form(
+            barcode='other',
+            serial_number=10,
+            form_state=FormState.DATA_ENTRY_1,
+            tally=other_tally)
+
+        request = self.factory.post('/', data={
+            'barcode': 'other',
+            'username': self.user.username,
+            'tally_id': other_tally.pk,
+        })
+        request.user = self.user
+        request.session = {}
+        response = views.WorkQueuesView.as_view()(
+            request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context_data['form'].non_field_errors())
+        self.assertIsNone(ResultForm.objects.get(barcode='other').claimed_by)
+
+    def test_work_queues_view_assign_unknown_user(self):
+        self._add_user_to_group(self.user, groups.TALLY_MANAGER)
+
+        request = self.factory.post('/', data={
+            'barcode': '0',
+            'username': 'nobody',
+            'tally_id': self.tally.pk,
+        })
+        request.user = self.user
+        request.session = {}
+        response = views.WorkQueuesView.as_view()(
+            request, tally_id=self.tally.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context_data['form'].non_field_errors())
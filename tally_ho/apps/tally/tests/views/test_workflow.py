@@ -490,15 +490,21 @@ class TestWorkflow(TestBase):
         request = self.factory.get('/')
         request.user = self.user
         request.session = {}
-        response =\
-            view(request, tally_id=tally.pk, result_form_pk=result_form.pk)
+
+        with self.assertWithinQueryBudget(view):
+            response = view(
+                request, tally_id=tally.pk, result_form_pk=result_form.pk)
+            response.render()
 
         self.assertEqual(response.status_code, 200)
-        response.render()
         self.assertIn(b'Result Form Details', response.content)
         self.assertIn(str(result_form.barcode).encode(), response.content)
         self.assertIn(b'Reconciliation Section', response.content)
         self.assertIn(b'Result Form Details Results Section', response.content)
+        self.assertIn(b'State Transition History', response.content)
+        self.assertEqual(
+            response.context_data['history_data'][0]['current_state'],
+            FormState.ARCHIVED.name)
 
 def configure_messages(request):
     setattr(request, 'session', 'session')
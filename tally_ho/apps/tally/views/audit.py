@@ -1,7 +1,9 @@
 import csv
 
 import dateutil.parser
+from django.contrib import messages
 from django.core.serializers.json import DjangoJSONEncoder, json
+from django.db.models import Exists, OuterRef
 from django.forms import model_to_dict
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect
@@ -9,6 +11,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic import FormView, TemplateView
+from reversion.views import RevisionMixin
 from djqscsv import render_to_csv_response
 from guardian.mixins import LoginRequiredMixin
 
@@ -30,8 +33,9 @@ from tally_ho.libs.views.form_state import form_in_state, safe_form_in_state
 from tally_ho.libs.views.mixins import (GroupRequiredMixin,
                                         ReverseSuccessURLMixin,
                                         TallyAccessMixin)
-from tally_ho.libs.views.pagination import paging
+from tally_ho.libs.views.pagination import seek_paging
 from tally_ho.libs.views.session import session_matches_post_result_form
+from tally_ho.libs.workflow.queues import claim_result_form, release_claims
 
 
 def save_result_form_processing_stats(
@@ -170,23 +174,22 @@ def forms_for_user(user_is_clerk, tally_id):
 
     :returns: A list of forms in the audit state for this user's group.
     """
-    form_list = ResultForm.objects.filter(
-        form_state=FormState.AUDIT, audit__reviewed_supervisor=False,
-        audit__active=True, tally__id=tally_id).distinct('barcode')\
-        .order_by('barcode')
+    audits = Audit.objects.filter(
+        result_form=OuterRef('pk'), active=True, reviewed_supervisor=False)
 
     if user_is_clerk:
-        form_list = form_list.filter(
-            form_state=FormState.AUDIT, audit__reviewed_team=False,
-            audit__active=True)
+        audits = audits.filter(reviewed_team=False)
 
-    return form_list
+    return ResultForm.objects.filter(
+        Exists(audits), form_state=FormState.AUDIT, tally__id=tally_id,
+    ).order_by('barcode')
 
 
 class DashboardView(LoginRequiredMixin,
                     GroupRequiredMixin,
                     TallyAccessMixin,
                     ReverseSuccessURLMixin,
+                    RevisionMixin,
                     FormView):
     form_class = AuditForm
     group_required = [groups.AUDIT_CLERK, groups.AUDIT_SUPERVISOR]
@@ -208,7 +211,8 @@ class DashboardView(LoginRequiredMixin,
         if format_ == 'csv' and active_tab == 'audit':
             return render_to_csv_response(form_list)
 
-        forms = paging(form_list, self.request, page_kwarg='page_audit')
+        forms = seek_paging(form_list, self.request, page_kwarg='page_audit',
+                            tally_id=tally_id)
 
         recall_requests_qs = WorkflowRequest.objects.filter(
             result_form__tally__id=tally_id,
@@ -224,8 +228,9 @@ class DashboardView(LoginRequiredMixin,
         if format_ == 'csv' and active_tab == 'recalls':
             return render_to_csv_response(recall_requests_qs)
 
-        recall_requests =\
-            paging(recall_requests_qs, self.request, page_kwarg='page_recalls')
+        recall_requests = seek_paging(
+            recall_requests_qs, self.request, page_kwarg='page_recalls',
+            tally_id=tally_id)
 
         context = self.get_context_data(
             forms=forms,
@@ -245,6 +250,14 @@ class DashboardView(LoginRequiredMixin,
         result_form = get_object_or_404(ResultForm, pk=pk, tally__id=tally_id)
         form_in_state(result_form, FormState.AUDIT)
 
+        if not claim_result_form(result_form, self.request.user.userprofile):
+            messages.error(
+                self.request,
+                _('Form %(barcode)s is being reviewed by another user.') % {
+                    'barcode': result_form.barcode})
+
+            return redirect('audit_dashboard', tally_id=tally_id)
+
         self.request.session['result_form'] = result_form.pk
 
         return redirect(self.success_url, tally_id=tally_id)
@@ -254,6 +267,7 @@ class ReviewView(LoginRequiredMixin,
                  GroupRequiredMixin,
                  TallyAccessMixin,
                  ReverseSuccessURLMixin,
+                 RevisionMixin,
                  FormView):
     form_class = AuditForm
     group_required = [groups.AUDIT_CLERK, groups.AUDIT_SUPERVISOR]
@@ -307,6 +321,9 @@ class ReviewView(LoginRequiredMixin,
                                         result_form,
                                         form)
             url = audit_action(audit, post_data, result_form, self.success_url)
+            # Forms still in audit wait for the next reviewer.
+            release_claims(ResultForm.objects.filter(
+                pk=result_form.pk, form_state=FormState.AUDIT))
 
             # Track supervisors result form reviewing processing time
             if groups.user_groups(user)[0] in [groups.AUDIT_SUPERVISOR,
@@ -334,6 +351,7 @@ class ReviewView(LoginRequiredMixin,
 class PrintCoverView(LoginRequiredMixin,
                      TallyAccessMixin,
                      GroupRequiredMixin,
+                     RevisionMixin,
                      TemplateView):
     group_required = [groups.AUDIT_CLERK, groups.AUDIT_SUPERVISOR]
     template_name = "audit/print_cover.html"
@@ -397,6 +415,7 @@ class CreateAuditView(LoginRequiredMixin,
                       GroupRequiredMixin,
                       TallyAccessMixin,
                       ReverseSuccessURLMixin,
+                      RevisionMixin,
                       FormView):
     form_class = BarcodeForm
     group_required = [groups.AUDIT_CLERK, groups.AUDIT_SUPERVISOR]
@@ -5,6 +5,7 @@ from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
+from reversion.views import RevisionMixin
 from djqscsv import render_to_csv_response
 from guardian.mixins import LoginRequiredMixin
 
@@ -24,7 +25,7 @@ from tally_ho.libs.views.mixins import (GroupRequiredMixin,
                                         PrintedResultFormMixin,
                                         ReverseSuccessURLMixin,
                                         TallyAccessMixin)
-from tally_ho.libs.views.pagination import paging
+from tally_ho.libs.views.pagination import seek_paging
 from tally_ho.libs.views.session import session_matches_post_result_form
 
 
@@ -157,6 +158,7 @@ class DashboardView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = ClearanceForm
@@ -174,7 +176,7 @@ class DashboardView(
         if format_ == "csv":
             return render_to_csv_response(form_list)
 
-        forms = paging(form_list, self.request)
+        forms = seek_paging(form_list, self.request, tally_id=tally_id)
 
         return self.render_to_response(
             self.get_context_data(
@@ -203,6 +205,7 @@ class ReviewView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = ClearanceForm
@@ -268,6 +271,7 @@ class PrintCoverView(
     LoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    RevisionMixin,
     TemplateView,
 ):
     group_required = [groups.CLEARANCE_CLERK, groups.CLEARANCE_SUPERVISOR]
@@ -321,6 +325,7 @@ class CreateClearanceView(
     LoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
@@ -431,6 +436,7 @@ class AddClearanceFormView(
     LoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    RevisionMixin,
     FormView,
 ):
     group_required = [groups.CLEARANCE_CLERK, groups.CLEARANCE_SUPERVISOR]
@@ -10,6 +10,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
+from reversion.views import RevisionMixin
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.forms.barcode_form import BarcodeForm
@@ -30,7 +31,11 @@ from tally_ho.libs.views.corrections import (
     save_form_results,
     update_result_form_entries_with_de_errors,
 )
-from tally_ho.libs.views.form_state import form_in_state, safe_form_in_state
+from tally_ho.libs.views.form_state import (
+    form_in_state,
+    safe_claim_result_form,
+    safe_form_in_state,
+)
 from tally_ho.libs.views.mixins import (
     GroupRequiredMixin,
     ReverseSuccessURLMixin,
@@ -229,7 +234,7 @@ def save_recon(post_data, user, result_form):
 
     if data_entry_1_errors or data_entry_2_errors:
         update_result_form_entries_with_de_errors(
-            data_entry_1_errors, data_entry_2_errors, post_data["tally_id"]
+            result_form, data_entry_1_errors, data_entry_2_errors
         )
 
 
@@ -238,12 +243,16 @@ class CorrectionView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
     group_required = groups.CORRECTIONS_CLERK
     template_name = "barcode_verify.html"
     success_url = "corrections-match"
+    # corrections_passed resets a form with mismatched results to data
+    # entry and then raises, the reset must not be rolled back.
+    revision_atomic = False
 
     def get_context_data(self, **kwargs):
         tally_id = self.kwargs.get("tally_id")
@@ -252,6 +261,7 @@ class CorrectionView(
         context["tally_id"] = tally_id
         context["form_action"] = ""
         context["header_text"] = _("Corrections")
+        context["queue_state"] = FormState.CORRECTION
         self.request.session["encoded_result_form_corrections_start_time"] = (
             json.loads(json.dumps(timezone.now(), cls=DjangoJSONEncoder))
         )
@@ -277,7 +287,11 @@ class CorrectionView(
             result_form = get_object_or_404(
                 ResultForm, barcode=barcode, tally__id=tally_id
             )
-            form = safe_form_in_state(result_form, FormState.CORRECTION, form)
+            form = safe_form_in_state(
+                result_form, FormState.CORRECTION, form
+            ) or safe_claim_result_form(
+                result_form, self.request.user.userprofile, form
+            )
 
             if form:
                 return self.form_invalid(form)
@@ -297,6 +311,7 @@ class CorrectionMatchView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = PassToQualityControlForm
@@ -359,6 +374,7 @@ class CorrectionRequiredView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = PassToQualityControlForm
@@ -1,17 +1,18 @@
 import json
 
-from django.db.models import F, Q
+from django.db.models import F
 from django.http import JsonResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
-from django_datatables_view.base_datatable_view import BaseDatatableView
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.models.candidate import Candidate
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.reports.progress import get_office_candidates_ids
+from tally_ho.libs.utils.search import keyword_filter
+from tally_ho.libs.views.datatables import KeysetDatatableView
 from tally_ho.libs.views.mixins import (AjaxLoginRequiredMixin,
                                         DataTablesMixin,
                                         GroupRequiredMixin,
@@ -19,7 +20,10 @@ from tally_ho.libs.views.mixins import (AjaxLoginRequiredMixin,
 
 
 class CandidateListDataView(
-    AjaxLoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, BaseDatatableView
+    AjaxLoginRequiredMixin,
+    GroupRequiredMixin,
+    TallyAccessMixin,
+    KeysetDatatableView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
     model = Candidate
@@ -67,8 +71,11 @@ class CandidateListDataView(
 
         if keyword:
             qs = qs.filter(
-                Q(full_name__icontains=keyword)
-                | Q(ballot__electrol_race__ballot_name__icontains=keyword)
+                keyword_filter(
+                    Candidate,
+                    keyword,
+                    ("full_name", "ballot__electrol_race__ballot_name"),
+                )
             )
 
         return qs
@@ -1,11 +1,10 @@
 import json
 
-from django.db.models import F, Q
+from django.db.models import F
 from django.http import JsonResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.views.generic import TemplateView
-from django_datatables_view.base_datatable_view import BaseDatatableView
 from djqscsv import render_to_csv_response
 from guardian.mixins import LoginRequiredMixin
 
@@ -15,6 +14,8 @@ from tally_ho.apps.tally.models.station import Station
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
 from tally_ho.apps.tally.views.constants import show_inactive_query_param
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.utils.search import keyword_filter
+from tally_ho.libs.views.datatables import KeysetDatatableView
 from tally_ho.libs.views.mixins import (
     AjaxLoginRequiredMixin,
     DataTablesMixin,
@@ -24,7 +25,10 @@ from tally_ho.libs.views.mixins import (
 
 
 class CenterListDataView(
-    AjaxLoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, BaseDatatableView
+    AjaxLoginRequiredMixin,
+    GroupRequiredMixin,
+    TallyAccessMixin,
+    KeysetDatatableView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
     model = Station
@@ -68,12 +72,18 @@ class CenterListDataView(
 
         if keyword:
             qs = qs.filter(
-                Q(station_number__contains=keyword)
-                | Q(center__office__name__icontains=keyword)
-                | Q(center__code__contains=keyword)
-                | Q(sub_constituency__name__icontains=keyword)
-                | Q(sub_constituency__code__contains=keyword)
-                | Q(center__name__icontains=keyword)
+                keyword_filter(
+                    Station,
+                    keyword,
+                    (
+                        "station_number",
+                        "center__office__name",
+                        "center__code",
+                        "sub_constituency__name",
+                        "sub_constituency__code",
+                        "center__name",
+                    ),
+                )
             )
         return qs
 
@@ -7,7 +7,6 @@ from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
-from django_datatables_view.base_datatable_view import BaseDatatableView
 from djqscsv import render_to_csv_response
 from guardian.mixins import LoginRequiredMixin
 
@@ -28,6 +27,8 @@ from tally_ho.libs.models.enums.form_state import (
 )
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.utils.enum import get_matching_enum_values
+from tally_ho.libs.utils.search import keyword_filter
+from tally_ho.libs.views.datatables import KeysetDatatableView
 from tally_ho.libs.views.mixins import (
     AjaxLoginRequiredMixin,
     DataTablesMixin,
@@ -39,7 +40,10 @@ ALL = "__all__"
 
 
 class FormListDataView(
-    AjaxLoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, BaseDatatableView
+    AjaxLoginRequiredMixin,
+    GroupRequiredMixin,
+    TallyAccessMixin,
+    KeysetDatatableView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
     model = ResultForm
@@ -149,26 +153,32 @@ class FormListDataView(
             qs = qs.filter(ballot__number__in=ballot.form_ballot_numbers)
 
         if keyword:
+            search = keyword_filter(
+                ResultForm,
+                keyword,
+                (
+                    "barcode",
+                    "center__code",
+                    "center__office__region__name",
+                    "center__sub_constituency__name",
+                    "center__office__name",
+                    "center__office__number",
+                    "station_number",
+                    "ballot__number",
+                    "ballot__electrol_race__election_level",
+                    "ballot__electrol_race__ballot_name",
+                ),
+            )
             # Get matching FormState enum values for case-insensitive search
             matching_states = get_matching_enum_values(FormState, keyword)
-            form_state_q = (
-                Q(form_state__in=matching_states) if matching_states else Q()
-            )
 
-            qs = qs.filter(
-                form_state_q
-                | Q(barcode__icontains=keyword)
-                | Q(center__code__contains=keyword)
-                | Q(station_id__contains=keyword)
-                | Q(center__office__region__name__icontains=keyword)
-                | Q(center__sub_constituency__name__icontains=keyword)
-                | Q(center__office__name__icontains=keyword)
-                | Q(center__office__number__contains=keyword)
-                | Q(station_number__contains=keyword)
-                | Q(ballot__number__contains=keyword)
-                | Q(ballot__electrol_race__election_level__icontains=keyword)
-                | Q(ballot__electrol_race__ballot_name__icontains=keyword)
-            )
+            if matching_states:
+                search |= Q(form_state__in=matching_states)
+
+            if tally_id and keyword.isdigit():
+                search |= Q(station_id__contains=keyword)
+
+            qs = qs.filter(search)
 
         return qs
 
@@ -325,22 +335,26 @@ class FormNotReceivedDataView(FormListDataView):
             qs = qs.filter(ballot__active=True)
 
         if keyword:
+            search = keyword_filter(
+                ResultForm,
+                keyword,
+                (
+                    "barcode",
+                    "center__code",
+                    "center__office__region__name",
+                    "center__office__name",
+                    "center__office__number",
+                    "station_number",
+                    "ballot__number",
+                ),
+            )
             # Get matching FormState enum values for case-insensitive search
             matching_states = get_matching_enum_values(FormState, keyword)
-            form_state_q = (
-                Q(form_state__in=matching_states) if matching_states else Q()
-            )
 
-            qs = qs.filter(
-                form_state_q
-                | Q(barcode__icontains=keyword)
-                | Q(center__code__contains=keyword)
-                | Q(center__office__region__name__icontains=keyword)
-                | Q(center__office__name__icontains=keyword)
-                | Q(center__office__number__contains=keyword)
-                | Q(station_number__contains=keyword)
-                | Q(ballot__number__contains=keyword)
-            )
+            if matching_states:
+                search |= Q(form_state__in=matching_states)
+
+            qs = qs.filter(search)
         return qs
 
 
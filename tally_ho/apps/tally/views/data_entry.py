@@ -8,6 +8,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
+from reversion.views import RevisionMixin
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.forms.barcode_form import BarcodeForm
@@ -26,6 +27,7 @@ from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.views.errors import add_generic_error
 from tally_ho.libs.views.form_state import (form_in_data_entry_state,
+                                            safe_claim_result_form,
                                             safe_form_in_state)
 from tally_ho.libs.views.mixins import (GroupRequiredMixin,
                                         ReverseSuccessURLMixin,
@@ -167,6 +169,7 @@ class DataEntryView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
@@ -179,16 +182,19 @@ class DataEntryView(
 
         user = self.request.user
 
-        is_admin = entry_type = None
+        is_admin = entry_type = queue_state = None
 
         if user_is_data_entry_1(user):
             entry_type = 1
+            queue_state = FormState.DATA_ENTRY_1
         elif user_is_data_entry_2(user):
             entry_type = 2
+            queue_state = FormState.DATA_ENTRY_2
         else:
             is_admin = True
 
         context["tally_id"] = self.kwargs.get("tally_id")
+        context["queue_state"] = queue_state
         context["form_action"] = ""
         context["header_text"] = _("Data Entry %(entry_type)s") % {
                 'entry_type': entry_type if not is_admin else _("Admin")}
@@ -221,6 +227,8 @@ class DataEntryView(
             )
             check_form = check_state_and_group(
                 result_form, self.request.user, form
+            ) or safe_claim_result_form(
+                result_form, self.request.user.userprofile, form
             )
 
             if check_form:
@@ -238,6 +246,7 @@ class CenterDetailsView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = CenterDetailsForm
@@ -327,6 +336,7 @@ class EnterResultsView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = CreateResultForm
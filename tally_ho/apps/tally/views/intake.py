@@ -6,6 +6,7 @@ from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
+from reversion.views import RevisionMixin
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.forms.barcode_form import BarcodeForm
@@ -69,6 +70,7 @@ class CenterDetailsView(LoginRequiredMixin,
                         GroupRequiredMixin,
                         TallyAccessMixin,
                         ReverseSuccessURLMixin,
+                        RevisionMixin,
                         FormView):
     form_class = BarcodeForm
     group_required = [groups.INTAKE_CLERK, groups.INTAKE_SUPERVISOR]
@@ -158,6 +160,7 @@ class EnterCenterView(LoginRequiredMixin,
                       GroupRequiredMixin,
                       TallyAccessMixin,
                       ReverseSuccessURLMixin,
+                      RevisionMixin,
                       FormView):
     form_class = CenterDetailsForm
     group_required = [groups.INTAKE_CLERK, groups.INTAKE_SUPERVISOR]
@@ -275,6 +278,7 @@ class CheckCenterDetailsView(LoginRequiredMixin,
                              GroupRequiredMixin,
                              TallyAccessMixin,
                              ReverseSuccessURLMixin,
+                             RevisionMixin,
                              FormView):
     group_required = [groups.INTAKE_CLERK, groups.INTAKE_SUPERVISOR]
     form_class = CenterDetailsForm
@@ -404,6 +408,7 @@ class CheckCenterDetailsView(LoginRequiredMixin,
 class PrintCoverView(LoginRequiredMixin,
                      GroupRequiredMixin,
                      TallyAccessMixin,
+                     RevisionMixin,
                      TemplateView):
     group_required = [groups.INTAKE_CLERK, groups.INTAKE_SUPERVISOR]
     template_name = "intake/print_cover.html"
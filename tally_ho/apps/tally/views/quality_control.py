@@ -9,6 +9,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
 from django.views.generic.edit import FormView
+from reversion.views import RevisionMixin
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.forms.barcode_form import BarcodeForm
@@ -22,7 +23,9 @@ from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.verify.quarantine_checks import check_quarantine
-from tally_ho.libs.views.form_state import form_in_state, safe_form_in_state
+from tally_ho.libs.views.form_state import (form_in_state,
+                                            safe_claim_result_form,
+                                            safe_form_in_state)
 from tally_ho.libs.views.mixins import (GroupRequiredMixin,
                                         ReverseSuccessURLMixin,
                                         TallyAccessMixin)
@@ -69,7 +72,7 @@ def result_form_results(result_form, active=True, workflow_request_pk=None):
         active=active,
         entry_version=EntryVersion.FINAL,
         candidate__ballot__electrol_race__election_level=election_level,
-    ).order_by("candidate__order")
+    ).select_related("candidate").order_by("candidate__order")
 
     if workflow_request_pk:
         results = results.filter(
@@ -84,6 +87,7 @@ class QualityControlView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
@@ -99,6 +103,7 @@ class QualityControlView(
         context["tally_id"] = self.kwargs.get("tally_id")
         context["form_action"] = ""
         context["header_text"] = _("Quality Control & Archiving")
+        context["queue_state"] = FormState.QUALITY_CONTROL
         self.request.session["encoded_result_form_qa_control_start_time"] = (
             json.loads(json.dumps(timezone.now(), cls=DjangoJSONEncoder))
         )
@@ -128,6 +133,8 @@ class QualityControlView(
                 result_form,
                 [FormState.QUALITY_CONTROL, FormState.ARCHIVING],
                 form,
+            ) or safe_claim_result_form(
+                result_form, self.request.user.userprofile, form
             )
 
             if form:
@@ -148,6 +155,7 @@ class QualityControlDashboardView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
@@ -244,6 +252,7 @@ class PrintView(
     LoginRequiredMixin,
     GroupRequiredMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = BarcodeForm
@@ -347,6 +356,7 @@ class ConfirmFormResetView(
     TallyAccessMixin,
     ReverseSuccessURLMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     FormView,
 ):
     form_class = ConfirmResetForm
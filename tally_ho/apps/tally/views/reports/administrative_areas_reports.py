@@ -1,29 +1,28 @@
 import ast
-import datetime
 import json
 import os
-from datetime import date
-from io import BytesIO
+from itertools import groupby
+from operator import itemgetter
 
-from django.conf import settings
+from celery.result import AsyncResult
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.db.models import (Case, CharField, Count, ExpressionWrapper, F,
-                              IntegerField, OuterRef, Q, Subquery, Sum)
+                              IntegerField, OuterRef, Q, Subquery, Sum,
+                              Window)
 from django.db.models import Value as V
 from django.db.models import When
 from django.db.models.functions import Coalesce
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import TemplateView
+from django.views.generic import TemplateView, View
 from django_datatables_view.base_datatable_view import BaseDatatableView
 from guardian.mixins import LoginRequiredMixin
-from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt
 
+from tally_ho.apps.tally.management.commands.export_results_presentation\
+    import async_export_results_presentation
 from tally_ho.apps.tally.models.all_candidates_votes import AllCandidatesVotes
 from tally_ho.apps.tally.models.center import Center
 from tally_ho.apps.tally.models.constituency import Constituency
@@ -40,9 +39,17 @@ from tally_ho.apps.tally.views.super_admin import \
     get_result_form_with_duplicate_results
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.reports.results_presentation import (
+    get_results_presentation_dir, results_presentation_cache_key)
+from tally_ho.libs.utils import analytics
+from tally_ho.libs.utils.cache import (delete_cached_model_instances_count,
+                                       get_cached_model_instances_count)
 from tally_ho.libs.utils.numbers import parse_int
 from tally_ho.libs.utils.query_set_helpers import Round
+from tally_ho.libs.views.datatables import AnalyticsDatatableMixin
+from tally_ho.libs.views.exports import ndjson_response, stream_queryset
 from tally_ho.libs.views.mixins import (AjaxLoginRequiredMixin, DataTablesMixin,
                                         GroupRequiredMixin, TallyAccessMixin)
 
@@ -1758,680 +1765,264 @@ def get_centers_stations(request):
 
 def get_export(request):
     """
-    Generates and returns a PowerPoint export based on the filter
-    values provided
+    Queues a PowerPoint export based on the filter values provided
+
+    returns: A JSON response of the url to poll the export's progress at
     """
     data = ast.literal_eval(request.GET.get("data"))
     tally_id = data.get("tally_id")
-    limit = parse_int(data.get("export_number"))
-    export_type = data.get("exportType")
-    center_ids = data.get("select_1_ids")
-    station_ids = data.get("select_2_ids")
-    election_level_names = data.get("election_level_names")
-    sub_race_type_names = data.get("sub_race_type_names")
-    ballot_status = data.get("ballot_status")
-    station_status = data.get("station_status")
-    candidate_status = data.get("candidate_status")
-    percentage_processed = data.get("percentage_processed")
-    sub_con_codes = data.get("sub_con_codes")
-    filters_applied = (
-        center_ids
-        or station_ids
-        or election_level_names
-        or sub_race_type_names
-        or ballot_status
-        or station_status
-        or candidate_status
-        or percentage_processed
-        or sub_con_codes
-    )
-
-    qs = Result.objects.select_related(
-        "candidate",
-    )
-    qs = qs.filter(
-        result_form__tally__id=tally_id,
-        result_form__form_state=FormState.ARCHIVED,
-        entry_version=EntryVersion.FINAL,
-        active=True,
-    )
-    qs = get_filtered_candidate_votes(
-        tally_id, qs, data=data if filters_applied else None
-    )
-
-    if export_type == "PPT" and qs.count() != 0:
-        result = create_ppt_export(qs, tally_id=tally_id, limit=limit)
-        return result
-    return HttpResponse("Not found")
 
+    if data.get("exportType") != "PPT":
+        return HttpResponse("Not found")
 
-def electrol_race_has_results(results_qs, electrol_race):
-    results_qs = results_qs.filter(
-        election_level=electrol_race.election_level,
-        sub_race_type=electrol_race.ballot_name,
-    ).order_by("-votes")
-    return results_qs.count() != 0
-
-
-def create_ppt_export(qs, tally_id=None, limit=None):
-    electrol_race_ids = list(
-        set([result.get("electrol_race_id") for result in qs])
-    )
-    filtered_electrol_races = ElectrolRace.objects.filter(
-        tally__id=tally_id, id__in=electrol_race_ids
+    celery_results = async_export_results_presentation.delay(
+        tally_id=tally_id, data=data
     )
 
-    headers = create_results_power_point_headers(
-        tally_id, filtered_electrol_races, qs
+    return JsonResponse(
+        {
+            "task_id": celery_results.id,
+            "progress_url": reverse(
+                "results-presentation-progress",
+                kwargs={"tally_id": tally_id, "task_id": celery_results.id},
+            ),
+        }
     )
 
-    powerpoint_data = []
-    race_bg_img_root_path = getattr(settings, "MEDIA_ROOT")
 
-    races_ids_to_total_votes_mapping = {}
-    for electral_race_id in filtered_electrol_races.values_list(
-        "id", flat=True
-    ):
-        races_ids_to_total_votes_mapping[electral_race_id] = sum(
-            [
-                q.get("total_votes")
-                for q in qs
-                if q.get("electrol_race_id") == electral_race_id
-            ]
-        )
+class ResultsPresentationProgressView(
+    AjaxLoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, View
+):
+    """Report the progress of a PowerPoint export and where to download
+    it once written."""
 
-    for electrol_race in filtered_electrol_races:
-        if electrol_race_has_results(qs, electrol_race):
-            data = [
-                r for r in qs if r.get("electrol_race_id") == electrol_race.id
-            ]
-            sorted_results = sorted(data, key=lambda x: -x["total_votes"])
-            body_data = sorted_results
-            if limit:
-                body_data = body_data[:limit]
-            body = [
-                {
-                    "candidate_name": item.get("candidate_name"),
-                    "total_votes": item.get("total_votes"),
-                    "valid_votes": races_ids_to_total_votes_mapping.get(
-                        item.get("electrol_race_id")
-                    ),
-                }
-                for item in body_data
-            ]
-            header = headers.get(
-                f"{electrol_race.election_level}_{electrol_race.ballot_name}"
-            )
-            file_path = (
-                f"{race_bg_img_root_path}/{electrol_race.background_image}"
+    group_required = groups.TALLY_MANAGER
+
+    def get(self, request, *args, **kwargs):
+        tally_id = kwargs.get("tally_id")
+        task_id = kwargs.get("task_id")
+        celery_results = AsyncResult(task_id)
+        job_status = celery_results.status
+        slides, _ = get_cached_model_instances_count(
+            results_presentation_cache_key(tally_id, task_id)
+        )
+        response = {"status": job_status, "slides": parse_int(slides)}
+
+        if job_status == "SUCCESS":
+            file_name = celery_results.result
+            response["download_url"] = (
+                reverse(
+                    "results-presentation-download",
+                    kwargs={"tally_id": tally_id, "file_name": file_name},
+                )
+                if file_name
+                else None
             )
-            powerpoint_data.append(
-                {
-                    "header": header,
-                    "body": body,
-                    "background_image": (
-                        file_path if os.path.isfile(file_path) else None
-                    ),
-                }
+            delete_cached_model_instances_count(
+                results_presentation_cache_key(tally_id, task_id)
             )
+        elif job_status == "FAILURE":
+            response["error_message"] = str(celery_results.result)
 
-    # Create a new PowerPoint presentation
-    prs = Presentation()
+        return JsonResponse(response)
 
-    # Set the cover page
-    create_results_power_point_cover_page(prs)
 
-    for data in powerpoint_data:
-        # Create the summary slide
-        create_results_power_point_summary_slide(
-            prs, power_point_race_data=data
-        )
+class ResultsPresentationDownloadView(
+    LoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, View
+):
+    group_required = groups.TALLY_MANAGER
 
-        # Create the candidates slides
-        create_results_power_point_candidates_results_slide(
-            prs, power_point_race_data=data, limit=limit
+    def get(self, request, *args, **kwargs):
+        file_name = kwargs.get("file_name")
+        path = os.path.join(
+            get_results_presentation_dir(kwargs.get("tally_id")), file_name
         )
 
-    # Save the presentation to a file
-    formatted_datestring = datetime.date.today().strftime("%Y%m%d")
-    response = save_ppt_presentation_to_file(
-        prs, f"election_results_{formatted_datestring}.pptx"
-    )
-
-    return response
-
-
-def save_ppt_presentation_to_file(prs, file_name):
-    pptx_stream = BytesIO()
-    prs.save(pptx_stream)
-    pptx_stream.seek(0)
-
-    # Create an HTTP response with the PowerPoint file
-    content_type = str(
-        "application/vnd.openxmlformats-officedocument"
-        ".presentationml.presentation"
-    )
-    response = HttpResponse(pptx_stream.getvalue(), content_type=content_type)
-    response["Content-Disposition"] = f"attachment; filename={file_name}"
-
-    return response
-
+        if os.path.basename(file_name) != file_name or not os.path.isfile(
+            path
+        ):
+            raise Http404
+
+        return FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename=file_name,
+            content_type=(
+                "application/vnd.openxmlformats-officedocument"
+                ".presentationml.presentation"
+            ),
+        )
 
-def create_results_power_point_cover_page(prs):
-    # Set the cover page
-    slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image = getattr(
-        settings, "CANDIDATE_RESULTS_PPT_COVER_PAGE_BCK_IMG_PATH"
-    )
 
-    # Set background image if provided
-    if background_image:
-        slide.shapes.add_picture(
-            background_image,
-            Inches(0),
-            Inches(0),
-            prs.slide_width,
-            prs.slide_height,
-        )
+def get_released_results(tally_id):
+    """
+    Returns the archived final results of the ballots available for release
+    of a tally.
 
-    # Add date of creation
-    date_of_creation = date.today().strftime("%B %d, %Y")
-    date_shape = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.5), Inches(8), Inches(0.5)
-    ).text_frame
-    date_shape.text = "Date: " + date_of_creation
-    date_shape.paragraphs[0].alignment = PP_ALIGN.CENTER
-    date_shape.paragraphs[0].runs[0].font.bold = True
-
-    return
-
-
-def create_results_power_point_summary_slide(prs, power_point_race_data):
-    # Create the summary slide
-    slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(slide_layout)
-    background_image = power_point_race_data["background_image"]
-    election_level_name = power_point_race_data["header"][
-        "election_level"
-    ].capitalize()
-    sub_race = power_point_race_data["header"]["sub_race_type"].capitalize()
-
-    summary_slide_title = (
-        f"{election_level_name} {sub_race} Election Summary Results"
+    :param tally_id: The tally id.
+    """
+    return Result.objects.filter(
+        result_form__tally__id=tally_id,
+        result_form__form_state=FormState.ARCHIVED,
+        entry_version=EntryVersion.FINAL,
+        result_form__ballot__available_for_release=True,
+        active=True,
     )
-    # Set background image if provided
-    if background_image:
-        slide.shapes.add_picture(
-            background_image,
-            Inches(0),
-            Inches(0),
-            prs.slide_width,
-            prs.slide_height,
-        )
 
-    # Access the title placeholder and set its text
-    if slide.shapes.title:
-        slide.shapes.title.text = summary_slide_title
-        # Apply formatting to the title
-        title_frame = slide.shapes.title.text_frame
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].font.size = Pt(24)
-        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    else:
-        # Add title text box for the summary slide
-        title_text_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.7), prs.slide_width - Inches(1), Inches(0.5)
-        )
-        title_text_frame = title_text_box.text_frame
-
-        # Set title properties
-        title_text_frame.text = summary_slide_title
-        title_text_frame.word_wrap = True
-        title_text_frame.margin_left = 0
-        title_text_frame.margin_right = 0
-        title_text_frame.margin_top = 0
-        title_text_frame.margin_bottom = 0
-
-        # Set title font properties
-        title_text_frame.clear()  # Clear existing paragraphs
-        p = title_text_frame.add_paragraph()
-        p.text = summary_slide_title
-        p.font.bold = True
-        p.font.size = Pt(24)
-        p.alignment = PP_ALIGN.CENTER
-
-    # Create a table shape for the summary data
-    summary_table = slide.shapes.add_table(
-        rows=9,
-        cols=2,
-        left=Inches(0.5),
-        top=Inches(1.7),
-        width=Inches(9),
-        height=Inches(2),
-    ).table
-
-    # Set the column widths for the summary table
-    column_widths = [Inches(4.5), Inches(4.5)]
-    for i, width in enumerate(column_widths):
-        summary_table.columns[i].width = width
-
-    # Populate the summary table with data
-    summary_table.cell(0, 0).text = "Election Level"
-    summary_table.cell(0, 1).text = str(
-        power_point_race_data["header"]["election_level"]
-    )
-    summary_table.cell(1, 0).text = "Name of Race"
-    summary_table.cell(1, 1).text = str(
-        power_point_race_data["header"]["sub_race_type"]
-    )
-    summary_table.cell(2, 0).text = "Stations Expected"
-    summary_table.cell(
-        2, 1
-    ).text = f"{power_point_race_data['header']['stations_expected']:,.0f}"
-    summary_table.cell(3, 0).text = "Stations Processed"
-    summary_table.cell(3, 1).text = str(
-        power_point_race_data["header"]["stations_processed"]
-    )
-    summary_table.cell(4, 0).text = "Percentage of Stations Processed"
-    percentage_of_stations_processed = power_point_race_data["header"][
-        "percentage_of_stations_processed"
-    ]
-    summary_table.cell(4, 1).text = f"{percentage_of_stations_processed}%"
-    summary_table.cell(5, 0).text = "Results Status"
-    summary_table.cell(5, 1).text = power_point_race_data["header"][
-        "results_status"
-    ]
-    summary_table.cell(6, 0).text = "Registrants"
-    registrants_in_processed_stations = power_point_race_data["header"][
-        "registrants_in_processed_stations"
-    ]
-    summary_table.cell(6, 1).text = f"{registrants_in_processed_stations:,.0f}"
-    summary_table.cell(7, 0).text = "Ballots Cast"
-    summary_table.cell(7, 1).text = str(
-        power_point_race_data["header"]["voters_in_counted_stations"]
-    )
-    summary_table.cell(8, 0).text = "Turnout"
-    summary_table.cell(
-        8, 1
-    ).text = f"{power_point_race_data['header']['percentage_turnout']}%"
 
-    return
+def build_candidate_results(rows):
+    """
+    Groups result rows ordered by candidate into candidate results with the
+    metadata of the result form of each result.
 
+    :param rows: Result rows ordered by candidate, see ``get_results``.
 
-def create_results_power_point_candidates_results_slide(
-    prs, power_point_race_data, limit
-):
-    background_image = power_point_race_data["background_image"]
-    candidates = power_point_race_data["body"]
-    num_candidates = len(candidates)
-    max_candidates_per_slide = 10
-    num_slides = (num_candidates - 1) // max_candidates_per_slide + 1
-    candidate_rank = 0
-    election_level_name = power_point_race_data["header"][
-        "election_level"
-    ].capitalize()
-    sub_race = power_point_race_data["header"]["sub_race_type"].capitalize()
-
-    for slide_num in range(num_slides):
-        # Create a new candidates slide
-        slide_layout = prs.slide_layouts[1]
-        slide = prs.slides.add_slide(slide_layout)
-
-        candidates_result_slide_title = (
-            f"Showing all {election_level_name} {sub_race} Election Results"
-        )
-        if limit:
-            candidates_result_slide_title = str(
-                f"Top {limit} Leading {election_level_name} {sub_race} "
-                "Election Results"
-            )
-        # Set background image if provided
-        if background_image:
-            slide.shapes.add_picture(
-                background_image,
-                Inches(0),
-                Inches(0),
-                prs.slide_width,
-                prs.slide_height,
-            )
-
-        # Access the title placeholder and set its text
-        if slide.shapes.title:
-            slide.shapes.title.text = candidates_result_slide_title
-            # Apply formatting to the title
-            title_frame = slide.shapes.title.text_frame
-            title_frame.paragraphs[0].font.bold = True
-            title_frame.paragraphs[0].font.size = Pt(24)
-            title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        else:
-            # Add title text box for the candidates slide
-            title_text_box = slide.shapes.add_textbox(
-                Inches(0.5),
-                Inches(0.7),
-                prs.slide_width - Inches(1),
-                Inches(0.5),
-            )
-            title_text_frame = title_text_box.text_frame
-
-            # Set title properties
-            title_text_frame.text = candidates_result_slide_title
-            title_text_frame.word_wrap = True
-            title_text_frame.margin_left = 0
-            title_text_frame.margin_right = 0
-            title_text_frame.margin_top = 0
-            title_text_frame.margin_bottom = 0
-
-            # Set title font properties
-            title_text_frame.clear()  # Clear existing paragraphs
-            p = title_text_frame.add_paragraph()
-            p.text = candidates_result_slide_title
-            p.font.bold = True
-            p.font.size = Pt(24)
-            p.alignment = PP_ALIGN.CENTER
-
-        # Calculate the number of candidates for the current slide
-        start_index = slide_num * max_candidates_per_slide
-        end_index = start_index + max_candidates_per_slide
-        candidates_slice = candidates[start_index:end_index]
-
-        # Create a table shape for the candidates data
-        candidates_table = slide.shapes.add_table(
-            rows=len(candidates_slice) + 1,
-            cols=5,
-            left=Inches(0.5),
-            top=Inches(1.7),
-            width=Inches(9),
-            height=Inches(2),
-        ).table
-
-        # Set the column widths for the candidates table
-        column_widths = [
-            Inches(1),
-            Inches(3),
-            Inches(2),
-            Inches(1.5),
-            Inches(1.5),
-        ]
-        for i, width in enumerate(column_widths):
-            candidates_table.columns[i].width = width
-
-        # Populate the candidates table with data
-        candidates_table.cell(0, 0).text = "Rank"
-        candidates_table.cell(0, 1).text = "Name"
-        candidates_table.cell(0, 2).text = "Votes"
-        candidates_table.cell(0, 3).text = "Total Votes"
-        candidates_table.cell(0, 4).text = "% Valid Votes"
-
-        for i, candidate in enumerate(candidates_slice):
-            candidate_rank = candidate_rank + 1
-            candidates_table.cell(i + 1, 0).text = str(candidate_rank)
-            candidates_table.cell(i + 1, 1).text = candidate["candidate_name"]
-            total_votes = candidate["total_votes"]
-            candidates_table.cell(i + 1, 2).text = str(total_votes)
-            valid_votes = candidate["valid_votes"]
-            candidates_table.cell(i + 1, 3).text = str(valid_votes)
-            if valid_votes == 0:
-                candidates_table.cell(i + 1, 4).text = "0"
-                continue
-            candidates_table.cell(i + 1, 4).text = str(
-                round(100 * total_votes / valid_votes, 2)
-            )
-
-    return
-
-
-def create_results_power_point_headers(tally_id, filtered_electrol_races, qs):
-    race_data_by_election_level_names = {
-        f"{electrol_race.election_level}_{electrol_race.ballot_name}": {
-            "election_level": electrol_race.election_level,
-            "sub_race_type": electrol_race.ballot_name,
+    returns: A generator of candidate results.
+    """
+    for _pk, candidate_rows in groupby(rows, key=itemgetter("candidate_pk")):
+        candidate_rows = list(candidate_rows)
+        row = candidate_rows[0]
+
+        yield {
+            "candidate__candidate_id": row["candidate_number"],
+            "candidate__ballot__number": row["ballot_number"],
+            "candidate__ballot__electrol_race__id": row["electrol_race_id"],
+            "candidate__ballot__electrol_race__election_level": row[
+                "election_level"
+            ],
+            "candidate__ballot__electrol_race__ballot_name": row[
+                "sub_race_type"
+            ],
+            "candidate_number": row["candidate_number"],
+            "candidate_name": row["candidate_name"],
+            "ballot_number": row["ballot_number"],
+            "total_votes": row["total_votes"],
+            "order": row["order"],
+            "candidate_status": "enabled"
+            if row["candidate_active"]
+            else "disabled",
+            "electrol_race_id": row["electrol_race_id"],
+            "election_level": row["election_level"],
+            "sub_race_type": row["sub_race_type"],
+            "candidate_id": row["candidate_number"],
+            "valid_votes": row["valid_votes"],
+            "metadata": [
+                {
+                    "barcode": result["barcode"],
+                    "gender": Gender(result["gender"]).name
+                    if result["gender"] is not None
+                    else None,
+                    "station_number": result["station_number"],
+                    "center_code": result["center_code"],
+                    "center_name": result["center_name"],
+                    "office_name": result["office_name"],
+                    "office_number": result["office_number"],
+                    "sub_con_name": result["sub_con_name"],
+                    "sub_con_code": result["sub_con_code"],
+                }
+                for result in candidate_rows
+            ],
         }
-        for electrol_race in filtered_electrol_races
-        if electrol_race_has_results(qs, electrol_race)
-    }
-    tally_stations_qs = Station.objects.filter(tally_id=tally_id)
-    stations_by_id = {station.id: station for station in tally_stations_qs}
-    # Calculate voters in counted stations and turnout percentage
-    for race_type_obj in race_data_by_election_level_names.values():
-        # race_type_obj =\
-        # race_data_by_election_level_names.get(election_level_name)
-        sub_race_type = race_type_obj.get("sub_race_type")
-        election_level_name = race_type_obj.get("election_level")
-        voters = (
-            Result.objects.filter(
-                result_form__tally__id=tally_id,
-                result_form__ballot__electrol_race__ballot_name=sub_race_type,
-                result_form__form_state=FormState.ARCHIVED,
-                entry_version=EntryVersion.FINAL,
-                active=True,
-            )
-            .aggregate(race_voters=Coalesce(Sum("votes"), 0))
-            .get("race_voters")
-        )
-        race_type_obj["voters_in_counted_stations"] = voters
-        # Calculate voters in counted stations
-        qs = tally_stations_qs.filter(
-            center__resultform__ballot__electrol_race__election_level=election_level_name,
-            center__resultform__ballot__electrol_race__ballot_name=sub_race_type,
-        )
-        race_type_obj["stations_expected"] = qs.distinct(
-            "station_number", "center", "tally"
-        ).count()
-
-        station_ids_by_races = (
-            qs.filter(
-                center__resultform__form_state=FormState.ARCHIVED,
-            )
-            .annotate(
-                race=F(
-                    "center__resultform__ballot__electrol_race__election_level"
-                )
-            )
-            .values("id")
-            .annotate(
-                races=ArrayAgg("race", distinct=True),
-            )
-        )
-        stations_processed = 0
-        registrants_in_processed_stations = 0
-        for station in station_ids_by_races:
-            station_obj = stations_by_id.get(station.get("id"))
-            if station_obj is None:
-                continue
-            # Calculate stations processed and total registrants
-            form_states = (
-                ResultForm.objects.filter(
-                    tally__id=tally_id,
-                    center__resultform__ballot__electrol_race__election_level=election_level_name,
-                    center__resultform__ballot__electrol_race__ballot_name=sub_race_type,
-                    center__stations__id=station.get("id"),
-                    station_number=station_obj.station_number,
-                )
-                .values_list("form_state", flat=True)
-                .distinct()
-            )
-
-            station_is_processed = (
-                form_states.count() == 1
-                and form_states[0] == FormState.ARCHIVED
-            )
-            if station_is_processed is False:
-                race_type_obj["stations_processed"] = 0
-                race_type_obj["registrants_in_processed_stations"] = 0
-                race_type_obj["percentage_of_stations_processed"] = 0
-                race_type_obj["percentage_turnout"] = 0
-                race_type_obj["results_status"] = "Partial"
-                continue
-
-            stations_processed += 1
-            registrants_in_processed_stations += station_obj.registrants
-
-        # Calculate turnout percentage
-        if stations_processed != 0:
-            race_type_obj["stations_processed"] = stations_processed
-            race_type_obj["registrants_in_processed_stations"] = (
-                registrants_in_processed_stations
-            )
-            race_type_obj["percentage_of_stations_processed"] = round(
-                100 * stations_processed / race_type_obj["stations_expected"],
-                2,
-            )
-            race_type_obj["results_status"] = (
-                "Final"
-                if race_type_obj["percentage_of_stations_processed"] >= 100.0
-                else "Partial"
-            )
-            race_type_obj["percentage_turnout"] = round(
-                100 * voters / registrants_in_processed_stations, 2
-            )
-
-    return race_data_by_election_level_names
 
 
 def get_results(request):
     """
-    Builds a json object of candidates results.
+    Streams candidates results as newline delimited JSON, one candidate
+    per line, by descending votes.
+
+    The results are read in one query ordered by candidate, with the
+    candidate and race totals computed by window functions, and grouped
+    into candidates as they are streamed.
 
     :param request: The request object containing the tally id.
 
-    returns: A JSON response of candidates results
+    returns: A streaming response of candidates results
     """
     tally_id = json.loads(request.GET.get("data")).get("tally_id")
-    qs = Result.objects.select_related(
-        "candidate",
-        "result_form__center__sub_constituency",
-        "result_form__ballot__electrol_race",
-        "result_form__office",
-    ).filter(
-        result_form__tally__id=tally_id,
-        result_form__form_state=FormState.ARCHIVED,
-        entry_version=EntryVersion.FINAL,
-        result_form__ballot__available_for_release=True,
-        active=True,
-    )
-    results_metadata_queryset = qs
-    qs = get_filtered_candidate_votes(
-        tally_id,
-        qs,
-        data=None,
-    )
-    races_ids_to_total_votes_mapping = {}
-    for electral_race_id in ElectrolRace.objects.filter(
-        tally__id=tally_id
-    ).values_list("id", flat=True):
-        races_ids_to_total_votes_mapping[electral_race_id] = sum(
-            [
-                q.get("total_votes")
-                for q in qs
-                if q.get("electrol_race_id") == electral_race_id
-            ]
+    rows = (
+        get_released_results(tally_id)
+        .annotate(
+            total_votes=Window(Sum("votes"), partition_by=[F("candidate")]),
+            valid_votes=Window(
+                Sum("votes"),
+                partition_by=[F("candidate__ballot__electrol_race")],
+            ),
         )
-
-    candidate_data = []
-    for candidate_result in qs:
-        candidate_result.update(
-            {
-                "candidate_id": candidate_result.get("candidate_number"),
-                "valid_votes": races_ids_to_total_votes_mapping.get(
-                    candidate_result.get("electrol_race_id")
-                ),
-                "metadata": [
-                    {
-                        "barcode": rs.result_form.barcode,
-                        "gender": rs.result_form.gender.name,
-                        "station_number": rs.result_form.station_number,
-                        "center_code": rs.result_form.center.code,
-                        "center_name": rs.result_form.center.name,
-                        "office_name": rs.result_form.office.name,
-                        "office_number": rs.result_form.office.number,
-                        "sub_con_name": \
-                        rs.result_form.center.sub_constituency.name,
-                        "sub_con_code": \
-                        rs.result_form.center.sub_constituency.code,
-                    }
-                    for rs in results_metadata_queryset.filter(
-                        candidate__candidate_id=candidate_result.get(
-                            "candidate_number"
-                        )
-                    )
-                ],
-            }
+        .order_by("-total_votes", "candidate")
+        .values(
+            "total_votes",
+            "valid_votes",
+            candidate_pk=F("candidate"),
+            candidate_number=F("candidate__candidate_id"),
+            candidate_name=F("candidate__full_name"),
+            candidate_active=F("candidate__active"),
+            order=F("candidate__order"),
+            ballot_number=F("candidate__ballot__number"),
+            electrol_race_id=F("candidate__ballot__electrol_race__id"),
+            election_level=F(
+                "candidate__ballot__electrol_race__election_level"
+            ),
+            sub_race_type=F("candidate__ballot__electrol_race__ballot_name"),
+            barcode=F("result_form__barcode"),
+            gender=F("result_form__gender"),
+            station_number=F("result_form__station_number"),
+            center_code=F("result_form__center__code"),
+            center_name=F("result_form__center__name"),
+            office_name=F("result_form__office__name"),
+            office_number=F("result_form__office__number"),
+            sub_con_name=F("result_form__center__sub_constituency__name"),
+            sub_con_code=F("result_form__center__sub_constituency__code"),
         )
-        candidate_data.append(candidate_result)
-
-    sorted_results_report = sorted(
-        candidate_data, key=lambda x: -x["total_votes"]
     )
 
-    return JsonResponse(
-        data={"data": sorted_results_report, "created_at": timezone.now()},
-        safe=False,
+    return ndjson_response(
+        build_candidate_results(stream_queryset(rows)),
+        f"results_{timezone.now():%Y%m%d_%H%M%S}.ndjson",
     )
 
 
 def get_centers_by_municipalities_results(request):
     """
-    Builds a An Array of Dictionaries contain candidates total votes grouped
-    by center code, sub race and sub constituency code.
+    Streams candidates total votes grouped by center code, sub race and
+    sub constituency code as newline delimited JSON, by descending votes.
 
     :param request: The request object containing the tally id.
 
-    returns: A JSON response
+    returns: A streaming response
     """
     tally_id = json.loads(request.GET.get("data")).get("tally_id")
-    qs = Result.objects.select_related(
-        "candidate",
-        "result_form__center__sub_constituency",
-        "result_form__ballot__electrol_race",
-        "result_form__office",
-    ).filter(
-        result_form__tally__id=tally_id,
-        result_form__form_state=FormState.ARCHIVED,
-        entry_version=EntryVersion.FINAL,
-        result_form__ballot__available_for_release=True,
-        active=True,
-    )
     data = (
-        qs.annotate(
+        get_released_results(tally_id)
+        .annotate(
             code=F("result_form__center__code"),
             sub_race=F("result_form__ballot__electrol_race__ballot_name"),
             sub_con_code=F("result_form__center__sub_constituency__code"),
         )
         .values("code", "sub_race", "sub_con_code")
         .annotate(total_votes=Sum("votes"))
+        .order_by("-total_votes")
     )
-    sorted_data = sorted(data, key=lambda x: -x["total_votes"])
 
-    return JsonResponse(
-        data={"data": sorted_data, "created_at": timezone.now()}, safe=False
+    return ndjson_response(
+        stream_queryset(data),
+        f"centers_by_mun_results_{timezone.now():%Y%m%d_%H%M%S}.ndjson",
     )
 
 
 def get_centers_by_municipalities_candidates_results(request):
     """
-    Builds a An Array of Dictionaries containing each candidates total votes
-    grouped by center code, sub race and sub constituency code.
+    Streams each candidates total votes grouped by center code, sub race
+    and sub constituency code as newline delimited JSON, by descending
+    votes.
 
     :param request: The request object containing the tally id.
 
-    returns: A JSON response
+    returns: A streaming response
     """
     tally_id = json.loads(request.GET.get("data")).get("tally_id")
-    qs = Result.objects.select_related(
-        "candidate",
-        "result_form__center__sub_constituency",
-        "result_form__ballot__electrol_race",
-        "result_form__office",
-    ).filter(
-        result_form__tally__id=tally_id,
-        result_form__form_state=FormState.ARCHIVED,
-        entry_version=EntryVersion.FINAL,
-        result_form__ballot__available_for_release=True,
-        active=True,
-    )
     data = (
-        qs.annotate(
+        get_released_results(tally_id)
+        .annotate(
             code=F("result_form__center__code"),
             sub_race=F("result_form__ballot__electrol_race__ballot_name"),
             sub_con_code=F("result_form__center__sub_constituency__code"),
@@ -2446,38 +2037,30 @@ def get_centers_by_municipalities_candidates_results(request):
             "candidate_name",
         )
         .annotate(total_votes=Sum("votes"))
+        .order_by("-total_votes")
     )
-    sorted_data = sorted(data, key=lambda x: -x["total_votes"])
 
-    return JsonResponse(
-        data={"data": sorted_data, "created_at": timezone.now()}, safe=False
+    return ndjson_response(
+        stream_queryset(data),
+        "centers_by_mun_c_votes_results_"
+        f"{timezone.now():%Y%m%d_%H%M%S}.ndjson",
     )
 
 
 def get_centers_stations_by_municipalities_candidates_results(request):
     """
-    Builds a An Array of Dictionaries containing each candidates total votes
-    grouped by center code, station number, sub race and sub constituency code.
+    Streams each candidates total votes grouped by center code, station
+    number, sub race and sub constituency code as newline delimited JSON,
+    by descending votes.
 
     :param request: The request object containing the tally id.
 
-    returns: A JSON response
+    returns: A streaming response
     """
     tally_id = json.loads(request.GET.get("data")).get("tally_id")
-    qs = Result.objects.select_related(
-        "candidate",
-        "result_form__center__sub_constituency",
-        "result_form__ballot__electrol_race",
-        "result_form__office",
-    ).filter(
-        result_form__tally__id=tally_id,
-        result_form__form_state=FormState.ARCHIVED,
-        entry_version=EntryVersion.FINAL,
-        result_form__ballot__available_for_release=True,
-        active=True,
-    )
     data = (
-        qs.annotate(
+        get_released_results(tally_id)
+        .annotate(
             code=F("result_form__center__code"),
             station_number=F("result_form__station_number"),
             sub_race=F("result_form__ballot__electrol_race__ballot_name"),
@@ -2494,11 +2077,13 @@ def get_centers_stations_by_municipalities_candidates_results(request):
             "candidate_name",
         )
         .annotate(total_votes=Sum("votes"))
+        .order_by("-total_votes")
     )
-    sorted_data = sorted(data, key=lambda x: -x["total_votes"])
 
-    return JsonResponse(
-        data={"data": sorted_data, "created_at": timezone.now()}, safe=False
+    return ndjson_response(
+        stream_queryset(data),
+        "centers_stations_by_mun_c_votes_results_"
+        f"{timezone.now():%Y%m%d_%H%M%S}.ndjson",
     )
 
 
@@ -2548,6 +2133,7 @@ class SummaryReportDataView(
     AjaxLoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    AnalyticsDatatableMixin,
     BaseDatatableView,
 ):
     group_required = groups.TALLY_MANAGER
@@ -2744,6 +2330,7 @@ class SummaryReportView(
             self.get_context_data(
                 remote_url=reverse("summary-list-data", kwargs=kwargs),
                 tally_id=tally_id,
+                analytics_snapshot=analytics.get_fresh_snapshot(),
                 region_name=region_name,
                 constituency_name=constituency_name,
             )
@@ -2754,6 +2341,7 @@ class ProgressiveReportDataView(
     AjaxLoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    AnalyticsDatatableMixin,
     BaseDatatableView,
 ):
     group_required = groups.TALLY_MANAGER
@@ -3018,6 +2606,7 @@ class ProgressiveReportView(
                     "progressive-report-list-data", kwargs=kwargs
                 ),
                 tally_id=tally_id,
+                analytics_snapshot=analytics.get_fresh_snapshot(),
                 region_name=region_name,
                 constituency_name=constituency_name,
             )
@@ -3028,6 +2617,7 @@ class DiscrepancyReportDataView(
     AjaxLoginRequiredMixin,
     GroupRequiredMixin,
     TallyAccessMixin,
+    AnalyticsDatatableMixin,
     BaseDatatableView,
 ):
     group_required = groups.TALLY_MANAGER
@@ -3516,6 +3106,7 @@ class DiscrepancyReportView(
             self.get_context_data(
                 remote_url=reverse(url, kwargs=kwargs),
                 tally_id=tally_id,
+                analytics_snapshot=analytics.get_fresh_snapshot(),
                 region_name=region_name,
                 constituency_name=constituency_name,
                 report_type=report_type,
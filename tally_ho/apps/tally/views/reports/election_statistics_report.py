@@ -1,6 +1,7 @@
 import json
 
-from django.db.models import F, Sum
+from django.db import connection
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.urls import reverse
 from django.views.generic import TemplateView
@@ -8,503 +9,278 @@ from django_datatables_view.base_datatable_view import BaseDatatableView
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.models.ballot import Ballot
-from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.gender import Gender
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.utils.cache import REPORTS, tally_cached
 from tally_ho.libs.utils.numbers import parse_int
 from tally_ho.libs.views.mixins import (AjaxLoginRequiredMixin, DataTablesMixin,
                                         GroupRequiredMixin, TallyAccessMixin)
 
 
-def generate_election_statistics(tally_id, election_level, gender=None):
-    election_statistics = []
-    # Calculate voters in counted stations
-    election_level_ballots = [
-        {"id": ballot.id, "number": ballot.number}
-        for ballot in Ballot.objects.filter(
-            tally_id=tally_id,
-            electrol_race__election_level=election_level,
-            active=True,
+# Stations of the centers with a form of a ballot of the election level,
+# with whether all their forms of the ballot are archived and the votes of
+# those forms, only read for archived forms as only they are counted.
+# Stations without forms of a ballot are expected but never counted.
+# Ballot rows are grouped by ballot and station gender, total rows
+# (ballot_id NULL) by station gender, where a station is counted if all its
+# forms of the election level are archived, with the votes of its ballot
+# with the most votes.
+ELECTION_STATISTICS_QUERY = """
+WITH forms AS (
+    SELECT rf.id, rf.center_id, rf.station_number, rf.ballot_id,
+        rf.form_state
+    FROM tally_resultform rf
+    JOIN tally_ballot b ON b.id = rf.ballot_id
+    JOIN tally_electrolrace er ON er.id = b.electrol_race_id
+    WHERE rf.tally_id = %(tally_id)s
+        AND b.active
+        AND er.election_level = %(election_level)s
+),
+station_forms AS (
+    SELECT center_id, station_number, ballot_id,
+        bool_and(form_state = %(archived)s) AS counted
+    FROM forms
+    GROUP BY center_id, station_number, ballot_id
+),
+station_votes AS (
+    SELECT f.center_id, f.station_number, f.ballot_id, SUM(r.votes) AS votes
+    FROM forms f
+    JOIN tally_result r ON r.result_form_id = f.id
+    WHERE f.form_state = %(archived)s
+        AND r.entry_version = %(final)s
+        AND r.active
+    GROUP BY f.center_id, f.station_number, f.ballot_id
+),
+station_ballots AS (
+    SELECT s.id AS station_id, s.gender, s.registrants, cb.ballot_id,
+        COALESCE(sf.counted, FALSE) AS counted,
+        COALESCE(sv.votes, 0) AS votes,
+        sf.counted IS NOT NULL AS has_forms
+    FROM tally_station s
+    JOIN (SELECT DISTINCT center_id, ballot_id FROM forms) cb
+        ON cb.center_id = s.center_id
+    LEFT JOIN station_forms sf
+        ON sf.center_id = s.center_id
+        AND sf.station_number = s.station_number
+        AND sf.ballot_id = cb.ballot_id
+    LEFT JOIN station_votes sv
+        ON sv.center_id = s.center_id
+        AND sv.station_number = s.station_number
+        AND sv.ballot_id = cb.ballot_id
+    WHERE s.tally_id = %(tally_id)s
+),
+stations AS (
+    SELECT station_id, gender, registrants,
+        COALESCE(bool_and(counted) FILTER (WHERE has_forms), FALSE)
+            AS counted,
+        MAX(votes) AS votes
+    FROM station_ballots
+    GROUP BY station_id, gender, registrants
+)
+SELECT ballot_id, gender,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE counted),
+    COALESCE(SUM(registrants) FILTER (WHERE counted), 0)::bigint,
+    COALESCE(SUM(votes) FILTER (WHERE counted), 0)::bigint
+FROM station_ballots
+GROUP BY ballot_id, gender
+UNION ALL
+SELECT NULL, gender,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE counted),
+    COALESCE(SUM(registrants) FILTER (WHERE counted), 0)::bigint,
+    COALESCE(SUM(votes) FILTER (WHERE counted), 0)::bigint
+FROM stations
+GROUP BY gender
+"""
+
+STATION_STATISTICS_FIELDS = (
+    "stations_expected",
+    "stations_counted",
+    "registrants_in_stations_counted",
+    "voters_in_counted_stations",
+)
+
+
+def percentage(numerator, denominator, default=0):
+    return round(100 * numerator / denominator, 2) if denominator else default
+
+
+def get_station_statistics(tally_id, election_level):
+    """Aggregate the stations of an election level in one query.
+
+    :param tally_id: The tally to aggregate stations of.
+    :param election_level: The election level of the ballots.
+
+    :returns: A dict of station statistics per ballot id, None for the
+        stations of every ballot, and station gender.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            ELECTION_STATISTICS_QUERY,
+            {
+                "tally_id": tally_id,
+                "election_level": election_level,
+                "archived": FormState.ARCHIVED.value,
+                "final": EntryVersion.FINAL.value,
+            },
         )
-        .only("id", "number")
-        .values_list("id", "number", named=True)
-    ]
 
-    # get stations
-    stations = [
-        {
-            "id": station.id,
-            "station_number": station.station_number,
-            "center": station.center,
-            "form_state": station.form_state,
-            "ballot_id": station.ballot_id,
-            "registrants": station.registrants,
-            "gender": station.gender,
+        return {
+            (ballot_id, Gender(gender)): dict(
+                zip(STATION_STATISTICS_FIELDS, statistics)
+            )
+            for ballot_id, gender, *statistics in cursor.fetchall()
         }
-        for station in Station.objects.filter(
-            tally_id=tally_id,
-            center__resultform__ballot__electrol_race__election_level=election_level,
-            center__resultform__ballot__active=True,
-        )
-        .annotate(
-            form_state=F("center__resultform__form_state"),
-            ballot_id=F("center__resultform__ballot__id"),
-        )
-        .order_by("station_number", "center_id", "tally_id")
-        .distinct("station_number", "center_id", "tally_id")
-        .only(
-            "id",
-            "station_number",
-            "center",
-            "form_state",
-            "ballot_id",
-            "gender",
-            "registrants",
-        )
-        .values_list(
-            "id",
-            "station_number",
-            "center",
-            "form_state",
-            "ballot_id",
-            "gender",
-            "registrants",
-            named=True,
-        )
-    ]
 
-    if gender:
-        stations = [
-            station for station in stations if station.get("gender") == gender
-        ]
 
-    result_forms = [
-        {
-            "id": result_form.id,
-            "station_number": result_form.station_number,
-            "center": result_form.center,
-            "form_state": result_form.form_state,
-            "ballot": result_form.ballot,
-        }
-        for result_form in ResultForm.objects.filter(
-            tally__id=tally_id,
-            ballot__electrol_race__election_level=election_level,
-            ballot__active=True,
-        )
-        .order_by("center_id", "station_number", "ballot_id", "tally_id")
-        .distinct("center_id", "station_number", "ballot_id", "tally_id")
-        .only(
-            "id",
-            "station_number",
-            "center",
-            "form_state",
-            "ballot",
-        )
-        .values_list(
-            "id",
-            "station_number",
-            "center",
-            "form_state",
-            "ballot",
-            named=True,
-        )
-    ]
+def sum_station_statistics(station_statistics, ballot_id, gender=None):
+    """Sum the statistics of a ballot over station genders.
 
-    if election_level != "Presidential":
-        aggregate_ballot_election_statistics = {
-            "ballot_number": "Total",
-            "stations_expected": 0,
-            "stations_counted": 0,
-            "voters_in_counted_stations": 0,
-            "registrants_in_stations_counted": 0,
-        }
+    :param station_statistics: Statistics from ``get_station_statistics``.
+    :param ballot_id: The ballot to sum, None for every ballot.
+    :param gender: Only sum stations of this gender if set.
+    """
+    totals = dict.fromkeys(STATION_STATISTICS_FIELDS, 0)
 
-    for ballot in election_level_ballots:
-        voters_in_counted_stations = 0
-        stations_counted = 0
-        registrants_in_stations_counted = 0
-        ballot_election_statistics = {
-            "ballot_number": ballot.get("number"),
-            "stations_counted": 0,
-            "percentage_of_stations_counted": 0,
-            "voters_in_counted_stations": 0,
-            "registrants_in_stations_counted": 0,
-            "percentage_turnout_in_stations_counted": 0,
-        }
-        # Calculate stations expected
-        ballot_stations = [
-            station
-            for station in stations
-            if station.get("ballot_id") == ballot.get("id")
-        ]
-        ballot_election_statistics["stations_expected"] = len(ballot_stations)
-        if election_level != "Presidential":
-            aggregate_ballot_election_statistics["stations_expected"] += (
-                ballot_election_statistics["stations_expected"]
-            )
+    for (statistics_ballot_id, statistics_gender), statistics in (
+        station_statistics.items()
+    ):
+        if statistics_ballot_id == ballot_id and gender in (
+            None,
+            statistics_gender,
+        ):
+            for field in STATION_STATISTICS_FIELDS:
+                totals[field] += statistics[field]
 
-        ballot_stations_with_archived_forms = [
-            station
-            for station in ballot_stations
-            if station.get("form_state") == FormState.ARCHIVED
-        ]
+    return totals
 
-        # Calculate stations processed/counted per ballot and total registrants
-        for station in ballot_stations_with_archived_forms:
-            form_states = set(
-                [
-                    result_form.get("form_state")
-                    for result_form in result_forms
-                    if result_form.get("ballot") == ballot.get("id")
-                    and result_form.get("station_number")
-                    == station.get("station_number")
-                    and result_form.get("center") == station.get("center")
-                ]
-            )
 
-            station_is_processed = (
-                len(form_states) == 1
-                and form_states.pop() == FormState.ARCHIVED
-            )
-            if station_is_processed:
-                stations_counted += 1
-                if station.get("registrants"):
-                    registrants_in_stations_counted += station.get(
-                        "registrants"
-                    )
-
-                # Calculate voters voted in processed stations
-                votes = (
-                    Result.objects.filter(
-                        result_form__tally__id=tally_id,
-                        result_form__ballot__electrol_race__election_level=election_level,
-                        result_form__ballot__active=True,
-                        result_form__ballot__id=ballot.get("id"),
-                        result_form__center__id=station.get("center"),
-                        result_form__station_number=station.get(
-                            "station_number"
-                        ),
-                        entry_version=EntryVersion.FINAL,
-                        active=True,
-                    )
-                    .annotate(
-                        race=F(
-                            "result_form__ballot__electrol_race__election_level"
-                        )
-                    )
-                    .values("race")
-                    .annotate(race_voters=Sum("votes"))
-                    .order_by("-race_voters")
-                    .values("race_voters")
-                )
-                if votes.count() != 0:
-                    voters_in_counted_stations += votes[0].get("race_voters")
-            else:
-                ballot_election_statistics["stations_counted"] = 0
-                ballot_election_statistics[
-                    "percentage_of_stations_counted"
-                ] = 0
-                ballot_election_statistics["voters_in_counted_stations"] = 0
-                ballot_election_statistics[
-                    "registrants_in_stations_counted"
-                ] = 0
-                ballot_election_statistics[
-                    "percentage_turnout_in_stations_counted"
-                ] = 0
-
-        # Calculate turnout percentage
-        if stations_counted != 0:
-            ballot_election_statistics["stations_counted"] = stations_counted
-            ballot_election_statistics["percentage_of_stations_counted"] = (
-                round(
-                    100
-                    * stations_counted
-                    / ballot_election_statistics["stations_expected"],
-                    2,
-                )
-                if ballot_election_statistics["stations_expected"]
-                else 0
-            )
-            ballot_election_statistics["voters_in_counted_stations"] = (
-                voters_in_counted_stations
-            )
-            ballot_election_statistics["registrants_in_stations_counted"] = (
-                registrants_in_stations_counted
-            )
-            ballot_election_statistics[
-                "percentage_turnout_in_stations_counted"
-            ] = (
-                round(
-                    100
-                    * voters_in_counted_stations
-                    / registrants_in_stations_counted,
-                    2,
-                )
-                if registrants_in_stations_counted
-                else 0
-            )
-            if election_level != "Presidential":
-                aggregate_ballot_election_statistics["stations_counted"] += (
-                    ballot_election_statistics["stations_counted"]
-                )
-                aggregate_ballot_election_statistics[
-                    "voters_in_counted_stations"
-                ] += ballot_election_statistics["voters_in_counted_stations"]
-                aggregate_ballot_election_statistics[
-                    "registrants_in_stations_counted"
-                ] += ballot_election_statistics[
-                    "registrants_in_stations_counted"
-                ]
-        if election_level != "Presidential":
-            aggregate_ballot_election_statistics[
-                "percentage_of_stations_counted"
-            ] = (
-                round(
-                    100
-                    * aggregate_ballot_election_statistics["stations_counted"]
-                    / aggregate_ballot_election_statistics[
-                        "stations_expected"
-                    ],
-                    2,
-                )
-                if aggregate_ballot_election_statistics["stations_expected"]
-                else 0.0
-            )
-            aggregate_ballot_election_statistics[
-                "percentage_turnout_in_stations_counted"
-            ] = (
-                round(
-                    100
-                    * aggregate_ballot_election_statistics[
-                        "voters_in_counted_stations"
-                    ]
-                    / aggregate_ballot_election_statistics[
-                        "registrants_in_stations_counted"
-                    ],
-                    2,
-                )
-                if aggregate_ballot_election_statistics[
-                    "registrants_in_stations_counted"
-                ]
-                else 0.0
-            )
+@tally_cached(REPORTS)
+def generate_election_statistics(tally_id, election_level, gender=None):
+    """Return the station statistics of each ballot of an election level.
+
+    Cached until a form of the tally changes state.
+
+    :param tally_id: The tally to report on.
+    :param election_level: The election level of the ballots.
+    :param gender: Only count stations of this gender if set.
+
+    :returns: A list of a dict per active ballot, followed by a total for
+        election levels other than Presidential.
+    """
+    station_statistics = get_station_statistics(tally_id, election_level)
+    election_statistics = []
+    ballots = Ballot.objects.filter(
+        tally_id=tally_id,
+        electrol_race__election_level=election_level,
+        active=True,
+    ).values_list("id", "number")
+
+    for ballot_id, ballot_number in ballots:
+        statistics = sum_station_statistics(
+            station_statistics, ballot_id, gender
+        )
+        election_statistics.append(
+            {
+                "ballot_number": ballot_number,
+                **statistics,
+                "percentage_of_stations_counted": percentage(
+                    statistics["stations_counted"],
+                    statistics["stations_expected"],
+                ),
+                "percentage_turnout_in_stations_counted": percentage(
+                    statistics["voters_in_counted_stations"],
+                    statistics["registrants_in_stations_counted"],
+                ),
+            }
+        )
 
-        election_statistics.append(ballot_election_statistics)
     if election_level != "Presidential":
-        election_statistics.append(aggregate_ballot_election_statistics)
+        statistics = sum_station_statistics(station_statistics, None, gender)
+        election_statistics.append(
+            {
+                "ballot_number": "Total",
+                **statistics,
+                "percentage_of_stations_counted": percentage(
+                    statistics["stations_counted"],
+                    statistics["stations_expected"],
+                    0.0,
+                ),
+                "percentage_turnout_in_stations_counted": percentage(
+                    statistics["voters_in_counted_stations"],
+                    statistics["registrants_in_stations_counted"],
+                    0.0,
+                ),
+            }
+        )
+
     return election_statistics
 
 
+@tally_cached(REPORTS)
 def generate_overview_election_statistics(tally_id, election_level):
-    election_statistics = {
-        "male_voters_in_counted_stations": 0,
-        "female_voters_in_counted_stations": 0,
-        "unisex_voters_in_counted_stations": 0,
-        "voters_in_counted_stations": 0,
-        "male_total_registrants_in_counted_stations": 0,
-        "female_total_registrants_in_counted_stations": 0,
-        "unisex_total_registrants_in_counted_stations": 0,
-        "total_registrants_in_counted_stations": 0,
-        "percentage_of_stations_processed": 0.0,
-        "male_projected_turnout_percentage": 0.0,
-        "female_projected_turnout_percentage": 0.0,
-        "unisex_projected_turnout_percentage": 0.0,
-        "projected_turnout_percentage": 0.0,
-    }
-    result_forms_expected = ResultForm.objects.filter(
+    """Return the form and station statistics of an election level, in
+    total and per station gender.
+
+    Cached until a form of the tally changes state.
+
+    :param tally_id: The tally to report on.
+    :param election_level: The election level of the ballots.
+    """
+    election_statistics = ResultForm.objects.filter(
         tally__id=tally_id,
         ballot__electrol_race__election_level=election_level,
         ballot__active=True,
-    ).distinct()
-    forms_expected = result_forms_expected.count()
-    election_statistics["forms_expected"] = forms_expected
-    forms_counted = result_forms_expected.filter(
-        form_state=FormState.ARCHIVED
-    ).count()
-    election_statistics["forms_counted"] = forms_counted
-    election_statistics["completion_percentage"] = (
-        round(100 * forms_counted / forms_expected, 2)
-        if forms_expected
-        else 0.0
+    ).aggregate(
+        forms_expected=Count("id"),
+        forms_counted=Count("id", filter=Q(form_state=FormState.ARCHIVED)),
     )
-    # Calculate voters in counted stations
-    qs = Station.objects.filter(
-        tally_id=tally_id,
-        center__resultform__ballot__electrol_race__election_level=election_level,
-        center__resultform__ballot__active=True,
+    election_statistics["completion_percentage"] = percentage(
+        election_statistics["forms_counted"],
+        election_statistics["forms_expected"],
+        0.0,
     )
-    election_statistics["stations_expected"] = (
-        qs.order_by("station_number", "center_id", "tally_id")
-        .distinct("station_number", "center_id", "tally_id")
-        .count()
+    station_statistics = get_station_statistics(tally_id, election_level)
+    statistics = sum_station_statistics(station_statistics, None)
+    election_statistics["stations_expected"] = statistics["stations_expected"]
+    election_statistics["percentage_of_stations_processed"] = percentage(
+        statistics["stations_counted"], statistics["stations_expected"], 0.0
     )
-
-    station_ids_by_races = (
-        qs.filter(
-            center__resultform__form_state=FormState.ARCHIVED,
-        )
-        .values("id")
-        .annotate(
-            number=F("station_number"),
-            station_gender=F("gender"),
-            num_registrants=F("registrants"),
-        )
-        .order_by("id")
-        .distinct()
+    election_statistics["voters_in_counted_stations"] = statistics[
+        "voters_in_counted_stations"
+    ]
+    election_statistics["total_registrants_in_counted_stations"] = (
+        statistics["registrants_in_stations_counted"]
+    )
+    election_statistics["projected_turnout_percentage"] = percentage(
+        statistics["voters_in_counted_stations"],
+        statistics["registrants_in_stations_counted"],
+        0.0,
     )
-    voters = 0
-    male_voters = 0
-    female_voters = 0
-    unisex_voters = 0
-    stations_counted = 0
-    total_male_registrants_in_counted_stations = 0
-    total_female_registrants_in_counted_stations = 0
-    total_unisex_registrants_in_counted_stations = 0
-    total_registrants_in_counted_stations = 0
-    for station in station_ids_by_races:
-        # Calculate stations processed and total registrants
-        form_states = (
-            ResultForm.objects.filter(
-                tally__id=tally_id,
-                ballot__electrol_race__election_level=election_level,
-                ballot__active=True,
-                center__stations__id=station.get("id"),
-                station_number=station.get("number"),
-            )
-            .values_list("form_state", flat=True)
-            .distinct()
-        )
-
-        station_is_processed = (
-            form_states.count() == 1 and form_states[0] == FormState.ARCHIVED
-        )
-        if station_is_processed is False:
-            election_statistics["male_voters_in_counted_stations"] = 0
-            election_statistics["female_voters_in_counted_stations"] = 0
-            election_statistics["unisex_voters_in_counted_stations"] = 0
-            election_statistics["voters_in_counted_stations"] = 0
-            election_statistics[
-                "male_total_registrants_in_counted_stations"
-            ] = 0
-            election_statistics[
-                "female_total_registrants_in_counted_stations"
-            ] = 0
-            election_statistics[
-                "unisex_total_registrants_in_counted_stations"
-            ] = 0
-            election_statistics["total_registrants_in_counted_stations"] = 0
-            election_statistics["percentage_of_stations_processed"] = 0.0
-            election_statistics["male_projected_turnout_percentage"] = 0.0
-            election_statistics["female_projected_turnout_percentage"] = 0.0
-            election_statistics["unisex_projected_turnout_percentage"] = 0.0
-            election_statistics["projected_turnout_percentage"] = 0.0
-            continue
-
-        stations_counted += 1
-        total_registrants_in_counted_stations += station.get("num_registrants")
-        if station.get("station_gender") == Gender.MALE:
-            total_male_registrants_in_counted_stations += station.get(
-                "num_registrants"
-            )
-        elif station.get("station_gender") == Gender.FEMALE:
-            total_female_registrants_in_counted_stations += station.get(
-                "num_registrants"
-            )
-        elif station.get("station_gender") == Gender.UNISEX:
-            total_unisex_registrants_in_counted_stations += station.get(
-                "num_registrants"
-            )
 
-        # Calculate voters voted in processed stations
-        votes = (
-            Result.objects.filter(
-                result_form__tally__id=tally_id,
-                result_form__ballot__electrol_race__election_level=election_level,
-                result_form__ballot__active=True,
-                result_form__center__stations__id=station.get("id"),
-                result_form__station_number=station.get("number"),
-                entry_version=EntryVersion.FINAL,
-                active=True,
-            )
-            .annotate(
-                race=F("result_form__ballot__electrol_race__election_level"),
-                ballot_number=F("result_form__ballot__number"),
-            )
-            .values("race", "ballot_number")
-            .annotate(race_voters=Sum("votes"))
-            .order_by("-race_voters")
-            .values("race_voters")
-        )
-        if votes.count() != 0:
-            voters += votes[0].get("race_voters")
-            if station.get("station_gender") == Gender.MALE:
-                male_voters += votes[0].get("race_voters")
-            elif station.get("station_gender") == Gender.FEMALE:
-                female_voters += votes[0].get("race_voters")
-            elif station.get("station_gender") == Gender.UNISEX:
-                unisex_voters += votes[0].get("race_voters")
-
-    # Calculate turnout percentage
-    if stations_counted != 0:
-        election_statistics["voters_in_counted_stations"] = voters
-        election_statistics["total_registrants_in_counted_stations"] = (
-            total_registrants_in_counted_stations
-        )
-        election_statistics["projected_turnout_percentage"] = (
-            round(100 * voters / total_registrants_in_counted_stations, 2)
-            if total_registrants_in_counted_stations
-            else 0.0
-        )
-        # Male station statistics
-        election_statistics["male_voters_in_counted_stations"] = male_voters
-        election_statistics["male_total_registrants_in_counted_stations"] = (
-            total_male_registrants_in_counted_stations
-        )
-        election_statistics["male_projected_turnout_percentage"] = (
-            round(
-                100 * male_voters / total_male_registrants_in_counted_stations,
-                2,
-            )
-            if total_male_registrants_in_counted_stations
-            else 0.0
-        )
-        # Female station statistics
-        election_statistics["female_voters_in_counted_stations"] = (
-            female_voters
-        )
-        election_statistics["female_total_registrants_in_counted_stations"] = (
-            total_female_registrants_in_counted_stations
-        )
-        election_statistics["female_projected_turnout_percentage"] = (
-            round(
-                100
-                * female_voters
-                / total_female_registrants_in_counted_stations,
-                2,
-            )
-            if total_female_registrants_in_counted_stations
-            else 0.0
-        )
-        # Unisex station statistics
-        election_statistics["unisex_voters_in_counted_stations"] = (
-            unisex_voters
-        )
-        election_statistics["unisex_total_registrants_in_counted_stations"] = (
-            total_unisex_registrants_in_counted_stations
+    for prefix, gender in (
+        ("male", Gender.MALE),
+        ("female", Gender.FEMALE),
+        ("unisex", Gender.UNISEX),
+    ):
+        statistics = sum_station_statistics(station_statistics, None, gender)
+        election_statistics[f"{prefix}_voters_in_counted_stations"] = (
+            statistics["voters_in_counted_stations"]
         )
-        election_statistics["unisex_projected_turnout_percentage"] = (
-            round(
-                100
-                * unisex_voters
-                / total_unisex_registrants_in_counted_stations,
-                2,
+        election_statistics[
+            f"{prefix}_total_registrants_in_counted_stations"
+        ] = statistics["registrants_in_stations_counted"]
+        election_statistics[f"{prefix}_projected_turnout_percentage"] = (
+            percentage(
+                statistics["voters_in_counted_stations"],
+                statistics["registrants_in_stations_counted"],
+                0.0,
             )
-            if total_unisex_registrants_in_counted_stations
-            else 0.0
         )
 
     return election_statistics
@@ -1,9 +1,11 @@
 from django.db.models import When, Case, Count, Q, Sum, F, \
     IntegerField, CharField, Value as V, Subquery, OuterRef
 
+from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.libs.utils.query_set_helpers import Round
+from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
 
 def get_filtered_candidate_votes(
@@ -209,3 +211,41 @@ def get_filtered_candidate_votes(
         )
     )
     return queryset
+
+
+def get_results_export_queryset(tally_id, data):
+    """
+    Build the votes per candidate of the archived final results of a tally
+    for an export.
+
+    :param tally_id: The tally id.
+    :param data: The export's filter values, see
+        ``get_filtered_candidate_votes``.
+
+    returns: The votes per candidate queryset.
+    """
+    filters_applied = any(
+        data.get(field)
+        for field in (
+            'select_1_ids',
+            'select_2_ids',
+            'election_level_names',
+            'sub_race_type_names',
+            'ballot_status',
+            'station_status',
+            'candidate_status',
+            'percentage_processed',
+            'sub_con_codes',
+        )
+    )
+    qs = Result.objects.select_related(
+        'candidate',
+    ).filter(
+        result_form__tally__id=tally_id,
+        result_form__form_state=FormState.ARCHIVED,
+        entry_version=EntryVersion.FINAL,
+        active=True,
+    )
+
+    return get_filtered_candidate_votes(
+        tally_id, qs, data=data if filters_applied else None)
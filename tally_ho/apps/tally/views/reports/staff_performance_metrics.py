@@ -1,10 +1,12 @@
-from django.db.models import Count, ExpressionWrapper, F, IntegerField, Q, Sum
+from django.db.models import ExpressionWrapper, F, IntegerField, Sum
 from django.db.models import Value as V
-from django.db.models.functions import Coalesce
 from django.views.generic import TemplateView
 from guardian.mixins import LoginRequiredMixin
 
-from tally_ho.apps.tally.models.result_form_stats import ResultFormStats
+from tally_ho.apps.tally.forms.date_range_form import DateRangeForm
+from tally_ho.apps.tally.models.result_form_stats_rollup import (
+    ResultFormStatsRollup,
+)
 from tally_ho.libs.permissions import groups
 from tally_ho.libs.views.mixins import GroupRequiredMixin
 
@@ -34,6 +36,35 @@ def approvals_percentage(
     return default_percentage_value
 
 
+def stats_rollups(request, tally_id):
+    """Return the result form stats rollups of a tally in the date range
+    of the request.
+
+    :param request: The request, with optional ``start_date`` and
+        ``end_date`` parameters.
+    :param tally_id: The id of the tally.
+
+    :returns: A tuple of the DateRangeForm and the rollups queryset.
+    """
+    form = DateRangeForm(request.GET)
+    rollups = ResultFormStatsRollup.objects.filter(tally__id=tally_id)
+
+    return form, form.filter(rollups)
+
+
+def group_approvals(approvals, group_name):
+    """Return the forms a group approved and the forms sent to it for
+    review.
+
+    :param approvals: A dict of approval totals by group name.
+    :param group_name: The name of the group.
+    """
+    totals = approvals.get(group_name, {})
+
+    return {'forms_approved': totals.get('forms_approved', 0),
+            'forms_sent_for_review': totals.get('forms_sent_for_review', 0)}
+
+
 class StaffPerformanceMetricsView(LoginRequiredMixin,
                                   GroupRequiredMixin,
                                   TemplateView):
@@ -43,19 +74,19 @@ class StaffPerformanceMetricsView(LoginRequiredMixin,
     def get(self, *args, **kwargs):
         tally_id = kwargs['tally_id']
         group_name = kwargs['group_name']
+        form, rollups = stats_rollups(self.request, tally_id)
 
         result_form_stats =\
-            ResultFormStats.objects\
-            .filter(
-                result_form__tally__id=tally_id,
-                user__groups__name=group_name)\
+            rollups.filter(group__name=group_name)\
             .values('user__username')\
             .annotate(
-                forms_processed=Count('user'),
-                total_processing_time=Coalesce(Sum('processing_time'), V(0)))
+                forms_processed=Sum('forms_processed'),
+                total_processing_time=Sum('processing_time'))\
+            .order_by('user__username')
 
         return self.render_to_response(
             self.get_context_data(
+                form=form,
                 tally_id=tally_id,
                 result_form_stats=result_form_stats,
                 user_group=group_name))
@@ -69,76 +100,31 @@ class SupervisorsApprovalsView(LoginRequiredMixin,
 
     def get(self, *args, **kwargs):
         tally_id = kwargs['tally_id']
-
-        tally_result_forms_stats =\
-            ResultFormStats.objects.filter(
-                user__groups__name__in=[groups.AUDIT_SUPERVISOR,
-                                        groups.SUPER_ADMINISTRATOR,
-                                        groups.TALLY_MANAGER],
-                result_form__tally__id=tally_id,
-                reviewed_by_supervisor=True)
-
-        result_forms_stats = tally_result_forms_stats\
-            .annotate(
-                count_approved_by_tally_manager=Count(
-                    'approved_by_supervisor',
-                    filter=Q(user__groups__name=groups.TALLY_MANAGER,
-                             approved_by_supervisor=True)))\
-            .annotate(
-                count_sent_for_review_by_tally_manager=Count(
-                    'id',
-                    filter=Q(user__groups__name=groups.TALLY_MANAGER)))\
-            .annotate(
-                count_approved_by_supervisor_admin=Count(
-                    'approved_by_supervisor',
-                    filter=Q(user__groups__name=groups.SUPER_ADMINISTRATOR,
-                             approved_by_supervisor=True)))\
-            .annotate(
-                count_sent_for_review_by_supervisor_admin=Count(
-                    'id',
-                    filter=Q(user__groups__name=groups.SUPER_ADMINISTRATOR)))\
-            .annotate(
-                count_approved_by_audit_supervisor=Count(
-                    'approved_by_supervisor',
-                    filter=Q(user__groups__name=groups.AUDIT_SUPERVISOR,
-                             approved_by_supervisor=True)))\
+        form, rollups = stats_rollups(self.request, tally_id)
+
+        approvals = {
+            row['group__name']: row
+            for row in rollups.filter(
+                group__name__in=[groups.AUDIT_SUPERVISOR,
+                                 groups.SUPER_ADMINISTRATOR,
+                                 groups.TALLY_MANAGER])
+            .values('group__name')
             .annotate(
-                count_sent_for_review_by_audit_supervisor=Count(
-                    'id',
-                    filter=Q(user__groups__name=groups.AUDIT_SUPERVISOR)))\
-            .aggregate(
-                approved_by_tally_manager=Coalesce(Sum(
-                    'count_approved_by_tally_manager'), V(0)),
-                sent_for_review_by_tally_manager=Coalesce(Sum(
-                    'count_sent_for_review_by_tally_manager'), V(0)),
-                approved_by_supervisor_admin=Coalesce(Sum(
-                    'count_approved_by_supervisor_admin'), V(0)),
-                sent_for_review_by_supervisor_admin=Coalesce(Sum(
-                    'count_sent_for_review_by_supervisor_admin'), V(0)),
-                approved_by_audit_supervisor=Coalesce(Sum(
-                    'count_approved_by_audit_supervisor'), V(0)),
-                sent_for_review_by_audit_supervisor=Coalesce(Sum(
-                    'count_sent_for_review_by_audit_supervisor'), V(0)))
+                forms_approved=Sum('forms_approved'),
+                forms_sent_for_review=Sum('forms_reviewed'))
+            .order_by()
+        }
 
         tally_manager_supervisor_approvals =\
-            {'forms_approved':
-             result_forms_stats['approved_by_tally_manager'],
-             'forms_sent_for_review':
-             result_forms_stats['sent_for_review_by_tally_manager']}
-
+            group_approvals(approvals, groups.TALLY_MANAGER)
         supervisor_administrator_approvals =\
-            {'forms_approved':
-             result_forms_stats['approved_by_supervisor_admin'],
-             'forms_sent_for_review':
-             result_forms_stats['sent_for_review_by_supervisor_admin']}
-
+            group_approvals(approvals, groups.SUPER_ADMINISTRATOR)
         audit_supervisor_approvals =\
-            {'forms_approved':
-             result_forms_stats['approved_by_audit_supervisor'],
-             'forms_sent_for_review':
-             result_forms_stats['sent_for_review_by_audit_supervisor']}
+            group_approvals(approvals, groups.AUDIT_SUPERVISOR)
+
         return self.render_to_response(
             self.get_context_data(
+                form=form,
                 tally_id=tally_id,
                 t_m_approvals=tally_manager_supervisor_approvals,
                 t_m_approvals_percentage=approvals_percentage(
@@ -159,34 +145,28 @@ class TrackCorrections(LoginRequiredMixin,
 
     def get(self, *args, **kwargs):
         tally_id = kwargs['tally_id']
-        corrections_stats = None
         percentage_value = 100
+        form, rollups = stats_rollups(self.request, tally_id)
 
-        qs =\
-            ResultFormStats.objects\
-            .filter(
-                user__groups__name__in=[groups.DATA_ENTRY_1_CLERK,
-                                        groups.DATA_ENTRY_2_CLERK],
-                result_form__tally__id=tally_id)
-
-        if qs:
-            corrections_stats =\
-                qs.values('user__username')\
-                .annotate(
-                    total_forms_processed=Count('user'),
-                    total_errors=Count(
-                        'data_entry_errors',
-                        filter=Q(data_entry_errors__gt=0)))\
-                .annotate(
-                    error_percentage=ExpressionWrapper(
-                        V(percentage_value) *
-                        F('total_errors')
-                        / F('total_forms_processed'),
-                        output_field=IntegerField()
-                    ))\
-                .order_by('-error_percentage')
+        corrections_stats =\
+            rollups.filter(
+                group__name__in=[groups.DATA_ENTRY_1_CLERK,
+                                 groups.DATA_ENTRY_2_CLERK])\
+            .values('user__username')\
+            .annotate(
+                total_forms_processed=Sum('forms_processed'),
+                total_errors=Sum('forms_with_errors'))\
+            .annotate(
+                error_percentage=ExpressionWrapper(
+                    V(percentage_value) *
+                    F('total_errors')
+                    / F('total_forms_processed'),
+                    output_field=IntegerField()
+                ))\
+            .order_by('-error_percentage')
 
         return self.render_to_response(
             self.get_context_data(
+                form=form,
                 tally_id=tally_id,
                 corrections_stats=corrections_stats))
@@ -1,4 +1,3 @@
-from django.db.models import Q
 from django.urls import reverse
 from django.views.generic import TemplateView
 from django_datatables_view.base_datatable_view import BaseDatatableView
@@ -8,6 +7,7 @@ from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.apps.tally.models.station import Station
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.utils.search import keyword_filter
 from tally_ho.libs.views.mixins import (AjaxLoginRequiredMixin, DataTablesMixin,
                                         GroupRequiredMixin, TallyAccessMixin)
 
@@ -42,12 +42,14 @@ class StationProgressListDataView(AjaxLoginRequiredMixin,
         keyword = self.request.POST.get('search[value]')
 
         if keyword:
-            qs = qs.filter(Q(station_number__contains=keyword) |
-                           Q(center__office__name__icontains=keyword) |
-                           Q(center__code__contains=keyword) |
-                           Q(sub_constituency__name__icontains=keyword) |
-                           Q(sub_constituency__code__contains=keyword) |
-                           Q(center__name__icontains=keyword))
+            qs = qs.filter(keyword_filter(Station, keyword, (
+                'station_number',
+                'center__office__name',
+                'center__code',
+                'sub_constituency__name',
+                'sub_constituency__code',
+                'center__name',
+            )))
         return qs
 
     def render_column(self, row, column):
@@ -102,8 +102,10 @@ def group_data_by_gender(
     :param admin_level_filter_name: The name of the admin level filter
     :return: The grouped data by gender
     """
+    # Replacement forms not yet assigned to a station have no center.
     return ResultForm.objects.filter(
         tally__id=tally_id,
+        center__isnull=False,
     ).annotate(
         station_gender_code=station_gender_query(
             tally_id,
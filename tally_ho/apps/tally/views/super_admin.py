@@ -3,7 +3,6 @@ from urllib.parse import urlencode
 
 from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth.models import User
 from django.contrib.messages.views import SuccessMessageMixin
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.core.exceptions import SuspiciousOperation
@@ -14,15 +13,15 @@ from django.db.models.functions import Cast
 from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
-from django.utils.dateparse import parse_datetime
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django_datatables_view.base_datatable_view import BaseDatatableView
 from guardian.mixins import LoginRequiredMixin
-from reversion.models import Version
+from reversion.views import RevisionMixin
 
 from tally_ho.apps.tally.forms.barcode_form import ResultFormSearchBarcodeForm
+from tally_ho.apps.tally.forms.bulk_form_state_form import BulkFormStateForm
 from tally_ho.apps.tally.forms.recon_form import ReconForm
 from tally_ho.apps.tally.forms.confirm_reset_form import ConfirmResetForm
 from tally_ho.apps.tally.forms.create_ballot_form import CreateBallotForm
@@ -81,7 +80,8 @@ from tally_ho.libs.utils.active_status import (
 )
 from tally_ho.libs.utils.collections import flatten
 from tally_ho.libs.utils.enum import get_matching_enum_values
-from tally_ho.libs.utils.time import format_duration_human_readable
+from tally_ho.libs.utils.search import keyword_filter
+from tally_ho.libs.views.datatables import KeysetDatatableView
 from tally_ho.libs.views.exports import (
     SPECIAL_BALLOTS,
     distinct_forms,
@@ -97,6 +97,10 @@ from tally_ho.libs.views.mixins import (
 )
 from tally_ho.libs.views.pagination import paging
 from tally_ho.libs.views.session import session_matches_post_result_form
+from tally_ho.libs.workflow.transitions import (
+    reject_result_forms,
+    reset_result_forms,
+)
 
 
 def duplicates(qs, tally_id=None):
@@ -352,6 +356,7 @@ class CreateResultFormView(
     TallyAccessMixin,
     ReverseSuccessURLMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     CreateView,
 ):
     model = ResultForm
@@ -443,6 +448,7 @@ class EditResultFormView(
     TallyAccessMixin,
     ReverseSuccessURLMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     UpdateView,
 ):
     model = ResultForm
@@ -482,6 +488,7 @@ class RemoveResultFormConfirmationView(
     TallyAccessMixin,
     ReverseSuccessURLMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     DeleteView,
 ):
     model = ResultForm
@@ -621,6 +628,7 @@ class DuplicateResultFormView(
     GroupRequiredMixin,
     TallyAccessMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     TemplateView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
@@ -723,29 +731,20 @@ class DuplicateResultFormView(
                 )
                 return HttpResponseRedirect(self.request.path_info)
         elif "send_all_clearance" in post_data:
-            archived_forms_barcodes = []
-            for results_form_duplicate in results_form_duplicates:
-                if results_form_duplicate.form_state != FormState.ARCHIVED:
-                    reject_reason = _(str("Form has duplicate results."))
-
-                    results_form_duplicate.previous_form_state = (
-                        results_form_duplicate.form_state
-                    )
-                    results_form_duplicate.user = self.request.user.userprofile
-                    results_form_duplicate.reject(
-                        new_state=FormState.CLEARANCE,
-                        reject_reason=reject_reason,
-                    )
-                    results_form_duplicate.duplicate_reviewed = True
-                    Clearance.objects.create(
-                        result_form=results_form_duplicate,
-                        user=self.request.user.userprofile,
-                    )
-                    results_form_duplicate.save()
-                else:
-                    archived_forms_barcodes.append(
-                        results_form_duplicate.barcode
-                    )
+            archived_forms_barcodes = list(
+                results_form_duplicates.filter(
+                    form_state=FormState.ARCHIVED
+                ).values_list("barcode", flat=True)
+            )
+            reject_result_forms(
+                results_form_duplicates.exclude(
+                    form_state=FormState.ARCHIVED
+                ),
+                new_state=FormState.CLEARANCE,
+                user=self.request.user.userprofile,
+                reject_reason=_(str("Form has duplicate results.")),
+                duplicate_reviewed=True,
+            )
 
             if archived_forms_barcodes:
                 messages.error(
@@ -847,7 +846,10 @@ class FormAuditView(
 
 
 class FormProgressDataView(
-    AjaxLoginRequiredMixin, GroupRequiredMixin, TallyAccessMixin, BaseDatatableView
+    AjaxLoginRequiredMixin,
+    GroupRequiredMixin,
+    TallyAccessMixin,
+    KeysetDatatableView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
     model = ResultForm
@@ -877,25 +879,29 @@ class FormProgressDataView(
         show_inactive = self.request.GET.get("show_inactive")
 
         if keyword:
+            search = keyword_filter(
+                ResultForm,
+                keyword,
+                (
+                    "barcode",
+                    "center__code",
+                    "center__office__region__name",
+                    "center__sub_constituency__name",
+                    "center__office__name",
+                    "center__office__number",
+                    "station_number",
+                    "ballot__number",
+                    "ballot__electrol_race__election_level",
+                    "ballot__electrol_race__ballot_name",
+                ),
+            )
             # Get matching FormState enum values for case-insensitive search
             matching_states = get_matching_enum_values(FormState, keyword)
-            form_state_q = (
-                Q(form_state__in=matching_states) if matching_states else Q()
-            )
 
-            qs = qs.filter(
-                form_state_q
-                | Q(barcode__icontains=keyword)
-                | Q(center__code__contains=keyword)
-                | Q(center__office__region__name__icontains=keyword)
-                | Q(center__sub_constituency__name__icontains=keyword)
-                | Q(center__office__name__icontains=keyword)
-                | Q(center__office__number__contains=keyword)
-                | Q(station_number__contains=keyword)
-                | Q(ballot__number__contains=keyword)
-                | Q(ballot__electrol_race__election_level__icontains=keyword)
-                | Q(ballot__electrol_race__ballot_name__icontains=keyword)
-            )
+            if matching_states:
+                search |= Q(form_state__in=matching_states)
+
+            qs = qs.filter(search)
 
         if not show_inactive or show_inactive.lower() != "true":
             qs = qs.filter(ballot__active=True)
@@ -1152,6 +1158,7 @@ class FormActionView(
     GroupRequiredMixin,
     TallyAccessMixin,
     ReverseSuccessURLMixin,
+    RevisionMixin,
     TemplateView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
@@ -1425,6 +1432,7 @@ class ResetFormConfirmationView(
     TallyAccessMixin,
     ReverseSuccessURLMixin,
     SuccessMessageMixin,
+    RevisionMixin,
     FormView,
 ):
     group_required = groups.SUPER_ADMINISTRATOR
@@ -1484,6 +1492,70 @@ class ResetFormConfirmationView(
         )
 
 
+class BulkFormStateView(
+    LoginRequiredMixin,
+    GroupRequiredMixin,
+    TallyAccessMixin,
+    FormView,
+):
+    """Send many result forms back to a state at once.
+
+    The first submission shows how many forms are selected, the second,
+    confirmed, moves them in one transaction.
+    """
+
+    group_required = groups.SUPER_ADMINISTRATOR
+    template_name = "super_admin/bulk_form_state.html"
+    form_class = BulkFormStateForm
+
+    def get_context_data(self, **kwargs):
+        context = super(BulkFormStateView, self).get_context_data(**kwargs)
+        context["tally_id"] = self.kwargs.get("tally_id")
+
+        return context
+
+    def get_form_kwargs(self):
+        kwargs = super(BulkFormStateView, self).get_form_kwargs()
+        kwargs["tally_id"] = self.kwargs.get("tally_id")
+
+        return kwargs
+
+    def form_valid(self, form):
+        tally_id = self.kwargs.get("tally_id")
+        result_forms = form.get_result_forms()
+        new_state = form.cleaned_data["new_state"]
+
+        if "confirm_submit" not in self.request.POST:
+            return self.render_to_response(
+                self.get_context_data(
+                    form=form,
+                    result_forms_count=result_forms.count(),
+                )
+            )
+
+        user = self.request.user.userprofile
+        reason = form.cleaned_data["reason"]
+
+        if new_state == FormState.UNSUBMITTED:
+            count = reset_result_forms(result_forms, user, reason)
+        else:
+            count = reject_result_forms(
+                result_forms,
+                new_state=new_state,
+                user=user,
+                reject_reason=reason,
+            )
+
+        messages.add_message(
+            self.request,
+            messages.SUCCESS,
+            _("%(count)d form(s) successfully moved to %(state)s")
+            % {"count": count, "state": new_state.name},
+        )
+
+        return redirect("bulk-form-state", tally_id=tally_id)
+
+
 class EditCenterView(
     LoginRequiredMixin,
     GroupRequiredMixin,
@@ -2473,82 +2545,14 @@ class ResultFormHistoryView(
             context["error"] = "Result form not found"
             return context
 
-        # Get version history
-        versions = Version.objects.get_for_object(result_form).order_by("pk")
+        history_data = result_form.transitions.history()
 
-        if not versions:
+        if not history_data:
             context["error"] = (
-                f"No version history found for result form "
-                f"{result_form.barcode}"
+                f"No history found for result form {result_form.barcode}"
             )
             return context
 
-        # Process history data
-        history_data = []
-        previous_timestamp = None
-
-        for version in versions:
-            version_data = version.field_dict
-
-            # Get user info
-            user_name = "Unknown"
-            if "user_id" in version_data and version_data["user_id"]:
-                try:
-                    user = User.objects.get(pk=version_data["user_id"])
-                    user_name = user.username
-                except User.DoesNotExist:
-                    user_name = f"User ID {version_data['user_id']}"
-
-            # Format timestamp
-            modified_date = version_data.get("modified_date")
-            timestamp = None
-            if modified_date:
-                if isinstance(modified_date, str):
-                    timestamp = parse_datetime(modified_date)
-                else:
-                    timestamp = modified_date
-
-            # Get form states
-            current_state = version_data.get("form_state")
-            previous_state = version_data.get("previous_form_state")
-
-            if current_state:
-                current_state_name = FormState(current_state).name
-            else:
-                current_state_name = "Unknown"
-
-            if previous_state:
-                previous_state_name = FormState(previous_state).name
-            else:
-                previous_state_name = "None"
-
-            # Calculate duration in previous state
-            duration = None
-            duration_display = None
-            if previous_timestamp and timestamp:
-                duration = timestamp - previous_timestamp
-                duration_display = format_duration_human_readable(duration)
-
-            history_data.append(
-                {
-                    "user": user_name,
-                    "timestamp": timestamp,
-                    "current_state": current_state_name,
-                    "previous_state": previous_state_name,
-                    "version_id": version.pk,
-                    "duration_in_previous_state": duration,
-                    "duration_display": duration_display,
-                    "is_current": False,
-                }
-            )
-
-            previous_timestamp = timestamp
-
-        # Reverse to show newest first, then mark first entry as current
-        history_data.reverse()
-        if history_data:
-            history_data[0]["is_current"] = True
-
         context.update(
             {
                 "result_form": result_form,
@@ -2,7 +2,6 @@ import json
 import logging
 import time
 
-import duckdb
 from celery.result import AsyncResult
 from django.conf import settings
 from django.contrib import messages
@@ -39,6 +38,16 @@ from tally_ho.apps.tally.management.commands.import_stations import \
     async_import_stations_from_stations_file
 from tally_ho.apps.tally.management.commands.import_sub_cons_and_cons import \
     async_import_sub_constituencies_and_constituencies_from_sub_cons_file
+from tally_ho.apps.tally.management.commands.ingest_csv_files import \
+    async_ingest_csv_file
+from tally_ho.apps.tally.management.commands.utils import (
+    INGEST_DONE,
+    INGEST_FAILED,
+    INGEST_QUEUED,
+    INGEST_RUNNING,
+    get_ingest_status,
+    write_ingest_status,
+)
 from tally_ho.apps.tally.models.ballot import Ballot
 from tally_ho.apps.tally.models.candidate import Candidate
 from tally_ho.apps.tally.models.center import Center
@@ -53,7 +62,10 @@ from tally_ho.apps.tally.models.sub_constituency import SubConstituency
 from tally_ho.apps.tally.models.tally import Tally
 from tally_ho.apps.tally.models.user_profile import UserProfile
 from tally_ho.libs.permissions import groups
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.utils.cache import (
+    delete_cached_model_instances_count,
+    get_cached_model_instances_count,
+)
 from tally_ho.libs.utils.numbers import parse_int
 from tally_ho.libs.views.mixins import (GroupRequiredMixin,
                                         ReverseSuccessURLMixin)
@@ -107,6 +119,24 @@ FILE_NAMES_PREFIXS = {
     "ballots_order_file": "ballot_order_",
     "result_forms_file": "result_forms_",
 }
+# The setting naming the columns each uploaded file must have, and the
+# column whose values must be unique, checked when the file is ingested.
+FILE_CHECKS = {
+    "ballots_file": ("BALLOT_COLUMN_NAMES", None),
+    "subconst_file": ("SUB_CONSTITUENCY_COLUMN_NAMES", None),
+    "subconst_ballots_file": ("SUB_CONSTITUENCY_BALLOTS_COLUMN_NAMES", None),
+    "centers_file": ("CENTER_COLUMN_NAMES", None),
+    "stations_file": ("STATION_COLUMN_NAMES", None),
+    "candidates_file": ("CANDIDATE_COLUMN_NAMES", None),
+    "ballots_order_file": ("BALLOT_ORDER_COLUMN_NAMES", None),
+    "result_forms_file": ("RESULT_FORM_COLUMN_NAMES", "barcode"),
+}
+# What the batch progress page shows for a file until it is counted.
+INGEST_STATUS_LABELS = {
+    INGEST_QUEUED: _("queued"),
+    INGEST_RUNNING: _("counting"),
+    INGEST_FAILED: _("not readable"),
+}
 logger = logging.getLogger(__name__)
 
 
@@ -129,22 +159,55 @@ def delete_all_tally_objects(tally):
         ElectrolRace.objects.filter(tally=tally).delete()
 
 
-def save_file(file_uploaded, file_name):
-    num_lines = 0
+def save_file(file_uploaded, file_name, file_key):
+    """Write an uploaded file and start ingesting it, converting it to the
+    Parquet file the import steps read, in a Celery task.
+
+    :param file_uploaded: The uploaded file.
+    :param file_name: The name to save the file under.
+    :param file_key: The key of the file in ``FILE_CHECKS``.
+    :returns: The path to the file.
+    """
     file_path = UPLOADED_FILES_PATH + file_name
+    col_names_setting, unique_field = FILE_CHECKS[file_key]
     try:
         with open(file_path, "wb+") as destination:
             for chunk in file_uploaded.chunks():
                 destination.write(chunk)
-        data = duckdb.from_csv_auto(file_path, header=True).distinct()
-        num_lines = data.shape[0]
+        write_ingest_status(file_path, INGEST_QUEUED)
+        async_ingest_csv_file.delay(
+            csv_file_path=file_path,
+            required_col_names=getattr(settings, col_names_setting),
+            unique_field=unique_field,
+        )
     except Exception as e:
         msg = f"Failed to read file, error: {e}"
         if logger:
             logger.warning(msg)
         raise Exception(msg)
 
-    return num_lines
+    return file_path
+
+
+def get_file_total(tally_id, file_key):
+    """Return the number of distinct rows of an uploaded file once it is
+    ingested, the state of its ingest until then.
+
+    :param tally_id: The tally the file was uploaded for.
+    :param file_key: The key of the file in ``FILE_NAMES_PREFIXS``.
+    :returns: The number of rows, the label of the state of the ingest, or
+        None if the file was not uploaded.
+    """
+    record = get_ingest_status(
+        f"{UPLOADED_FILES_PATH}{FILE_NAMES_PREFIXS[file_key]}{tally_id}.csv")
+
+    if record is None:
+        return None
+
+    if record["status"] == INGEST_DONE:
+        return record["rows"]
+
+    return str(INGEST_STATUS_LABELS[record["status"]])
 
 
 def exec_csv_file_import_func(
@@ -538,71 +601,14 @@ class TallyFilesFormView(
 
         delete_all_tally_objects(tally)
 
-        ballots_file_name_prefix = FILE_NAMES_PREFIXS["ballots_file"]
-        ballots_file = f"{ballots_file_name_prefix}{tally_id}.csv"
-        ballots_file_lines = save_file(data["ballots_file"], ballots_file)
-
-        subconst_file_name_prefix = FILE_NAMES_PREFIXS["subconst_file"]
-        subconst_file = f"{subconst_file_name_prefix}{tally_id}.csv"
-        subconst_file_lines = save_file(data["subconst_file"], subconst_file)
-
-        subconst_ballots_file_name_prefix = FILE_NAMES_PREFIXS[
-            "subconst_ballots_file"
-        ]
-        subconst_ballots_file = (
-            f"{subconst_ballots_file_name_prefix}{tally_id}.csv"
-        )
-        subconst_ballots_file_lines = save_file(
-            data["subconst_ballots_file"], subconst_ballots_file
-        )
-
-        centers_file_name_prefix = FILE_NAMES_PREFIXS["centers_file"]
-        centers_file = f"{centers_file_name_prefix}{tally_id}.csv"
-        centers_file_lines = save_file(data["centers_file"], centers_file)
-
-        stations_file_name_prefix = FILE_NAMES_PREFIXS["stations_file"]
-        stations_file = f"{stations_file_name_prefix}{tally_id}.csv"
-        stations_file_lines = save_file(data["stations_file"], stations_file)
-
-        candidates_file_name_prefix = FILE_NAMES_PREFIXS["candidates_file"]
-        candidates_file = f"{candidates_file_name_prefix}{tally_id}.csv"
-        candidates_file_lines = save_file(
-            data["candidates_file"], candidates_file
-        )
-
-        ballots_order_file_name_prefix = FILE_NAMES_PREFIXS[
-            "ballots_order_file"
-        ]
-        ballots_order_file = f"{ballots_order_file_name_prefix}{tally_id}.csv"
-        ballots_order_file_lines = save_file(
-            data["ballots_order_file"], ballots_order_file
-        )
-
-        result_forms_file_name_prefix = FILE_NAMES_PREFIXS["result_forms_file"]
-        result_forms_file = f"{result_forms_file_name_prefix}{tally_id}.csv"
-        result_forms_file_lines = save_file(
-            data["result_forms_file"], result_forms_file
-        )
+        url_kwargs = {"tally_id": tally_id}
 
-        url_kwargs = {
-            "tally_id": tally_id,
-            "ballots_file": ballots_file,
-            "ballots_file_lines": ballots_file_lines,
-            "subconst_file": subconst_file,
-            "subconst_file_lines": subconst_file_lines,
-            "subconst_ballots_file": subconst_ballots_file,
-            "subconst_ballots_file_lines": subconst_ballots_file_lines,
-            "centers_file": centers_file,
-            "centers_file_lines": centers_file_lines,
-            "stations_file": stations_file,
-            "stations_file_lines": stations_file_lines,
-            "candidates_file": candidates_file,
-            "candidates_file_lines": candidates_file_lines,
-            "ballots_order_file": ballots_order_file,
-            "ballots_order_file_lines": ballots_order_file_lines,
-            "result_forms_file": result_forms_file,
-            "result_forms_file_lines": result_forms_file_lines,
-        }
+        for file_key, file_name_prefix in FILE_NAMES_PREFIXS.items():
+            file_name = f"{file_name_prefix}{tally_id}.csv"
+            save_file(data[file_key], file_name, file_key)
+            url_kwargs[file_key] = file_name
+            # Counted once the file is ingested, see get_import_progress.
+            url_kwargs[f"{file_key}_lines"] = 0
 
         return HttpResponseRedirect(
             reverse(self.success_url, kwargs=url_kwargs)
@@ -625,6 +631,13 @@ class BatchView(
             "get-import-progress", kwargs={"tally_id": tally_id}
         )
 
+        for step_args in STEP_TO_ARGS.values():
+            file_key, lines_key = step_args[:2]
+            total = get_file_total(tally_id, file_key)
+
+            if total is not None:
+                context_data[lines_key] = total
+
         return self.render_to_response(self.get_context_data(**context_data))
 
     @method_decorator(ensure_csrf_cookie)
@@ -653,34 +666,26 @@ class BatchView(
         )
 
 
-def get_job_status_from_memcache(memcache_key, memcache_client):
+def get_job_status_from_cache(cache_key):
     """
-    Get incremental count of elements processed from memcache.
+    Get incremental count of elements processed from the cache.
 
-    :param memcache_key: memcache key.
-    :param memcache_client: memcache client.
-    :returns: elements processed, done state and error message.
+    :param cache_key: cache key the import job reports progress under.
+    :returns: elements processed and done state.
     """
-    error_message = None
-    elements_processed = 0
-    done = False
-
-    cached_data, error_message = memcache_client.get(memcache_key)
-    if cached_data:
-        json_data = json.loads(cached_data)
-        elements_processed = parse_int(json_data.get("elements_processed"))
-        done = json_data.get("done")
+    elements_processed, done = get_cached_model_instances_count(cache_key)
 
     if done:
-        _, error_message = memcache_client.delete(memcache_key)
+        delete_cached_model_instances_count(cache_key)
 
-    return elements_processed, done, error_message
+    return parse_int(elements_processed), done
 
 
 def get_import_progress(request, **kwargs):
     """
     Get file import job progress from celery task and if the job is still in
-    PENDING status, get incremental count of elements processed from memcache.
+    PENDING status, get incremental count of elements processed from the
+    cache.
 
     :param request: request dictionary.
     :param kwargs: kwargs.
@@ -689,7 +694,7 @@ def get_import_progress(request, **kwargs):
     tally_id = kwargs.get("tally_id")
     task_id = request.POST.get("task_id")
     current_step = parse_int(request.POST.get("step"))
-    instances_count_memcache_key = (
+    instances_count_cache_key = (
         f"{tally_id}_{STEP_TO_ARGS[current_step][0]}_{current_step}"
     )
     result_form_upload_step = list(STEP_TO_ARGS.keys())[-1]
@@ -698,7 +703,6 @@ def get_import_progress(request, **kwargs):
     error_message = None
     elements_processed = 0
     done = False
-    memcache_client = MemCache()
     celery_results = AsyncResult(task_id)
     job_status = celery_results.status
     job_data = celery_results.result
@@ -706,16 +710,16 @@ def get_import_progress(request, **kwargs):
     if job_status == "SUCCESS":
         elements_processed = job_data
         done = True
-        _, error_message = memcache_client.delete(instances_count_memcache_key)
+        delete_cached_model_instances_count(instances_count_cache_key)
 
     if job_status == "FAILURE":
         error_message = job_data
         done = False
-        memcache_client.delete(instances_count_memcache_key)
+        delete_cached_model_instances_count(instances_count_cache_key)
 
     if job_status == "PENDING":
-        elements_processed, done, error_message = get_job_status_from_memcache(
-            instances_count_memcache_key, memcache_client
+        elements_processed, done = get_job_status_from_cache(
+            instances_count_cache_key
         )
         if elements_processed == 0:
             if current_step == result_form_upload_step:
@@ -736,6 +740,9 @@ def get_import_progress(request, **kwargs):
             {
                 "status": "OK",
                 "elements_processed": elements_processed,
+                "total_elements": get_file_total(
+                    tally_id, STEP_TO_ARGS[current_step][0]
+                ),
                 "done": done,
             }
         ),
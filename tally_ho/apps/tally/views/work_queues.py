@@ -0,0 +1,147 @@
+from django.contrib import messages
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.shortcuts import redirect
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+from django.views.generic import FormView
+from guardian.mixins import LoginRequiredMixin
+
+from tally_ho.apps.tally.forms.assign_claim_form import AssignClaimForm
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.views.audit import forms_for_user, is_clerk
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.permissions import groups
+from tally_ho.libs.views.mixins import (GroupRequiredMixin,
+                                        TallyAccessMixin,
+                                        check_membership)
+from tally_ho.libs.views.pagination import seek_paging
+from tally_ho.libs.workflow.queues import (
+    assign_result_forms,
+    claim_next_form,
+    claimed,
+    queue_counts,
+    queue_forms,
+    release_claims,
+)
+
+# The clerk groups that work each queue, and the page they return to
+# with the barcode of the form they claimed.
+QUEUE_CLERKS = {
+    FormState.DATA_ENTRY_1: ([groups.DATA_ENTRY_1_CLERK], 'data-entry'),
+    FormState.DATA_ENTRY_2: ([groups.DATA_ENTRY_2_CLERK], 'data-entry'),
+    FormState.CORRECTION: ([groups.CORRECTIONS_CLERK], 'corrections'),
+    FormState.QUALITY_CONTROL: ([groups.QUALITY_CONTROL_CLERK,
+                                 groups.QUALITY_CONTROL_SUPERVISOR],
+                                'quality-control'),
+    FormState.AUDIT: ([groups.AUDIT_CLERK, groups.AUDIT_SUPERVISOR],
+                      'audit_dashboard'),
+}
+
+
+class ClaimNextFormView(LoginRequiredMixin,
+                        GroupRequiredMixin,
+                        TallyAccessMixin,
+                        View):
+    """Claim the next form of a work queue for the clerk and show them its
+    barcode.
+    """
+    group_required = sorted({
+        group for clerk_groups, _url in QUEUE_CLERKS.values()
+        for group in clerk_groups})
+
+    def post(self, *args, **kwargs):
+        tally_id = kwargs.get('tally_id')
+
+        try:
+            form_state = FormState[kwargs.get('form_state')]
+            clerk_groups, url = QUEUE_CLERKS[form_state]
+        except KeyError:
+            raise Http404
+
+        if not check_membership(clerk_groups, self.request.user):
+            raise PermissionDenied
+
+        if form_state == FormState.AUDIT:
+            result_forms = forms_for_user(is_clerk(self.request.user),
+                                          tally_id)
+        else:
+            result_forms = queue_forms(tally_id, form_state)
+
+        result_form = claim_next_form(
+            result_forms, self.request.user.userprofile)
+
+        if result_form:
+            messages.success(
+                self.request,
+                _('Your next form is %(barcode)s') % {
+                    'barcode': result_form.barcode})
+        else:
+            messages.info(
+                self.request,
+                _('No forms are waiting in %(state)s') % {
+                    'state': form_state.label})
+
+        return redirect(url, tally_id=tally_id)
+
+
+class WorkQueuesView(LoginRequiredMixin,
+                     GroupRequiredMixin,
+                     TallyAccessMixin,
+                     FormView):
+    """Show supervisors the forms waiting in each work queue and the forms
+    clerks have claimed, and let them assign and release claims.
+    """
+    form_class = AssignClaimForm
+    group_required = [groups.TALLY_MANAGER,
+                      groups.INTAKE_SUPERVISOR,
+                      groups.CLEARANCE_SUPERVISOR,
+                      groups.QUALITY_CONTROL_SUPERVISOR,
+                      groups.AUDIT_SUPERVISOR]
+    template_name = 'work_queues.html'
+
+    def get_form_kwargs(self):
+        kwargs = super(WorkQueuesView, self).get_form_kwargs()
+        kwargs['tally_id'] = self.kwargs.get('tally_id')
+
+        return kwargs
+
+    def get_context_data(self, **kwargs):
+        context = super(WorkQueuesView, self).get_context_data(**kwargs)
+        tally_id = self.kwargs.get('tally_id')
+        claims = ResultForm.objects.filter(claimed(), tally__id=tally_id)\
+            .select_related('claimed_by').order_by('claimed_date')
+
+        context['tally_id'] = tally_id
+        context['queues'] = queue_counts(tally_id)
+        context['claims'] = seek_paging(claims, self.request,
+                                        tally_id=tally_id)
+
+        return context
+
+    def post(self, *args, **kwargs):
+        tally_id = kwargs.get('tally_id')
+        release = self.request.POST.get('release')
+
+        if release and release.isdigit():
+            release_claims(ResultForm.objects.filter(
+                pk=release, tally__id=tally_id))
+            messages.success(self.request, _('Claim released'))
+
+            return redirect('work-queues', tally_id=tally_id)
+
+        return super(WorkQueuesView, self).post(*args, **kwargs)
+
+    def form_valid(self, form):
+        result_form = form.cleaned_data['result_form']
+        user = form.cleaned_data['user']
+
+        assign_result_forms(
+            ResultForm.objects.filter(pk=result_form.pk), user)
+        messages.success(
+            self.request,
+            _('Form %(barcode)s assigned to %(username)s') % {
+                'barcode': result_form.barcode,
+                'username': user.username})
+
+        return redirect('work-queues', tally_id=self.kwargs.get('tally_id'))
@@ -7,6 +7,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView, DetailView, FormView
 from django.views.generic.edit import FormMixin
+from reversion.views import RevisionMixin
 from guardian.mixins import LoginRequiredMixin
 
 from tally_ho.apps.tally.forms.barcode_form import BarcodeForm
@@ -22,6 +23,7 @@ from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.request_status import RequestStatus
 from tally_ho.libs.models.enums.request_type import RequestType
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.utils.query_budget import query_budget
 from tally_ho.libs.views.mixins import TallyAccessMixin
 
 
@@ -59,6 +61,7 @@ class WorkflowPermissionMixin(AccessMixin):
 class InitiateRecallView(LoginRequiredMixin,
                          AuditUserRequiredMixin,
                          TallyAccessMixin,
+                         RevisionMixin,
                          FormView):
     form_class = BarcodeForm
     template_name = 'barcode_verify.html'
@@ -122,6 +125,7 @@ class InitiateRecallView(LoginRequiredMixin,
 class CreateRecallRequestView(LoginRequiredMixin,
                               AuditUserRequiredMixin,
                               TallyAccessMixin,
+                              RevisionMixin,
                               CreateView):
     model = WorkflowRequest
     form_class = RequestRecallForm
@@ -192,6 +196,7 @@ class CreateRecallRequestView(LoginRequiredMixin,
         return reverse(self.success_url_name, kwargs=kwargs) + '?tab=recalls'
 
 
+@query_budget(15)
 class ViewResultFormDetailsView(LoginRequiredMixin,
                                 TallyAccessMixin,
                                 DetailView):
@@ -208,7 +213,7 @@ class ViewResultFormDetailsView(LoginRequiredMixin,
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        result_form = self.get_object()
+        result_form = self.object
         tally_id = self.kwargs.get('tally_id')
 
         context['tally_id'] = tally_id
@@ -257,6 +262,9 @@ class ViewResultFormDetailsView(LoginRequiredMixin,
                     result_form_results(result_form=result_form)
         except ResultForm.results.RelatedObjectDoesNotExist:
             context['results'] = None
+
+        context['history_data'] = result_form.transitions.history()
+
         return context
 
 
@@ -264,6 +272,7 @@ class RecallRequestDetailView(LoginRequiredMixin,
                               WorkflowPermissionMixin,
                               TallyAccessMixin,
                               FormMixin, # For handling the approval form
+                              RevisionMixin,
                               DetailView):
     model = WorkflowRequest
     form_class = ApprovalForm
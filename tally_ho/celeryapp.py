@@ -17,6 +17,9 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 app.conf.broker_transport_options = {"visibility_timeout": 10}
 
+# Connects the task signals recording the queries of each task.
+import tally_ho.libs.utils.query_budget  # noqa: E402,F401
+
 @app.task
 def debug_task():
     """A test task"""
@@ -0,0 +1,61 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from tally_ho.libs.utils import query_budget
+
+
+class QueryBudgetMiddleware(object):
+    """Records the queries of each request, see ``libs/utils/query_budget``.
+
+    It should come first in ``MIDDLEWARE`` so the queries of the other
+    middleware, e.g. the session and user lookups, count too. Requests are
+    logged by URL name, or by path when the URL has no name.
+
+    Streaming responses run their queries as their content is sent, after
+    the middleware returns, so they are recorded until the content ends.
+    Their budget is not enforced, the response has started by then.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not query_budget.is_enabled():
+            return self.get_response(request)
+
+        recorder = query_budget.QueryRecorder(request.path)
+        request.query_recorder = recorder
+
+        with connections[DEFAULT_DB_ALIAS].execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.record_stream(
+                recorder, response.streaming_content)
+        else:
+            query_budget.finish(recorder)
+
+        return response
+
+    def record_stream(self, recorder, content):
+        connection = connections[DEFAULT_DB_ALIAS]
+        content = iter(content)
+
+        try:
+            while True:
+                with connection.execute_wrapper(recorder):
+                    chunk = next(content, None)
+
+                if chunk is None:
+                    return
+
+                yield chunk
+        finally:
+            query_budget.finish(recorder, strict=False)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        recorder = getattr(request, 'query_recorder', None)
+
+        if recorder is not None:
+            match = request.resolver_match
+            recorder.name = match.view_name if match and match.url_name\
+                else request.path
+            recorder.budget = query_budget.get_query_budget(view_func)
@@ -0,0 +1,24 @@
+from django.shortcuts import render
+
+from tally_ho.apps.tally.models.result_form import ResultFormConflict
+
+
+class ResultFormConflictMiddleware(object):
+    """Answer requests that lost a race to change a result form's state
+    with a conflict page instead of a server error.
+
+    The workflow views run in the transaction of their RevisionMixin, so
+    what the request wrote has already been rolled back.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, ResultFormConflict):
+            return render(request,
+                          'errors/409.html',
+                          {'error_message': str(exception)},
+                          status=409)
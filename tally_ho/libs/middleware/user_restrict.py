@@ -1,30 +1,53 @@
+from django.contrib.auth.signals import user_logged_in
 from django.contrib.sessions.models import Session
+from django.dispatch import receiver
 from tracking.models import Visitor
-from datetime import datetime
+from tracking.utils import get_ip_address
+
+
+@receiver(user_logged_in, dispatch_uid='user_restrict_flag_login')
+def flag_login(sender, request, user, **kwargs):
+    if request is not None:
+        request.user_restrict_login = True
+
+
+def end_other_sessions(user, ip_address, session_key):
+    """End the sessions a user has open from other IP addresses.
+
+    Visitors are found through the index on their ``user_id`` and updated
+    and deleted in bulk.
+
+    :param user: The user who logged in.
+    :param ip_address: The IP address the user logged in from.
+    :param session_key: The session of the login, never ended.
+    """
+    session_keys = list(
+        Visitor.objects.filter(user_id=user.id)
+        .exclude(ip_address=ip_address)
+        .exclude(session_key=session_key)
+        .values_list('session_key', flat=True))
+
+    if session_keys:
+        Session.objects.filter(session_key__in=session_keys).delete()
+        Visitor.objects.filter(
+            session_key__in=session_keys).update(user=None)
 
 
 class UserRestrictMiddleware(object):
     """Prevents more than one user logging in at once from two different IPs.
+
+    Only requests that log a user in, flagged by the ``user_logged_in``
+    signal, query the database.
     """
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        ip_address = request.META.get('REMOTE_ADDR', '')
-
-        try:
-            last_login = request.user.last_login
-        except Exception:
-            last_login = 0
-
-        if str(last_login) == str(datetime.now())[:19]:
-            previous_visitors = Visitor.objects.filter(
-                user=request.user).exclude(ip_address=ip_address)
+        response = self.get_response(request)
 
-            for visitor in previous_visitors:
-                Session.objects.filter(
-                    session_key=visitor.session_key).delete()
-                visitor.user = None
-                visitor.save()
+        if getattr(request, 'user_restrict_login', False):
+            end_other_sessions(request.user,
+                               get_ip_address(request) or '',
+                               request.session.session_key)
 
-        return self.get_response(request)
+        return response
@@ -0,0 +1,66 @@
+import random
+
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_in
+from django.dispatch import receiver
+from django.utils import timezone
+from tracking.middleware import VisitorTrackingMiddleware
+from tracking.settings import (
+    TRACK_PAGEVIEWS,
+    TRACK_QUERY_STRING,
+    TRACK_REFERER,
+)
+
+from tally_ho.libs.utils import visitor_tracking
+
+
+def is_ajax(request):
+    return request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest'
+
+
+@receiver(user_logged_in, dispatch_uid='visitor_tracking_record_login')
+def record_login(sender, request, user, **kwargs):
+    if request is not None and hasattr(request, 'session'):
+        visitor_tracking.record_login(request, user)
+
+
+class BufferedVisitorTrackingMiddleware(VisitorTrackingMiddleware):
+    """Tracks visitors like django-tracking2 without writing on each request.
+
+    Each tracked request becomes an event handed to
+    ``tally_ho.libs.utils.visitor_tracking``, which buffers it according to
+    ``TRACK_BUFFER_BACKEND`` and writes events in batches.
+
+    AJAX requests are tracked with a probability of
+    ``TRACK_AJAX_SAMPLE_RATE``, 0 skips them and 1 tracks all of them.
+    ``TRACK_AJAX_REQUESTS`` must be True for sampled requests to pass the
+    django-tracking2 checks.
+    """
+    def _should_track(self, user, request, response):
+        if is_ajax(request):
+            sample_rate = getattr(settings, 'TRACK_AJAX_SAMPLE_RATE', 0)
+
+            if random.random() >= sample_rate:
+                return False
+
+        return super()._should_track(user, request, response)
+
+    def process_response(self, request, response):
+        user = getattr(request, 'user', None)
+
+        if user and user.is_anonymous:
+            user = None
+
+        if not self._should_track(user, request, response):
+            return response
+
+        # Force a save to generate a session key if one does not exist
+        if not request.session.session_key:
+            request.session.save()
+
+        visitor_tracking.track(visitor_tracking.build_event(
+            user, request, timezone.now(), TRACK_PAGEVIEWS,
+            track_referer=TRACK_REFERER,
+            track_query_string=TRACK_QUERY_STRING))
+
+        return response
@@ -23,7 +23,6 @@ Caller responsibilities:
 
 from __future__ import annotations
 
-import reversion
 from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils import timezone
@@ -38,6 +37,7 @@ from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.models.enums.pvp_bundle_status import PvpBundleStatus
 from tally_ho.libs.models.enums.pvp_mode import PvpMode
+from tally_ho.libs.utils.revisions import bulk_create_revision
 
 _RECON_FIELD_MAP_R2 = {
     "number_of_voter_cards_in_the_ballot_box":
@@ -68,24 +68,27 @@ def import_submission(
     """Import one validated PVP submission.
 
     Entry-version writes depend on ``bundle.mode`` — see the module
-    docstring for the DE1_ONLY vs DE1_AND_DE2 breakdown. Wraps the
-    write pass in a reversion revision for audit history.
+    docstring for the DE1_ONLY vs DE1_AND_DE2 breakdown. Every written
+    row is recorded in one reversion revision for audit history.
     """
-    with reversion.create_revision():
-        reversion.set_user(uploaded_by)
-        reversion.set_comment(
+    context = _prepare_import(
+        parsed_submission, tally=tally, bundle=bundle,
+    )
+    submission, written = _apply_import(
+        parsed_submission,
+        uploaded_by=uploaded_by,
+        zip_ref=zip_ref,
+        **context,
+    )
+    bulk_create_revision(
+        written,
+        user=uploaded_by,
+        comment=(
             f"PVP import (bundle {bundle.id}, "
             f"instance {parsed_submission.odk_instance_id})"
-        )
-        context = _prepare_import(
-            parsed_submission, tally=tally, bundle=bundle,
-        )
-        return _apply_import(
-            parsed_submission,
-            uploaded_by=uploaded_by,
-            zip_ref=zip_ref,
-            **context,
-        )
+        ),
+    )
+    return submission
 
 
 def _prepare_import(parsed_submission, *, tally, bundle):
@@ -188,20 +191,26 @@ def _apply_import(
     parse-time guarantees hold here: recon keys are present (checked
     in ``bundle._check_required_columns``) and round values are
     non-null and equal (``bundle._check_round_integrity``).
+
+    Returns the submission and the rows written, for the revision.
     """
     recon = parsed_submission.recon
-    for entry_version, get_round, recon_map in entries:
-        for parsed_candidate, candidate in candidates_by_parsed.items():
-            Result.objects.create(
-                candidate=candidate,
-                result_form=result_form,
-                tally=tally,
-                user=uploaded_by,
-                entry_version=entry_version,
-                votes=get_round(parsed_candidate),
-                active=True,
-            )
-        ReconciliationForm.objects.create(
+    results = Result.objects.bulk_create([
+        Result(
+            candidate=candidate,
+            result_form=result_form,
+            tally=tally,
+            user=uploaded_by,
+            entry_version=entry_version,
+            votes=get_round(parsed_candidate),
+            active=True,
+        )
+        for entry_version, get_round, _ in entries
+        for parsed_candidate, candidate in candidates_by_parsed.items()
+    ])
+    recon_forms = []
+    for entry_version, _, recon_map in entries:
+        recon_forms.append(ReconciliationForm.objects.create(
             result_form=result_form,
             tally=tally,
             user=uploaded_by,
@@ -218,7 +227,7 @@ def _apply_import(
             ballot_number_from=None,
             ballot_number_to=None,
             notes=None,
-        )
+        ))
 
     result_form.previous_form_state = result_form.form_state
     result_form.form_state = next_state
@@ -231,7 +240,7 @@ def _apply_import(
         lambda: _save_images(submission.id, parsed_submission.images, zip_ref),
     )
 
-    return submission
+    return submission, [*results, *recon_forms, result_form]
 
 
 def import_bundle(*, bundle, submissions, tally, uploaded_by, zip_ref):
@@ -0,0 +1,132 @@
+"""The ballot topology of a tally.
+
+Which ballots are the component ballots of which general ballots, the
+candidates of each ballot and the ballots of the forms of each office only
+change when a tally is set up or edited. ``get_ballot_topology`` reads
+them in three queries and caches them in the ``REFERENCE_DATA`` namespace,
+which is invalidated when a ballot, candidate or sub constituency is saved
+or deleted, when a result form changes ballot or office, and by the setup
+imports.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from tally_ho.apps.tally.models.candidate import Candidate
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.sub_constituency import SubConstituency
+from tally_ho.libs.utils.cache import REFERENCE_DATA, tally_cached
+
+
+@dataclass(frozen=True)
+class BallotTopology:
+    """The ballot relations of a tally, by primary key.
+
+    :param component_ballots: The component ballots of each general
+        ballot.
+    :param ballot_candidates: The candidates of each ballot in ballot
+        order.
+    :param inactive_candidates: The candidates that are not active.
+    :param office_ballots: The ballots of the result forms of each office.
+    """
+    component_ballots: dict = field(default_factory=dict)
+    ballot_candidates: dict = field(default_factory=dict)
+    inactive_candidates: frozenset = frozenset()
+    office_ballots: dict = field(default_factory=dict)
+
+    @property
+    def general_ballots(self):
+        """The general ballots of each component ballot."""
+        general_ballots = defaultdict(list)
+
+        for general, components in self.component_ballots.items():
+            for component in components:
+                general_ballots[component].append(general)
+
+        return dict(general_ballots)
+
+    def candidate_ids(self, ballot_id, active_only=False):
+        """Return the candidates of a ballot in ballot order.
+
+        :param ballot_id: The primary key of the ballot.
+        :param active_only: Leave out the candidates that are not active.
+        """
+        candidate_ids = self.ballot_candidates.get(ballot_id, ())
+
+        if active_only:
+            return [candidate_id for candidate_id in candidate_ids
+                    if candidate_id not in self.inactive_candidates]
+
+        return list(candidate_ids)
+
+    def form_candidate_ids(self, ballot_id):
+        """Return the candidates a form of a ballot counts votes for, those
+        of the ballot and of its component ballots.
+
+        :param ballot_id: The primary key of the ballot of the form.
+        """
+        candidate_ids = self.candidate_ids(ballot_id)
+
+        for component in self.component_ballots.get(ballot_id, ()):
+            candidate_ids.extend(self.candidate_ids(component))
+
+        return candidate_ids
+
+    def office_candidate_ids(self, office_id):
+        """Return the candidates of the forms of an office.
+
+        :param office_id: The primary key of the office.
+
+        :returns: A sorted list of candidate primary keys.
+        """
+        return sorted({
+            candidate_id
+            for ballot_id in self.office_ballots.get(office_id, ())
+            for candidate_id in self.form_candidate_ids(ballot_id)})
+
+
+@tally_cached(REFERENCE_DATA)
+def get_ballot_topology(tally_id):
+    """Return the ballot topology of a tally.
+
+    :param tally_id: The tally to return the topology of.
+
+    :returns: A BallotTopology.
+    """
+    component_ballots = defaultdict(set)
+    ballot_candidates = defaultdict(list)
+    inactive_candidates = set()
+    office_ballots = defaultdict(set)
+
+    for general, component in SubConstituency.objects.filter(
+            ballot_general__tally_id=tally_id,
+            ballot_component__isnull=False,
+    ).values_list('ballot_general_id', 'ballot_component_id'):
+        component_ballots[general].add(component)
+
+    for ballot_id, candidate_id, active in Candidate.objects.filter(
+            ballot__tally_id=tally_id,
+    ).order_by('ballot_id', 'order', 'pk').values_list(
+            'ballot_id', 'pk', 'active'):
+        ballot_candidates[ballot_id].append(candidate_id)
+
+        if not active:
+            inactive_candidates.add(candidate_id)
+
+    for office_id, ballot_id in ResultForm.objects.filter(
+            tally_id=tally_id,
+            office__isnull=False,
+            ballot__isnull=False,
+    ).order_by().values_list('office_id', 'ballot_id').distinct():
+        office_ballots[office_id].add(ballot_id)
+
+    return BallotTopology(
+        component_ballots={
+            general: tuple(sorted(components))
+            for general, components in component_ballots.items()},
+        ballot_candidates={
+            ballot_id: tuple(candidate_ids)
+            for ballot_id, candidate_ids in ballot_candidates.items()},
+        inactive_candidates=frozenset(inactive_candidates),
+        office_ballots={
+            office_id: tuple(sorted(ballot_ids))
+            for office_id, ballot_ids in office_ballots.items()})
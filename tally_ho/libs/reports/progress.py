@@ -1,6 +1,4 @@
-from django.contrib.postgres.aggregates import ArrayAgg
-
-from django.db.models import Sum, When, Case, Value as V
+from django.db.models import Sum, Value as V
 from django.db.models.query import QuerySet
 from django.db.models.functions import Coalesce
 from django.core.exceptions import ImproperlyConfigured
@@ -8,6 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.reports.ballot_topology import get_ballot_topology
 
 
 def rounded_percent(numerator, denominator):
@@ -25,42 +24,7 @@ def get_office_candidates_ids(office_id, tally_id):
 
     :returns: A list of candidates ids.
     """
-    result_forms = ResultForm.objects.filter(
-        office_id=office_id,
-        tally_id=tally_id)
-    ballot_candidate_id_field_name =\
-        'ballot__sc_general__ballot_component__candidates__id'
-    default_case_value = 0
-
-    candidate_id_map =\
-        result_forms\
-        .aggregate(
-            ballot_component_candidate_ids=ArrayAgg(
-                Case(
-                    When(
-                        ballot__sc_general__ballot_component__isnull=False,
-                        then=ballot_candidate_id_field_name),
-                    default=V(default_case_value)),
-                distinct=True),
-            ballot_candidate_ids=ArrayAgg(
-                Case(
-                    When(
-                        ballot__candidates__id__isnull=False,
-                        then='ballot__candidates__id'),
-                    default=V(default_case_value)),
-                distinct=True))
-
-    candidate_ids =\
-        candidate_id_map['ballot_component_candidate_ids'] +\
-        candidate_id_map['ballot_candidate_ids']
-
-    # Remove default_case_value from candidate_ids
-    candidate_ids =\
-        list(filter(
-            lambda candidate_id:
-                candidate_id != default_case_value, candidate_ids))
-
-    return candidate_ids
+    return get_ballot_topology(tally_id).office_candidate_ids(office_id)
 
 
 class ProgressReport(object):
@@ -0,0 +1,576 @@
+"""PowerPoint presentations of the candidates results of a tally.
+
+``write_results_presentation`` reads the candidates votes rows once,
+grouping them by electrol race, then adds the slides of one race at a
+time, reporting its progress in the cache. The presentation is written to
+a file, in a Celery task, see
+``management/commands/export_results_presentation.py``, rather than
+built in memory during a request. Background images are read once per
+presentation, however many slides show them.
+"""
+import os
+import time
+from datetime import date
+from io import BytesIO
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Sum
+from pptx import Presentation
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from tally_ho.apps.tally.models.electrol_race import ElectrolRace
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.utils.cache import cache_model_instances_count
+
+DEFAULT_MAX_AGE = 60 * 60 * 24
+
+# Stations of the centers with a form of each race: expected, in centers
+# with an archived form, and processed, where every form of the station
+# is archived, with the registrants of the processed stations.
+RACE_STATIONS_QUERY = """
+WITH center_races AS (
+    SELECT DISTINCT rf.center_id, er.election_level, er.ballot_name
+    FROM tally_resultform rf
+    JOIN tally_ballot b ON b.id = rf.ballot_id
+    JOIN tally_electrolrace er ON er.id = b.electrol_race_id
+    WHERE rf.tally_id = %(tally_id)s
+),
+centers AS (
+    SELECT center_id, bool_or(form_state = %(archived)s) AS has_archived
+    FROM tally_resultform
+    WHERE tally_id = %(tally_id)s
+    GROUP BY center_id
+),
+station_forms AS (
+    SELECT center_id, station_number,
+        bool_and(form_state = %(archived)s) AS processed
+    FROM tally_resultform
+    WHERE tally_id = %(tally_id)s
+    GROUP BY center_id, station_number
+)
+SELECT cr.election_level, cr.ballot_name,
+    COUNT(DISTINCT (s.center_id, s.station_number)),
+    COUNT(*) FILTER (WHERE c.has_archived),
+    COUNT(*) FILTER (WHERE c.has_archived AND sf.processed),
+    COALESCE(
+        SUM(s.registrants) FILTER (WHERE c.has_archived AND sf.processed), 0
+    )::bigint
+FROM center_races cr
+JOIN centers c ON c.center_id = cr.center_id
+JOIN tally_station s ON s.center_id = cr.center_id
+LEFT JOIN station_forms sf
+    ON sf.center_id = s.center_id
+    AND sf.station_number = s.station_number
+WHERE s.tally_id = %(tally_id)s
+GROUP BY cr.election_level, cr.ballot_name
+"""
+
+
+def get_results_presentation_dir(tally_id):
+    """Return the directory the presentations of a tally are written to."""
+    root = getattr(settings, "RESULTS_PRESENTATION_DIR", None) or os.path.join(
+        settings.BASE_DIR, "..", "data", "presentations"
+    )
+
+    return os.path.join(root, str(tally_id))
+
+
+def results_presentation_cache_key(tally_id, task_id):
+    """Return the key an export task reports the slides it wrote under."""
+    return f"{tally_id}_results_presentation_{task_id}"
+
+
+def remove_old_results_presentations(directory):
+    """Remove the presentations older than
+    ``RESULTS_PRESENTATION_MAX_AGE`` seconds from a directory.
+    """
+    max_age = getattr(
+        settings, "RESULTS_PRESENTATION_MAX_AGE", DEFAULT_MAX_AGE
+    )
+    oldest = time.time() - max_age
+
+    for entry in os.scandir(directory):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < oldest:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            # Removed by a concurrent export.
+            pass
+
+
+def read_background_image(path, images):
+    """Return a background image, reading its file once per presentation.
+
+    :param path: The path of the image file.
+    :param images: A dict of the images read so far, by path.
+
+    :returns: A file-like object of the image, or None if there is no
+        file at the path.
+    """
+    if path not in images:
+        images[path] = None
+
+        if path and os.path.isfile(path):
+            with open(path, "rb") as image_file:
+                images[path] = BytesIO(image_file.read())
+
+    return images[path]
+
+
+def group_results_by_electrol_race(rows):
+    """Group candidates votes rows by electrol race in one pass.
+
+    :param rows: Candidates votes rows, see
+        ``get_filtered_candidate_votes``.
+
+    :returns: A dict of the rows of each electrol race id, with the most
+        votes first, and a dict of the total votes of each.
+    """
+    results = {}
+    total_votes = {}
+
+    for row in rows:
+        electrol_race_id = row["electrol_race_id"]
+        results.setdefault(electrol_race_id, []).append(row)
+        total_votes[electrol_race_id] = (
+            total_votes.get(electrol_race_id, 0) + row["total_votes"]
+        )
+
+    for electrol_race_rows in results.values():
+        # Ties are broken here, the rows are read in no particular order.
+        electrol_race_rows.sort(
+            key=lambda row: (
+                -row["total_votes"],
+                row["candidate_number"],
+                row["ballot_number"],
+                row["candidate_name"],
+            )
+        )
+
+    return results, total_votes
+
+
+def write_results_presentation(
+    rows, path, tally_id, limit=None, cache_key=None
+):
+    """Write a presentation of the candidates results of each electrol race.
+
+    :param rows: Candidates votes rows, see
+        ``get_filtered_candidate_votes``.
+    :param path: The path of the file to write.
+    :param tally_id: The tally of the results.
+    :param limit: Only show this many leading candidates per race if set.
+    :param cache_key: The key to report the slides written under.
+
+    :returns: The number of slides written, 0 without writing a file if
+        there are no results.
+    """
+    results, total_votes = group_results_by_electrol_race(rows)
+
+    if not results:
+        return 0
+
+    electrol_races = list(
+        ElectrolRace.objects.filter(tally__id=tally_id, id__in=results)
+    )
+    headers = create_results_power_point_headers(tally_id, electrol_races)
+    images = {}
+    prs = Presentation()
+    create_results_power_point_cover_page(
+        prs,
+        read_background_image(
+            getattr(settings, "CANDIDATE_RESULTS_PPT_COVER_PAGE_BCK_IMG_PATH"),
+            images,
+        ),
+    )
+
+    for electrol_race in electrol_races:
+        body_data = results[electrol_race.id]
+
+        if limit:
+            body_data = body_data[:limit]
+
+        power_point_race_data = {
+            "header": headers.get(
+                f"{electrol_race.election_level}_{electrol_race.ballot_name}"
+            ),
+            "body": [
+                {
+                    "candidate_name": item.get("candidate_name"),
+                    "total_votes": item.get("total_votes"),
+                    "valid_votes": total_votes[electrol_race.id],
+                }
+                for item in body_data
+            ],
+            "background_image": read_background_image(
+                os.path.join(
+                    settings.MEDIA_ROOT, str(electrol_race.background_image)
+                ),
+                images,
+            ),
+        }
+        slides_count = len(prs.slides)
+        create_results_power_point_summary_slide(
+            prs, power_point_race_data=power_point_race_data
+        )
+        create_results_power_point_candidates_results_slide(
+            prs, power_point_race_data=power_point_race_data, limit=limit
+        )
+
+        if cache_key:
+            cache_model_instances_count(
+                cache_key, len(prs.slides) - slides_count
+            )
+
+    # Readers never see a partly written file.
+    prs.save(f"{path}.tmp")
+    os.replace(f"{path}.tmp", path)
+
+    if cache_key:
+        cache_model_instances_count(cache_key, 0, done=True)
+
+    return len(prs.slides)
+
+
+def create_results_power_point_cover_page(prs, background_image=None):
+    # Set the cover page
+    slide_layout = prs.slide_layouts[0]
+    slide = prs.slides.add_slide(slide_layout)
+
+    # Set background image if provided
+    if background_image:
+        slide.shapes.add_picture(
+            background_image,
+            Inches(0),
+            Inches(0),
+            prs.slide_width,
+            prs.slide_height,
+        )
+
+    # Add date of creation
+    date_of_creation = date.today().strftime("%B %d, %Y")
+    date_shape = slide.shapes.add_textbox(
+        Inches(0.5), Inches(0.5), Inches(8), Inches(0.5)
+    ).text_frame
+    date_shape.text = "Date: " + date_of_creation
+    date_shape.paragraphs[0].alignment = PP_ALIGN.CENTER
+    date_shape.paragraphs[0].runs[0].font.bold = True
+
+    return
+
+
+def create_results_power_point_summary_slide(prs, power_point_race_data):
+    # Create the summary slide
+    slide_layout = prs.slide_layouts[1]
+    slide = prs.slides.add_slide(slide_layout)
+    background_image = power_point_race_data["background_image"]
+    election_level_name = power_point_race_data["header"][
+        "election_level"
+    ].capitalize()
+    sub_race = power_point_race_data["header"]["sub_race_type"].capitalize()
+
+    summary_slide_title = (
+        f"{election_level_name} {sub_race} Election Summary Results"
+    )
+    # Set background image if provided
+    if background_image:
+        slide.shapes.add_picture(
+            background_image,
+            Inches(0),
+            Inches(0),
+            prs.slide_width,
+            prs.slide_height,
+        )
+
+    # Access the title placeholder and set its text
+    if slide.shapes.title:
+        slide.shapes.title.text = summary_slide_title
+        # Apply formatting to the title
+        title_frame = slide.shapes.title.text_frame
+        title_frame.paragraphs[0].font.bold = True
+        title_frame.paragraphs[0].font.size = Pt(24)
+        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    else:
+        # Add title text box for the summary slide
+        title_text_box = slide.shapes.add_textbox(
+            Inches(0.5), Inches(0.7), prs.slide_width - Inches(1), Inches(0.5)
+        )
+        title_text_frame = title_text_box.text_frame
+
+        # Set title properties
+        title_text_frame.text = summary_slide_title
+        title_text_frame.word_wrap = True
+        title_text_frame.margin_left = 0
+        title_text_frame.margin_right = 0
+        title_text_frame.margin_top = 0
+        title_text_frame.margin_bottom = 0
+
+        # Set title font properties
+        title_text_frame.clear()  # Clear existing paragraphs
+        p = title_text_frame.add_paragraph()
+        p.text = summary_slide_title
+        p.font.bold = True
+        p.font.size = Pt(24)
+        p.alignment = PP_ALIGN.CENTER
+
+    # Create a table shape for the summary data
+    summary_table = slide.shapes.add_table(
+        rows=9,
+        cols=2,
+        left=Inches(0.5),
+        top=Inches(1.7),
+        width=Inches(9),
+        height=Inches(2),
+    ).table
+
+    # Set the column widths for the summary table
+    column_widths = [Inches(4.5), Inches(4.5)]
+    for i, width in enumerate(column_widths):
+        summary_table.columns[i].width = width
+
+    # Populate the summary table with data
+    summary_table.cell(0, 0).text = "Election Level"
+    summary_table.cell(0, 1).text = str(
+        power_point_race_data["header"]["election_level"]
+    )
+    summary_table.cell(1, 0).text = "Name of Race"
+    summary_table.cell(1, 1).text = str(
+        power_point_race_data["header"]["sub_race_type"]
+    )
+    summary_table.cell(2, 0).text = "Stations Expected"
+    summary_table.cell(
+        2, 1
+    ).text = f"{power_point_race_data['header']['stations_expected']:,.0f}"
+    summary_table.cell(3, 0).text = "Stations Processed"
+    summary_table.cell(3, 1).text = str(
+        power_point_race_data["header"]["stations_processed"]
+    )
+    summary_table.cell(4, 0).text = "Percentage of Stations Processed"
+    percentage_of_stations_processed = power_point_race_data["header"][
+        "percentage_of_stations_processed"
+    ]
+    summary_table.cell(4, 1).text = f"{percentage_of_stations_processed}%"
+    summary_table.cell(5, 0).text = "Results Status"
+    summary_table.cell(5, 1).text = power_point_race_data["header"][
+        "results_status"
+    ]
+    summary_table.cell(6, 0).text = "Registrants"
+    registrants_in_processed_stations = power_point_race_data["header"][
+        "registrants_in_processed_stations"
+    ]
+    summary_table.cell(6, 1).text = f"{registrants_in_processed_stations:,.0f}"
+    summary_table.cell(7, 0).text = "Ballots Cast"
+    summary_table.cell(7, 1).text = str(
+        power_point_race_data["header"]["voters_in_counted_stations"]
+    )
+    summary_table.cell(8, 0).text = "Turnout"
+    summary_table.cell(
+        8, 1
+    ).text = f"{power_point_race_data['header']['percentage_turnout']}%"
+
+    return
+
+
+def create_results_power_point_candidates_results_slide(
+    prs, power_point_race_data, limit
+):
+    background_image = power_point_race_data["background_image"]
+    candidates = power_point_race_data["body"]
+    num_candidates = len(candidates)
+    max_candidates_per_slide = 10
+    num_slides = (num_candidates - 1) // max_candidates_per_slide + 1
+    candidate_rank = 0
+    election_level_name = power_point_race_data["header"][
+        "election_level"
+    ].capitalize()
+    sub_race = power_point_race_data["header"]["sub_race_type"].capitalize()
+
+    for slide_num in range(num_slides):
+        # Create a new candidates slide
+        slide_layout = prs.slide_layouts[1]
+        slide = prs.slides.add_slide(slide_layout)
+
+        candidates_result_slide_title = (
+            f"Showing all {election_level_name} {sub_race} Election Results"
+        )
+        if limit:
+            candidates_result_slide_title = str(
+                f"Top {limit} Leading {election_level_name} {sub_race} "
+                "Election Results"
+            )
+        # Set background image if provided
+        if background_image:
+            slide.shapes.add_picture(
+                background_image,
+                Inches(0),
+                Inches(0),
+                prs.slide_width,
+                prs.slide_height,
+            )
+
+        # Access the title placeholder and set its text
+        if slide.shapes.title:
+            slide.shapes.title.text = candidates_result_slide_title
+            # Apply formatting to the title
+            title_frame = slide.shapes.title.text_frame
+            title_frame.paragraphs[0].font.bold = True
+            title_frame.paragraphs[0].font.size = Pt(24)
+            title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        else:
+            # Add title text box for the candidates slide
+            title_text_box = slide.shapes.add_textbox(
+                Inches(0.5),
+                Inches(0.7),
+                prs.slide_width - Inches(1),
+                Inches(0.5),
+            )
+            title_text_frame = title_text_box.text_frame
+
+            # Set title properties
+            title_text_frame.text = candidates_result_slide_title
+            title_text_frame.word_wrap = True
+            title_text_frame.margin_left = 0
+            title_text_frame.margin_right = 0
+            title_text_frame.margin_top = 0
+            title_text_frame.margin_bottom = 0
+
+            # Set title font properties
+            title_text_frame.clear()  # Clear existing paragraphs
+            p = title_text_frame.add_paragraph()
+            p.text = candidates_result_slide_title
+            p.font.bold = True
+            p.font.size = Pt(24)
+            p.alignment = PP_ALIGN.CENTER
+
+        # Calculate the number of candidates for the current slide
+        start_index = slide_num * max_candidates_per_slide
+        end_index = start_index + max_candidates_per_slide
+        candidates_slice = candidates[start_index:end_index]
+
+        # Create a table shape for the candidates data
+        candidates_table = slide.shapes.add_table(
+            rows=len(candidates_slice) + 1,
+            cols=5,
+            left=Inches(0.5),
+            top=Inches(1.7),
+            width=Inches(9),
+            height=Inches(2),
+        ).table
+
+        # Set the column widths for the candidates table
+        column_widths = [
+            Inches(1),
+            Inches(3),
+            Inches(2),
+            Inches(1.5),
+            Inches(1.5),
+        ]
+        for i, width in enumerate(column_widths):
+            candidates_table.columns[i].width = width
+
+        # Populate the candidates table with data
+        candidates_table.cell(0, 0).text = "Rank"
+        candidates_table.cell(0, 1).text = "Name"
+        candidates_table.cell(0, 2).text = "Votes"
+        candidates_table.cell(0, 3).text = "Total Votes"
+        candidates_table.cell(0, 4).text = "% Valid Votes"
+
+        for i, candidate in enumerate(candidates_slice):
+            candidate_rank = candidate_rank + 1
+            candidates_table.cell(i + 1, 0).text = str(candidate_rank)
+            candidates_table.cell(i + 1, 1).text = candidate["candidate_name"]
+            total_votes = candidate["total_votes"]
+            candidates_table.cell(i + 1, 2).text = str(total_votes)
+            valid_votes = candidate["valid_votes"]
+            candidates_table.cell(i + 1, 3).text = str(valid_votes)
+            if valid_votes == 0:
+                candidates_table.cell(i + 1, 4).text = "0"
+                continue
+            candidates_table.cell(i + 1, 4).text = str(
+                round(100 * total_votes / valid_votes, 2)
+            )
+
+    return
+
+
+def create_results_power_point_headers(tally_id, electrol_races):
+    """Aggregate the stations and votes of the races of a presentation.
+
+    :param tally_id: The tally of the races.
+    :param electrol_races: The races shown in the presentation.
+
+    :returns: A dict of the headers of each race, by election level and
+        ballot name.
+    """
+    race_data_by_election_level_names = {
+        f"{electrol_race.election_level}_{electrol_race.ballot_name}": {
+            "election_level": electrol_race.election_level,
+            "sub_race_type": electrol_race.ballot_name,
+        }
+        for electrol_race in electrol_races
+    }
+    voters_by_ballot_name = {
+        row["ballot_name"]: row["race_voters"]
+        for row in Result.objects.filter(
+            result_form__tally__id=tally_id,
+            result_form__form_state=FormState.ARCHIVED,
+            entry_version=EntryVersion.FINAL,
+            active=True,
+        )
+        .values(
+            ballot_name=F("result_form__ballot__electrol_race__ballot_name")
+        )
+        .annotate(race_voters=Sum("votes"))
+    }
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            RACE_STATIONS_QUERY,
+            {"tally_id": tally_id, "archived": FormState.ARCHIVED.value},
+        )
+        race_stations = {
+            f"{election_level}_{ballot_name}": stations
+            for election_level, ballot_name, *stations in cursor.fetchall()
+        }
+
+    for key, race_type_obj in race_data_by_election_level_names.items():
+        voters = voters_by_ballot_name.get(race_type_obj["sub_race_type"], 0)
+        (
+            stations_expected,
+            stations_considered,
+            stations_processed,
+            registrants_in_processed_stations,
+        ) = race_stations.get(key, (0, 0, 0, 0))
+        race_type_obj["voters_in_counted_stations"] = voters
+        race_type_obj["stations_expected"] = stations_expected
+
+        if stations_processed:
+            race_type_obj["stations_processed"] = stations_processed
+            race_type_obj["registrants_in_processed_stations"] = (
+                registrants_in_processed_stations
+            )
+            race_type_obj["percentage_of_stations_processed"] = round(
+                100 * stations_processed / stations_expected, 2
+            )
+            race_type_obj["results_status"] = (
+                "Final"
+                if race_type_obj["percentage_of_stations_processed"] >= 100.0
+                else "Partial"
+            )
+            race_type_obj["percentage_turnout"] = (
+                round(100 * voters / registrants_in_processed_stations, 2)
+                if registrants_in_processed_stations
+                else 0
+            )
+        elif stations_considered:
+            race_type_obj["stations_processed"] = 0
+            race_type_obj["registrants_in_processed_stations"] = 0
+            race_type_obj["percentage_of_stations_processed"] = 0
+            race_type_obj["percentage_turnout"] = 0
+            race_type_obj["results_status"] = "Partial"
+
+    return race_data_by_election_level_names
@@ -212,6 +212,13 @@ class TestImportSubmissionDB(ImportSubmissionTestBase, TestCase):
         self.assertIn("PVP import", comment)
         self.assertEqual(versions.first().revision.user_id, self.user.id)
 
+    def test_versions_every_written_row_in_one_revision(self):
+        self._import()
+        revision = Version.objects.get_for_object(
+            self.result_form).get().revision
+        # Two results, one recon form and the result form.
+        self.assertEqual(revision.version_set.count(), 4)
+
     def test_atomic_rollback_leaves_no_partial_writes(self):
         # Use a candidate_id that doesn't exist for this tally so the
         # internal Candidate lookup raises and the @transaction.atomic
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from django.contrib.auth.models import AnonymousUser, Group, User
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.test import RequestFactory, TestCase
@@ -31,10 +33,19 @@ from tally_ho.libs.permissions.groups import (
     create_permission_groups,
 )
 from tally_ho.libs.tests.fixtures.electrol_race_data import electrol_races
+from tally_ho.libs.utils.query_budget import get_query_budget, record_queries
 from tally_ho.libs.verify.quarantine_checks import (
     create_quarantine_checks as create_quarantine_checks_fn,
 )
 
+# Tests that read cached values back use a per process cache so they do not
+# depend on a running memcached.
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 
 def configure_messages(request):
     setattr(request, "session", "session")
@@ -481,3 +492,17 @@ class TestBase(TestCase):
         count = user.groups.count()
         add_user_to_group(user, name)
         self.assertTrue(user.groups.count() > count)
+
+    @contextmanager
+    def assertWithinQueryBudget(self, view):
+        """Fail if the block runs more queries than the budget of a view."""
+        name = getattr(view, 'view_class', view).__name__
+        budget = get_query_budget(view)
+        self.assertIsNotNone(budget, f'{name} declares no query budget')
+
+        with record_queries(name, budget=budget, strict=False) as recorder:
+            yield recorder
+
+        if recorder.over_budget:
+            self.fail(f'{name} ran {recorder.count} queries, its budget is '
+                      f'{budget}')
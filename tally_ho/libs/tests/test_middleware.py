@@ -3,10 +3,29 @@ from importlib import import_module
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.test import TestCase, RequestFactory
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import TestCase, RequestFactory, override_settings
 from mock import patch
+from tracking.models import Pageview, Visitor
 
 from tally_ho.libs.middleware.idle_timeout import IdleTimeout
+from tally_ho.apps.tally.models.result_form import ResultFormConflict
+from tally_ho.libs.middleware.query_budget import QueryBudgetMiddleware
+from tally_ho.libs.middleware.result_form_conflict import (
+    ResultFormConflictMiddleware,
+)
+from tally_ho.libs.middleware.user_restrict import UserRestrictMiddleware
+from tally_ho.libs.middleware.visitor_tracking import (
+    BufferedVisitorTrackingMiddleware,
+)
+from tally_ho.libs.utils import visitor_tracking
+from tally_ho.libs.utils.query_budget import (
+    QueryBudgetExceeded,
+    get_query_metrics,
+    query_budget,
+    reset_query_metrics,
+)
 
 
 class TestMiddleware(TestCase):
@@ -46,3 +65,128 @@ class TestMiddleware(TestCase):
         self.request.session['last_visit'] = t1
         idt.__call__(self.request)
         self.assertNotIn('last_visit', self.request.session)
+
+    def test_user_restrict_ends_sessions_from_other_ips(self):
+        bob = self.request.user
+        other = self._session()
+        other.create()
+        Visitor.objects.create(session_key=other.session_key, user=bob,
+                               ip_address='10.0.0.2')
+        same_ip = Visitor.objects.create(session_key='same-ip', user=bob,
+                                         ip_address='127.0.0.1')
+        self.request.session.create()
+        self.request.user_restrict_login = True
+
+        UserRestrictMiddleware(lambda x: x).__call__(self.request)
+
+        self.assertFalse(
+            Session.objects.filter(session_key=other.session_key).exists())
+        self.assertIsNone(Visitor.objects.get(pk=other.session_key).user)
+        same_ip.refresh_from_db()
+        self.assertEqual(same_ip.user, bob)
+
+    def test_user_restrict_ignores_requests_without_login(self):
+        other = self._session()
+        other.create()
+        Visitor.objects.create(session_key=other.session_key,
+                               user=self.request.user,
+                               ip_address='10.0.0.2')
+
+        with self.assertNumQueries(0):
+            UserRestrictMiddleware(lambda x: x).__call__(self.request)
+
+        self.assertTrue(
+            Session.objects.filter(session_key=other.session_key).exists())
+
+    @override_settings(TRACK_BUFFER_BACKEND='memory', TRACK_BUFFER_SIZE=2,
+                       TRACK_BUFFER_FLUSH_INTERVAL=60)
+    def test_buffered_visitor_tracking_writes_in_batches(self):
+        visitor_tracking.reset_buffer()
+        self.addCleanup(visitor_tracking.reset_buffer)
+        middleware = BufferedVisitorTrackingMiddleware(lambda x: x)
+        self.request.session.create()
+
+        with self.assertNumQueries(0):
+            middleware.process_response(self.request, HttpResponse())
+
+        self.assertFalse(Visitor.objects.exists())
+        middleware.process_response(self.request, HttpResponse())
+
+        visitor = Visitor.objects.get(pk=self.request.session.session_key)
+        self.assertEqual(visitor.user, self.request.user)
+        self.assertEqual(visitor.pageviews.count(), 2)
+
+    @override_settings(TRACK_BUFFER_BACKEND=None, TRACK_AJAX_SAMPLE_RATE=0)
+    def test_buffered_visitor_tracking_skips_ajax(self):
+        self.request.META['HTTP_X_REQUESTED_WITH'] = 'XMLHttpRequest'
+        middleware = BufferedVisitorTrackingMiddleware(lambda x: x)
+        self.request.session.create()
+
+        middleware.process_response(self.request, HttpResponse())
+        self.assertFalse(Visitor.objects.exists())
+
+        with self.settings(TRACK_AJAX_SAMPLE_RATE=1):
+            middleware.process_response(self.request, HttpResponse())
+        self.assertEqual(Pageview.objects.count(), 1)
+
+    @override_settings(QUERY_INSTRUMENTATION=True, QUERY_BUDGET_STRICT=True)
+    def test_query_budget_middleware(self):
+        reset_query_metrics()
+
+        @query_budget(1)
+        def view(request):
+            return HttpResponse()
+
+        def get_response(queries):
+            def run(request):
+                middleware.process_view(request, view, (), {})
+
+                for _ in range(queries):
+                    User.objects.exists()
+
+                return view(request)
+
+            return run
+
+        middleware = QueryBudgetMiddleware(get_response(1))
+        middleware(self.request)
+
+        self.assertEqual(get_query_metrics(),
+                         {'/.runs': 1, '/.queries': 1})
+
+        middleware = QueryBudgetMiddleware(get_response(2))
+
+        with self.assertRaises(QueryBudgetExceeded):
+            middleware(self.request)
+
+        with self.settings(QUERY_INSTRUMENTATION=False):
+            middleware(self.request)
+
+    @override_settings(QUERY_INSTRUMENTATION=True, QUERY_BUDGET_STRICT=True)
+    def test_query_budget_middleware_records_streams(self):
+        reset_query_metrics()
+
+        def rows():
+            for _ in range(3):
+                yield str(User.objects.exists())
+
+        middleware = QueryBudgetMiddleware(
+            lambda request: StreamingHttpResponse(rows()))
+        response = middleware(self.request)
+
+        self.assertEqual(get_query_metrics(), {})
+        self.assertEqual(b''.join(response.streaming_content),
+                         b'TrueTrueTrue')
+        self.assertEqual(get_query_metrics(),
+                         {'/.runs': 1, '/.queries': 3})
+
+    def test_result_form_conflict_middleware(self):
+        middleware = ResultFormConflictMiddleware(lambda request: None)
+
+        response = middleware.process_exception(
+            self.request, ResultFormConflict('Form 1 was changed'))
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn(b'Form 1 was changed', response.content)
+        self.assertIsNone(
+            middleware.process_exception(self.request, ValueError()))
@@ -0,0 +1,121 @@
+"""Test libs.utils.analytics module."""
+import os
+import shutil
+import tempfile
+
+from django.db.models import CharField, F, Func
+from django.test import TestCase, override_settings
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (
+    create_ballot,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.utils import analytics
+
+
+class TestAnalytics(TestCase):
+    def setUp(self):
+        self.snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.snapshot_dir)
+        settings_override = override_settings(
+            ANALYTICS_SNAPSHOT_DIR=self.snapshot_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.tally = create_tally()
+        ballot = create_ballot(self.tally)
+
+        for i in range(3):
+            create_result_form(
+                barcode=str(i),
+                serial_number=i,
+                ballot=ballot,
+                form_state=FormState.ARCHIVED if i else FormState.INTAKE,
+                tally=self.tally)
+
+        self.forms = ResultForm.objects.filter(tally=self.tally).order_by(
+            'serial_number').values('barcode', 'form_state', 'created_date')
+
+    def test_take_snapshot(self):
+        snapshot = analytics.take_snapshot()
+
+        self.assertEqual(snapshot, analytics.get_snapshot())
+        self.assertEqual(
+            snapshot['tables']['tally_resultform'],
+            ResultForm.objects.count())
+        self.assertTrue(os.path.exists(os.path.join(
+            snapshot['path'], 'tally_resultform.parquet')))
+        self.assertEqual(
+            set(snapshot['tables']),
+            {model._meta.db_table for model in analytics.snapshot_models()})
+        self.assertNotIn('auth_user', snapshot['tables'])
+        self.assertNotIn('django_session', snapshot['tables'])
+
+        for _ in range(2):
+            analytics.take_snapshot()
+
+        self.assertEqual(
+            len([name for name in os.listdir(self.snapshot_dir)
+                 if os.path.isdir(os.path.join(self.snapshot_dir, name))]),
+            analytics.SNAPSHOTS_KEPT)
+
+    def test_fetch_reads_snapshot(self):
+        rows = list(self.forms)
+        analytics.take_snapshot()
+        ResultForm.objects.filter(tally=self.tally).update(
+            form_state=FormState.UNSUBMITTED)
+
+        self.assertEqual(
+            analytics.fetch(self.forms, from_snapshot=True), rows)
+        self.assertEqual(rows[0]['form_state'], FormState.INTAKE)
+        self.assertEqual(
+            analytics.count(self.forms.filter(
+                form_state=FormState.ARCHIVED), from_snapshot=True),
+            2)
+
+    def test_fetch_reads_database_unless_from_snapshot(self):
+        analytics.take_snapshot()
+        ResultForm.objects.filter(tally=self.tally).update(
+            form_state=FormState.UNSUBMITTED)
+
+        self.assertEqual(analytics.fetch(self.forms), list(self.forms))
+        self.assertEqual(
+            analytics.count(self.forms.filter(
+                form_state=FormState.ARCHIVED)),
+            0)
+
+    def test_text_ordering_reads_database(self):
+        analytics.take_snapshot()
+        ResultForm.objects.filter(tally=self.tally).update(
+            form_state=FormState.UNSUBMITTED)
+        forms = self.forms.order_by('-barcode')
+
+        self.assertEqual(
+            analytics.fetch(forms, from_snapshot=True), list(forms))
+
+    @override_settings(ANALYTICS_SNAPSHOT_MAX_AGE=0)
+    def test_stale_snapshot_reads_database(self):
+        analytics.take_snapshot()
+        ResultForm.objects.filter(tally=self.tally).update(
+            form_state=FormState.UNSUBMITTED)
+
+        self.assertEqual(
+            analytics.fetch(self.forms, from_snapshot=True),
+            list(self.forms))
+        self.assertEqual(
+            analytics.count(self.forms.filter(
+                form_state=FormState.ARCHIVED), from_snapshot=True),
+            0)
+
+    def test_unsupported_statement_reads_database(self):
+        analytics.take_snapshot()
+        forms = self.forms.annotate(quoted=Func(
+            F('barcode'), function='quote_ident', output_field=CharField()))
+
+        with self.assertLogs(analytics.logger, 'WARNING'):
+            rows = analytics.fetch(forms, from_snapshot=True)
+
+        self.assertEqual(rows, list(forms))
+        self.assertEqual(rows[0]['quoted'], '"0"')
@@ -1,14 +1,16 @@
-import json
-
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from tally_ho.apps.tally.models.electrol_race import ElectrolRace
 from tally_ho.libs.tests.fixtures.electrol_race_data import electrol_races
-from tally_ho.libs.tests.test_base import create_tally
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.tests.test_base import LOCMEM_CACHES, create_tally
+from tally_ho.libs.utils.cache import (
+    delete_cached_model_instances_count,
+    get_cached_model_instances_count,
+)
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class TestBulkCreateManager(TestCase):
     def setUp(self):
         self.tally = create_tally()
@@ -18,15 +20,13 @@ class TestBulkCreateManager(TestCase):
                 ElectrolRace(tally=self.tally, **electrol_race_data)
             )
         self.cache_key = "test_cache_key"
-        self.memcache_client = MemCache()
-        self.memcache_client.delete(self.cache_key)
+        delete_cached_model_instances_count(self.cache_key)
 
     def test_bulk_create(self):
         manager = BulkCreateManager(
             objs_count=len(electrol_races),
             cache_instances_count=True,
             cache_key=self.cache_key,
-            memcache_client=self.memcache_client,
         )
 
         # Add objects to the manager
@@ -40,12 +40,11 @@ class TestBulkCreateManager(TestCase):
         )
 
         # Ensure cache is updated with the correct count
-        memcache_data, _ = self.memcache_client.get(self.cache_key)
-        cached_data = json.loads(memcache_data)
-        self.assertEqual(
-            cached_data.get("elements_processed"), len(electrol_races)
+        elements_processed, done = get_cached_model_instances_count(
+            self.cache_key
         )
-        self.assertTrue(cached_data.get("done"))
+        self.assertEqual(elements_processed, len(electrol_races))
+        self.assertTrue(done)
 
     def test_no_cache(self):
         manager = BulkCreateManager(objs_count=len(electrol_races))
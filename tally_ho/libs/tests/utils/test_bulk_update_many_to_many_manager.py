@@ -1,16 +1,22 @@
-import json
-
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from tally_ho.apps.tally.models.sub_constituency import SubConstituency
-from tally_ho.libs.tests.test_base import create_tally, create_ballot
-from tally_ho.libs.utils.memcache import MemCache
+from tally_ho.libs.tests.test_base import (
+    LOCMEM_CACHES,
+    create_ballot,
+    create_tally,
+)
+from tally_ho.libs.utils.cache import (
+    delete_cached_model_instances_count,
+    get_cached_model_instances_count,
+)
 from tally_ho.libs.utils.query_set_helpers import BulkCreateManager
 from tally_ho.libs.utils.query_set_helpers import BulkUpdateManyToManyManager
 from tally_ho.libs.tests.fixtures.sub_con_data import (
     sub_cons
 )
 
+@override_settings(CACHES=LOCMEM_CACHES)
 class TestBulkUpdateManyToManyManager(TestCase):
     def setUp(self):
         self.tally = create_tally()
@@ -29,15 +35,13 @@ class TestBulkUpdateManyToManyManager(TestCase):
         for obj in self.objects:
             manager.add(obj)
         self.cache_key = 'test_cache_key'
-        self.memcache_client = MemCache()
-        self.memcache_client.delete(self.cache_key)
+        delete_cached_model_instances_count(self.cache_key)
 
     def test_bulk_create(self):
         manager = BulkUpdateManyToManyManager(
             instances_count=len(sub_cons),
             cache_instances_count=True,
             cache_key=self.cache_key,
-            memcache_client=self.memcache_client
         )
 
         # Add objects to the manager
@@ -53,11 +57,10 @@ class TestBulkUpdateManyToManyManager(TestCase):
             len(sub_cons))
 
         # Ensure cache is updated with the correct count
-        memcache_data, _ = self.memcache_client.get(self.cache_key)
-        cached_data = json.loads(memcache_data)
-        self.assertEqual(
-            cached_data.get('elements_processed'), len(sub_cons))
-        self.assertTrue(cached_data.get('done'))
+        elements_processed, done =\
+            get_cached_model_instances_count(self.cache_key)
+        self.assertEqual(elements_processed, len(sub_cons))
+        self.assertTrue(done)
 
     def test_no_cache(self):
         manager = BulkUpdateManyToManyManager(instances_count=len(sub_cons))
@@ -0,0 +1,99 @@
+"""Test libs.utils.cache module."""
+from django.test import TestCase, override_settings
+
+from tally_ho.libs.tests.test_base import LOCMEM_CACHES
+from tally_ho.libs.utils.cache import (
+    REFERENCE_DATA,
+    REPORTS,
+    cache_model_instances_count,
+    delete_cached_model_instances_count,
+    get_cache,
+    get_cache_metrics,
+    get_cached_model_instances_count,
+    invalidate_tally_cache,
+    reset_cache_metrics,
+    tally_cache_key,
+    tally_cached,
+)
+
+calls = []
+
+
+@tally_cached(REPORTS)
+def votes_report(tally_id, ballot_number=None):
+    calls.append((tally_id, ballot_number))
+    return {'tally': tally_id, 'ballot': ballot_number}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestCache(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        reset_cache_metrics()
+        calls.clear()
+
+    def test_tally_cache_key(self):
+        key = tally_cache_key(1, REPORTS, 'votes', 2)
+
+        self.assertEqual(key, tally_cache_key(1, REPORTS, 'votes', 2))
+        self.assertNotEqual(key, tally_cache_key(2, REPORTS, 'votes', 2))
+        self.assertNotEqual(key, tally_cache_key(1, REPORTS, 'votes', 3))
+        self.assertNotEqual(key, tally_cache_key(1, REFERENCE_DATA, 'votes'))
+
+    def test_invalidate_namespace(self):
+        reports_key = tally_cache_key(1, REPORTS, 'votes')
+        reference_key = tally_cache_key(1, REFERENCE_DATA, 'ballots')
+        invalidate_tally_cache(1, REPORTS)
+
+        self.assertNotEqual(reports_key, tally_cache_key(1, REPORTS, 'votes'))
+        self.assertEqual(reference_key,
+                         tally_cache_key(1, REFERENCE_DATA, 'ballots'))
+
+    def test_invalidate_tally(self):
+        reports_key = tally_cache_key(1, REPORTS, 'votes')
+        other_tally_key = tally_cache_key(2, REPORTS, 'votes')
+        invalidate_tally_cache(1)
+
+        self.assertNotEqual(reports_key, tally_cache_key(1, REPORTS, 'votes'))
+        self.assertEqual(other_tally_key, tally_cache_key(2, REPORTS, 'votes'))
+
+    def test_tally_cached(self):
+        self.assertEqual(votes_report(1, ballot_number=2),
+                         {'tally': 1, 'ballot': 2})
+        self.assertEqual(votes_report(1, 2), {'tally': 1, 'ballot': 2})
+        votes_report(1, ballot_number=3)
+
+        self.assertEqual(calls, [(1, 2), (1, 3)])
+        self.assertEqual(get_cache_metrics(),
+                         {'reports.misses': 2, 'reports.hits': 1})
+
+        votes_report.invalidate(1)
+        votes_report(1, ballot_number=2)
+
+        self.assertEqual(calls, [(1, 2), (1, 3), (1, 2)])
+
+    def test_tally_cached_caches_none(self):
+        @tally_cached(REFERENCE_DATA)
+        def nothing(tally_id):
+            calls.append(tally_id)
+
+        nothing(tally_id=1)
+        nothing(tally_id=1)
+
+        self.assertEqual(calls, [1])
+
+    def test_cache_model_instances_count(self):
+        cache_key = 'test_cache_key'
+        self.assertEqual(get_cached_model_instances_count(cache_key),
+                         (0, False))
+
+        cache_model_instances_count(cache_key, 10)
+        cache_model_instances_count(cache_key, 5, done=True)
+
+        self.assertEqual(get_cached_model_instances_count(cache_key),
+                         (15, True))
+
+        delete_cached_model_instances_count(cache_key)
+
+        self.assertEqual(get_cached_model_instances_count(cache_key),
+                         (0, False))
@@ -0,0 +1,119 @@
+"""Test libs.utils.query_budget module."""
+import json
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.views.generic import View
+
+from tally_ho.celeryapp import debug_task
+from tally_ho.libs.utils.query_budget import (
+    QueryBudgetExceeded,
+    finish_task_recording,
+    fingerprint,
+    get_query_budget,
+    get_query_metrics,
+    query_budget,
+    record_queries,
+    reset_query_metrics,
+    start_task_recording,
+)
+
+
+@query_budget(3)
+class BudgetView(View):
+    pass
+
+
+@query_budget(1)
+def budget_view(request):
+    pass
+
+
+def query_users(count):
+    for pk in range(count):
+        User.objects.filter(pk=pk).exists()
+
+
+@override_settings(QUERY_INSTRUMENTATION=True, QUERY_REPEAT_THRESHOLD=3,
+                   QUERY_BUDGET_STRICT=False)
+class TestQueryBudget(TestCase):
+    def setUp(self):
+        reset_query_metrics()
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint("SELECT *\n  FROM t WHERE a = 'x' AND b IN (%s, %s)"
+                        " LIMIT 21"),
+            'SELECT * FROM t WHERE a = ? AND b IN (...) LIMIT ?')
+        self.assertEqual(fingerprint('SELECT 1 FROM t WHERE id IN (%s)'),
+                         fingerprint('SELECT 2 FROM t WHERE id IN (%s, %s)'))
+
+    def test_get_query_budget(self):
+        self.assertEqual(get_query_budget(BudgetView.as_view()), 3)
+        self.assertEqual(get_query_budget(budget_view), 1)
+        self.assertIsNone(get_query_budget(View.as_view()))
+
+    def test_record_queries(self):
+        with self.assertLogs('tally_ho.libs.utils.query_budget',
+                             'INFO') as logs:
+            with record_queries('users', budget=2) as recorder:
+                query_users(2)
+
+        self.assertEqual(recorder.count, 2)
+        self.assertGreater(recorder.seconds, 0)
+        self.assertFalse(recorder.over_budget)
+        self.assertEqual(recorder.repeated(), [])
+        self.assertEqual(logs.records[0].levelname, 'INFO')
+        self.assertEqual(json.loads(logs.records[0].getMessage())['queries'],
+                         2)
+
+    def test_record_queries_repeated(self):
+        with self.assertLogs('tally_ho.libs.utils.query_budget',
+                             'WARNING') as logs:
+            with record_queries('users') as recorder:
+                query_users(3)
+
+        [(sql, count)] = recorder.repeated()
+        report = json.loads(logs.records[0].getMessage())
+
+        self.assertEqual(count, 3)
+        self.assertIn('"auth_user"', sql)
+        self.assertEqual(report['repeated'][0]['count'], 3)
+        self.assertEqual(len(report['repeated'][0]['fingerprint']), 12)
+        self.assertEqual(get_query_metrics(),
+                         {'users.runs': 1, 'users.queries': 3,
+                          'users.over_budget': 0, 'users.repeated': 1})
+
+    def test_record_queries_over_budget(self):
+        with self.assertLogs('tally_ho.libs.utils.query_budget', 'WARNING'):
+            with record_queries('users', budget=1) as recorder:
+                query_users(2)
+
+        self.assertTrue(recorder.over_budget)
+        self.assertEqual(get_query_metrics()['users.over_budget'], 1)
+
+    def test_record_queries_strict(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            with record_queries('users', budget=1, strict=True):
+                query_users(2)
+
+        with self.settings(QUERY_BUDGET_STRICT=True):
+            with self.assertRaises(QueryBudgetExceeded):
+                with record_queries('users', budget=1):
+                    query_users(2)
+
+    def test_task_signals(self):
+        start_task_recording(task_id='task-1', task=debug_task)
+        query_users(2)
+        finish_task_recording(task_id='task-1')
+        query_users(1)
+
+        self.assertEqual(
+            get_query_metrics()[f'{debug_task.name}.queries'], 2)
+
+    def test_task_signals_disabled(self):
+        with self.settings(QUERY_INSTRUMENTATION=False):
+            start_task_recording(task_id='task-1', task=debug_task)
+            finish_task_recording(task_id='task-1')
+
+        self.assertEqual(get_query_metrics(), {})
@@ -0,0 +1,71 @@
+import reversion
+from django.contrib.contenttypes.models import ContentType
+from reversion.models import Revision, Version
+
+from tally_ho.apps.tally.models.all_candidates_votes import (
+    AllCandidatesVotes,
+)
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_stats import ResultFormStats
+from tally_ho.apps.tally.models.tally import Tally
+from tally_ho.libs.tests.test_base import (
+    create_result_form,
+    create_tally,
+    TestBase,
+)
+from tally_ho.libs.utils.revisions import bulk_create_revision
+
+
+class TestRevisions(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.tally = create_tally()
+
+    def test_excluded_models_are_not_registered(self):
+        self.assertTrue(reversion.is_registered(ResultForm))
+        self.assertFalse(reversion.is_registered(AllCandidatesVotes))
+        self.assertFalse(reversion.is_registered(ResultFormStats))
+
+    def test_bulk_create_revision_inserts_versions_at_once(self):
+        result_forms = [
+            create_result_form(barcode=str(i), serial_number=i,
+                               tally=self.tally)
+            for i in range(3)
+        ]
+
+        ContentType.objects.get_for_model(ResultForm)
+
+        # The revision, the versions and the transaction savepoints.
+        with self.assertNumQueries(4):
+            revision = bulk_create_revision(
+                result_forms, user=self.user, comment='Bulk')
+
+        self.assertEqual(revision.user_id, self.user.id)
+        self.assertEqual(revision.comment, 'Bulk')
+        for result_form in result_forms:
+            version = Version.objects.get_for_object(result_form).get()
+            self.assertEqual(version.revision, revision)
+            self.assertEqual(version.field_dict['barcode'],
+                             result_form.barcode)
+
+    def test_bulk_create_revision_skips_unversioned_objects(self):
+        self.assertIsNone(bulk_create_revision([
+            ResultForm(tally=self.tally),
+            Tally.objects.get(pk=self.tally.pk),
+        ]))
+        self.assertFalse(Revision.objects.exists())
+
+    def test_bulk_create_revision_versions_like_reversion(self):
+        result_form = create_result_form(tally=self.tally)
+
+        with reversion.create_revision():
+            reversion.add_to_revision(result_form)
+
+        bulk_create_revision([result_form])
+        version, bulk_version = Version.objects.get_for_object(
+            result_form).order_by('pk')
+
+        self.assertEqual(bulk_version.content_type, version.content_type)
+        self.assertEqual(bulk_version.format, version.format)
+        self.assertEqual(bulk_version.serialized_data,
+                         version.serialized_data)
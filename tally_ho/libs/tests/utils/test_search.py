@@ -0,0 +1,59 @@
+"""Test libs.utils.search module."""
+from django.test import TestCase
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.tests.test_base import (
+    create_ballot,
+    create_center,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.utils.search import keyword_filter
+
+FIELDS = ('barcode', 'station_number', 'center__office__name')
+
+
+class TestSearch(TestCase):
+    def setUp(self):
+        tally = create_tally()
+        ballot = create_ballot(tally)
+        self.north = create_result_form(
+            barcode='1001',
+            serial_number=1,
+            ballot=ballot,
+            center=create_center('1', office_name='North', tally=tally),
+            station_number=7,
+            tally=tally)
+        self.south = create_result_form(
+            barcode='2002',
+            serial_number=2,
+            ballot=ballot,
+            center=create_center('2', office_name='South', tally=tally),
+            station_number=3,
+            tally=tally)
+
+    def search(self, keyword):
+        return set(ResultForm.objects.filter(
+            keyword_filter(ResultForm, keyword, FIELDS)))
+
+    def test_keyword_filter(self):
+        self.assertEqual(self.search('nor'), {self.north})
+        self.assertEqual(self.search('00'), {self.north, self.south})
+        self.assertEqual(self.search('3'), {self.south})
+        self.assertEqual(self.search('west'), set())
+
+    def test_numbers_only_match_digits(self):
+        q = keyword_filter(ResultForm, 'north', FIELDS)
+
+        self.assertNotIn('station_number', str(q))
+        self.assertEqual(
+            set(ResultForm.objects.filter(
+                keyword_filter(ResultForm, 'x', ('station_number',)))),
+            set())
+
+    def test_related_fields_are_searched_in_subqueries(self):
+        sql = str(ResultForm.objects.filter(
+            keyword_filter(ResultForm, 'north', FIELDS)).query)
+
+        self.assertNotIn('JOIN', sql)
+        self.assertIn('"tally_resultform"."center_id" IN (SELECT', sql)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from tracking.models import Pageview, Visitor
+
+from tally_ho.libs.utils.visitor_tracking import MemoryBuffer, write_events
+
+
+def event(session_key, view_time, user_id=None, pageview=True):
+    return {
+        'session_key': session_key,
+        'user_id': user_id,
+        'ip_address': '127.0.0.1',
+        'user_agent': 'agent',
+        'expiry_age': 3600,
+        'expiry_time': (view_time + timedelta(hours=1)).isoformat(),
+        'view_time': view_time.isoformat(),
+        'pageview': {
+            'url': '/',
+            'method': 'GET',
+            'referer': None,
+            'query_string': None,
+        } if pageview else None,
+    }
+
+
+class TestVisitorTracking(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username='bob')
+        self.start = timezone.now()
+
+    def test_write_events_merges_events_per_session(self):
+        events = [
+            event('a', self.start),
+            event('a', self.start + timedelta(seconds=30), self.user.id),
+            event('b', self.start, pageview=False),
+        ]
+
+        with self.assertNumQueries(5):
+            self.assertEqual(write_events(events), 3)
+
+        visitor = Visitor.objects.get(pk='a')
+        self.assertEqual(visitor.user, self.user)
+        self.assertEqual(visitor.start_time, self.start)
+        self.assertEqual(visitor.time_on_site, 30)
+        self.assertEqual(visitor.pageviews.count(), 2)
+        self.assertEqual(Pageview.objects.filter(visitor_id='b').count(), 0)
+
+    def test_write_events_keeps_existing_visitor_user(self):
+        Visitor.objects.create(session_key='a', user=self.user,
+                               ip_address='127.0.0.1',
+                               start_time=self.start)
+
+        write_events([event('a', self.start + timedelta(seconds=10))])
+
+        visitor = Visitor.objects.get(pk='a')
+        self.assertEqual(visitor.user, self.user)
+        self.assertEqual(visitor.time_on_site, 10)
+
+    def test_memory_buffer_flushes_when_full(self):
+        buffer = MemoryBuffer(size=2, flush_interval=60)
+
+        buffer.push(event('a', self.start))
+        self.assertFalse(Pageview.objects.exists())
+
+        buffer.push(event('a', self.start))
+        self.assertEqual(Pageview.objects.count(), 2)
+        self.assertEqual(buffer.events, [])
@@ -0,0 +1,93 @@
+from django.test import override_settings
+
+from tally_ho.apps.tally.models.sub_constituency import SubConstituency
+from tally_ho.libs.reports.ballot_topology import get_ballot_topology
+from tally_ho.libs.tests.test_base import (
+    LOCMEM_CACHES,
+    TestBase,
+    create_ballot,
+    create_candidate,
+    create_office,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.utils.cache import get_cache
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestBallotTopology(TestBase):
+    def setUp(self):
+        get_cache().clear()
+        self.tally = create_tally()
+        self.office = create_office(tally=self.tally)
+        self.general = create_ballot(self.tally, number=1)
+        self.component = create_ballot(self.tally, number=2)
+        SubConstituency.objects.create(
+            code=1,
+            ballot_general=self.general,
+            ballot_component=self.component,
+            tally=self.tally)
+        self.general_candidates = [
+            create_candidate(self.general, f'general {i}', tally=self.tally)
+            for i in range(2)
+        ]
+        self.component_candidate = create_candidate(
+            self.component, 'component', tally=self.tally, active=False)
+        self.result_form = create_result_form(
+            ballot=self.general, office=self.office, tally=self.tally)
+
+    def test_get_ballot_topology(self):
+        with self.assertNumQueries(3):
+            topology = get_ballot_topology(self.tally.pk)
+
+        general_ids = [candidate.pk for candidate in self.general_candidates]
+        component_id = self.component_candidate.pk
+
+        self.assertEqual(topology.component_ballots,
+                         {self.general.pk: (self.component.pk,)})
+        self.assertEqual(topology.general_ballots,
+                         {self.component.pk: [self.general.pk]})
+        self.assertEqual(topology.candidate_ids(self.general.pk),
+                         general_ids)
+        self.assertEqual(
+            topology.candidate_ids(self.component.pk, active_only=True), [])
+        self.assertEqual(topology.form_candidate_ids(self.general.pk),
+                         general_ids + [component_id])
+        self.assertEqual(topology.office_candidate_ids(self.office.pk),
+                         sorted(general_ids + [component_id]))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_ballot_topology(self.tally.pk), topology)
+
+    def test_setup_edits_invalidate_topology(self):
+        get_ballot_topology(self.tally.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            candidate = create_candidate(
+                self.general, 'new', tally=self.tally)
+
+        self.assertIn(candidate.pk, get_ballot_topology(
+            self.tally.pk).candidate_ids(self.general.pk))
+
+        other_office = create_office(name='other', tally=self.tally)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.result_form.office = other_office
+            self.result_form.save()
+
+        topology = get_ballot_topology(self.tally.pk)
+
+        self.assertEqual(topology.office_candidate_ids(self.office.pk), [])
+        self.assertEqual(
+            topology.office_ballots, {other_office.pk: (self.general.pk,)})
+
+    def test_saving_a_form_keeps_topology(self):
+        topology = get_ballot_topology(self.tally.pk)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.result_form.save()
+
+        self.assertEqual(callbacks, [])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_ballot_topology(self.tally.pk), topology)
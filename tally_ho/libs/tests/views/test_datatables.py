@@ -0,0 +1,159 @@
+import json
+
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.views.data.form_list_view import FormListDataView
+from tally_ho.libs.permissions import groups
+from tally_ho.libs.tests.test_base import (
+    LOCMEM_CACHES,
+    TestBase,
+    create_ballot,
+    create_center,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.utils.cache import get_cache
+from tally_ho.libs.views.datatables import keyset_after
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestKeysetDatatableView(TestBase):
+    def setUp(self):
+        get_cache().clear()
+        self.factory = RequestFactory()
+        self._create_permission_groups()
+        self._create_and_login_user()
+        self._add_user_to_group(self.user, groups.SUPER_ADMINISTRATOR)
+        self.tally = create_tally()
+        self.tally.users.add(self.user)
+        ballot = create_ballot(self.tally)
+        centers = [create_center(code=str(code), tally=self.tally)
+                   for code in (3, 1, 2)]
+
+        for i in range(9):
+            create_result_form(
+                barcode=f'{i:09d}',
+                serial_number=i,
+                ballot=ballot,
+                # Forms without a center sort last, or first descending.
+                center=centers[i % 3] if i % 4 else None,
+                station_number=i % 2,
+                tally=self.tally)
+
+    def get_page(self, start, length, column=0, direction='asc'):
+        request = self.factory.post('/', data={
+            'start': start,
+            'length': length,
+            'order[0][column]': column,
+            'order[0][dir]': direction,
+            'draw': 1,
+        })
+        request.user = self.user
+        response = FormListDataView.as_view()(
+            request, tally_id=self.tally.pk)
+
+        return json.loads(response.content)
+
+    def test_keyset_after(self):
+        for ordering in (['center__code', 'station_number', 'pk'],
+                         ['-center__code', '-station_number', 'pk']):
+            keyset = [(name.lstrip('-'), name.startswith('-'), True)
+                      for name in ordering[:-1]] + [('pk', False, False)]
+            fields = [name for name, _, _ in keyset]
+            rows = list(ResultForm.objects.filter(tally=self.tally)
+                        .order_by(*ordering).values_list(*fields))
+
+            for i, row in enumerate(rows):
+                after = ResultForm.objects.filter(tally=self.tally)\
+                    .filter(keyset_after(keyset, row))\
+                    .order_by(*ordering).values_list(*fields)
+
+                self.assertEqual(list(after), rows[i + 1:])
+
+    def test_pages_match_offset_pages(self):
+        for column, direction in ((1, 'asc'), (1, 'desc'), (0, 'desc')):
+            barcodes = [
+                row[0] for row in self.get_page(
+                    0, -1, column, direction)['data']]
+
+            self.assertEqual(len(barcodes), 9)
+
+            for start in range(0, 9, 2):
+                page = self.get_page(start, 2, column, direction)
+
+                self.assertEqual(
+                    [row[0] for row in page['data']],
+                    barcodes[start:start + 2])
+                self.assertEqual(page['recordsFiltered'], 9)
+
+    def test_next_page_seeks_without_offset(self):
+        self.get_page(0, 3, 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            page = self.get_page(3, 3, 1)
+
+        self.assertEqual(len(page['data']), 3)
+        self.assertFalse(any('OFFSET' in query['sql']
+                             for query in queries.captured_queries))
+
+    def test_counts_are_cached(self):
+        self.get_page(0, 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get_page(3, 3)
+
+        self.assertFalse(any('COUNT(' in query['sql']
+                             for query in queries.captured_queries))
+
+    def test_page_queries_do_not_grow_with_rows(self):
+        self.get_page(0, 3)
+        self.get_page(0, 9)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get_page(0, 3)
+
+        with CaptureQueriesContext(connection) as more_queries:
+            self.get_page(0, 9)
+
+        self.assertEqual(len(more_queries), len(queries))
+
+    @override_settings(DATATABLE_ESTIMATED_COUNT_MIN=0)
+    def test_tally_count_is_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE tally_resultform')
+
+        view = FormListDataView()
+        view.kwargs = {'tally_id': self.tally.pk}
+        qs = ResultForm.objects.filter(tally=self.tally)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = view.count_records(qs)
+
+        self.assertEqual(count, view.estimate_count(qs))
+        self.assertEqual(len(queries), 1)
+        self.assertIn('EXPLAIN', queries.captured_queries[0]['sql'])
+
+    @override_settings(DATATABLE_ESTIMATED_COUNT_MIN=0)
+    def test_searched_count_is_not_estimated(self):
+        view = FormListDataView()
+        view.kwargs = {'tally_id': self.tally.pk}
+        view.request = RequestFactory().post('/', {'search[value]': '1'})
+        qs = ResultForm.objects.filter(tally=self.tally)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = view.count_records(qs)
+
+        self.assertEqual(count, qs.count())
+        self.assertNotIn('EXPLAIN', queries.captured_queries[0]['sql'])
+
+    def test_get_select_related(self):
+        view = FormListDataView()
+        view._columns = view.columns
+
+        self.assertEqual(
+            view.get_select_related(ResultForm),
+            ['ballot__electrol_race', 'center__office__region',
+             'center__sub_constituency', 'office'])
@@ -1,4 +1,5 @@
 import csv
+import json
 import os
 
 
@@ -20,11 +21,14 @@ from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.apps.tally.models.pvp_submission import PvpSubmission
 from tally_ho.apps.tally.models.pvp_upload_bundle import PvpUploadBundle
 from tally_ho.libs.models.enums.pvp_mode import PvpMode
+from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.libs.views.exports import (
     build_candidate_results_output,
     build_result_and_recon_output,
     export_candidate_votes,
+    ndjson_response,
     save_barcode_results,
+    stream_queryset,
 )
 
 
@@ -555,3 +559,26 @@ class TestPvpExportColumns(TestBase):
         self.tally.save()
         out = build_candidate_results_output(rf)
         self.assertEqual(out["pvp_mode_applied"], "DE1_ONLY")
+
+
+class TestNdjsonExports(TestBase):
+    def test_ndjson_response_streams_queryset_rows(self):
+        tally = create_tally()
+
+        for barcode in ('1', '2'):
+            create_result_form(
+                barcode=barcode, serial_number=int(barcode), tally=tally)
+
+        response = ndjson_response(
+            stream_queryset(
+                ResultForm.objects.filter(tally=tally)
+                .order_by('barcode').values('barcode', 'created_date'),
+                chunk_size=1),
+            'forms.ndjson')
+
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="forms.ndjson"')
+        rows = [json.loads(line) for line in response.streaming_content]
+        self.assertEqual([row['barcode'] for row in rows], ['1', '2'])
+        self.assertIsInstance(rows[0]['created_date'], str)
@@ -0,0 +1,130 @@
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.tests.test_base import (
+    LOCMEM_CACHES,
+    TestBase,
+    create_ballot,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.utils.cache import get_cache
+from tally_ho.libs.views.pagination import dump_cursor, seek_paging
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestSeekPaging(TestBase):
+    def setUp(self):
+        get_cache().clear()
+        self.factory = RequestFactory()
+        self.tally = create_tally()
+        ballot = create_ballot(self.tally)
+
+        for i in range(7):
+            create_result_form(
+                barcode=f'{i:09d}',
+                serial_number=i,
+                ballot=ballot,
+                # Repeated station numbers sort by primary key.
+                station_number=i % 2,
+                tally=self.tally)
+
+        self.forms = ResultForm.objects.filter(tally=self.tally)
+
+    def get_page(self, objects_list, cursor=None, **kwargs):
+        request = self.factory.get(
+            '/', {'page': cursor} if cursor else {})
+
+        return seek_paging(objects_list, request, per_page=3, **kwargs)
+
+    def barcodes(self, page):
+        return [result_form.barcode for result_form in page]
+
+    def test_pages_do_not_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.get_page(self.forms.order_by('barcode'))
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('COUNT', queries[0]['sql'])
+        self.assertIn('LIMIT 4', queries[0]['sql'])
+        self.assertEqual(self.barcodes(page),
+                         ['000000000', '000000001', '000000002'])
+        self.assertEqual(page.number, 1)
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertIsNone(page.num_pages)
+
+    def test_next_and_previous_pages(self):
+        forms = self.forms.order_by('-station_number')
+        expected = list(forms.order_by('-station_number', 'pk')
+                        .values_list('barcode', flat=True))
+        page = self.get_page(forms)
+        pages = [self.barcodes(page)]
+
+        while page.has_next():
+            page = self.get_page(forms, page.next_cursor)
+            pages.append(self.barcodes(page))
+
+        self.assertEqual(page.number, 3)
+        self.assertEqual(pages, [expected[0:3], expected[3:6], expected[6:]])
+
+        page = self.get_page(forms, page.previous_cursor)
+
+        self.assertEqual(page.number, 2)
+        self.assertEqual(self.barcodes(page), expected[3:6])
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        page = self.get_page(forms, page.previous_cursor)
+
+        self.assertEqual(page.number, 1)
+        self.assertEqual(self.barcodes(page), expected[0:3])
+        self.assertFalse(page.has_previous())
+
+    def test_invalid_cursor_reads_first_page(self):
+        forms = self.forms.order_by('barcode')
+
+        for cursor in ('1', 'bad:cursor', dump_cursor({'n': 2, 'k': [1]})):
+            page = self.get_page(forms, cursor)
+
+            self.assertEqual(page.number, 1)
+            self.assertEqual(self.barcodes(page)[0], '000000000')
+
+    def test_unordered_keys_are_paged_with_offset(self):
+        forms = self.forms.order_by('barcode').values_list(
+            'barcode', flat=True)
+        page = self.get_page(forms)
+        page = self.get_page(forms, page.next_cursor)
+
+        self.assertEqual(list(page), ['000000003', '000000004', '000000005'])
+        self.assertEqual(page.number, 2)
+        self.assertTrue(page.has_previous())
+
+    def test_count_is_cached(self):
+        forms = self.forms.order_by('barcode')
+        page = self.get_page(forms, tally_id=self.tally.pk)
+
+        self.assertEqual(page.count, 7)
+        self.assertEqual(page.num_pages, 3)
+
+        create_result_form(barcode='000000007', serial_number=7,
+                           tally=self.tally)
+
+        with CaptureQueriesContext(connection) as queries:
+            page = self.get_page(forms, page.next_cursor,
+                                 tally_id=self.tally.pk)
+
+        self.assertEqual(page.count, 7)
+        self.assertFalse(any('COUNT' in query['sql'] for query in queries))
+
+    def test_single_page_is_counted_from_its_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.get_page(self.forms.filter(barcode='000000001')
+                                 .order_by('barcode'),
+                                 tally_id=self.tally.pk)
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(page.count, 1)
+        self.assertFalse(page.has_other_pages())
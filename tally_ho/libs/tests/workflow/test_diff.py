@@ -0,0 +1,90 @@
+"""Tests for the result form data entry differences."""
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    create_ballot,
+    create_candidate,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.workflow.diff import (
+    ResultsDiff,
+    diff_result_form,
+    diff_results,
+    election_level_results,
+)
+
+
+class TestDiff(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.tally = create_tally()
+        self.ballot = create_ballot(self.tally)
+        self.candidates = [
+            create_candidate(self.ballot, f'candidate {i}', tally=self.tally)
+            for i in range(2)
+        ]
+        self.result_forms = [
+            create_result_form(
+                barcode=str(i),
+                serial_number=i,
+                ballot=self.ballot,
+                tally=self.tally)
+            for i in range(2)
+        ]
+
+    def create_results(self, result_form, entry_version, votes):
+        for candidate, candidate_votes in zip(self.candidates, votes):
+            Result.objects.create(
+                result_form=result_form,
+                user=self.user,
+                candidate=candidate,
+                votes=candidate_votes,
+                entry_version=entry_version)
+
+    def test_diff_results(self):
+        matching, mismatching = self.result_forms
+        self.create_results(matching, EntryVersion.DATA_ENTRY_1, [1, 2])
+        self.create_results(matching, EntryVersion.DATA_ENTRY_2, [1, 2])
+        self.create_results(matching, EntryVersion.FINAL, [1, 2])
+        self.create_results(mismatching, EntryVersion.DATA_ENTRY_1, [3, 4])
+        self.create_results(mismatching, EntryVersion.DATA_ENTRY_2, [3, 5])
+
+        with self.assertNumQueries(1):
+            diffs = diff_results(election_level_results(Result.objects.all()))
+
+        first, second = [candidate.pk for candidate in self.candidates]
+        self.assertTrue(diffs[matching.pk].entries_match)
+        self.assertEqual(diffs[matching.pk].final, {first: [1], second: [2]})
+        self.assertFalse(diffs[mismatching.pk].entries_match)
+        self.assertEqual(
+            diffs[mismatching.pk].split(),
+            ([{'candidate': first, 'votes': 3}],
+             [{'candidate': second, 'votes': 5}]))
+
+    def test_diff_result_form_counts(self):
+        result_form = self.result_forms[0]
+
+        self.assertEqual(
+            diff_result_form(result_form, Result.objects.all()),
+            ResultsDiff())
+
+        self.create_results(result_form, EntryVersion.DATA_ENTRY_1, [1, 2])
+        self.create_results(result_form, EntryVersion.DATA_ENTRY_2, [1])
+        diff = diff_result_form(result_form, Result.objects.all())
+
+        self.assertTrue(diff.double_entered)
+        self.assertFalse(diff.counts_match)
+        self.assertFalse(diff.entries_match)
+
+    def test_election_level_results(self):
+        result_form = self.result_forms[0]
+        self.create_results(result_form, EntryVersion.DATA_ENTRY_1, [1, 2])
+        Result.objects.filter(candidate=self.candidates[0]).update(
+            active=False)
+
+        self.assertEqual(
+            list(election_level_results(Result.objects.all()).values_list(
+                'candidate', flat=True)),
+            [self.candidates[1].pk])
@@ -0,0 +1,113 @@
+"""Tests for the result form work queues."""
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.workflow.queues import (
+    assign_result_forms,
+    claim_next_form,
+    claim_result_form,
+    queue_counts,
+    queue_forms,
+    release_claims,
+)
+from tally_ho.libs.workflow.transitions import reject_result_forms
+
+
+class TestQueues(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.user_profile = self.user.userprofile
+        self.other_user = self._create_user('other', 'password')
+        self.tally = create_tally()
+
+        for i in range(3):
+            create_result_form(
+                barcode=str(i),
+                serial_number=i,
+                form_state=FormState.DATA_ENTRY_1,
+                tally=self.tally)
+
+        self.queue = queue_forms(self.tally.pk, FormState.DATA_ENTRY_1)
+
+    def test_claim_next_form(self):
+        result_form = claim_next_form(self.queue, self.user_profile)
+
+        self.assertEqual(result_form.barcode, '0')
+        result_form.refresh_from_db()
+        self.assertEqual(result_form.claimed_by, self.user_profile)
+        self.assertIsNotNone(result_form.claimed_date)
+
+        # Claiming again returns the user's claimed form.
+        self.assertEqual(
+            claim_next_form(self.queue, self.user_profile), result_form)
+        # Other clerks skip it.
+        self.assertEqual(
+            claim_next_form(self.queue, self.other_user).barcode, '1')
+
+    def test_claim_next_form_empty_queue(self):
+        queue = queue_forms(self.tally.pk, FormState.AUDIT)
+
+        self.assertIsNone(claim_next_form(queue, self.user_profile))
+
+    @override_settings(WORK_QUEUE_CLAIM_SECONDS=60)
+    def test_claims_lapse(self):
+        result_form = claim_next_form(self.queue, self.other_user)
+        ResultForm.objects.filter(pk=result_form.pk).update(
+            claimed_date=timezone.now() - timedelta(seconds=61))
+
+        self.assertEqual(
+            claim_next_form(self.queue, self.user_profile), result_form)
+
+    def test_claim_result_form(self):
+        result_form = self.queue.get(barcode='1')
+
+        self.assertTrue(claim_result_form(result_form, self.other_user))
+        self.assertFalse(claim_result_form(result_form, self.user_profile))
+        self.assertTrue(claim_result_form(result_form, self.other_user))
+
+        release_claims(self.queue.filter(barcode='1'))
+
+        self.assertTrue(claim_result_form(result_form, self.user_profile))
+
+    def test_assign_result_forms(self):
+        claim_result_form(self.queue.get(barcode='2'), self.other_user)
+
+        self.assertEqual(
+            assign_result_forms(
+                self.queue.filter(barcode='2'), self.user_profile),
+            1)
+        self.assertEqual(
+            self.queue.get(barcode='2').claimed_by, self.user_profile)
+
+    def test_state_changes_release_claims(self):
+        result_form = claim_next_form(self.queue, self.user_profile)
+        result_form.form_state = FormState.DATA_ENTRY_2
+        result_form.save(update_fields=['form_state'])
+        result_form.refresh_from_db()
+
+        self.assertIsNone(result_form.claimed_by)
+
+        claim_result_form(result_form, self.user_profile)
+        reject_result_forms(ResultForm.objects.filter(pk=result_form.pk))
+        result_form.refresh_from_db()
+
+        self.assertIsNone(result_form.claimed_by)
+
+    def test_queue_counts(self):
+        claim_next_form(self.queue, self.user_profile)
+        counts = {
+            row['form_state']: (row['waiting'], row['claimed'])
+            for row in queue_counts(self.tally.pk)
+        }
+
+        self.assertEqual(counts[FormState.DATA_ENTRY_1], (3, 1))
+        self.assertEqual(counts[FormState.AUDIT], (0, 0))
@@ -0,0 +1,207 @@
+"""Tests for the set-based result form state transitions."""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tally_ho.apps.tally.models.audit import Audit
+from tally_ho.apps.tally.models.clearance import Clearance
+from tally_ho.apps.tally.models.reconciliation_form import ReconciliationForm
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_reset import ResultFormReset
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.tests.test_base import (
+    TestBase,
+    create_audit,
+    create_ballot,
+    create_candidate,
+    create_reconciliation_form,
+    create_result,
+    create_result_form,
+    create_tally,
+)
+from tally_ho.libs.workflow.queues import claim_result_form
+from tally_ho.libs.workflow.transitions import (
+    promote_matching_forms,
+    reject_result_forms,
+    reset_result_forms,
+)
+
+
+class TestTransitions(TestBase):
+    def setUp(self):
+        self._create_and_login_user()
+        self.user_profile = self.user.userprofile
+        self.tally = create_tally()
+        self.ballot = create_ballot(self.tally)
+        self.candidate = create_candidate(
+            self.ballot, 'candidate', tally=self.tally)
+
+    def create_result_forms(self, count, form_state=FormState.ARCHIVED,
+                            start=0):
+        for i in range(start, start + count):
+            result_form = create_result_form(
+                barcode=str(i),
+                serial_number=i,
+                ballot=self.ballot,
+                form_state=form_state,
+                tally=self.tally)
+            create_result(result_form, self.candidate, self.user, votes=1)
+            create_reconciliation_form(result_form, self.user)
+
+        return ResultForm.objects.filter(tally=self.tally)
+
+    def test_reject_result_forms(self):
+        result_forms = self.create_result_forms(2)
+
+        self.assertEqual(
+            reject_result_forms(
+                result_forms,
+                new_state=FormState.CLEARANCE,
+                user=self.user_profile,
+                reject_reason='Duplicate results'),
+            2)
+
+        self.assertFalse(Result.objects.filter(active=True).exists())
+        self.assertFalse(
+            ReconciliationForm.objects.filter(active=True).exists())
+
+        for result_form in result_forms:
+            self.assertEqual(result_form.form_state, FormState.CLEARANCE)
+            self.assertEqual(
+                result_form.previous_form_state, FormState.ARCHIVED)
+            self.assertEqual(result_form.rejected_count, 1)
+            self.assertEqual(result_form.reject_reason, 'Duplicate results')
+            self.assertEqual(result_form.user, self.user_profile)
+            self.assertTrue(result_form.clearances.filter(
+                active=True, user=self.user_profile).exists())
+
+        self.assertEqual(
+            list(ResultFormTransition.objects.filter(
+                result_form__tally=self.tally,
+                to_state=FormState.CLEARANCE,
+            ).values_list('from_state', 'user')),
+            [(FormState.ARCHIVED, self.user_profile.pk)] * 2)
+
+    def test_reject_keeps_existing_audits(self):
+        result_forms = self.create_result_forms(2)
+        create_audit(result_forms.get(barcode='0'), self.user)
+
+        reject_result_forms(
+            result_forms, new_state=FormState.AUDIT, user=self.user_profile)
+
+        self.assertEqual(Audit.objects.filter(active=True).count(), 2)
+        self.assertFalse(Clearance.objects.exists())
+
+    def test_reject_queries_do_not_grow_with_forms(self):
+        self.create_result_forms(2)
+
+        with CaptureQueriesContext(connection) as few_forms:
+            reject_result_forms(ResultForm.objects.filter(tally=self.tally))
+
+        self.create_result_forms(
+            6, form_state=FormState.DATA_ENTRY_2, start=2)
+
+        with CaptureQueriesContext(connection) as many_forms:
+            reject_result_forms(ResultForm.objects.filter(tally=self.tally))
+
+        self.assertEqual(len(many_forms), len(few_forms))
+
+    def test_reset_result_forms(self):
+        result_forms = self.create_result_forms(2)
+        create_audit(result_forms.get(barcode='0'), self.user)
+
+        self.assertEqual(
+            reset_result_forms(result_forms, self.user_profile, 'Reset'), 2)
+
+        self.assertFalse(Result.objects.filter(active=True).exists())
+        self.assertFalse(Audit.objects.filter(active=True).exists())
+        self.assertEqual(
+            set(result_forms.values_list('form_state', flat=True)),
+            {FormState.UNSUBMITTED})
+        self.assertEqual(
+            ResultFormReset.objects.filter(
+                tally=self.tally, reason='Reset').count(),
+            2)
+
+    def test_reject_without_forms(self):
+        self.assertEqual(
+            reject_result_forms(ResultForm.objects.filter(tally=self.tally)),
+            0)
+
+    def create_entries(self, result_form, votes_1, votes_2, voters=(1, 1)):
+        for entry_version, votes, number_of_voters in (
+                (EntryVersion.DATA_ENTRY_1, votes_1, voters[0]),
+                (EntryVersion.DATA_ENTRY_2, votes_2, voters[1])):
+            Result.objects.create(
+                result_form=result_form,
+                user=self.user_profile,
+                candidate=self.candidate,
+                votes=votes,
+                entry_version=entry_version)
+            create_reconciliation_form(
+                result_form,
+                self.user_profile,
+                entry_version=entry_version,
+                number_of_voters=number_of_voters)
+
+    def test_promote_matching_forms(self):
+        result_forms = self.create_result_forms(
+            5, form_state=FormState.CORRECTION)
+        ResultForm.objects.update(user=self.user_profile)
+        Result.objects.update(active=False)
+        ReconciliationForm.objects.update(active=False)
+        matching, mismatching, mismatching_recon, claimed, no_recon = [
+            result_forms.get(barcode=str(i)) for i in range(5)]
+        self.create_entries(matching, 3, 3)
+        self.create_entries(mismatching, 3, 4)
+        self.create_entries(mismatching_recon, 3, 3, voters=(1, 2))
+        self.create_entries(claimed, 3, 3)
+        claim_result_form(claimed, self.user_profile)
+        Result.objects.create(
+            result_form=no_recon,
+            user=self.user_profile,
+            candidate=self.candidate,
+            votes=5,
+            entry_version=EntryVersion.DATA_ENTRY_1)
+        Result.objects.create(
+            result_form=no_recon,
+            user=self.user_profile,
+            candidate=self.candidate,
+            votes=5,
+            entry_version=EntryVersion.DATA_ENTRY_2)
+
+        self.assertEqual(
+            promote_matching_forms(self.tally.pk, batch_size=2), 2)
+
+        self.assertEqual(
+            dict(result_forms.values_list('barcode', 'form_state')),
+            {'0': FormState.QUALITY_CONTROL,
+             '1': FormState.CORRECTION,
+             '2': FormState.CORRECTION,
+             '3': FormState.CORRECTION,
+             '4': FormState.QUALITY_CONTROL})
+        matching.refresh_from_db()
+        self.assertEqual(matching.previous_form_state, FormState.CORRECTION)
+        self.assertIsNone(matching.user)
+        self.assertEqual(
+            list(matching.results_final.values_list('candidate', 'votes')),
+            [(self.candidate.pk, 3)])
+        recon_form = matching.reconciliationform_set.get(
+            active=True, entry_version=EntryVersion.FINAL)
+        self.assertEqual(recon_form.user, self.user_profile)
+        self.assertFalse(no_recon.reconciliationform_set.filter(
+            active=True).exists())
+        self.assertEqual(
+            list(ResultFormTransition.objects.filter(
+                to_state=FormState.QUALITY_CONTROL,
+            ).order_by('result_form').values_list(
+                'result_form__barcode', 'from_state', 'user')),
+            [('0', FormState.CORRECTION, None),
+             ('4', FormState.CORRECTION, None)])
+
+        # Promoted forms are not promoted again.
+        self.assertEqual(promote_matching_forms(self.tally.pk), 0)
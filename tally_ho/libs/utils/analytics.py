@@ -0,0 +1,429 @@
+"""Columnar analytics over snapshots of the tally tables.
+
+Reports scan and aggregate whole tallies, which Postgres answers row by
+row on the server that also takes the writes of data entry.
+``take_snapshot`` exports the tables the reports read, ``SNAPSHOT_MODELS``,
+in one repeatable read transaction, to a Parquet file per table. ``fetch``
+and ``count`` run the SQL Django compiles for a ``values()`` queryset on
+the latest snapshot with DuckDB, which scans the columns a query reads on
+all cores.
+
+DuckDB runs the SQL Django wrote for Postgres as it is, and the two differ
+on collation, ``LIKE`` escapes and more, so a statement can run and return
+other rows. Only querysets passed with ``from_snapshot=True`` read a
+snapshot, and each of those call sites is tested to read the same rows
+from both. Querysets ordered by text read the database, as DuckDB does not
+collate text like Postgres.
+
+Reports read a snapshot only while it is at most
+``ANALYTICS_SNAPSHOT_MAX_AGE`` seconds old, and read the database
+otherwise, or when DuckDB cannot run a statement. The
+``snapshot_analytics`` task takes a snapshot every
+``ANALYTICS_SNAPSHOT_INTERVAL`` seconds, see ``CELERY_BEAT_SCHEDULE``.
+
+Datetimes are stored in UTC without a time zone, as DuckDB needs pytz to
+return time zone aware values, and made aware again when read.
+"""
+import datetime
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+
+import duckdb
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, FieldError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.query import ValuesIterable
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_MAX_AGE = 600
+# The tables the reports reading snapshots join. Users, sessions and
+# permissions are never exported.
+SNAPSHOT_MODELS = (
+    'tally.Ballot',
+    'tally.Candidate',
+    'tally.Center',
+    'tally.Constituency',
+    'tally.ElectrolRace',
+    'tally.Office',
+    'tally.ReconciliationForm',
+    'tally.Region',
+    'tally.Result',
+    'tally.ResultForm',
+    'tally.Station',
+    'tally.SubConstituency',
+)
+# Older snapshots are kept for queries still reading them.
+SNAPSHOTS_KEPT = 2
+CURRENT_SNAPSHOT_FILE = 'current.json'
+# Statements DuckDB failed to run, read from the database from then on.
+MAX_UNSUPPORTED_STATEMENTS = 1000
+
+TEXT_FIELDS = {'CharField', 'EmailField', 'SlugField', 'TextField'}
+
+# Postgres types DuckDB reads as they are, other types are read as text.
+DUCKDB_TYPES = {
+    'bigint',
+    'boolean',
+    'date',
+    'double precision',
+    'integer',
+    'numeric',
+    'real',
+    'smallint',
+    'text',
+    'time',
+    'uuid',
+    'varchar',
+}
+
+_PLACEHOLDER = re.compile(r'%([s%])')
+
+_local = threading.local()
+_unsupported_statements = set()
+
+
+def _quote(value):
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def get_snapshot_dir():
+    return getattr(settings, 'ANALYTICS_SNAPSHOT_DIR', None) or\
+        os.path.join(settings.BASE_DIR, '..', 'data', 'analytics')
+
+
+def snapshot_models():
+    """Return the models of the tables a snapshot exports."""
+    return [apps.get_model(label) for label in SNAPSHOT_MODELS]
+
+
+def _duckdb_type(field, connection):
+    db_type = field.db_type(connection) or ''
+
+    if db_type == 'timestamp with time zone':
+        return 'TIMESTAMP'
+
+    if db_type.split('(')[0] in DUCKDB_TYPES:
+        return db_type
+
+    return 'VARCHAR'
+
+
+def _export_table(cursor, duckdb_connection, model, directory):
+    """Export a model's table to a Parquet file.
+
+    :returns: The number of rows exported.
+    """
+    connection = cursor.db
+    quote_name = connection.ops.quote_name
+    table = model._meta.db_table
+    columns = []
+    types = {}
+
+    for field in model._meta.local_concrete_fields:
+        duckdb_type = _duckdb_type(field, connection)
+        column = quote_name(field.column)
+        types[field.column] = duckdb_type
+        columns.append(f"{column} AT TIME ZONE 'UTC'"
+                       if duckdb_type == 'TIMESTAMP' else column)
+
+    csv_path = os.path.join(directory, f'{table}.csv')
+
+    with open(csv_path, 'wb') as csv_file:
+        with cursor.copy(
+                f'COPY (SELECT {", ".join(columns)} FROM '
+                f'{quote_name(table)}) TO STDOUT (FORMAT csv)') as copy:
+            for data in copy:
+                csv_file.write(data)
+
+    # Columns are given rather than sniffed, which fails on empty files.
+    # Postgres writes NULL unquoted and empty strings quoted.
+    csv_columns = ', '.join(
+        f'{_quote(column)}: {_quote(duckdb_type)}'
+        for column, duckdb_type in types.items())
+    rows_count = duckdb_connection.execute(
+        f'COPY (SELECT * FROM read_csv({_quote(csv_path)}, header=false, '
+        "auto_detect=false, delim=',', quote='\"', escape='\"', "
+        f'allow_quoted_nulls=false, columns={{{csv_columns}}})) '
+        f"TO {_quote(os.path.join(directory, f'{table}.parquet'))} "
+        '(FORMAT parquet)').fetchone()[0]
+    os.remove(csv_path)
+
+    return rows_count
+
+
+def _remove_old_snapshots(root, name):
+    names = sorted(
+        entry for entry in os.listdir(root)
+        if os.path.isdir(os.path.join(root, entry)))
+
+    # Snapshots taken after this one are still being written.
+    for old_name in names[:max(names.index(name) - SNAPSHOTS_KEPT + 1, 0)]:
+        shutil.rmtree(os.path.join(root, old_name), ignore_errors=True)
+
+
+def take_snapshot(using=DEFAULT_DB_ALIAS):
+    """Export the tally tables to a new snapshot and make it current.
+
+    :param using: The database to export.
+
+    :returns: The snapshot, see ``get_snapshot``.
+    """
+    root = get_snapshot_dir()
+    created = timezone.now()
+    name = f'{created:%Y%m%dT%H%M%S.%f}-{uuid.uuid4().hex[:8]}'
+    directory = os.path.join(root, name)
+    os.makedirs(directory)
+    connection = connections[using]
+    tables = {}
+
+    try:
+        with duckdb.connect() as duckdb_connection:
+            isolate = not connection.in_atomic_block
+
+            with transaction.atomic(using=using),\
+                    connection.cursor() as cursor:
+                if isolate:
+                    # Export every table as of the same moment.
+                    cursor.execute(
+                        'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, '
+                        'READ ONLY')
+
+                for model in snapshot_models():
+                    tables[model._meta.db_table] = _export_table(
+                        cursor, duckdb_connection, model, directory)
+
+        snapshot = {
+            'name': name,
+            'created': created.isoformat(),
+            'database': connection.settings_dict['NAME'],
+            'tables': tables,
+        }
+        current_path = os.path.join(root, CURRENT_SNAPSHOT_FILE)
+
+        with open(f'{current_path}.{name}', 'w') as current_file:
+            json.dump(snapshot, current_file)
+
+        os.replace(f'{current_path}.{name}', current_path)
+    except BaseException:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+
+    _remove_old_snapshots(root, name)
+
+    return get_snapshot()
+
+
+def get_snapshot():
+    """Return the current snapshot, or None if none was taken.
+
+    :returns: A dict of the ``name``, ``created`` datetime, ``path`` of
+        the files and rows per table in ``tables`` of the snapshot.
+    """
+    root = get_snapshot_dir()
+
+    try:
+        with open(os.path.join(root, CURRENT_SNAPSHOT_FILE)) as current:
+            snapshot = json.load(current)
+    except (OSError, ValueError):
+        return None
+
+    snapshot['created'] = datetime.datetime.fromisoformat(
+        snapshot['created'])
+    snapshot['path'] = os.path.join(root, snapshot['name'])
+
+    return snapshot
+
+
+def get_fresh_snapshot(using=DEFAULT_DB_ALIAS):
+    """Return the current snapshot if reports can read it, or None.
+
+    :param using: The database the reports read.
+    """
+    max_age = getattr(settings, 'ANALYTICS_SNAPSHOT_MAX_AGE',
+                      DEFAULT_SNAPSHOT_MAX_AGE)
+
+    if not max_age:
+        return None
+
+    snapshot = get_snapshot()
+
+    if snapshot is None or\
+            snapshot['database'] !=\
+            connections[using].settings_dict['NAME'] or\
+            timezone.now() - snapshot['created'] >\
+            datetime.timedelta(seconds=max_age):
+        return None
+
+    return snapshot
+
+
+def _connect(snapshot):
+    """Return this thread's DuckDB connection to a snapshot."""
+    if getattr(_local, 'name', None) != snapshot['name']:
+        if getattr(_local, 'connection', None) is not None:
+            _local.connection.close()
+
+        _local.connection = duckdb.connect()
+        _local.name = snapshot['name']
+        # Postgres divides integers without a remainder.
+        _local.connection.execute('SET integer_division = true')
+
+        for table in snapshot['tables']:
+            path = os.path.join(snapshot['path'], f'{table}.parquet')
+            _local.connection.execute(
+                f'CREATE VIEW "{table}" AS '
+                f'SELECT * FROM read_parquet({_quote(path)})')
+
+    return _local.connection
+
+
+def _param(value):
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        return timezone.make_naive(value, datetime.timezone.utc)
+
+    return value
+
+
+def _execute(snapshot, sql, params):
+    """Run a statement Django compiled for Postgres on a snapshot.
+
+    :returns: A list of row tuples, or None if DuckDB cannot run it.
+    """
+    if sql in _unsupported_statements:
+        return None
+
+    try:
+        return _connect(snapshot).execute(
+            _PLACEHOLDER.sub(
+                lambda match: '?' if match.group(1) == 's' else '%', sql),
+            [_param(param) for param in params]).fetchall()
+    except duckdb.Error as e:
+        logger.warning(
+            'Reading from the database, the analytics snapshot cannot run '
+            '%s: %s', sql, e)
+
+        if len(_unsupported_statements) >= MAX_UNSUPPORTED_STATEMENTS:
+            _unsupported_statements.clear()
+
+        _unsupported_statements.add(sql)
+
+        return None
+
+
+def _is_datetime(expression):
+    try:
+        return expression.output_field.get_internal_type() ==\
+            'DateTimeField'
+    except (AttributeError, FieldError):
+        return False
+
+
+def _orders_by_text(compiler):
+    for order_by, _ in compiler.get_order_by():
+        try:
+            internal_type =\
+                order_by.expression.output_field.get_internal_type()
+        except (AttributeError, FieldError):
+            return True
+
+        if internal_type in TEXT_FIELDS:
+            return True
+
+    return False
+
+
+def _snapshot_rows(qs):
+    if qs._iterable_class is not ValuesIterable:
+        return None
+
+    snapshot = get_fresh_snapshot(qs.db)
+
+    if snapshot is None:
+        return None
+
+    compiler = qs.query.get_compiler(using=qs.db)
+
+    try:
+        sql, params = compiler.as_sql()
+    except EmptyResultSet:
+        return []
+
+    if _orders_by_text(compiler):
+        return None
+
+    rows = _execute(snapshot, sql, params)
+
+    if rows is None:
+        return None
+
+    fields = [select[0] for select in compiler.select[:compiler.col_count]]
+    converters = compiler.get_converters(fields)
+
+    if converters:
+        rows = compiler.apply_converters(rows, converters)
+
+    aware = [index for index, field in enumerate(fields)
+             if _is_datetime(field)] if settings.USE_TZ else []
+    names = [*qs.query.extra_select, *qs.query.values_select,
+             *qs.query.annotation_select]
+    results = []
+
+    for row in rows:
+        row = list(row)
+
+        for index in aware:
+            if row[index] is not None:
+                row[index] = row[index].replace(tzinfo=datetime.timezone.utc)
+
+        results.append(dict(zip(names, row)))
+
+    return results
+
+
+def fetch(qs, from_snapshot=False):
+    """Return the rows of a queryset, from the latest snapshot if fresh.
+
+    Only ``values()`` querysets are read from snapshots.
+
+    :param qs: A queryset.
+    :param from_snapshot: Read the snapshot, only for querysets tested to
+        read the same rows from it as from the database.
+
+    :returns: A list of the rows of the queryset.
+    """
+    rows = _snapshot_rows(qs) if from_snapshot else None
+
+    return list(qs) if rows is None else rows
+
+
+def count(qs, from_snapshot=False):
+    """Return the number of rows of a queryset, from the latest snapshot
+    if fresh.
+
+    :param qs: A queryset.
+    :param from_snapshot: Read the snapshot, only for querysets tested to
+        count the same rows in it as in the database.
+    """
+    snapshot = get_fresh_snapshot(qs.db) if from_snapshot else None
+
+    if snapshot is not None:
+        try:
+            sql, params = qs.query.get_compiler(using=qs.db).as_sql()
+        except EmptyResultSet:
+            return 0
+
+        rows = _execute(
+            snapshot, f'SELECT COUNT(*) FROM ({sql}) AS query', params)
+
+        if rows is not None:
+            return rows[0][0]
+
+    return qs.count()
@@ -0,0 +1,204 @@
+"""Caching helpers built on Django's cache framework.
+
+Cached values are scoped to a tally and grouped into namespaces, e.g.
+``REPORTS`` or ``REFERENCE_DATA``. Every key embeds a tally generation and
+a namespace generation, so invalidating is a single counter increment
+instead of a search for the keys to delete: readers switch to new keys and
+the stale entries expire on their own.
+"""
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+REPORTS = 'reports'
+REFERENCE_DATA = 'reference_data'
+DATATABLES = 'datatables'
+PAGES = 'pages'
+
+DEFAULT_TIMEOUT = 60 * 60
+IMPORT_PROGRESS_TIMEOUT = 60 * 60 * 24
+
+_metrics = Counter()
+_missing = object()
+
+
+def get_cache():
+    """Return the cache backend used for tally data."""
+    return caches[getattr(settings, 'TALLY_CACHE_ALIAS', 'default')]
+
+
+def _generation_keys(tally_id, namespace):
+    return (f'tally:{tally_id}:generation',
+            f'tally:{tally_id}:{namespace}:generation')
+
+
+def _get_generations(tally_id, namespace):
+    """Return the tally and namespace generations, creating missing ones.
+
+    Generations start from the current time rather than 0 so a generation
+    evicted from the cache never comes back with a value older keys used.
+    """
+    keys = _generation_keys(tally_id, namespace)
+    cache = get_cache()
+    generations = cache.get_many(keys)
+
+    for key in keys:
+        if key not in generations:
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key, 0)
+
+    return [generations[key] for key in keys]
+
+
+def tally_cache_key(tally_id, namespace, *parts):
+    """Build the current cache key for a value in a tally namespace.
+
+    :param tally_id: The tally the value belongs to.
+    :param namespace: The namespace the value belongs to.
+    :param parts: Values identifying the cached value in the namespace,
+        hashed so any representation makes a valid memcached key.
+
+    :returns: A cache key that changes when the tally or the namespace is
+        invalidated.
+    """
+    tally_generation, namespace_generation =\
+        _get_generations(tally_id, namespace)
+    digest = hashlib.md5(repr(parts).encode('utf-8')).hexdigest()
+
+    return 'tally:{}:{}:{}.{}:{}'.format(
+        tally_id, namespace, tally_generation, namespace_generation, digest)
+
+
+def invalidate_tally_cache(tally_id, namespace=None):
+    """Invalidate the cached values of a tally.
+
+    :param tally_id: The tally to invalidate values for.
+    :param namespace: Only invalidate this namespace, invalidate every
+        namespace of the tally if None.
+    """
+    tally_key, namespace_key = _generation_keys(tally_id, namespace)
+    key = namespace_key if namespace else tally_key
+
+    try:
+        get_cache().incr(key)
+    except ValueError:
+        # Nothing was cached under this generation yet, or it was evicted.
+        get_cache().set(key, time.time_ns(), timeout=None)
+
+    _metrics[f'{namespace or "*"}.invalidations'] += 1
+
+
+def get_or_set(tally_id, namespace, parts, func, timeout=DEFAULT_TIMEOUT):
+    """Return a cached value, computing and caching it on a miss.
+
+    :param tally_id: The tally the value belongs to.
+    :param namespace: The namespace the value belongs to.
+    :param parts: A tuple identifying the value in the namespace.
+    :param func: A callable without arguments returning the value.
+    :param timeout: Seconds to keep the value for.
+
+    :returns: The cached or computed value.
+    """
+    cache = get_cache()
+    key = tally_cache_key(tally_id, namespace, *parts)
+    value = cache.get(key, _missing)
+
+    if value is not _missing:
+        _metrics[f'{namespace}.hits'] += 1
+        return value
+
+    _metrics[f'{namespace}.misses'] += 1
+    value = func()
+    cache.set(key, value, timeout)
+
+    return value
+
+
+def tally_cached(namespace, timeout=DEFAULT_TIMEOUT):
+    """Decorate a function to read its result through the tally cache.
+
+    The decorated function must accept a ``tally_id`` argument, the other
+    arguments are part of the cache key so they must have a stable
+    ``repr``.
+
+    :param namespace: The namespace to cache results in.
+    :param timeout: Seconds to keep results for.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            tally_id = arguments.pop('tally_id')
+            parts = (func.__module__, func.__qualname__,
+                     sorted(arguments.items()))
+
+            return get_or_set(tally_id, namespace, parts,
+                              lambda: func(*args, **kwargs), timeout)
+
+        wrapper.invalidate = functools.partial(
+            invalidate_tally_cache, namespace=namespace)
+
+        return wrapper
+
+    return decorator
+
+
+def get_cache_metrics():
+    """Return this process' hit, miss and invalidation counts."""
+    return dict(_metrics)
+
+
+def reset_cache_metrics():
+    _metrics.clear()
+
+
+def cache_model_instances_count(cache_key, instances_count, done=False):
+    """Add to the count of model instances an import job has processed.
+
+    Progress reporting must never fail an import, cache errors are logged.
+
+    :param cache_key: The key the import job reports progress under.
+    :param instances_count: The number of instances processed since the
+        last call.
+    :param done: True if the import job has finished.
+    """
+    cache = get_cache()
+
+    try:
+        cache.add(cache_key, 0, timeout=IMPORT_PROGRESS_TIMEOUT)
+        cache.incr(cache_key, instances_count)
+
+        if done:
+            cache.set(f'{cache_key}_done', True,
+                      timeout=IMPORT_PROGRESS_TIMEOUT)
+    except ValueError as e:
+        logger.warning('Error caching instances count, error: %s', e)
+
+
+def get_cached_model_instances_count(cache_key):
+    """Return the progress an import job reported.
+
+    :param cache_key: The key the import job reports progress under.
+
+    :returns: A tuple of the count of processed instances and whether the
+        job is done.
+    """
+    data = get_cache().get_many([cache_key, f'{cache_key}_done'])
+
+    return data.get(cache_key, 0), data.get(f'{cache_key}_done', False)
+
+
+def delete_cached_model_instances_count(cache_key):
+    get_cache().delete_many([cache_key, f'{cache_key}_done'])
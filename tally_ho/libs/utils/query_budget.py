@@ -0,0 +1,238 @@
+"""Query counts, repeated queries and database time per view and task.
+
+``QueryBudgetMiddleware`` and the Celery task signals below record every
+query a request or task runs through a database execute wrapper. When it
+finishes, they log one JSON line to this module's logger with:
+
+- ``queries``, the number of queries,
+- ``db_ms``, the time spent in the database,
+- ``repeated``, the statements run ``QUERY_REPEAT_THRESHOLD`` times or
+  more, grouped by fingerprint. These are usually N+1 queries, a query
+  per row of a loop.
+
+Views and tasks can declare the most queries they should run with
+``query_budget``. A run over its budget, or with repeated statements, is
+logged as a warning, and raises ``QueryBudgetExceeded`` instead when
+``QUERY_BUDGET_STRICT`` is True.
+
+The wrapper only counts, times and stores the statement of each query.
+Fingerprints are computed once per distinct statement when the run ends.
+"""
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_THRESHOLD = 10
+
+_metrics = Counter()
+_task_recorders = {}
+
+_IN_LIST = re.compile(r'\bIN \((?:%s|\$\d+)(?:, (?:%s|\$\d+))*\)')
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(max_queries):
+    """Declare the most queries a view or task should run.
+
+    Decorates a function view, a class based view or a Celery task
+    function. For tasks, apply it below ``app.task``.
+
+    :param max_queries: The number of queries allowed.
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+
+        return view
+
+    return decorator
+
+
+def get_query_budget(view):
+    """Return the query budget declared on a view or task, or None."""
+    budget = getattr(view, 'query_budget', None)
+
+    if budget is None:
+        view_class = getattr(view, 'view_class', None)
+        budget = getattr(view_class, 'query_budget', None)
+
+    if budget is None:
+        run = getattr(view, 'run', None)
+        budget = getattr(run, 'query_budget', None)
+
+    return budget
+
+
+def fingerprint(sql):
+    """Return a statement with its literals and ``IN`` lists collapsed.
+
+    Statements that differ only by their parameters have the same
+    fingerprint.
+    """
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _IN_LIST.sub('IN (...)', sql)
+
+    return _LITERALS.sub('?', sql)
+
+
+class QueryRecorder(object):
+    """A database execute wrapper recording the queries of a run."""
+
+    def __init__(self, name, budget=None):
+        self.name = name
+        self.budget = budget
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    @property
+    def over_budget(self):
+        return self.budget is not None and self.count > self.budget
+
+    def repeated(self, threshold=None):
+        """Return the fingerprints run at least ``threshold`` times.
+
+        :param threshold: The number of runs, ``QUERY_REPEAT_THRESHOLD``
+            by default.
+
+        :returns: A list of ``(fingerprint, count)``, most run first.
+        """
+        if threshold is None:
+            threshold = getattr(settings, 'QUERY_REPEAT_THRESHOLD',
+                                DEFAULT_REPEAT_THRESHOLD)
+
+        fingerprints = Counter()
+        for sql, count in self.statements.items():
+            fingerprints[fingerprint(sql)] += count
+
+        return [(sql, count) for sql, count in fingerprints.most_common()
+                if count >= threshold]
+
+    def report(self, repeated=None):
+        """Return the JSON serializable summary of the run."""
+        if repeated is None:
+            repeated = self.repeated()
+
+        return {
+            'name': self.name,
+            'queries': self.count,
+            'db_ms': round(self.seconds * 1000, 3),
+            'budget': self.budget,
+            'repeated': [
+                {
+                    'fingerprint': hashlib.md5(sql.encode()).hexdigest()[:12],
+                    'count': count,
+                    'sql': sql[:500],
+                }
+                for sql, count in repeated
+            ],
+        }
+
+
+def finish(recorder, strict=None):
+    """Log the queries of a run and enforce its budget.
+
+    :param recorder: The ``QueryRecorder`` of the run.
+    :param strict: True to raise ``QueryBudgetExceeded`` when the run is
+        over budget, ``QUERY_BUDGET_STRICT`` by default.
+    """
+    if strict is None:
+        strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+
+    _metrics[f'{recorder.name}.runs'] += 1
+    _metrics[f'{recorder.name}.queries'] += recorder.count
+
+    repeated = recorder.repeated()
+    problem = recorder.over_budget or repeated
+
+    if problem:
+        _metrics[f'{recorder.name}.over_budget'] += recorder.over_budget
+        _metrics[f'{recorder.name}.repeated'] += bool(repeated)
+
+    level = logging.WARNING if problem else logging.INFO
+
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps(recorder.report(repeated)))
+
+    if strict and recorder.over_budget:
+        raise QueryBudgetExceeded(
+            f'{recorder.name} ran {recorder.count} queries, its budget is '
+            f'{recorder.budget}')
+
+
+@contextmanager
+def record_queries(name, budget=None, strict=None, using=DEFAULT_DB_ALIAS):
+    """Record, log and enforce the budget of the queries of a block.
+
+    :param name: The name the run is logged as.
+    :param budget: The number of queries allowed, None for no budget.
+    :param strict: True to raise ``QueryBudgetExceeded`` when the block is
+        over budget, ``QUERY_BUDGET_STRICT`` by default.
+    :param using: The database alias to record.
+    """
+    recorder = QueryRecorder(name, budget)
+
+    with connections[using].execute_wrapper(recorder):
+        yield recorder
+
+    finish(recorder, strict=strict)
+
+
+def is_enabled():
+    return getattr(settings, 'QUERY_INSTRUMENTATION', False)
+
+
+@task_prerun.connect(dispatch_uid='query_budget_task_prerun')
+def start_task_recording(task_id=None, task=None, **kwargs):
+    if not is_enabled():
+        return
+
+    recorder = QueryRecorder(task.name, get_query_budget(task))
+    wrapper = connections[DEFAULT_DB_ALIAS].execute_wrapper(recorder)
+    wrapper.__enter__()
+    _task_recorders[task_id] = (recorder, wrapper)
+
+
+@task_postrun.connect(dispatch_uid='query_budget_task_postrun')
+def finish_task_recording(task_id=None, **kwargs):
+    recorder, wrapper = _task_recorders.pop(task_id, (None, None))
+
+    if recorder is None:
+        return
+
+    wrapper.__exit__(None, None, None)
+    # Raising here would not fail the task, which has already returned.
+    finish(recorder, strict=False)
+
+
+def get_query_metrics():
+    """Return this process' run, query and problem counts per name."""
+    return dict(_metrics)
+
+
+def reset_query_metrics():
+    _metrics.clear()
@@ -9,9 +9,7 @@ from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.candidate import Candidate
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
-from tally_ho.libs.utils.cache_model_instances_count_to_memcache import (
-    cache_model_instances_count_to_memcache
-)
+from tally_ho.libs.utils.cache import cache_model_instances_count
 
 
 class Cast(Func):
@@ -157,11 +155,9 @@ class BulkCreateManager(object):
             chunk_size=None,
             cache_instances_count=False,
             cache_key=None,
-            memcache_client=None,
         ):
         self.create_queues = defaultdict(list)
         self.cache_instances_count = cache_instances_count
-        self.memcache_client = memcache_client
         self.cache_key = cache_key
         self.default_chunk_size = 500
         self.objs_count = objs_count
@@ -178,10 +174,9 @@ class BulkCreateManager(object):
     def _commit(self, model_class, objs, last_chunk=False):
         instances = model_class.objects.bulk_create(objs)
         if self.cache_instances_count:
-            cache_model_instances_count_to_memcache(
+            cache_model_instances_count(
                 self.cache_key, len(instances),
-                done=last_chunk or self.objs_count is not None,
-                memcache_client=self.memcache_client)
+                done=last_chunk or self.objs_count is not None)
         return instances
 
     def add(self, obj):
@@ -224,13 +219,11 @@ class BulkUpdateManyToManyManager(object):
             instances_count=None,
             chunk_size=None,
             cache_instances_count=False,
-            memcache_client=None,
             cache_key=None):
         self._queue = defaultdict(list)
         self.default_chunk_size = 100
         self.cache_instances_count = cache_instances_count
         self.instances_count = instances_count
-        self.memcache_client = memcache_client
         self.cache_key = cache_key
         self.chunk_size =\
             chunk_size or self._calculate_chuck_size()
@@ -254,11 +247,10 @@ class BulkUpdateManyToManyManager(object):
                             many_to_many_field_name).set(
                         many_to_many_obj.get(many_to_many_field_name))
             if self.cache_instances_count:
-                cache_model_instances_count_to_memcache(
+                cache_model_instances_count(
                     self.cache_key,
                     len(instances_list),
-                    done=last_chunk or self.instances_count is not None,
-                    memcache_client=self.memcache_client)
+                    done=last_chunk or self.instances_count is not None)
 
     def add(self, instance_obj=None):
         model_key = instance_obj.get('instance')._meta.label
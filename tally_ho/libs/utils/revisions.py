@@ -0,0 +1,125 @@
+"""Scoped django-reversion revisions.
+
+Revisions are not created for every request. Views that move a result
+form through the workflow opt in with ``reversion.views.RevisionMixin``,
+and batch writes record their objects with ``bulk_create_revision``.
+Models listed in ``REVERSION_EXCLUDED_MODELS`` are never versioned, see
+``docs/operations/revisions.md``.
+"""
+import reversion
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.db import router, transaction
+from django.utils import timezone
+from django.utils.encoding import force_str
+from reversion.models import Revision, Version
+
+# The options each model was registered with, reversion does not expose
+# them. bulk_create_revision serializes versions with them.
+_version_options = {}
+
+
+def is_excluded(model):
+    """Return True if ``REVERSION_EXCLUDED_MODELS`` lists the model.
+
+    :param model: A model class.
+    """
+    return model._meta.label in getattr(
+        settings, 'REVERSION_EXCLUDED_MODELS', ())
+
+
+def register(model=None, **kwargs):
+    """Register a model with django-reversion unless it is excluded.
+
+    Takes the arguments of ``reversion.register`` and can also be used as
+    a class decorator.
+
+    :param model: The model class to register.
+    """
+    def register_model(model):
+        if not is_excluded(model):
+            reversion.register(model, **kwargs)
+            _version_options[model] = _get_version_options(model, **kwargs)
+
+        return model
+
+    if model is None:
+        return register_model
+
+    return register_model(model)
+
+
+def _get_version_options(model, fields=None, exclude=(), format='json',
+                         for_concrete_model=True,
+                         use_natural_foreign_keys=False, **kwargs):
+    # The defaults and the fields reversion.register versions.
+    opts = model._meta.concrete_model._meta
+
+    if fields is None:
+        fields = [field.name
+                  for field in opts.local_fields + opts.local_many_to_many]
+
+    return {
+        'fields': tuple(name for name in fields if name not in exclude),
+        'format': format,
+        'for_concrete_model': for_concrete_model,
+        'use_natural_foreign_keys': use_natural_foreign_keys,
+    }
+
+
+def _build_version(obj, using):
+    options = _version_options[obj.__class__]
+
+    return Version(
+        content_type=ContentType.objects.db_manager(using).get_for_model(
+            obj.__class__,
+            for_concrete_model=options['for_concrete_model']),
+        object_id=force_str(obj.pk),
+        db=router.db_for_write(obj.__class__, instance=obj),
+        format=options['format'],
+        serialized_data=serializers.serialize(
+            options['format'],
+            (obj,),
+            fields=options['fields'],
+            use_natural_foreign_keys=options['use_natural_foreign_keys'],
+        ),
+        object_repr=force_str(obj),
+    )
+
+
+def bulk_create_revision(objects, user=None, comment='', using=None):
+    """Save a revision of many saved objects with one insert of versions.
+
+    ``reversion.create_revision`` inserts the versions of a revision one
+    by one and versions each object as it is saved, so it cannot follow
+    ``bulk_create``. Objects of unregistered or excluded models, and
+    objects without a primary key, are skipped.
+
+    :param objects: The saved model instances to version.
+    :param user: The user to record on the revision.
+    :param comment: The comment to record on the revision.
+    :param using: The database to save the revision in.
+
+    :returns: The revision, or None if no object was versioned.
+    """
+    versions = [
+        _build_version(obj, using)
+        for obj in objects
+        if obj.pk is not None and reversion.is_registered(obj.__class__)
+        and obj.__class__ in _version_options
+    ]
+
+    if not versions:
+        return None
+
+    with transaction.atomic(using=using):
+        revision = Revision.objects.using(using).create(
+            date_created=timezone.now(), user=user, comment=comment)
+
+        for version in versions:
+            version.revision = revision
+
+        Version.objects.using(using).bulk_create(versions)
+
+    return revision
@@ -0,0 +1,73 @@
+"""Keyword search for the datatable views.
+
+``keyword_filter`` builds the filter of a search box from the fields it
+searches:
+
+- text fields match with ``icontains``, which the pg_trgm indexes of
+  migration 0083 serve,
+- number fields match their digits with ``contains``, and are skipped
+  when the keyword is not a number as they could not match,
+- fields of a related model are searched in a subquery on that model,
+  ``center IN (SELECT id FROM center WHERE ...)``, instead of through
+  joins, so the related table is searched once through its own indexes
+  and the rows of the searched table only check a key.
+"""
+from django.db import models
+from django.db.models import Q
+
+
+def _field_filter(field, lookup, keyword):
+    if isinstance(field, (models.CharField, models.TextField)):
+        return Q(**{f'{lookup}__icontains': keyword})
+
+    if isinstance(field, models.IntegerField) and not keyword.isdigit():
+        return None
+
+    return Q(**{f'{lookup}__contains': keyword})
+
+
+def _search(model, keyword, fields):
+    terms = []
+    related_fields = {}
+
+    for lookup in fields:
+        name, _, related_lookup = lookup.partition('__')
+        field = model._meta.get_field(name)
+
+        if related_lookup:
+            related_fields.setdefault(name, []).append(related_lookup)
+        else:
+            terms.append(_field_filter(field, name, keyword))
+
+    for name, lookups in related_fields.items():
+        related_model = model._meta.get_field(name).related_model
+        related_filter = _search(related_model, keyword, lookups)
+
+        if related_filter is not None:
+            terms.append(Q(**{
+                f'{name}__in': related_model._default_manager
+                .filter(related_filter).values('pk')}))
+
+    q = None
+
+    for term in terms:
+        if term is not None:
+            q = term if q is None else q | term
+
+    return q
+
+
+def keyword_filter(model, keyword, fields):
+    """Return a filter for the rows with a field containing a keyword.
+
+    :param model: The model searched.
+    :param keyword: The text searched for.
+    :param fields: Lookups of the fields searched, through foreign keys
+        for fields of related models, e.g. ``center__office__name``.
+
+    :returns: A Q object, matching no rows if no field can contain the
+        keyword.
+    """
+    q = _search(model, keyword, fields)
+
+    return Q(pk__in=[]) if q is None else q
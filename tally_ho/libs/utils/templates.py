@@ -4,9 +4,9 @@ from djqscsv import render_to_csv_response
 
 
 def get_edits_link(station):
-    url_center = reverse('edit-center', args=[station.center.tally.id,
+    url_center = reverse('edit-center', args=[station.center.tally_id,
                                               station.center.code])
-    url_station = reverse('edit-station', args=[station.center.tally.id,
+    url_station = reverse('edit-station', args=[station.center.tally_id,
                                                 station.pk])
 
     template = (
@@ -53,11 +53,11 @@ def get_active_candidate_link(candidate):
 
     if candidate.active:
         url = reverse('candidate-disable',
-                      args=[candidate.tally.id, candidate.id])
+                      args=[candidate.tally_id, candidate.id])
         text = 'Disable'
     else:
         url = reverse('candidate-enable',
-                      args=[candidate.tally.id, candidate.id])
+                      args=[candidate.tally_id, candidate.id])
         text = 'Enable'
 
     button_html = '<a href="%s" class="btn btn-default btn-small">%s</a>' %\
@@ -67,7 +67,7 @@ def get_active_candidate_link(candidate):
 
 def get_ballot_link(ballot):
     url = reverse('edit-ballot',
-                      args=[ballot.tally.id, ballot.id])
+                      args=[ballot.tally_id, ballot.id])
     button_html =\
         f'<a href="{url}" class="btn btn-default btn-small">Edit</a>'
 
@@ -75,7 +75,7 @@ def get_ballot_link(ballot):
 
 def get_electrol_race_link(electrol_race):
     url = reverse('edit-electrol-race',
-                      args=[electrol_race.tally.id, electrol_race.id])
+                      args=[electrol_race.tally_id, electrol_race.id])
     button_html =\
         f'<a href="{url}" class="btn btn-default btn-small">Edit</a>'
 
@@ -85,7 +85,7 @@ def get_electrol_race_link(electrol_race):
 def get_edit_user_link(user, is_tally=False, **kwargs):
     role = kwargs.get('role', 'user')
     if is_tally and user.tally:
-        url = reverse('edit-user-tally', args=[role, user.tally.id, user.id])
+        url = reverse('edit-user-tally', args=[role, user.tally_id, user.id])
     else:
         url = reverse('edit-user', args=[role, user.id])
     button_html = '<a href="%s" class="btn btn-default btn-small">%s</a>' %\
@@ -111,10 +111,10 @@ def get_tally_edit_link(tally):
 
 
 def get_result_form_edit_delete_links(result_form):
-    url_update_form = reverse('update-form', args=[result_form.tally.id,
+    url_update_form = reverse('update-form', args=[result_form.tally_id,
                                                    result_form.id])
     url_delete_form = reverse('remove-form-confirmation',
-                              args=[result_form.tally.id, result_form.pk])
+                              args=[result_form.tally_id, result_form.pk])
 
     template = (
         '<a href="%s" class="btn btn-default btn-small vertical-margin">%s'
@@ -0,0 +1,288 @@
+"""Buffered writes for django-tracking2 visitors and pageviews.
+
+``BufferedVisitorTrackingMiddleware`` turns each tracked request into an
+event instead of writing ``Visitor`` and ``Pageview`` rows while the
+response waits. Events are buffered according to ``TRACK_BUFFER_BACKEND``:
+
+- ``'memory'``: a list per process, flushed by the process itself once it
+  holds ``TRACK_BUFFER_SIZE`` events or is ``TRACK_BUFFER_FLUSH_INTERVAL``
+  seconds old. Events still buffered when a process exits are lost.
+- ``'redis'``: a list at ``TRACK_BUFFER_URL`` shared by every process,
+  flushed by the ``flush_visitor_tracking`` Celery beat task.
+- ``None``: no buffer, events are written during the request.
+
+A flush writes any number of events with one query to read the existing
+visitors and three bulk queries to write them and their pageviews.
+"""
+import json
+import logging
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import smart_str
+from tracking.models import Pageview, Visitor
+from tracking.utils import get_ip_address
+
+logger = logging.getLogger(__name__)
+
+MEMORY = 'memory'
+REDIS = 'redis'
+
+DEFAULT_BUFFER_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 30
+DEFAULT_BUFFER_KEY = 'tally_ho:tracking:events'
+
+# The user of an existing visitor is written by record_login, a batch must
+# not overwrite it with the value it read.
+VISITOR_UPDATE_FIELDS = [
+    'user_agent', 'expiry_age', 'expiry_time', 'time_on_site']
+
+
+def build_event(user, request, view_time, track_pageview,
+                track_referer=False, track_query_string=False):
+    """Return the JSON serializable event for a tracked request.
+
+    :param user: The authenticated user or None.
+    :param request: The tracked request, its session must have a key.
+    :param view_time: When the request was handled.
+    :param track_pageview: True to record a pageview with the visit.
+    :param track_referer: True to record the HTTP referer.
+    :param track_query_string: True to record the query string.
+
+    :returns: A dict describing the visit.
+    """
+    user_agent = request.META.get('HTTP_USER_AGENT')
+
+    return {
+        'session_key': request.session.session_key,
+        'user_id': user.id if user else None,
+        'ip_address': get_ip_address(request) or '',
+        'user_agent': smart_str(
+            user_agent, encoding='latin-1', errors='ignore')
+        if user_agent else None,
+        'expiry_age': request.session.get_expiry_age(),
+        'expiry_time': request.session.get_expiry_date().isoformat(),
+        'view_time': view_time.isoformat(),
+        'pageview': {
+            'url': request.path,
+            'method': request.method,
+            'referer': request.META.get('HTTP_REFERER')
+            if track_referer else None,
+            'query_string': request.META.get('QUERY_STRING')
+            if track_query_string else None,
+        } if track_pageview else None,
+    }
+
+
+def write_events(events):
+    """Write tracking events to the ``Visitor`` and ``Pageview`` tables.
+
+    Events are merged per session so a visitor is written once however
+    many of its requests are in the batch.
+
+    :param events: An iterable of dicts returned by ``build_event``.
+
+    :returns: The number of events written.
+    """
+    events = list(events)
+
+    if not events:
+        return 0
+
+    events_by_session = {}
+    for event in events:
+        events_by_session.setdefault(event['session_key'], []).append(event)
+
+    with transaction.atomic():
+        existing = Visitor.objects.in_bulk(list(events_by_session))
+        new_visitors = []
+        changed_visitors = []
+
+        for session_key, session_events in events_by_session.items():
+            first, last = session_events[0], session_events[-1]
+            visitor = existing.get(session_key)
+
+            if visitor is None:
+                visitor = Visitor(
+                    session_key=session_key,
+                    ip_address=first['ip_address'],
+                    start_time=parse_datetime(first['view_time']),
+                    user_id=next((e['user_id'] for e in session_events
+                                  if e['user_id']), None))
+                new_visitors.append(visitor)
+            else:
+                changed_visitors.append(visitor)
+
+            visitor.expiry_age = last['expiry_age']
+            visitor.expiry_time = parse_datetime(last['expiry_time'])
+            visitor.user_agent = last['user_agent'] or visitor.user_agent
+            visitor.time_on_site = int((
+                parse_datetime(last['view_time']) - visitor.start_time
+            ).total_seconds())
+
+        # A visitor created since in_bulk ran, e.g. by a login, wins.
+        Visitor.objects.bulk_create(new_visitors, ignore_conflicts=True)
+        Visitor.objects.bulk_update(changed_visitors, VISITOR_UPDATE_FIELDS)
+        Pageview.objects.bulk_create([
+            Pageview(visitor_id=event['session_key'],
+                     view_time=parse_datetime(event['view_time']),
+                     **event['pageview'])
+            for event in events if event['pageview']
+        ])
+
+    return len(events)
+
+
+def record_login(request, user):
+    """Write the visitor of a login immediately.
+
+    Single login enforcement looks for the other visitors of a user, so
+    the visitor of every login must be in the database before the next
+    login of the same user, whatever the buffer backend.
+
+    :param request: The login request.
+    :param user: The user who logged in.
+    """
+    session_key = request.session.session_key
+
+    if not session_key:
+        return
+
+    Visitor.objects.update_or_create(
+        session_key=session_key,
+        defaults={'user_id': user.id},
+        create_defaults={
+            'user_id': user.id,
+            'ip_address': get_ip_address(request) or '',
+        })
+
+
+class MemoryBuffer(object):
+    """Buffer events in the current process."""
+
+    def __init__(self, size, flush_interval):
+        self.size = size
+        self.flush_interval = flush_interval
+        self.events = []
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+
+    def push(self, event):
+        with self.lock:
+            self.events.append(event)
+            full = len(self.events) >= self.size or\
+                time.monotonic() - self.started >= self.flush_interval
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            events, self.events = self.events, []
+            self.started = time.monotonic()
+
+        return write_events(events)
+
+
+class RedisBuffer(object):
+    """Buffer events in a Redis list shared by every process."""
+
+    def __init__(self, url, key, size):
+        self.client = redis.Redis.from_url(url)
+        self.key = key
+        self.size = size
+
+    def push(self, event):
+        self.client.rpush(self.key, json.dumps(event))
+
+    def flush(self):
+        """Write buffered events in batches until the list is empty.
+
+        :returns: The number of events written.
+        """
+        written = 0
+
+        while True:
+            pipeline = self.client.pipeline()
+            pipeline.lrange(self.key, 0, self.size - 1)
+            pipeline.ltrim(self.key, self.size, -1)
+            events, _ = pipeline.execute()
+
+            if not events:
+                return written
+
+            written += write_events(json.loads(event) for event in events)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """Return this process' tracking buffer, None if buffering is off."""
+    global _buffer
+
+    backend = getattr(settings, 'TRACK_BUFFER_BACKEND', None)
+
+    if backend is None:
+        return None
+
+    with _buffer_lock:
+        if _buffer is None:
+            size = getattr(settings, 'TRACK_BUFFER_SIZE', DEFAULT_BUFFER_SIZE)
+
+            if backend == MEMORY:
+                _buffer = MemoryBuffer(size, getattr(
+                    settings, 'TRACK_BUFFER_FLUSH_INTERVAL',
+                    DEFAULT_FLUSH_INTERVAL))
+            elif backend == REDIS:
+                _buffer = RedisBuffer(
+                    getattr(settings, 'TRACK_BUFFER_URL',
+                            settings.CELERY_BROKER_URL),
+                    getattr(settings, 'TRACK_BUFFER_KEY', DEFAULT_BUFFER_KEY),
+                    size)
+            else:
+                raise ValueError(
+                    f'Unknown TRACK_BUFFER_BACKEND: {backend}')
+
+    return _buffer
+
+
+def reset_buffer():
+    """Forget this process' buffer so settings changes take effect."""
+    global _buffer
+
+    with _buffer_lock:
+        _buffer = None
+
+
+def track(event):
+    """Buffer a tracking event, or write it if buffering is off.
+
+    Tracking must never fail a request, errors are logged.
+
+    :param event: A dict returned by ``build_event``.
+    """
+    try:
+        buffer = get_buffer()
+
+        if buffer is None:
+            write_events([event])
+        else:
+            buffer.push(event)
+    except Exception as e:
+        logger.warning('Error tracking visit, error: %s', e)
+
+
+def flush():
+    """Write the events buffered by this process or in Redis.
+
+    :returns: The number of events written.
+    """
+    buffer = get_buffer()
+
+    return buffer.flush() if buffer else 0
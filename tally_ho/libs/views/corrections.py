@@ -1,51 +1,36 @@
-from collections import OrderedDict
-
-from django.db.models import Q
 from django.forms import ValidationError
 from django.utils.translation import gettext_lazy as _
 
-from tally_ho.apps.tally.models.candidate import Candidate
 from tally_ho.apps.tally.models.result_form_stats import ResultFormStats
 from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import get_matched_results
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.permissions import groups
+from tally_ho.libs.workflow.diff import diff_result_form
 
 
 def update_result_form_entries_with_de_errors(
-    data_entry_1_errors, data_entry_2_errors, tally_id
+    result_form, data_entry_1_errors, data_entry_2_errors
 ):
-    """Update result form stats entries that have DE errors.
+    """Attribute DE errors to the stats of the clerks who entered a result
+    form.
 
+    :param result_form: The result form with DE errors.
     :param data_entry_1_errors: Number of errors caused by data entry 1 clerk.
     :param data_entry_2_errors: Number of errors caused by data entry 2 clerk.
-    :param tally_id: ID of tally.
     """
+    qs = ResultFormStats.objects.filter(result_form=result_form)
 
-    qs = ResultFormStats.objects.filter(
-        result_form__tally__id=tally_id)
+    for group, errors in ((groups.DATA_ENTRY_1_CLERK, data_entry_1_errors),
+                          (groups.DATA_ENTRY_2_CLERK, data_entry_2_errors)):
+        if not errors:
+            continue
 
-    if data_entry_1_errors:
-        data_entry_1_result_form_stat =\
-            qs.filter(
-                Q(user__groups__name=groups.DATA_ENTRY_1_CLERK))\
+        result_form_stat = qs.filter(user__groups__name=group)\
             .order_by('-created_date').first()
 
-        if data_entry_1_result_form_stat:
-            data_entry_1_result_form_stat.data_entry_errors +=\
-                data_entry_1_errors
-            data_entry_1_result_form_stat.save()
-
-    if data_entry_2_errors:
-        data_entry_2_result_form_stat =\
-            qs.filter(
-                Q(user__groups__name=groups.DATA_ENTRY_2_CLERK))\
-            .order_by('-created_date').first()
-
-        if data_entry_2_result_form_stat:
-            data_entry_2_result_form_stat.data_entry_errors +=\
-                data_entry_2_errors
-            data_entry_2_result_form_stat.save()
+        if result_form_stat:
+            result_form_stat.add_data_entry_errors(errors)
 
 
 def get_matched_forms(result_form):
@@ -55,26 +40,16 @@ def get_matched_forms(result_form):
 
     :returns: A list of matches and a list is mismatches.
     """
-    results_v1 = Result.objects.filter(
-        active=True,
-        result_form=result_form,
-        entry_version=EntryVersion.DATA_ENTRY_1).values('candidate', 'votes')
-    results_v2 = Result.objects.filter(
-        active=True,
-        result_form=result_form,
-        entry_version=EntryVersion.DATA_ENTRY_2).values('candidate', 'votes')
+    diff = diff_result_form(
+        result_form, Result.objects.filter(active=True))
 
-    if not results_v1 or not results_v2:
+    if not diff.double_entered:
         raise Exception(_(u"Result Form has no double entries."))
 
-    if results_v1.count() != results_v2.count():
+    if not diff.counts_match:
         return False
 
-    tuple_list = [i.items() for i in results_v1]
-    matches = [rec for rec in results_v2 if rec.items() in tuple_list]
-    no_match = [rec for rec in results_v2 if rec.items() not in tuple_list]
-
-    return matches, no_match
+    return diff.split()
 
 
 def get_candidates(results, num_results=None):
@@ -86,20 +61,16 @@ def get_candidates(results, num_results=None):
     :returns: A list of tuples of candidates and the results associated with
         them.
     """
-    candidates = OrderedDict()
+    candidates = {}
 
-    for result in results.order_by(
-        'candidate__ballot__electrol_race__election_level',
-        'candidate__order', 'entry_version'):
-        candidate = result.candidate
+    for result in results.select_related('candidate').order_by(
+            'candidate__order', 'entry_version'):
+        candidate = candidates.setdefault(
+            result.candidate_id, [result.candidate])
+        candidate.append(result)
 
-        if candidates.get(candidate):
-            candidates[candidate].append(result)
-        else:
-            candidates.update({candidate: [result]})
-
-    return [[c] + r[0:num_results] if num_results else r
-            for c, r in candidates.items()]
+    return [c[0:num_results + 1] if num_results else c[1:]
+            for c in candidates.values()]
 
 
 def get_result_form_results(result_form):
@@ -147,7 +118,7 @@ def save_candidate_results_by_prefix(prefix, result_form, post_data, user):
 
     candidate_fields = [f for f in post_data if f.startswith(prefix)]
     results = get_result_form_results(result_form)
-    no_match = get_matched_results(result_form, results)[1]
+    matches, no_match = get_matched_results(result_form, results)
 
     if len(candidate_fields) != len(no_match):
         raise ValidationError(
@@ -160,26 +131,19 @@ def save_candidate_results_by_prefix(prefix, result_form, post_data, user):
         else:
             data_entry_2_errors += 1
 
-    changed_candidates = []
+    final_votes = {rec['candidate']: rec['votes']
+                   for rec in matches + no_match}
 
     for field in candidate_fields:
-        candidate_pk = field.replace(prefix, '')
-        candidate = Candidate.objects.get(pk=candidate_pk)
-        votes = post_data[field]
-        save_result(candidate, result_form, EntryVersion.FINAL, votes, user)
-        changed_candidates.append(candidate)
-
-    results_v2 = results.filter(result_form=result_form,
-                                entry_version=EntryVersion.DATA_ENTRY_2)
+        final_votes[int(field.replace(prefix, ''))] = post_data[field]
 
-    for result in results_v2:
-        if result.candidate not in changed_candidates:
-            save_result(result.candidate, result_form, EntryVersion.FINAL,
-                        result.votes, user)
+    for candidate_id, votes in final_votes.items():
+        save_result(candidate_id, result_form, EntryVersion.FINAL, votes,
+                    user)
 
     if data_entry_1_errors or data_entry_2_errors:
         update_result_form_entries_with_de_errors(
-            data_entry_1_errors, data_entry_2_errors, post_data['tally_id'])
+            result_form, data_entry_1_errors, data_entry_2_errors)
 
 
 def save_final_results(result_form, user):
@@ -192,13 +156,13 @@ def save_final_results(result_form, user):
         result_form=result_form,
         entry_version=EntryVersion.DATA_ENTRY_2, active=True)
 
-    for result in results:
-        save_result(result.candidate, result_form, EntryVersion.FINAL,
-                    result.votes, user)
+    for candidate_id, votes in results.values_list('candidate_id', 'votes'):
+        save_result(candidate_id, result_form, EntryVersion.FINAL, votes,
+                    user)
 
 
-def save_result(candidate, result_form, entry_version, votes, user):
-    Result.objects.create(candidate=candidate,
+def save_result(candidate_id, result_form, entry_version, votes, user):
+    Result.objects.create(candidate_id=candidate_id,
                           result_form=result_form,
                           entry_version=entry_version,
                           votes=votes,
@@ -0,0 +1,368 @@
+"""Server side DataTables views for large tables.
+
+``BaseDatatableView`` counts the whole table and the filtered rows on
+every draw and pages with ``OFFSET``, so every page and every search
+keystroke scans up to the page it shows, twice more for the counts.
+``KeysetDatatableView`` keeps the DataTables protocol and:
+
+- pages by seeking past the ordering keys of the last row of the
+  previous page when it has seen that page, with a shorter ``OFFSET``
+  from the closest page it has seen otherwise,
+- caches counts for ``DATATABLE_CACHE_TIMEOUT`` seconds, so paging and
+  repeating a search do not count again, and reports the planner's row
+  estimate instead of counting when it is at least
+  ``DATATABLE_ESTIMATED_COUNT_MIN`` rows and no search is active,
+- selects only the ordering keys of the page first, then loads the rows
+  of the page by primary key, so annotations that are not filtered or
+  ordered on, and the relations rendered by dotted columns, are only
+  evaluated for the rows shown.
+
+The ordering always ends with the primary key so rows with equal sort
+values keep a stable order between pages.
+"""
+import json
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.query import ModelIterable
+from django_datatables_view.base_datatable_view import BaseDatatableView
+
+from tally_ho.libs.utils import analytics
+from tally_ho.libs.utils.cache import DATATABLES, get_cache, tally_cache_key
+
+DEFAULT_CACHE_TIMEOUT = 60
+DEFAULT_ESTIMATED_COUNT_MIN = 100000
+# Pages remembered per ordering and filter, oldest forgotten first.
+MAX_CURSORS = 100
+
+
+def _resolve(model, name):
+    """Return the field a lookup path ends in and whether it can be null.
+
+    :param model: The model the path starts from.
+    :param name: A path of field names separated by ``__``.
+
+    :returns: A tuple of the field and True when a nullable field or
+        relation on the path can make the value null.
+    """
+    nullable = False
+    parts = name.split('__')
+
+    for part in parts[:-1]:
+        field = model._meta.get_field(part)
+
+        if not (field.many_to_one or field.one_to_one) or\
+                not field.concrete:
+            raise FieldDoesNotExist(name)
+
+        nullable = nullable or field.null
+        model = field.related_model
+
+    field = model._meta.get_field(parts[-1])
+
+    return field, nullable or field.null
+
+
+def keyset_after(keyset, values):
+    """Return a filter for the rows ordered after a row.
+
+    Nulls are ordered as Postgres orders them, last when ascending and
+    first when descending.
+
+    :param keyset: A list of ``(name, descending, nullable)`` ordering
+        keys, ending with the primary key.
+    :param values: The values of the keys of the row.
+
+    :returns: A Q object.
+    """
+    after_row = None
+    same = Q()
+
+    for (name, descending, nullable), value in zip(keyset, values):
+        if value is None:
+            after = Q(**{f'{name}__isnull': False}) if descending else None
+            equal = Q(**{f'{name}__isnull': True})
+        else:
+            after = Q(**{f'{name}__{"lt" if descending else "gt"}': value})
+            equal = Q(**{name: value})
+
+            if nullable and not descending:
+                after |= Q(**{f'{name}__isnull': True})
+
+        if after is not None:
+            after_row = same & after if after_row is None else\
+                after_row | (same & after)
+
+        same &= equal
+
+    name, descending, nullable = keyset[0]
+
+    if values[0] is not None and not nullable:
+        # Redundant with the filter above, but a bound on the first key
+        # alone lets an index on it skip the rows before the page.
+        after_row &= Q(**{f'{name}__{"lte" if descending else "gte"}':
+                          values[0]})
+
+    return after_row
+
+
+def get_keyset(qs):
+    """Return the ordering keys of a queryset, or None.
+
+    :param qs: An ordered queryset.
+
+    :returns: A list of ``(name, descending, nullable)`` ending with
+        the primary key, or None if the queryset cannot be paged by
+        its ordering.
+    """
+    if qs._iterable_class is not ModelIterable:
+        return None
+
+    keyset = []
+    pk_name = qs.model._meta.pk.name
+
+    for item in qs.query.order_by or qs.model._meta.ordering:
+        if not isinstance(item, str) or item == '?':
+            return None
+
+        descending = item.startswith('-')
+        name = item.lstrip('-')
+
+        if name in ('pk', pk_name):
+            keyset.append(('pk', descending, False))
+
+            return keyset
+
+        if name in qs.query.annotations:
+            keyset.append((name, descending, True))
+            continue
+
+        try:
+            field, nullable = _resolve(qs.model, name)
+        except FieldDoesNotExist:
+            return None
+
+        if field.is_relation:
+            # Ordering by a relation orders by the related model's
+            # ordering, not the value of the key.
+            return None
+
+        keyset.append((name, descending, nullable))
+
+    keyset.append(('pk', False, False))
+
+    return keyset
+
+
+class KeysetDatatableView(BaseDatatableView):
+    """A DataTables view of a model queryset paged by its ordering keys.
+
+    Subclasses are written like ``BaseDatatableView`` subclasses. Views
+    returning ``values()`` querysets, or ordering by expressions, are
+    paged with ``OFFSET`` like ``BaseDatatableView``.
+    """
+    keyset = None
+
+    def get_cache_timeout(self):
+        return getattr(settings, 'DATATABLE_CACHE_TIMEOUT',
+                       DEFAULT_CACHE_TIMEOUT)
+
+    def get_cache_key(self, kind, qs):
+        """Return the cache key of a value computed from a queryset.
+
+        :param kind: What the value is, e.g. ``count``.
+        :param qs: The queryset the value is computed from.
+
+        :returns: A cache key, or None if the queryset matches no rows.
+        """
+        try:
+            sql, params = qs.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+
+        return tally_cache_key(self.kwargs.get('tally_id'), DATATABLES,
+                               type(self).__name__, kind, sql, params)
+
+    def estimate_count(self, qs):
+        """Return the planner's estimate of the rows of a queryset, or None.
+
+        The estimate is as fresh as the statistics of the last ``ANALYZE``
+        of the tables the queryset reads.
+
+        :param qs: The queryset to estimate, e.g. the forms of a tally.
+        """
+        if connections[qs.db].vendor != 'postgresql':
+            return None
+
+        plan = json.loads(qs.explain(format='json'))
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def is_searching(self):
+        """Return True if the request searches the table, whose rows are
+        counted rather than estimated.
+        """
+        request = getattr(self, 'request', None)
+
+        return request is not None and bool(
+            self._querydict.get('search[value]'))
+
+    def count_records(self, qs):
+        key = self.get_cache_key('count', qs)
+
+        if key is None:
+            return 0
+
+        count = get_cache().get(key)
+
+        if count is None:
+            if not qs.query.distinct and not self.is_searching():
+                count = self.estimate_count(qs)
+
+            if count is None or count < getattr(
+                    settings, 'DATATABLE_ESTIMATED_COUNT_MIN',
+                    DEFAULT_ESTIMATED_COUNT_MIN):
+                count = qs.count()
+
+            get_cache().set(key, count, self.get_cache_timeout())
+
+        return count
+
+    def get_keyset(self, qs):
+        return get_keyset(qs)
+
+    def ordering(self, qs):
+        qs = super().ordering(qs)
+
+        if self.pre_camel_case_notation or isinstance(qs, list):
+            return qs
+
+        self.keyset = self.get_keyset(qs)
+
+        if self.keyset:
+            qs = qs.order_by(*[f'{"-" if descending else ""}{name}'
+                               for name, descending, _ in self.keyset])
+
+        return qs
+
+    def get_select_related(self, model):
+        """Return the relations the dotted columns of the view render.
+
+        :param model: The model of the rows.
+        """
+        paths = set()
+
+        for column in self._columns:
+            if not isinstance(column, str):
+                continue
+
+            related_model = model
+            path = []
+
+            for part in column.split('.')[:-1]:
+                try:
+                    field = related_model._meta.get_field(part)
+                except FieldDoesNotExist:
+                    break
+
+                if not (field.many_to_one or field.one_to_one) or\
+                        not field.concrete:
+                    break
+
+                path.append(part)
+                related_model = field.related_model
+
+            if path:
+                paths.add('__'.join(path))
+
+        return sorted(path for path in paths
+                      if not any(other.startswith(f'{path}__')
+                                 for other in paths))
+
+    def get_page_rows(self, qs, pks):
+        """Return the rows of a page in the order of their primary keys.
+
+        :param qs: The filtered queryset of the view.
+        :param pks: The primary keys of the rows of the page.
+        """
+        rows = qs.filter(pk__in=pks).order_by()
+        select_related = self.get_select_related(qs.model)
+
+        if select_related:
+            rows = rows.select_related(*select_related)
+
+        rows_by_pk = {row.pk: row for row in rows}
+
+        return [rows_by_pk[pk] for pk in pks if pk in rows_by_pk]
+
+    def paging(self, qs):
+        if self.pre_camel_case_notation or not self.keyset:
+            return super().paging(qs)
+
+        limit = min(int(self._querydict.get('length', 10)),
+                    self.max_display_length)
+        start = int(self._querydict.get('start', 0))
+
+        if limit == -1:
+            select_related = self.get_select_related(qs.model)
+
+            return qs.select_related(*select_related)\
+                if select_related else qs
+
+        fields = [name for name, _, _ in self.keyset]
+        key = self.get_cache_key('cursors', qs)
+
+        if key is None:
+            return []
+
+        cursors = get_cache().get(key) or {}
+        seen = [page for page in cursors if page <= start]
+        page_qs = qs
+
+        if seen:
+            page = max(seen)
+            page_qs = qs.filter(keyset_after(self.keyset, cursors[page]))
+            start -= page
+        else:
+            page = 0
+
+        keys = list(page_qs.values_list(*fields)[start:start + limit])
+
+        if len(keys) == limit:
+            next_page = page + start + limit
+
+            if next_page not in cursors:
+                cursors[next_page] = keys[-1]
+
+                while len(cursors) > MAX_CURSORS:
+                    del cursors[next(iter(cursors))]
+
+                get_cache().set(key, cursors, self.get_cache_timeout())
+
+        return self.get_page_rows(qs, [row[-1] for row in keys])
+
+
+class AnalyticsDatatableMixin:
+    """Count and page a ``BaseDatatableView`` on the analytics snapshot.
+
+    For views of ``values()`` querysets aggregating a tally, see
+    ``tally_ho.libs.utils.analytics``, whose rows are tested to be the same
+    read from a snapshot as from the database. Rows are read from the
+    database when there is no fresh snapshot, and for keyword searches,
+    as DuckDB does not escape ``LIKE`` patterns like Postgres.
+    """
+    def reads_snapshot(self):
+        return not self.request.POST.get("search[value]")
+
+    def count_records(self, qs):
+        return analytics.count(qs, from_snapshot=self.reads_snapshot())
+
+    def paging(self, qs):
+        qs = super().paging(qs)
+
+        if not isinstance(qs, QuerySet):
+            return qs
+
+        return analytics.fetch(qs, from_snapshot=self.reads_snapshot())
@@ -1,4 +1,5 @@
 import csv
+import json
 import os
 from collections import OrderedDict, defaultdict
 from tempfile import NamedTemporaryFile
@@ -6,21 +7,27 @@ from tempfile import NamedTemporaryFile
 from django.conf import settings
 from django.core.files.base import File
 from django.core.files.storage import default_storage
-from django.http import HttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from tally_ho.apps.tally.models.ballot import Ballot
+from tally_ho.apps.tally.models.candidate import Candidate
 from tally_ho.apps.tally.models.result import Result
 from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.libs.models.enums.entry_version import EntryVersion
 from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.reports.ballot_topology import get_ballot_topology
 
 OUTPUT_PATH = 'results/all_candidate_votes_%s.csv'
 ACTIVE_OUTPUT_PATH = 'results/active_candidate_votes_%s.csv'
 RESULTS_PATH = 'results/form_results_%s.csv'
 DUPLICATE_RESULTS_PATH = 'results/duplicate_results_%s.csv'
 SPECIAL_BALLOTS = None
+# Rows fetched per round trip when streaming a queryset.
+STREAM_CHUNK_SIZE = 2000
 
 
 def path_with_timestamp(path):
@@ -177,11 +184,9 @@ def save_barcode_results(complete_barcodes, output_duplicates=False,
 
     center_to_votes = defaultdict(list)
     center_to_forms = defaultdict(list)
-    ballots_to_candidates = {}
-
-    for ballot in valid_ballots(tally_id):
-        ballots_to_candidates[ballot.number] = \
-            ballot.candidates.all().order_by('order')
+    topology = get_ballot_topology(tally_id)
+    candidates = Candidate.objects.filter(
+        ballot__tally__id=tally_id).select_related('ballot').in_bulk()
 
     csv_file = NamedTemporaryFile(delete=False, suffix='.csv')
 
@@ -224,7 +229,6 @@ def save_barcode_results(complete_barcodes, output_duplicates=False,
             'center__office',
             'center__sub_constituency'
         ).prefetch_related(
-            'ballot__candidates',  # For result_form.candidates property
             'reconciliationform_set',
             'center__stations'  # For result_form.station property
         )
@@ -250,7 +254,8 @@ def save_barcode_results(complete_barcodes, output_duplicates=False,
             vote_list = ()
             output = build_result_and_recon_output(result_form)
 
-            for candidate in result_form.candidates:
+            for candidate_id in topology.candidate_ids(result_form.ballot_id):
+                candidate = candidates[candidate_id]
                 # OPTIMIZATION: Use pre-fetched votes instead of querying
                 key = (result_form.id, candidate.id)
                 votes = votes_lookup.get(key, 0)
@@ -357,16 +362,12 @@ def export_candidate_votes(save_barcodes=False,
               'stations completed',
               'stations percent completed']
 
-    max_candidates = 0
-
-    for ballot in Ballot.objects.filter(tally__id=tally_id):
-        if not show_disabled_candidates:
-            ballot_number = ballot.candidates.filter(active=True).count()
-        else:
-            ballot_number = ballot.candidates.count()
-
-        if ballot_number > max_candidates:
-            max_candidates = ballot_number
+    topology = get_ballot_topology(tally_id)
+    max_candidates = max(
+        (len(topology.candidate_ids(
+            ballot_id, active_only=not show_disabled_candidates))
+         for ballot_id in topology.ballot_candidates),
+        default=0)
 
     for i in range(1, max_candidates + 1):
         header.append('candidate %s name' % i)
@@ -532,3 +533,34 @@ def get_result_export_response(report, tally_id):
         response.status_code = 404
 
     return response
+
+
+def stream_queryset(qs, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield the rows of a queryset from a server-side cursor.
+
+    The cursor is read in a transaction so Postgres streams the rows
+    rather than materializing them for a cursor held across transactions,
+    which PgBouncer in transaction mode does not support either.
+
+    :param qs: The queryset to read.
+    :param chunk_size: The rows to fetch per round trip.
+    """
+    with transaction.atomic(using=qs.db):
+        yield from qs.iterator(chunk_size=chunk_size)
+
+
+def ndjson_response(rows, file_name):
+    """Stream rows as a newline delimited JSON file download.
+
+    :param rows: An iterable of JSON serializable rows, written as read.
+    :param file_name: The name of the downloaded file.
+
+    :returns: A streaming HTTP response.
+    """
+    response = StreamingHttpResponse(
+        (json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows),
+        content_type='application/x-ndjson',
+    )
+    response['Content-Disposition'] = f'attachment; filename="{file_name}"'
+
+    return response
@@ -1,9 +1,11 @@
 from django.core.exceptions import SuspiciousOperation
 from django.utils.translation import gettext_lazy as _
 
+from tally_ho.apps.tally.models.result_form import ResultForm
 from tally_ho.libs.models.enums.form_state import FormState
 from tally_ho.libs.utils.collections import listify
 from tally_ho.libs.views.errors import add_generic_error
+from tally_ho.libs.workflow.queues import claim_result_form
 
 
 def safe_form_in_state(result_form, states, form):
@@ -49,6 +51,29 @@ def form_in_state(result_form, states):
     return True
 
 
+def safe_claim_result_form(result_form, user, form):
+    """Claim a result form for a user and add an error to form if another
+    user is processing it.
+
+    :param result_form: The result form to claim.
+    :param user: The UserProfile processing the form.
+    :param form: The form to add an error message to if any exist.
+
+    :returns: Form with an error message or None.
+    """
+    if claim_result_form(result_form, user):
+        return None
+
+    username = ResultForm.objects.filter(pk=result_form.pk)\
+        .values_list('claimed_by__username', flat=True).first()
+
+    return add_generic_error(
+        form,
+        _("Form is being processed by %(username)s. Ask a supervisor to "
+          "release it from the work queues to process it.")
+        % {"username": username})
+
+
 def form_in_data_entry_state(result_form):
     """Check that result form is in a data entry state."""
     return form_in_state(
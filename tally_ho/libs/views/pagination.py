@@ -1,5 +1,19 @@
+import collections.abc
+import json
+import math
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import EmptyResultSet
 from django.core.paginator import EmptyPage, Paginator, PageNotAnInteger
 
+from tally_ho.libs.utils.cache import PAGES, get_cache, tally_cache_key
+from tally_ho.libs.views.datatables import get_keyset, keyset_after
+
+PAGE_SIZE = 10
+DEFAULT_COUNT_CACHE_TIMEOUT = 60
+CURSOR_SALT = 'tally_ho.libs.views.pagination'
+
 
 def paging(objects_list, request, page_kwarg='page'):
     """Return the appropriate page for this list and request.
@@ -10,7 +24,7 @@ def paging(objects_list, request, page_kwarg='page'):
 
     :returns: A page for this list and request.
     """
-    paginator = Paginator(objects_list, 10)
+    paginator = Paginator(objects_list, PAGE_SIZE)
     page = request.GET.get(page_kwarg)
 
     return paginate(paginator, page)
@@ -32,3 +46,223 @@ def paginate(paginator, page):
     except EmptyPage:
         # If page is out of range (e.g. 9999), deliver last page.
         return paginator.page(paginator.num_pages)
+
+
+def _json_value(value):
+    # Dates and times at full precision, DjangoJSONEncoder drops the
+    # microseconds a key needs to seek past its row.
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+class CursorSerializer:
+    """Serialize page cursors, including ordering keys of any type."""
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'),
+                          default=_json_value).encode('latin-1')
+
+    def loads(self, data):
+        return json.loads(data.decode('latin-1'))
+
+
+def dump_cursor(cursor):
+    return signing.dumps(cursor, salt=CURSOR_SALT,
+                         serializer=CursorSerializer)
+
+
+def load_cursor(value):
+    """Return the cursor of a page parameter, the first page's if missing
+    or invalid.
+
+    :param value: The value of the page parameter.
+
+    :returns: A dict with the page number, ``n``, and for pages read by
+        ordering keys, the keys to seek from, ``k``, and whether to seek
+        backwards, ``b``.
+    """
+    if not value:
+        return {}
+
+    try:
+        cursor = signing.loads(value, salt=CURSOR_SALT,
+                               serializer=CursorSerializer)
+    except signing.BadSignature:
+        return {}
+
+    return cursor if isinstance(cursor, dict) else {}
+
+
+def cached_count(objects_list, tally_id):
+    """Return the number of rows of a queryset, counted at most once every
+    ``PAGINATION_COUNT_CACHE_TIMEOUT`` seconds.
+
+    :param objects_list: The queryset to count.
+    :param tally_id: The tally the rows belong to.
+
+    :returns: The number of rows, as of when it was counted.
+    """
+    try:
+        sql, params = objects_list.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    key = tally_cache_key(tally_id, PAGES, 'count', sql, params)
+    count = get_cache().get(key)
+
+    if count is None:
+        count = objects_list.count()
+        get_cache().set(key, count, getattr(
+            settings, 'PAGINATION_COUNT_CACHE_TIMEOUT',
+            DEFAULT_COUNT_CACHE_TIMEOUT))
+
+    return count
+
+
+def _key_values(row, keyset):
+    values = []
+
+    for name, _, _ in keyset:
+        value = row
+
+        for part in name.split('__'):
+            value = getattr(value, part) if value is not None else None
+
+        values.append(value)
+
+    return values
+
+
+def _order_by(keyset):
+    return [f'{"-" if descending else ""}{name}'
+            for name, descending, _ in keyset]
+
+
+class SeekPage(collections.abc.Sequence):
+    """A page of a list read without counting the list.
+
+    Used like a ``django.core.paginator.Page`` for next and previous
+    links, which take the ``previous_cursor`` and ``next_cursor`` as the
+    value of the page parameter instead of a page number.
+    """
+    def __init__(self, object_list, number, previous_cursor=None,
+                 next_cursor=None, count=None, per_page=PAGE_SIZE):
+        self.object_list = object_list
+        self.number = number
+        self.previous_cursor = previous_cursor
+        self.next_cursor = next_cursor
+        self.count = count
+        self.per_page = per_page
+
+    def __repr__(self):
+        return f'<Page {self.number}>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def num_pages(self):
+        """The approximate number of pages, None if the list is not
+        counted."""
+        if self.count is None:
+            return None
+
+        return max(math.ceil(self.count / self.per_page),
+                   self.number + 1 if self.has_next() else self.number)
+
+
+def seek_paging(objects_list, request, page_kwarg='page', tally_id=None,
+                per_page=PAGE_SIZE):
+    """Return the page of a queryset for this request without counting
+    the queryset.
+
+    Pages read one row more than they show to know if there is a next
+    page. Querysets ordered by fields are read by seeking past the
+    ordering keys of the last row of the previous page, or before the
+    first row of the next page, so an index on the ordering reads only
+    the rows of the page. Other querysets are read with an ``OFFSET``.
+
+    :param objects_list: The queryset to paginate.
+    :param request: The request to retrieve a page from.
+    :param page_kwarg: The name of the query parameter for the cursor.
+    :param tally_id: The tally of the rows, to show an approximate number
+        of pages from a cached count. None to not count the rows.
+    :param per_page: The number of rows of a page.
+
+    :returns: A SeekPage for this queryset and request.
+    """
+    cursor = load_cursor(request.GET.get(page_kwarg))
+    keyset = get_keyset(objects_list)
+    keys = cursor.get('k') if keyset else None
+    number = cursor.get('n', 1) if keys or not keyset else 1
+
+    if not isinstance(number, int) or number < 1 or\
+            keys is not None and len(keys) != len(keyset):
+        keys, number = None, 1
+
+    if keys is not None and cursor.get('b'):
+        reverse_keyset = [(name, not descending, nullable)
+                          for name, descending, nullable in keyset]
+        rows = list(objects_list.order_by(*_order_by(reverse_keyset))
+                    .filter(keyset_after(reverse_keyset, keys))
+                    [:per_page + 1])
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        has_next = bool(rows)
+    elif keyset:
+        page_qs = objects_list.order_by(*_order_by(keyset))
+
+        if keys is not None:
+            page_qs = page_qs.filter(keyset_after(keyset, keys))
+
+        rows = list(page_qs[:per_page + 1])
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_previous = keys is not None
+    else:
+        offset = (number - 1) * per_page
+        rows = list(objects_list[offset:offset + per_page + 1])
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_previous = number > 1
+
+    if not has_previous:
+        number = 1
+
+    previous_cursor = next_cursor = None
+
+    if has_previous:
+        previous = {'n': number - 1}
+
+        if keyset and rows and number > 2:
+            previous.update(k=_key_values(rows[0], keyset), b=True)
+
+        previous_cursor = dump_cursor(previous)
+
+    if has_next:
+        next_ = {'n': number + 1}
+
+        if keyset:
+            next_['k'] = _key_values(rows[-1], keyset)
+
+        next_cursor = dump_cursor(next_)
+
+    count = None
+
+    if number == 1 and not has_next:
+        count = len(rows)
+    elif tally_id is not None:
+        count = cached_count(objects_list, tally_id)
+
+    return SeekPage(rows, number, previous_cursor, next_cursor, count,
+                    per_page)
@@ -0,0 +1,131 @@
+"""Differences between the data entries of result forms.
+
+The active results of one form or of a batch of forms are read with one
+query of ``(result_form_id, candidate_id, entry_version, votes)`` rows
+and grouped into a ``ResultsDiff`` per form, which holds the votes of
+each entry keyed by candidate id. Matching data entry 1 and data entry 2
+is then a dict lookup per candidate instead of a list scan, which is
+what the corrections views and the promotion of matching forms to final
+read.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.db.models import F
+
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+
+
+@dataclass
+class ResultsDiff:
+    """The votes of each entry of a result form, keyed by candidate id.
+
+    Each candidate has a list of the votes of its results in an entry,
+    which holds one item unless results were duplicated.
+    """
+    data_entry_1: dict = field(default_factory=dict)
+    data_entry_2: dict = field(default_factory=dict)
+    final: dict = field(default_factory=dict)
+    counts: dict = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def double_entered(self):
+        """True if both data entries have results."""
+        return bool(self.data_entry_1) and bool(self.data_entry_2)
+
+    @property
+    def counts_match(self):
+        """True if both data entries have the same number of results."""
+        return self.counts[EntryVersion.DATA_ENTRY_1] ==\
+            self.counts[EntryVersion.DATA_ENTRY_2]
+
+    @property
+    def duplicated(self):
+        """True if a candidate has more than one result in an entry."""
+        return any(
+            len(votes) > 1
+            for entry in (self.data_entry_1, self.data_entry_2, self.final)
+            for votes in entry.values())
+
+    @property
+    def entries_match(self):
+        """True if the data entries are the same for every candidate."""
+        return self.double_entered and self.counts_match and\
+            not self.split()[1]
+
+    def split(self):
+        """Split the data entry 2 results into matching and mismatching
+        ones, as ``{'candidate': id, 'votes': votes}`` dicts.
+
+        :returns: A list of matched and a list of unmatched results.
+        """
+        matched, no_match = [], []
+
+        for candidate_id, entered_votes in self.data_entry_2.items():
+            data_entry_1 = self.data_entry_1.get(candidate_id, ())
+
+            for votes in entered_votes:
+                result = {'candidate': candidate_id, 'votes': votes}
+
+                if votes in data_entry_1:
+                    matched.append(result)
+                else:
+                    no_match.append(result)
+
+        return matched, no_match
+
+
+ENTRIES = {
+    EntryVersion.DATA_ENTRY_1: 'data_entry_1',
+    EntryVersion.DATA_ENTRY_2: 'data_entry_2',
+    EntryVersion.FINAL: 'final',
+}
+
+
+def election_level_results(results):
+    """Filter results to the active ones of the election level of their
+    form's ballot, as ``ResultForm.form_results`` does for one form.
+
+    :param results: A Result queryset.
+
+    :returns: A Result queryset.
+    """
+    return results.filter(
+        active=True,
+        candidate__ballot__electrol_race__election_level=F(
+            'result_form__ballot__electrol_race__election_level'))
+
+
+def diff_results(results):
+    """Group results by result form and entry, keyed by candidate id.
+
+    :param results: A Result queryset of the results to compare, read
+        with one query.
+
+    :returns: A dict of result form id to its ResultsDiff.
+    """
+    diffs = defaultdict(ResultsDiff)
+    rows = results.order_by('id').values_list(
+        'result_form_id', 'candidate_id', 'entry_version', 'votes')
+
+    for result_form_id, candidate_id, entry_version, votes in rows:
+        diff = diffs[result_form_id]
+        diff.counts[entry_version] += 1
+        entry = ENTRIES.get(entry_version)
+
+        if entry:
+            getattr(diff, entry).setdefault(candidate_id, []).append(votes)
+
+    return dict(diffs)
+
+
+def diff_result_form(result_form, results):
+    """Return the ResultsDiff of a result form.
+
+    :param result_form: The result form to compare the entries of.
+    :param results: A Result queryset to look within.
+
+    :returns: The ResultsDiff, empty if the form has no results.
+    """
+    return diff_results(results.filter(result_form=result_form)).get(
+        result_form.pk, ResultsDiff())
@@ -0,0 +1,177 @@
+"""Work queues of the result forms waiting for clerks.
+
+A form's queue is its tally and state, so the queues are read from
+``ResultForm`` through its ``(tally, form_state, id)`` index and every
+transition keeps them current. Clerks claim the next form with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so clerks claiming at the same
+time neither wait on nor take the same form. A claim is stored on the
+form and lapses after ``WORK_QUEUE_CLAIM_SECONDS`` or when the form
+changes state.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+
+# The states forms wait in for a clerk, in workflow order.
+QUEUE_STATES = (
+    FormState.UNSUBMITTED,
+    FormState.INTAKE,
+    FormState.DATA_ENTRY_1,
+    FormState.DATA_ENTRY_2,
+    FormState.CORRECTION,
+    FormState.QUALITY_CONTROL,
+    FormState.AUDIT,
+    FormState.CLEARANCE,
+)
+
+
+def claim_expiry_date():
+    """Return the date before which claims have lapsed."""
+    return timezone.now() - timedelta(
+        seconds=settings.WORK_QUEUE_CLAIM_SECONDS)
+
+
+def claimed(expiry_date=None):
+    """Return a filter for forms with a live claim.
+
+    :param expiry_date: The date before which claims have lapsed,
+        defaults to ``claim_expiry_date()``.
+    """
+    return Q(claimed_by__isnull=False,
+             claimed_date__gte=expiry_date or claim_expiry_date())
+
+
+def claimable(user=None):
+    """Return a filter for forms with no live claim, or claimed by user.
+
+    :param user: The UserProfile whose own claims are claimable.
+    """
+    q = ~claimed()
+
+    if user:
+        q |= Q(claimed_by=user)
+
+    return q
+
+
+def queue_forms(tally_id, form_state):
+    """Return the forms in a queue, oldest first.
+
+    :param tally_id: The id of the tally.
+    :param form_state: The FormState of the queue.
+
+    :returns: A ResultForm queryset.
+    """
+    return ResultForm.objects.filter(
+        tally__id=tally_id, form_state=form_state).order_by('id')
+
+
+def claim_next_form(result_forms, user):
+    """Claim the first form of a queue for a user.
+
+    A user's live claim on a form of the queue is returned again, so
+    claiming is safe to repeat. Otherwise the first form not claimed by
+    someone else is locked, skipping forms other clerks are claiming,
+    and claimed.
+
+    :param result_forms: An ordered ResultForm queryset of the queue.
+    :param user: The UserProfile claiming the form.
+
+    :returns: The claimed ResultForm, or None if none are waiting.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        result_form = result_forms.filter(
+            claimed_by=user, claimed_date__gte=claim_expiry_date()).first()
+
+        if result_form is None:
+            result_form = result_forms.filter(claimable())\
+                .select_for_update(skip_locked=True, of=('self',))\
+                .first()
+
+        if result_form is None:
+            return None
+
+        ResultForm.objects.filter(pk=result_form.pk).update(
+            claimed_by=user, claimed_date=now)
+
+    result_form.claimed_by = user
+    result_form.claimed_date = now
+
+    return result_form
+
+
+def claim_result_form(result_form, user):
+    """Claim a form if it has no live claim by someone else.
+
+    :param result_form: The ResultForm to claim.
+    :param user: The UserProfile claiming the form.
+
+    :returns: True if the user holds the claim.
+    """
+    now = timezone.now()
+    updated = ResultForm.objects.filter(
+        claimable(user), pk=result_form.pk, form_state=result_form.form_state,
+    ).update(claimed_by=user, claimed_date=now)
+
+    if updated:
+        result_form.claimed_by = user
+        result_form.claimed_date = now
+
+    return bool(updated)
+
+
+def assign_result_forms(result_forms, user):
+    """Claim forms for a user, replacing other claims on them.
+
+    :param result_forms: A ResultForm queryset of the forms to assign.
+    :param user: The UserProfile to assign the forms to.
+
+    :returns: The number of forms assigned.
+    """
+    return ResultForm.objects.filter(pk__in=result_forms.values('pk'))\
+        .update(claimed_by=user, claimed_date=timezone.now())
+
+
+def release_claims(result_forms):
+    """Release the claims on forms.
+
+    :param result_forms: A ResultForm queryset of the forms to release.
+
+    :returns: The number of forms released.
+    """
+    return ResultForm.objects.filter(
+        pk__in=result_forms.values('pk'), claimed_by__isnull=False,
+    ).update(claimed_by=None, claimed_date=None)
+
+
+def queue_counts(tally_id):
+    """Return the number of forms waiting and claimed in each queue.
+
+    :param tally_id: The id of the tally.
+
+    :returns: A list of dicts with the ``form_state``, the number of
+        forms ``waiting`` in it and how many of them are ``claimed``, in
+        ``QUEUE_STATES`` order.
+    """
+    rows = ResultForm.objects.filter(
+        tally__id=tally_id, form_state__in=QUEUE_STATES,
+    ).values('form_state').annotate(
+        waiting=Count('id'),
+        claimed=Count('id', filter=claimed()),
+    ).order_by()
+    counts = {row['form_state']: row for row in rows}
+
+    return [
+        counts.get(
+            form_state,
+            {'form_state': form_state, 'waiting': 0, 'claimed': 0})
+        for form_state in QUEUE_STATES
+    ]
@@ -0,0 +1,393 @@
+"""Set-based state transitions of many result forms.
+
+``ResultForm.reject`` and ``ResultForm.reset_to_unsubmitted`` move one
+form at a time. The functions here move every form of a queryset in one
+transaction: the records of the forms are deactivated with one
+``UPDATE`` per table, the forms with one more, and the transition log,
+reset records and reversion versions of the forms are written with
+``bulk_create``. Forms in corrections whose data entries match are
+promoted to quality control the same way, with their final results and
+reconciliation forms written with ``bulk_create``.
+"""
+import functools
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tally_ho.apps.tally.models.archive import Archive
+from tally_ho.apps.tally.models.audit import Audit
+from tally_ho.apps.tally.models.clearance import Clearance
+from tally_ho.apps.tally.models.quality_control import QualityControl
+from tally_ho.apps.tally.models.reconciliation_form import ReconciliationForm
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.result_form_reset import ResultFormReset
+from tally_ho.apps.tally.models.result_form_transition import (
+    ResultFormTransition,
+)
+from tally_ho.libs.models.enums.entry_version import EntryVersion
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.utils.cache import REPORTS, invalidate_tally_cache
+from tally_ho.libs.utils.revisions import bulk_create_revision
+from tally_ho.libs.workflow.diff import diff_results, election_level_results
+from tally_ho.libs.workflow.queues import claimable
+
+# The records a rejection deactivates, as ResultForm.reject does.
+REJECTED_RECORDS = (Result, ReconciliationForm)
+# The records a reset deactivates, as ResultForm.reset_to_unsubmitted does.
+RESET_RECORDS = (
+    Result,
+    ReconciliationForm,
+    Audit,
+    Clearance,
+    QualityControl,
+    Archive,
+)
+# The review records forms sent to these states need, created for the
+# forms without an active one.
+REVIEW_RECORDS = {
+    FormState.AUDIT: Audit,
+    FormState.CLEARANCE: Clearance,
+}
+# The entered fields of reconciliation forms, which the data entries
+# must match on and the final reconciliation form copies.
+RECONCILIATION_FIELDS = (
+    'ballot_number_from',
+    'ballot_number_to',
+    'number_of_voters',
+    'number_of_voter_cards_in_the_ballot_box',
+    'number_invalid_votes',
+    'number_valid_votes',
+    'number_sorted_and_counted',
+    'notes',
+)
+
+
+def deactivate_records(models, result_form_ids, workflow_request=None):
+    """Deactivate the active records of result forms.
+
+    :param models: The record models to deactivate, with ``active`` and
+        ``result_form`` fields.
+    :param result_form_ids: The ids of the result forms.
+    :param workflow_request: Optional WorkflowRequest to record as the
+        reason results and reconciliation forms were deactivated.
+
+    :returns: A dict of the number of records deactivated by model.
+    """
+    modified_date = timezone.now()
+    deactivated = {}
+
+    for model in models:
+        values = {'active': False, 'modified_date': modified_date}
+
+        if workflow_request and model in (Result, ReconciliationForm):
+            values['deactivated_by_request'] = workflow_request
+
+        deactivated[model] = model.objects.filter(
+            result_form_id__in=result_form_ids,
+            active=True,
+        ).update(**values)
+
+    return deactivated
+
+
+def _lock_result_forms(result_forms, skip_locked=False):
+    """Lock result forms and return their ids, tallies and states."""
+    return list(
+        ResultForm.objects.filter(pk__in=result_forms.values('pk'))
+        .select_for_update(skip_locked=skip_locked)
+        .order_by('pk')
+        .values_list('pk', 'tally_id', 'form_state'))
+
+
+def _record_transitions(rows, user, comment, records=()):
+    """Log the state changes of updated result forms and version them.
+
+    :param rows: The ids, tallies and previous states of the forms.
+    :param user: The user who changed the states.
+    :param comment: The comment of the forms' revision.
+    :param records: Other saved records to version in the revision.
+    """
+    result_forms = ResultForm.objects.in_bulk([pk for pk, _, _ in rows])
+    created_date = timezone.now()
+
+    ResultFormTransition.objects.bulk_create([
+        ResultFormTransition.for_result_form(
+            result_forms[pk], from_state, created_date=created_date,
+            user_id=user.pk if user else None)
+        for pk, _, from_state in rows
+        if from_state != result_forms[pk].form_state
+    ])
+    bulk_create_revision(
+        [*result_forms.values(), *records], user=user, comment=comment)
+
+    for tally_id in {tally_id for _, tally_id, _ in rows}:
+        transaction.on_commit(functools.partial(
+            invalidate_tally_cache, tally_id, REPORTS))
+
+
+@transaction.atomic
+def reject_result_forms(
+        result_forms,
+        new_state=FormState.DATA_ENTRY_1,
+        user=None,
+        reject_reason=None,
+        workflow_request=None,
+        duplicate_reviewed=False):
+    """Reject result forms to a state, as ``ResultForm.reject`` does for
+    one form.
+
+    Deactivates the forms' active results and reconciliation forms, sets
+    their state, previous state, user and reject reason, releases their
+    claims and increments their rejected count and version. Forms sent to
+    audit or clearance get an active audit or clearance record if they
+    have none.
+
+    :param result_forms: A queryset of the result forms to reject.
+    :param new_state: The state to set the forms to.
+    :param user: The user rejecting the forms, required to create audit
+        and clearance records.
+    :param reject_reason: Optional reason text for the rejection.
+    :param workflow_request: Optional WorkflowRequest that triggered the
+        rejection.
+    :param duplicate_reviewed: Whether the forms' duplicates are
+        reviewed.
+
+    :returns: The number of forms rejected.
+    """
+    rows = _lock_result_forms(result_forms)
+    result_form_ids = [pk for pk, _, _ in rows]
+
+    if not rows:
+        return 0
+
+    deactivate_records(
+        REJECTED_RECORDS, result_form_ids, workflow_request=workflow_request)
+    values = {
+        'form_state': new_state,
+        'previous_form_state': F('form_state'),
+        'rejected_count': F('rejected_count') + 1,
+        'duplicate_reviewed': duplicate_reviewed,
+        'reject_reason': reject_reason,
+        'claimed_by': None,
+        'claimed_date': None,
+        'version': F('version') + 1,
+        'modified_date': timezone.now(),
+    }
+
+    if user:
+        values['user'] = user
+
+    ResultForm.objects.filter(pk__in=result_form_ids).update(**values)
+
+    review_model = REVIEW_RECORDS.get(new_state)
+
+    if review_model:
+        reviewed_ids = set(review_model.objects.filter(
+            result_form_id__in=result_form_ids, active=True,
+        ).values_list('result_form_id', flat=True))
+        review_model.objects.bulk_create([
+            review_model(result_form_id=pk, tally_id=tally_id, user=user)
+            for pk, tally_id, _ in rows
+            if pk not in reviewed_ids
+        ])
+
+    _record_transitions(rows, user, f'Rejected to {new_state.name}')
+
+    return len(rows)
+
+
+@transaction.atomic
+def reset_result_forms(result_forms, user, reason):
+    """Reset result forms to unsubmitted, as
+    ``ResultForm.reset_to_unsubmitted`` does for one form.
+
+    Deactivates the forms' active results, reconciliation forms, audits,
+    clearances, quality controls and archives, clears their PVP
+    submission and claims, increments their version, and records a reset
+    per form.
+
+    :param result_forms: A queryset of the result forms to reset.
+    :param user: The user resetting the forms.
+    :param reason: The reason text for the reset.
+
+    :returns: The number of forms reset.
+    """
+    rows = _lock_result_forms(result_forms)
+    result_form_ids = [pk for pk, _, _ in rows]
+
+    if not rows:
+        return 0
+
+    deactivate_records(RESET_RECORDS, result_form_ids)
+    ResultForm.objects.filter(pk__in=result_form_ids).update(
+        form_state=FormState.UNSUBMITTED,
+        pvp_submission=None,
+        claimed_by=None,
+        claimed_date=None,
+        version=F('version') + 1,
+        modified_date=timezone.now())
+    ResultFormReset.objects.bulk_create([
+        ResultFormReset(
+            user=user, result_form_id=pk, tally_id=tally_id, reason=reason)
+        for pk, tally_id, _ in rows
+    ])
+    _record_transitions(rows, user, 'Reset to UNSUBMITTED')
+
+    return len(rows)
+
+
+def _reconciliations(result_form_ids):
+    """Return the entered fields and users of the active reconciliation
+    forms of result forms, by result form id and entry version.
+    """
+    reconciliations = defaultdict(lambda: defaultdict(list))
+    rows = ReconciliationForm.objects.filter(
+        result_form_id__in=result_form_ids, active=True,
+    ).order_by('pk').values(
+        'result_form_id', 'entry_version', 'user_id', *RECONCILIATION_FIELDS)
+
+    for row in rows:
+        result_form_id = row.pop('result_form_id')
+        reconciliations[result_form_id][row.pop('entry_version')].append(row)
+
+    return reconciliations
+
+
+def _reconciliation_matches(entries):
+    """Return the data entry 2 reconciliation of a form if it matches
+    data entry 1, or None.
+
+    :param entries: The form's reconciliation rows by entry version.
+    """
+    data_entry_1 = entries.get(EntryVersion.DATA_ENTRY_1, [])
+    data_entry_2 = entries.get(EntryVersion.DATA_ENTRY_2, [])
+
+    if len(data_entry_1) != 1 or len(data_entry_2) != 1 or\
+            entries.get(EntryVersion.FINAL):
+        return None
+
+    if any(data_entry_1[0][name] != data_entry_2[0][name]
+           for name in RECONCILIATION_FIELDS):
+        return None
+
+    return data_entry_2[0]
+
+
+@transaction.atomic
+def promote_result_forms(result_forms, user=None):
+    """Promote the forms in corrections whose data entries match to
+    quality control, as ``CorrectionMatchView`` does for one form.
+
+    A form is promoted when both data entries have the same votes for
+    every candidate and, if it has reconciliation forms, the same entered
+    reconciliation fields. Its final results and reconciliation form are
+    copied from data entry 2, its state, previous state and user are set,
+    and its claim released and version incremented. Forms claimed by a
+    clerk or locked by another transaction, forms with final results and
+    forms whose entries differ stay in corrections.
+
+    :param result_forms: A queryset of the result forms to promote.
+    :param user: The user promoting the forms, None when they are
+        promoted automatically. Final reconciliation forms promoted
+        automatically keep the user of data entry 2.
+
+    :returns: The number of forms promoted.
+    """
+    rows = _lock_result_forms(
+        result_forms.filter(claimable(user), form_state=FormState.CORRECTION),
+        skip_locked=True)
+    result_form_ids = [pk for pk, _, _ in rows]
+    diffs = diff_results(election_level_results(
+        Result.objects.filter(result_form_id__in=result_form_ids)))
+    reconciliations = _reconciliations(result_form_ids)
+    promoted = []
+    results = []
+    recon_forms = []
+
+    for pk, tally_id, from_state in rows:
+        diff = diffs.get(pk)
+
+        if diff is None or not diff.entries_match or diff.final or\
+                diff.duplicated:
+            continue
+
+        reconciliation = None
+
+        if pk in reconciliations:
+            reconciliation = _reconciliation_matches(reconciliations[pk])
+
+            if reconciliation is None:
+                continue
+
+            user_id = reconciliation.pop('user_id')
+            recon_forms.append(ReconciliationForm(
+                result_form_id=pk,
+                tally_id=tally_id,
+                user_id=user.pk if user else user_id,
+                entry_version=EntryVersion.FINAL,
+                **reconciliation))
+
+        promoted.append((pk, tally_id, from_state))
+        results.extend(
+            Result(result_form_id=pk,
+                   tally_id=tally_id,
+                   candidate_id=candidate_id,
+                   user=user,
+                   entry_version=EntryVersion.FINAL,
+                   votes=votes)
+            for candidate_id, (votes,) in diff.data_entry_2.items())
+
+    if not promoted:
+        return 0
+
+    Result.objects.bulk_create(results)
+    # Final results are never updated, so their table holds their
+    # history and only the reconciliation forms join the forms' revision.
+    recon_forms = ReconciliationForm.objects.bulk_create(recon_forms)
+    ResultForm.objects.filter(pk__in=[pk for pk, _, _ in promoted]).update(
+        form_state=FormState.QUALITY_CONTROL,
+        previous_form_state=F('form_state'),
+        user=user,
+        claimed_by=None,
+        claimed_date=None,
+        version=F('version') + 1,
+        modified_date=timezone.now())
+    _record_transitions(
+        promoted, user, 'Promoted matching entries to QUALITY_CONTROL',
+        records=recon_forms)
+
+    return len(promoted)
+
+
+def promote_matching_forms(tally_id, user=None, batch_size=None):
+    """Promote the forms in corrections of a tally whose data entries
+    match, in batches of one transaction each.
+
+    :param tally_id: The id of the tally.
+    :param user: The user promoting the forms, None when they are
+        promoted automatically.
+    :param batch_size: The number of forms to read per batch, defaults
+        to ``MATCHING_FORMS_PROMOTION_BATCH_SIZE``.
+
+    :returns: The number of forms promoted.
+    """
+    batch_size = batch_size or settings.MATCHING_FORMS_PROMOTION_BATCH_SIZE
+    queue = ResultForm.objects.filter(
+        tally__id=tally_id, form_state=FormState.CORRECTION).order_by('pk')
+    promoted = 0
+    last_pk = 0
+
+    while True:
+        pks = list(queue.filter(pk__gt=last_pk).values_list(
+            'pk', flat=True)[:batch_size])
+
+        if not pks:
+            return promoted
+
+        promoted += promote_result_forms(
+            ResultForm.objects.filter(pk__in=pks), user=user)
+        last_pk = pks[-1]
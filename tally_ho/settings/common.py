@@ -11,6 +11,8 @@ https://docs.djangoproject.com/en/1.6/ref/settings/
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 import os
 
+from tally_ho.settings.database import connection_settings
+
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 
 
@@ -41,7 +43,9 @@ INSTALLED_APPS = (
 )
 
 MIDDLEWARE = (
-    'tracking.middleware.VisitorTrackingMiddleware',
+    'tally_ho.libs.middleware.query_budget.QueryBudgetMiddleware',
+    'tally_ho.libs.middleware.visitor_tracking.'
+    'BufferedVisitorTrackingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -49,12 +53,13 @@ MIDDLEWARE = (
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'reversion.middleware.RevisionMiddleware',
     'tally_ho.libs.middleware.idle_timeout.IdleTimeout',
     'tally_ho.libs.middleware.user_restrict.UserRestrictMiddleware',
     'tally_ho.libs.middleware.disable_clientside_caching.'
     'DisableClientsideCachingMiddleware',
     'tally_ho.libs.middleware.exception_logging.ExceptionLoggingMiddleware',
+    'tally_ho.libs.middleware.result_form_conflict.'
+    'ResultFormConflictMiddleware',
 )
 
 ROOT_URLCONF = 'tally_ho.urls'
@@ -71,6 +76,8 @@ DATABASES = {
         'USER': 'postgres',
         'PASSWORD': 'postgres',
         'HOST': '127.0.0.1',
+        # Reuse connections across requests, see settings/database.py
+        **connection_settings(),
     }
 }
 
@@ -153,6 +160,32 @@ DEFAULT_IDLE_TIMEOUT = 60
 # Individual pageviews will be tracked
 TRACK_PAGEVIEWS = True
 
+# Visits are buffered and written in batches, see
+# libs/utils/visitor_tracking.py. Use 'redis' when a Celery beat flushes
+# the buffer, None to write during each request.
+TRACK_BUFFER_BACKEND = 'memory'
+TRACK_BUFFER_SIZE = 100
+TRACK_BUFFER_FLUSH_INTERVAL = 30
+
+# Fraction of AJAX requests, e.g. datatable polls, to track. AJAX requests
+# must pass django-tracking2's checks for sampling to apply.
+TRACK_AJAX_REQUESTS = True
+TRACK_AJAX_SAMPLE_RATE = 0
+TRACK_IGNORE_URLS = (
+    r'^(favicon\.ico|robots\.txt)$',
+    r'^static/',
+    r'^data/[\w-]+-data/',
+)
+
+# Views and Celery tasks log their query count, database time and repeated
+# queries, see libs/utils/query_budget.py. A statement run
+# QUERY_REPEAT_THRESHOLD times in one request or task is reported as a
+# likely N+1 query. With QUERY_BUDGET_STRICT, views running more queries
+# than their declared budget raise QueryBudgetExceeded.
+QUERY_INSTRUMENTATION = True
+QUERY_REPEAT_THRESHOLD = 10
+QUERY_BUDGET_STRICT = False
+
 LOCALE_PATHS = (os.path.realpath(os.path.join(BASE_DIR, '..', 'locale')),)
 
 # Logging
@@ -177,6 +210,43 @@ DEFAULT_AUTO_FIELD='django.db.models.AutoField'
 # Memcache settings
 CLIENT_URL = '127.0.0.1:11211'
 
+# Shared by every web and celery worker process, see libs/utils/cache.py.
+# ignore_exc turns an unreachable memcached into cache misses.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': CLIENT_URL,
+        'KEY_PREFIX': 'tally_ho',
+        'OPTIONS': {
+            'no_delay': True,
+            'ignore_exc': True,
+            'max_pool_size': 10,
+            'use_pooling': True,
+        },
+    }
+}
+TALLY_CACHE_ALIAS = 'default'
+
+# Server side DataTables, see libs/views/datatables.py. Counts and page
+# cursors are cached for DATATABLE_CACHE_TIMEOUT seconds, unfiltered tables
+# of at least DATATABLE_ESTIMATED_COUNT_MIN rows report the planner's row
+# estimate instead of a count.
+DATATABLE_CACHE_TIMEOUT = 60
+DATATABLE_ESTIMATED_COUNT_MIN = 100000
+
+# Dashboard lists, see seek_paging in libs/views/pagination.py, page without
+# counting and show a number of pages from a count cached for
+# PAGINATION_COUNT_CACHE_TIMEOUT seconds.
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+# Models never versioned by django-reversion, see libs/utils/revisions.py.
+# AllCandidatesVotes is a database view and ResultFormStats is written on
+# every workflow step.
+REVERSION_EXCLUDED_MODELS = (
+    'tally.AllCandidatesVotes',
+    'tally.ResultFormStats',
+)
+
 # Celery settings
 ## use True for testing and False when you use rabbitMQ and celery
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
@@ -194,6 +264,49 @@ CELERY_ROUTES = {
     }
 }
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+# Heavy reports read snapshots of the tally tables, see
+# libs/utils/analytics.py. Reports read the database when the latest
+# snapshot is older than ANALYTICS_SNAPSHOT_MAX_AGE seconds, set it to 0
+# to always read the database.
+ANALYTICS_SNAPSHOT_DIR = os.path.join(BASE_DIR, '..', 'data', 'analytics')
+ANALYTICS_SNAPSHOT_INTERVAL = 300
+ANALYTICS_SNAPSHOT_MAX_AGE = 600
+# Uploaded tally setup files are converted once to Parquet files, with a
+# report of their columns, rows and validation, in UPLOAD_INGEST_PATH. The
+# imports read the Parquet files instead of the CSV files.
+UPLOAD_INGEST_PATH = os.path.join(BASE_DIR, '..', 'data', 'ingested')
+# PowerPoint results exports are written by a Celery task to a directory
+# per tally, and removed after RESULTS_PRESENTATION_MAX_AGE seconds.
+RESULTS_PRESENTATION_DIR = os.path.join(
+    BASE_DIR, '..', 'data', 'presentations')
+RESULTS_PRESENTATION_MAX_AGE = 60 * 60 * 24
+# A clerk's claim on the next form of a work queue lapses after
+# WORK_QUEUE_CLAIM_SECONDS, returning the form to the queue.
+WORK_QUEUE_CLAIM_SECONDS = 60 * 15
+# Tallies that promote matching forms automatically have the forms in
+# corrections whose data entries match moved to quality control every
+# MATCHING_FORMS_PROMOTION_INTERVAL seconds, in batches of
+# MATCHING_FORMS_PROMOTION_BATCH_SIZE forms.
+MATCHING_FORMS_PROMOTION_INTERVAL = 60
+MATCHING_FORMS_PROMOTION_BATCH_SIZE = 500
+
+CELERY_BEAT_SCHEDULE = {
+    'flush-visitor-tracking': {
+        'task': 'tally_ho.apps.tally.management.commands.'
+        'flush_visitor_tracking.flush_visitor_tracking',
+        'schedule': 30.0,
+    },
+    'snapshot-analytics': {
+        'task': 'tally_ho.apps.tally.management.commands.'
+        'snapshot_analytics.snapshot_analytics',
+        'schedule': float(ANALYTICS_SNAPSHOT_INTERVAL),
+    },
+    'promote-matching-forms': {
+        'task': 'tally_ho.apps.tally.management.commands.'
+        'promote_matching_forms.promote_matching_forms',
+        'schedule': float(MATCHING_FORMS_PROMOTION_INTERVAL),
+    },
+}
 
 # Quaritine trigger data
 QUARANTINE_DATA = [
@@ -300,19 +413,6 @@ SUB_CON_FILE_COLS_NAMES_TO_SUB_CON_MODEL_FIELDS =\
     'constituency_name': 'constituency'
 }
 
-# Maps result form file columns to ResultForm Model fields
-RESULT_FORM_FILE_COLS_NAMES_TO_RESULT_FORM_MODEL_FIELDS =\
-{
-    'station_number': 'station_number',
-    'name': 'name',
-    'barcode': 'barcode',
-    'serial_number': 'serial_number',
-    'gender': 'gender',
-    'center_code': 'center',
-    'office_name': 'office',
-    'ballot_number' : 'ballot',
-    'region_name': 'region'
-}
 # Maps stations file columns to Station Model fields
 STATIONS_FILE_COLS_NAMES_TO_STATION_MODEL_FIELDS =\
 {
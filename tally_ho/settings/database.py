@@ -0,0 +1,68 @@
+"""Database connection reuse settings shared by the settings modules.
+
+Two modes are supported, selected with environment variables so the same
+settings module can be tuned per deployment:
+
+- persistent connections (default): each worker keeps its connection open
+  for ``TALLY_HO_DB_CONN_MAX_AGE`` seconds and Django checks it is still
+  usable before reusing it.
+- pooled connections: setting ``TALLY_HO_DB_POOL_MAX_SIZE`` switches to
+  psycopg's built-in pool (``OPTIONS['pool']``, Django 5.1+). Persistent
+  connections are disabled in this mode because Django does not support
+  combining the two.
+
+See ``docs/operations/database-connections.md`` for sizing guidance.
+"""
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+
+    if value is None or value == '':
+        return default
+
+    return int(value)
+
+
+def connection_settings(conn_max_age=60,
+                        pool_min_size=None,
+                        pool_max_size=None,
+                        pool_timeout=10):
+    """Return the connection related keys of a ``DATABASES`` entry.
+
+    Environment variables take precedence over the arguments so operators
+    can change the mode without editing a settings module.
+
+    :param conn_max_age: Seconds to keep a persistent connection open,
+        ``None`` to keep it open forever, ``0`` to close after each request.
+    :param pool_min_size: Connections the pool keeps open when idle.
+    :param pool_max_size: Maximum connections per pool, ``None`` disables
+        pooling.
+    :param pool_timeout: Seconds to wait for a free pooled connection
+        before raising an error.
+
+    :returns: A dict to merge into a ``DATABASES`` entry.
+    """
+    pool_max_size = _env_int('TALLY_HO_DB_POOL_MAX_SIZE', pool_max_size)
+
+    if pool_max_size:
+        pool_min_size = _env_int('TALLY_HO_DB_POOL_MIN_SIZE', pool_min_size)
+        pool_timeout = _env_int('TALLY_HO_DB_POOL_TIMEOUT', pool_timeout)
+
+        return {
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': False,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': min(pool_min_size or 1, pool_max_size),
+                    'max_size': pool_max_size,
+                    'timeout': pool_timeout,
+                },
+            },
+        }
+
+    return {
+        'CONN_MAX_AGE': _env_int('TALLY_HO_DB_CONN_MAX_AGE', conn_max_age),
+        'CONN_HEALTH_CHECKS': True,
+    }
@@ -1 +1,9 @@
 from tally_ho.settings.common import *  # noqa
+
+# Database connections are reused per worker, see settings/database.py.
+# uwsgi runs 32 processes, to cap the server side connection count switch to
+# a pool instead, e.g.:
+#
+# from tally_ho.settings.common import DATABASES
+# from tally_ho.settings.database import connection_settings
+# DATABASES['default'].update(connection_settings(pool_max_size=2))
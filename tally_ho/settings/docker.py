@@ -12,6 +12,8 @@ inherits ``tally_ho.settings.common`` and keeps ``DEBUG=False``.
 import os
 
 from tally_ho.settings.common import *  # noqa
+from tally_ho.settings.common import CACHES
+from tally_ho.settings.database import connection_settings
 
 DEBUG = True
 
@@ -23,12 +25,22 @@ DATABASES = {
         'PASSWORD': 'db1_password',
         'HOST': 'db1',
         'PORT': 5432,
+        # gunicorn runs a handful of sync workers in the demo stack, keep
+        # their connections open between requests.
+        **connection_settings(conn_max_age=300),
     }
 }
 
+CLIENT_URL = 'memcached:11211'
+CACHES['default']['LOCATION'] = CLIENT_URL
+
 CELERY_BROKER_URL = 'redis://redis:6379/0'
 CELERY_RESULT_BACKEND = 'cache+memcached://memcached:11211/'
 
+# The worker runs celery beat, which flushes the shared buffer.
+TRACK_BUFFER_BACKEND = 'redis'
+TRACK_BUFFER_URL = 'redis://redis:6379/1'
+
 # Trust the host port the nginx container is bound to so POSTs pass CSRF.
 _http_port = os.environ.get('TALLY_HO_HTTP_PORT', '8000')
 CSRF_TRUSTED_ORIGINS = [
@@ -12,7 +12,7 @@ from tally_ho.apps.tally.views import (audit, clearance, corrections,
                                        data_entry, home, intake, profile,
                                        pvp as pvp_views,
                                        quality_control, super_admin,
-                                       tally_manager)
+                                       tally_manager, work_queues)
 from tally_ho.apps.tally.views.data import (ballot_list_view,
                                             candidate_list_view,
                                             center_list_view,
@@ -567,6 +567,11 @@ urlpatterns = [
         super_admin.ResetFormConfirmationView.as_view(),
         name="reset-form-confirmation",
     ),
+    re_path(
+        r"^super-administrator/bulk-form-state/(?P<tally_id>(\d+))$",
+        super_admin.BulkFormStateView.as_view(),
+        name="bulk-form-state",
+    ),
     re_path(
         r"^super-administrator/form-progress/(?P<tally_id>(\d+))/$",
         super_admin.FormProgressView.as_view(),
@@ -1013,6 +1018,16 @@ urlpatterns = [
         corrections.ConfirmationView.as_view(),
         name="corrections-success",
     ),
+    re_path(
+        r"^work-queues/(?P<tally_id>(\d+))/$",
+        work_queues.WorkQueuesView.as_view(),
+        name="work-queues",
+    ),
+    re_path(
+        r"^work-queues/claim/(?P<tally_id>(\d+))/(?P<form_state>\w+)/$",
+        work_queues.ClaimNextFormView.as_view(),
+        name="work-queue-claim",
+    ),
     re_path(
         r"^audit/(?P<tally_id>(\d+))/$",
         audit.DashboardView.as_view(),
@@ -1361,6 +1376,20 @@ urlpatterns = [
         election_statistics_report.ElectionStatisticsDataView.as_view(),
         name="election-statistics-data",
     ),
+    re_path(
+        r"^reports/internal/results-presentation-progress/"
+        r"(?P<tally_id>(\d+))/(?P<task_id>[\w\-]+)/$",
+        administrative_areas_reports.ResultsPresentationProgressView
+        .as_view(),
+        name="results-presentation-progress",
+    ),
+    re_path(
+        r"^reports/internal/results-presentation/"
+        r"(?P<tally_id>(\d+))/(?P<file_name>[\w\-]+\.pptx)/$",
+        administrative_areas_reports.ResultsPresentationDownloadView
+        .as_view(),
+        name="results-presentation-download",
+    ),
     re_path(
         r"^reports/internal/center-overall-votes/(?P<tally_id>(\d+))/$",
         overall_votes.OverallVotes.as_view(),
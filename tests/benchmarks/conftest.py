@@ -0,0 +1,286 @@
+"""Benchmark harness for the reports, exports, imports and workflow.
+
+Benchmarks run against synthetic tallies, see
+``docs/operations/benchmarks.md``:
+
+    uv run pytest tests/benchmarks --benchmark-sizes small,medium
+
+Each benchmark records the median wall time over
+``--benchmark-rounds`` rounds, the number of queries and the peak Python
+memory of one more round. Rounds run in a transaction that is rolled back
+so benchmarks that write can be repeated. Results are compared with the
+baselines in ``--benchmark-baseline``, a benchmark fails when it is more
+than ``--benchmark-threshold`` slower, and ``NOISE_SECONDS`` slower, uses
+more queries or more than ``--benchmark-threshold`` more memory.
+``--benchmark-save`` writes the results as the new baselines instead.
+"""
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from django.db import connection, transaction
+
+from tally_ho.apps.tally.management.commands.create_synthetic_tally import (
+    create_synthetic_tally,
+)
+from tally_ho.apps.tally.models.user_profile import UserProfile
+from tally_ho.libs.permissions import groups
+
+DEFAULT_BASELINE = Path('.benchmarks') / 'baselines.json'
+SEED = 1
+# Timings within this many seconds of their baseline are noise, however
+# large the fraction.
+NOISE_SECONDS = 0.1
+
+# Sizes of the synthetic tallies, large is the create_synthetic_tally
+# default of about 50,000 result forms and 5 million results.
+SIZES = {
+    'small': {
+        'regions': 1,
+        'offices_per_region': 1,
+        'sub_cons_per_office': 2,
+        'centers_per_sub_con': 5,
+        'stations_per_center': 5,
+        'ballots': 4,
+        'ballots_per_sub_con': 2,
+        'candidates_per_ballot': 10,
+        'duplicates': 5,
+        'replacements': 5,
+    },
+    'medium': {
+        'regions': 2,
+        'offices_per_region': 2,
+        'sub_cons_per_office': 5,
+        'centers_per_sub_con': 10,
+        'stations_per_center': 5,
+        'ballots': 20,
+        'ballots_per_sub_con': 2,
+        'candidates_per_ballot': 25,
+        'duplicates': 50,
+        'replacements': 50,
+    },
+    'large': {},
+}
+
+_results_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmarks')
+    group.addoption(
+        '--benchmark-sizes',
+        default='small',
+        help=f'Comma separated tally sizes, of {", ".join(SIZES)}.')
+    group.addoption(
+        '--benchmark-rounds',
+        type=int,
+        default=3,
+        help='Timed rounds per benchmark.')
+    group.addoption(
+        '--benchmark-baseline',
+        default=str(DEFAULT_BASELINE),
+        help='JSON file of baselines to compare with or save to.')
+    group.addoption(
+        '--benchmark-save',
+        action='store_true',
+        help='Save the results as the baselines instead of comparing.')
+    group.addoption(
+        '--benchmark-threshold',
+        type=float,
+        default=0.25,
+        help='Fraction a result may exceed its baseline by.')
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = {}
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = metafunc.config.getoption('benchmark_sizes').split(',')
+        unknown = set(sizes) - set(SIZES)
+
+        if unknown:
+            raise pytest.UsageError(
+                f'Unknown benchmark sizes: {", ".join(sorted(unknown))}')
+
+        metafunc.parametrize('size', sizes, scope='session')
+
+
+@pytest.fixture(scope='session')
+def synthetic_tally(size, django_db_setup, django_db_blocker):
+    """The synthetic tally of a size, created once per session."""
+    with django_db_blocker.unblock():
+        tally, _ = create_synthetic_tally(
+            name=f'Benchmark {size}', seed=SEED, clean=True, **SIZES[size])
+
+    return tally
+
+
+@pytest.fixture
+def user(db, synthetic_tally):
+    """A tally manager with access to the synthetic tally."""
+    user = UserProfile.objects.create(username='benchmark')
+    groups.create_permission_groups()
+    groups.add_user_to_group(user, groups.TALLY_MANAGER)
+    synthetic_tally.users.add(user)
+
+    return user
+
+
+def load_baselines(path):
+    path = Path(path)
+
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+def find_regressions(result, baseline, threshold):
+    """Return descriptions of the measures of a result over its baseline.
+
+    :param result: A dict of the measured ``seconds``, ``queries`` and
+        ``peak_memory``.
+    :param baseline: A dict of the same measures from an earlier run.
+    :param threshold: The fraction a measure may exceed its baseline by.
+
+    :returns: A list of strings, empty if there is no regression.
+    """
+    regressions = []
+
+    for measure in ('seconds', 'queries', 'peak_memory'):
+        if measure not in baseline:
+            continue
+
+        limit = baseline[measure] * (1 + threshold)
+
+        if measure == 'queries':
+            # Query counts are deterministic, any increase is a regression.
+            limit = baseline[measure]
+        elif measure == 'seconds':
+            limit = max(limit, baseline[measure] + NOISE_SECONDS)
+
+        if result[measure] > limit:
+            regressions.append(
+                f'{measure} {result[measure]:.4g} > baseline '
+                f'{baseline[measure]:.4g}')
+
+    return regressions
+
+
+class QueryCounter(object):
+    """A database execute wrapper counting the queries it runs."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+
+class Benchmark(object):
+    def __init__(self, name, config):
+        self.name = name
+        self.rounds = config.getoption('benchmark_rounds')
+        self.threshold = config.getoption('benchmark_threshold')
+        self.baseline = load_baselines(
+            config.getoption('benchmark_baseline')).get(name)
+        self.save = config.getoption('benchmark_save')
+        self.results = config.stash[_results_key]
+
+    def _round(self, func, setup, trace):
+        with transaction.atomic():
+            args = setup() if setup else ()
+
+            queries = QueryCounter()
+
+            with connection.execute_wrapper(queries):
+                if trace:
+                    tracemalloc.start()
+
+                started = time.perf_counter()
+                func(*args)
+                seconds = time.perf_counter() - started
+
+                if trace:
+                    _, peak_memory = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+            transaction.set_rollback(True)
+
+        return (seconds, queries.count, peak_memory) if trace else seconds
+
+    def __call__(self, func, setup=None):
+        """Measure a function and compare it with its baseline.
+
+        :param func: The function to measure.
+        :param setup: A function run before each round, outside the timer,
+            returning the arguments of ``func``.
+
+        :returns: A dict of the measured ``seconds``, ``queries`` and
+            ``peak_memory``.
+        """
+        _, queries, peak_memory = self._round(func, setup, trace=True)
+        result = {
+            'seconds': statistics.median(
+                self._round(func, setup, trace=False)
+                for _ in range(self.rounds)),
+            'queries': queries,
+            'peak_memory': peak_memory,
+        }
+        self.results[self.name] = result
+
+        if self.baseline and not self.save:
+            regressions = find_regressions(
+                result, self.baseline, self.threshold)
+
+            if regressions:
+                pytest.fail(f'{self.name} regressed: '
+                            f'{"; ".join(regressions)}', pytrace=False)
+
+        return result
+
+
+@pytest.fixture
+def benchmark(request, db):
+    return Benchmark(request.node.nodeid, request.config)
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(_results_key, {})
+
+    if not results or not session.config.getoption('benchmark_save'):
+        return
+
+    path = Path(session.config.getoption('benchmark_baseline'))
+    baselines = load_baselines(path)
+    baselines.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_results_key, {})
+
+    if not results:
+        return
+
+    terminalreporter.section('benchmarks')
+    terminalreporter.write_line(
+        f'{"benchmark":<70} {"seconds":>10} {"queries":>8} {"peak MiB":>9}')
+
+    for name, result in sorted(results.items()):
+        terminalreporter.write_line(
+            f'{name.split("::", 1)[-1]:<70} {result["seconds"]:>10.4f} '
+            f'{result["queries"]:>8} '
+            f'{result["peak_memory"] / 2 ** 20:>9.1f}')
+
+    if config.getoption('benchmark_save'):
+        terminalreporter.write_line(
+            f'Saved baselines to {config.getoption("benchmark_baseline")}')
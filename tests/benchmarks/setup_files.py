@@ -0,0 +1,115 @@
+"""Write the tally setup files of a tally, in the formats the importers read.
+
+The files of a synthetic tally give the importer benchmarks input of the
+same size and shape as the tally, see ``tally_setup_files`` in the test
+fixtures for examples of the formats.
+"""
+import csv
+from pathlib import Path
+
+from tally_ho.apps.tally.models.ballot import Ballot
+from tally_ho.apps.tally.models.candidate import Candidate
+from tally_ho.apps.tally.models.center import Center
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.station import Station
+from tally_ho.apps.tally.models.sub_constituency import SubConstituency
+
+
+def _write_csv(path, header, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_setup_files(tally, directory):
+    """Write the setup files of a tally to a directory.
+
+    :param tally: The tally to write the files of.
+    :param directory: The directory to write the files to.
+
+    :returns: A dict of file paths by name, ``ballots``, ``subcons``,
+        ``subs_ballots``, ``centers``, ``stations``, ``candidates``,
+        ``ballot_order`` and ``result_forms``.
+    """
+    directory = Path(directory)
+    paths = {
+        name: directory / f'{name}.csv'
+        for name in ['ballots', 'subcons', 'subs_ballots', 'centers',
+                     'stations', 'candidates', 'ballot_order',
+                     'result_forms']
+    }
+    ballots = Ballot.objects.filter(tally=tally)\
+        .select_related('electrol_race').order_by('number')
+    sub_cons = SubConstituency.objects.filter(tally=tally)\
+        .select_related('constituency').prefetch_related('ballots')\
+        .order_by('code')
+    candidates = Candidate.objects.filter(tally=tally)\
+        .select_related('ballot', 'electrol_race').order_by('candidate_id')
+
+    _write_csv(
+        paths['ballots'],
+        ['election_level', 'sub_type', 'number'],
+        ((ballot.electrol_race.election_level,
+          ballot.electrol_race.ballot_name,
+          ballot.number) for ballot in ballots))
+    _write_csv(
+        paths['subcons'],
+        ['sub_constituency_code', 'number_of_ballots', 'constituency_name',
+         'sub_constituency_name'],
+        ((sub_con.code, len(sub_con.ballots.all()),
+          sub_con.constituency.name, sub_con.name) for sub_con in sub_cons))
+    _write_csv(
+        paths['subs_ballots'],
+        ['sub_constituency_code', 'ballot_number'],
+        ((sub_con.code, ballot.number)
+         for sub_con in sub_cons for ballot in sub_con.ballots.all()))
+    _write_csv(
+        paths['centers'],
+        ['center_id', 'name', 'center_type', 'center_lat', 'center_lon',
+         'region_name', 'office_name', 'office_id', 'constituency_name',
+         'subconstituency_id', 'mahalla_name', 'village_name', 'reg_open'],
+        ((center.code, center.name, 'General', center.latitude,
+          center.longitude, center.office.region.name, center.office.name,
+          center.office.number, center.constituency.name,
+          center.sub_constituency.code, center.mahalla, center.village, 1)
+         for center in Center.objects.filter(tally=tally).select_related(
+             'office__region', 'constituency', 'sub_constituency')
+         .order_by('code')))
+    _write_csv(
+        paths['stations'],
+        ['center_code', 'center_name', 'sub_constituency_code',
+         'station_number', 'station_gender', 'station_registrants'],
+        ((station.center.code, station.center.name,
+          station.sub_constituency.code, station.station_number,
+          station.gender.name.lower(), station.registrants)
+         for station in Station.objects.filter(tally=tally).select_related(
+             'center', 'sub_constituency')
+         .order_by('center__code', 'station_number')))
+    _write_csv(
+        paths['candidates'],
+        ['candidate_id', 'candidate_full_name', 'ballot_number',
+         'race_type'],
+        ((candidate.candidate_id, candidate.full_name,
+          candidate.ballot.number, candidate.electrol_race.ballot_name)
+         for candidate in candidates))
+    _write_csv(
+        paths['ballot_order'],
+        ['candidate_id', 'ballot_order'],
+        ((candidate.candidate_id, candidate.order)
+         for candidate in candidates))
+    # Replacement forms have no center or ballot and are not imported.
+    _write_csv(
+        paths['result_forms'],
+        ['ballot_number', 'center_code', 'station_number', 'gender', 'name',
+         'office_name', 'barcode', 'serial_number', 'region_name'],
+        ((result_form.ballot.number, result_form.center.code,
+          result_form.station_number, result_form.gender.name.lower(),
+          result_form.center.name, result_form.office.name,
+          result_form.barcode, result_form.serial_number,
+          result_form.office.region.name)
+         for result_form in ResultForm.objects.filter(
+             tally=tally, is_replacement=False).select_related(
+             'ballot', 'center', 'office__region').order_by('barcode')))
+
+    return paths
@@ -0,0 +1,28 @@
+import os
+
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.views.exports import (
+    export_candidate_votes,
+    save_barcode_results,
+)
+
+
+def _remove(path):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def test_export_candidate_votes(benchmark, synthetic_tally):
+    benchmark(lambda: _remove(export_candidate_votes(
+        output_to_file=False, tally_id=synthetic_tally.id)))
+
+
+def test_save_barcode_results(benchmark, synthetic_tally):
+    barcodes = ResultForm.objects.filter(
+        tally=synthetic_tally,
+        form_state=FormState.ARCHIVED).values_list('barcode', flat=True)
+    barcodes = list(barcodes)
+
+    benchmark(lambda: _remove(save_barcode_results(
+        barcodes, output_to_file=False, tally_id=synthetic_tally.id)))
@@ -0,0 +1,77 @@
+import pytest
+
+from tally_ho.apps.tally.management.commands.asign_ballots_to_sub_cons import (
+    async_asign_ballots_to_sub_cons_from_ballots_file,
+)
+from tally_ho.apps.tally.management.commands.import_candidates import (
+    async_import_candidates_from_candidates_file,
+)
+from tally_ho.apps.tally.management.commands.import_centers import (
+    async_import_centers_from_centers_file,
+)
+from tally_ho.apps.tally.management.commands.import_electrol_races_and_ballots\
+    import async_import_electrol_races_and_ballots_from_ballots_file
+from tally_ho.apps.tally.management.commands.import_result_forms import (
+    async_import_results_forms_from_result_forms_file,
+)
+from tally_ho.apps.tally.management.commands.import_stations import (
+    async_import_stations_from_stations_file,
+)
+from tally_ho.apps.tally.management.commands.import_sub_cons_and_cons import (
+    async_import_sub_constituencies_and_constituencies_from_sub_cons_file,
+)
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.apps.tally.models.tally import Tally
+from .setup_files import write_setup_files
+
+# The import steps in the order a tally is set up, each step needs the
+# rows of the steps before it.
+STEPS = [
+    ('ballots', async_import_electrol_races_and_ballots_from_ballots_file),
+    ('subcons',
+     async_import_sub_constituencies_and_constituencies_from_sub_cons_file),
+    ('subs_ballots', async_asign_ballots_to_sub_cons_from_ballots_file),
+    ('centers', async_import_centers_from_centers_file),
+    ('stations', async_import_stations_from_stations_file),
+    ('candidates', async_import_candidates_from_candidates_file),
+    ('result_forms', async_import_results_forms_from_result_forms_file),
+]
+
+
+@pytest.fixture(scope='session')
+def setup_files(synthetic_tally, django_db_blocker, tmp_path_factory):
+    with django_db_blocker.unblock():
+        return write_setup_files(
+            synthetic_tally, tmp_path_factory.mktemp('setup_files'))
+
+
+def _import(step, tally, setup_files):
+    name, task = STEPS[step]
+    task(tally_id=tally.id,
+         csv_file_path=str(setup_files[name]),
+         ballot_order_file_path=str(setup_files['ballot_order']))
+
+
+@pytest.mark.parametrize('step', range(len(STEPS)),
+                         ids=[name for name, _ in STEPS])
+def test_import(benchmark, synthetic_tally, setup_files, step):
+    def setup():
+        tally = Tally.objects.create(name='Benchmark import')
+
+        for previous_step in range(step):
+            _import(previous_step, tally, setup_files)
+
+        return (tally,)
+
+    benchmark(lambda tally: _import(step, tally, setup_files), setup=setup)
+
+
+def test_import_creates_tally(synthetic_tally, setup_files, db):
+    tally = Tally.objects.create(name='Benchmark import')
+
+    for step in range(len(STEPS)):
+        _import(step, tally, setup_files)
+
+    assert ResultForm.objects.filter(tally=tally).count() ==\
+        ResultForm.objects.filter(
+            tally=synthetic_tally, is_replacement=False).count()
@@ -0,0 +1,52 @@
+import pytest
+from django.test import RequestFactory
+
+from tally_ho.apps.tally.models.result import Result
+from tally_ho.apps.tally.views.reports.administrative_areas_reports import (
+    results_queryset,
+)
+from tally_ho.apps.tally.views.reports.election_statistics_report import (
+    generate_election_statistics,
+)
+from tally_ho.apps.tally.views.reports.turnout_reports_by_admin_areas import (
+    TurnoutReportByAdminAreasDataView,
+)
+from tally_ho.apps.tally.views.reports.turnout_reports_by_gender import (
+    TurnoutReportByGenderAndAdminAreasDataView,
+)
+
+ADMIN_LEVELS = ['region', 'office', 'constituency', 'sub_constituency']
+
+
+def test_results_queryset(benchmark, synthetic_tally):
+    benchmark(lambda: list(results_queryset(
+        synthetic_tally.id, Result.objects.filter(tally=synthetic_tally))))
+
+
+def test_generate_election_statistics(benchmark, synthetic_tally):
+    benchmark(lambda: generate_election_statistics(
+        synthetic_tally.id, 'Parliamentary'))
+
+
+@pytest.mark.parametrize('view_class', [
+    TurnoutReportByAdminAreasDataView,
+    TurnoutReportByGenderAndAdminAreasDataView,
+], ids=['admin_areas', 'gender'])
+@pytest.mark.parametrize('admin_level', ADMIN_LEVELS)
+def test_turnout_report(benchmark, synthetic_tally, user, view_class,
+                        admin_level):
+    view = view_class.as_view()
+
+    def setup():
+        request = RequestFactory().get('/')
+        request.user = user
+        request.session = {}
+
+        return (request,)
+
+    def turnout_report(request):
+        response = view(request, tally_id=synthetic_tally.id,
+                        admin_level=admin_level)
+        assert response.status_code == 200
+
+    benchmark(turnout_report, setup=setup)
@@ -0,0 +1,63 @@
+import zipfile
+
+from tally_ho.apps.tally.management.commands.create_demo_pvp_bundle import (
+    create_demo_pvp_bundle,
+)
+from tally_ho.apps.tally.models.pvp_upload_bundle import PvpUploadBundle
+from tally_ho.apps.tally.models.result_form import ResultForm
+from tally_ho.libs.models.enums.form_state import FormState
+from tally_ho.libs.models.enums.pvp_mode import PvpMode
+from tally_ho.libs.pvp.bundle import parse_bundle
+from tally_ho.libs.pvp.import_submission import import_bundle
+from tally_ho.libs.pvp.validation import validate_row
+from tally_ho.libs.verify.quarantine_checks import check_quarantine
+
+QUARANTINE_FORMS = 100
+
+
+def test_check_quarantine(benchmark, synthetic_tally, user):
+    result_forms = list(ResultForm.objects.filter(
+        tally=synthetic_tally,
+        form_state=FormState.ARCHIVED).order_by('barcode')[:QUARANTINE_FORMS])
+
+    def check_forms():
+        for result_form in result_forms:
+            check_quarantine(result_form, user)
+
+    benchmark(check_forms)
+
+
+def test_import_bundle(benchmark, synthetic_tally, user, tmp_path):
+    zip_path = create_demo_pvp_bundle(
+        tally=synthetic_tally, output=tmp_path / 'bundle.zip')
+    parsed = parse_bundle(zip_path)
+
+    def setup():
+        synthetic_tally.pvp_mode = PvpMode.DE1_ONLY
+        synthetic_tally.save(update_fields=['pvp_mode'])
+        rf_by_barcode = {
+            rf.barcode: rf
+            for rf in ResultForm.objects.filter(
+                tally=synthetic_tally,
+                barcode__in=[s.barcode for s in parsed.rows])
+        }
+        submissions = [
+            s for s in parsed.rows
+            if validate_row(s, synthetic_tally, rf_by_barcode).valid
+        ]
+        assert submissions
+        bundle = PvpUploadBundle.objects.create(
+            tally=synthetic_tally,
+            uploaded_by=user,
+            filename='bundle.zip',
+            mode=PvpMode.DE1_ONLY)
+
+        return bundle, submissions
+
+    def import_submissions(bundle, submissions):
+        with zipfile.ZipFile(zip_path) as zip_ref:
+            import_bundle(bundle=bundle, submissions=submissions,
+                          tally=synthetic_tally, uploaded_by=user,
+                          zip_ref=zip_ref)
+
+    benchmark(import_submissions, setup=setup)
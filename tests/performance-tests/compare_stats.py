@@ -0,0 +1,56 @@
+"""Compare the p50/p99 response times of two headless locust runs.
+
+Run the same scenario twice with ``--csv`` and pass both ``*_stats.csv``
+files, e.g. to compare persistent connections against a psycopg pool:
+
+    locust -f data_entry1_clerk.py --headless -u 50 -r 5 -t 5m --csv before
+    locust -f data_entry1_clerk.py --headless -u 50 -r 5 -t 5m --csv after
+    python compare_stats.py before_stats.csv after_stats.csv
+"""
+import csv
+import sys
+
+PERCENTILES = ['50%', '99%']
+
+
+def read_stats(path):
+    with open(path, newline='') as stats_file:
+        return {
+            (row['Type'], row['Name']): row
+            for row in csv.DictReader(stats_file)
+        }
+
+
+def change(before, after):
+    before, after = float(before), float(after)
+
+    if not before:
+        return 'n/a'
+
+    return '{:+.1f}%'.format((after - before) / before * 100)
+
+
+def main(before_path, after_path):
+    before, after = read_stats(before_path), read_stats(after_path)
+    header = ['Request']
+
+    for percentile in PERCENTILES:
+        header += [f'{percentile} before', f'{percentile} after', 'change']
+
+    print('\t'.join(header))
+
+    for key in sorted(set(before) & set(after)):
+        row = [' '.join(filter(None, key))]
+
+        for percentile in PERCENTILES:
+            row += [before[key][percentile], after[key][percentile],
+                    change(before[key][percentile], after[key][percentile])]
+
+        print('\t'.join(row))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+
+    main(*sys.argv[1:])